@@ -0,0 +1,81 @@
+"""
+Benchmark - Repaint halaman dengan banyak glow/shadow (offscreen)
+    
+    python benchmarks/bench_glow.py
+
+Angka = waktu terbaik dari beberapa ronde (ms per full repaint / per frame hover).
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("PYNPUT_BACKEND", "dummy")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from PyQt6.QtWidgets import QApplication, QWidget, QGridLayout
+from PyQt6.QtGui import QPixmap
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from src.theme import ThemeEngine
+from src.components.buttons import GamingButton
+from src.components.cards import StatCard, FeatureCard
+from src.components.panels import GamingPanel
+
+ROUNDS = 5
+FRAMES = 50
+
+
+def best_of(fn) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for i in range(FRAMES):
+            fn(i)
+        best = min(best, (time.perf_counter() - start) * 1000 / FRAMES)
+    return best
+
+
+def main():
+    ThemeEngine.apply(app)
+    
+    page = QWidget()
+    page.resize(1000, 700)
+    grid = QGridLayout(page)
+    grid.setSpacing(24)
+    
+    buttons = []
+    for i in range(24):
+        button = GamingButton(f"Button {i}", ("primary", "accent", "secondary")[i % 3])
+        buttons.append(button)
+        grid.addWidget(button, i // 6, i % 6)
+    for i in range(3):
+        grid.addWidget(StatCard("Stat", str(i), "sub"), 4, i * 2, 1, 2)
+        grid.addWidget(FeatureCard("Feature", "desc"), 5, i * 2, 1, 2)
+    grid.addWidget(GamingPanel(title="Panel"), 6, 0, 1, 6)
+    page.show()
+    app.processEvents()
+    
+    target = QPixmap(page.size())
+    
+    def full_repaint(i):
+        page.render(target)
+    
+    def hover_frame(i):
+        # Satu tombol fade-in glow (seperti frame animasi hover), repaint yang kotor saja
+        button = buttons[i % len(buttons)]
+        button._set_glow_intensity((i * 7) % 150 + 1)
+        page.repaint()
+    
+    results = [
+        ("Full repaint", best_of(full_repaint)),
+        ("Hover glow frame", best_of(hover_frame)),
+    ]
+    
+    for name, ms in results:
+        print(f"{name:24s} {ms:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
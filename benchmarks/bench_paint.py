@@ -0,0 +1,80 @@
+"""
+Benchmark - Throughput paintEvent komponen custom-painted (offscreen)
+    
+    python benchmarks/bench_paint.py
+
+Angka = waktu terbaik dari beberapa ronde (us per repaint) + repaint/detik.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("PYNPUT_BACKEND", "dummy")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import Qt
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from src.components.controls import GamingCheckbox, GamingRadio
+from src.components.switches import GamingSwitch
+from src.components.progress import CircularProgress
+
+ROUNDS = 5
+FRAMES = 2000
+
+
+def best_of(widget, step) -> float:
+    """Render widget ke pixmap FRAMES kali (step(i) mengubah state per frame), return us/frame"""
+    target = QPixmap(widget.size())
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for i in range(FRAMES):
+            step(i)
+            target.fill(Qt.GlobalColor.transparent)
+            widget.render(target)
+        best = min(best, (time.perf_counter() - start) * 1e6 / FRAMES)
+    return best
+
+
+def main():
+    checkbox = GamingCheckbox("Repeat while held")
+    checkbox.resize(200, 28)
+    radio = GamingRadio("Option")
+    radio.resize(200, 28)
+    switch = GamingSwitch()
+    circular = CircularProgress(size=100)
+    
+    def flip_checkbox(i):
+        checkbox._checked = bool(i & 1)
+        checkbox._hovered = bool(i & 2)
+    
+    def flip_radio(i):
+        radio._checked = bool(i & 1)
+        radio._hovered = bool(i & 2)
+    
+    def animate_switch(i):
+        # Handle bergerak 4 -> 28 seperti animasi toggle
+        switch._checked = bool((i // 25) & 1)
+        switch._handle_position = 4 + i % 25
+    
+    def step_progress(i):
+        circular._progress = i % 101
+    
+    results = [
+        ("GamingCheckbox", best_of(checkbox, flip_checkbox)),
+        ("GamingRadio", best_of(radio, flip_radio)),
+        ("GamingSwitch (anim)", best_of(switch, animate_switch)),
+        ("CircularProgress", best_of(circular, step_progress)),
+    ]
+    
+    for name, us in results:
+        print(f"{name:24s} {us:8.1f} us  ({1e6 / us:8.0f} frame/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark - Waktu konstruksi widget & flip state (offscreen)
+    
+    python benchmarks/bench_widget_build.py
+
+Angka = waktu terbaik dari beberapa ronde (ms per widget / per operasi).
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("PYNPUT_BACKEND", "dummy")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from PyQt6.QtWidgets import QApplication
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from src.theme import ThemeEngine
+from src.components.buttons import GamingButton, ToggleButton
+from src.components.panels import NavItem
+from src.core.hotkey_manager import HotkeyBinding, KeyAction, ActionType
+from src.widgets.hotkey_widgets import HotkeyItemWidget, AddEditHotkeyDialog, AddActionDialog
+
+ROUNDS = 5
+
+
+def best_of(fn, count: int) -> float:
+    """Jalankan fn() count kali per ronde, return ms per panggilan (ronde tercepat)"""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(count):
+            fn()
+        best = min(best, (time.perf_counter() - start) * 1000 / count)
+        app.processEvents()
+    return best
+
+
+def build(factory):
+    def run():
+        widget = factory()
+        widget.ensurePolished()
+        widget.adjustSize()
+        widget.deleteLater()
+    return run
+
+
+def main():
+    ThemeEngine.apply(app)
+    
+    binding = HotkeyBinding(
+        id="bench", name="Bench", trigger_keys=["f1", "f2"],
+        actions=[KeyAction(ActionType.KEY_PRESS, ["a"]) for _ in range(5)]
+    )
+    
+    results = [
+        ("GamingButton", best_of(build(lambda: GamingButton("Go", "primary", "small")), 200)),
+        ("ToggleButton", best_of(build(lambda: ToggleButton("ON", "OFF")), 200)),
+        ("NavItem", best_of(build(lambda: NavItem("Nav", "*")), 200)),
+        ("HotkeyItemWidget", best_of(build(lambda: HotkeyItemWidget(binding)), 100)),
+        ("AddActionDialog", best_of(build(lambda: AddActionDialog()), 20)),
+        ("AddEditHotkeyDialog", best_of(build(lambda: AddEditHotkeyDialog(binding)), 20)),
+    ]
+    
+    toggle = ToggleButton("ON", "OFF")
+    toggle.ensurePolished()
+    results.append(("ToggleButton flip", best_of(lambda: setattr(toggle, "is_on", not toggle.is_on), 500)))
+    
+    nav = NavItem("Nav", "*")
+    nav.ensurePolished()
+    results.append(("NavItem set_active", best_of(lambda: nav.set_active(not nav.active), 500)))
+    
+    for name, ms in results:
+        print(f"{name:24s} {ms:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,94 @@
 """
 Tobelsoft Macro - Gaming Tool Application
 Main Entry Point
+    
+    python main.py                          # UI (data & hook di-load di background)
+    python main.py --profile-startup        # + cetak timing per fase startup
+    python main.py --headless --profile p   # engine saja, tanpa UI / PyQt6
+    python main.py --engine-process         # UI + engine di process terpisah
+    python main.py --preset-store sqlite    # preset di SQLite (migrasi sekali dari folder JSON)
 """
+import time
+_START = time.perf_counter()
+
+import argparse
+import multiprocessing
 import sys
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
 
-from src.theme import Styles
-from src.windows.main_window import MainWindow
+from src.core.startup_profiler import startup_profiler
 
 
-def main():
+def parse_args(argv):
+    """Argumen aplikasi; sisanya (argumen Qt) diteruskan ke QApplication"""
+    parser = argparse.ArgumentParser(description="Tobelsoft Macro - Gaming Tool")
+    parser.add_argument("--headless", action="store_true",
+                        help="jalankan engine tanpa UI (PyQt6 tidak di-import)")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="profile/data file JSON (default: appdata/tobelsoft_macro_data.json)")
+    parser.add_argument("--start-active", action="store_true",
+                        help="headless: langsung aktif tanpa menunggu master toggle")
+    parser.add_argument("--engine-process", action="store_true",
+                        help="jalankan input engine di process terpisah dari UI")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="cetak timing per fase startup")
+    parser.add_argument("--preset-store", choices=("json", "sqlite"), default="json",
+                        help="backend library preset (sqlite: search & paging terindex)")
+    return parser.parse_known_args(argv)
+
+
+def run_gui(args, qt_argv) -> int:
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import Qt, QTimer
+    startup_profiler.mark("import Qt")
+    
     # Enable high DPI scaling
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
     
-    app = QApplication(sys.argv)
+    app = QApplication(qt_argv)
     app.setApplicationName("Tobelsoft Macro")
     app.setApplicationVersion("1.0.0")
+    startup_profiler.mark("create QApplication")
+    
+    # Apply global stylesheet (compiled sekali untuk seluruh aplikasi)
+    from src.theme import ThemeEngine
+    ThemeEngine.apply(app)
+    startup_profiler.mark("compile + apply stylesheet")
     
-    # Apply global stylesheet
-    app.setStyleSheet(Styles.app_stylesheet())
+    from src.windows.main_window import MainWindow
+    startup_profiler.mark("import UI modules")
     
-    # Create and show main window
-    window = MainWindow()
+    # Create and show main window (data load & hook install ditunda)
+    window = MainWindow(deferred_init=True, data_file=args.profile,
+                        engine_process=args.engine_process, preset_store=args.preset_store)
+    startup_profiler.mark("build main window")
     window.show()
+    startup_profiler.mark("show window")
+    
+    if startup_profiler.enabled:
+        QTimer.singleShot(0, lambda: startup_profiler.mark("first frame (event loop idle)"))
+        
+        def on_ready():
+            startup_profiler.mark("controller ready")
+            startup_profiler.print_report()
+        window.hotkey_controller.ready.connect(on_ready)
+    
+    return app.exec()
+
+
+def main():
+    # EXE (PyInstaller): child engine process masuk lewat sini
+    multiprocessing.freeze_support()
+    args, qt_args = parse_args(sys.argv[1:])
+    if args.profile_startup:
+        startup_profiler.enable(_START)
+    
+    if args.headless:
+        from src.core.headless import run_headless
+        sys.exit(run_headless(args.profile, start_active=args.start_active))
     
-    sys.exit(app.exec())
+    sys.exit(run_gui(args, [sys.argv[0]] + qt_args))
 
 
 if __name__ == "__main__":
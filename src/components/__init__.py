@@ -1,20 +1,30 @@
 # Components Module
-from .buttons import GamingButton, IconButton, ToggleButton
-from .cards import GamingCard, StatCard, FeatureCard
-from .panels import GamingPanel, GlassPanel, SidebarPanel, NavItem
-from .inputs import GamingInput, GamingTextArea, GamingSpinBox, GamingComboBox
-from .labels import GlowLabel, TitleLabel, BadgeLabel, StatusIndicator
-from .progress import GamingProgressBar, CircularProgress, LabeledProgress
-from .switches import GamingSwitch
-from .controls import GamingCheckbox, GamingRadio, GamingRadioGroup, GamingSlider, ChecklistGroup
+# Lazy exports: modul komponen baru di-import saat class-nya dipakai (startup lebih cepat)
+import importlib
 
-__all__ = [
-    'GamingButton', 'IconButton', 'ToggleButton',
-    'GamingCard', 'StatCard', 'FeatureCard',
-    'GamingPanel', 'GlassPanel', 'SidebarPanel', 'NavItem',
-    'GamingInput', 'GamingTextArea', 'GamingSpinBox', 'GamingComboBox',
-    'GlowLabel', 'TitleLabel', 'BadgeLabel', 'StatusIndicator',
-    'GamingProgressBar', 'CircularProgress', 'LabeledProgress',
-    'GamingSwitch',
-    'GamingCheckbox', 'GamingRadio', 'GamingRadioGroup', 'GamingSlider', 'ChecklistGroup'
-]
+_EXPORTS = {
+    'GamingButton': '.buttons', 'IconButton': '.buttons', 'ToggleButton': '.buttons',
+    'GamingCard': '.cards', 'StatCard': '.cards', 'FeatureCard': '.cards',
+    'GamingPanel': '.panels', 'GlassPanel': '.panels', 'SidebarPanel': '.panels', 'NavItem': '.panels',
+    'GamingInput': '.inputs', 'GamingTextArea': '.inputs', 'GamingSpinBox': '.inputs', 'GamingComboBox': '.inputs',
+    'GlowLabel': '.labels', 'TitleLabel': '.labels', 'BadgeLabel': '.labels', 'StatusIndicator': '.labels',
+    'GamingProgressBar': '.progress', 'CircularProgress': '.progress', 'LabeledProgress': '.progress',
+    'GamingSwitch': '.switches',
+    'GamingCheckbox': '.controls', 'GamingRadio': '.controls', 'GamingRadioGroup': '.controls',
+    'GamingSlider': '.controls', 'ChecklistGroup': '.controls',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,13 +1,13 @@
 """
 Custom Button Components untuk Gaming Tool
 """
-from PyQt6.QtWidgets import QPushButton, QGraphicsDropShadowEffect
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtProperty, QSize
+from PyQt6.QtWidgets import QPushButton
+from PyQt6.QtCore import Qt, pyqtProperty, QSize, QPoint
 from PyQt6.QtGui import QColor, QIcon, QFont
 
 import sys
 sys.path.append('..')
-from src.theme import Colors, Styles
+from src.theme import Colors, Styles, ThemeEngine, AnimationClock, GlowSource
 
 
 class GamingButton(QPushButton):
@@ -27,41 +27,16 @@ class GamingButton(QPushButton):
         
         self._setup_style()
         self._setup_shadow()
-        self._setup_animation()
     
     def _setup_style(self):
-        """Apply style berdasarkan variant"""
-        styles = {
-            "primary": Styles.button_primary(),
-            "secondary": Styles.button_secondary(),
-            "accent": Styles.button_accent(),
-            "danger": Styles.button_danger(),
-            "ghost": Styles.button_ghost()
-        }
-        
-        # Size adjustments
-        size_styles = {
-            "small": "padding: 8px 16px; font-size: 10px; min-height: 16px;",
-            "normal": "",  # Use default
-            "large": "padding: 16px 32px; font-size: 14px; min-height: 24px;"
-        }
-        
-        base_style = styles.get(self.variant, styles["primary"])
-        size_style = size_styles.get(self.size, "")
-        
-        # Combine styles
-        self.setStyleSheet(base_style)
-        if size_style:
-            current = self.styleSheet()
-            # Inject size style into QPushButton block
-            self.setStyleSheet(current.replace("QPushButton {", f"QPushButton {{ {size_style}"))
-        
+        """Apply style berdasarkan variant (rule ada di ThemeEngine)"""
+        variant = self.variant if self.variant in ThemeEngine.BUTTON_VARIANTS else "primary"
+        self.setProperty("variant", variant)
+        self.setProperty("btnSize", self.size)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
     
     def _setup_shadow(self):
-        """Setup drop shadow/glow effect"""
-        self.shadow = QGraphicsDropShadowEffect(self)
-        
+        """Setup glow (pixmap cache GlowRenderer, bukan graphics effect)"""
         shadow_colors = {
             "primary": Colors.PRIMARY_LIGHT,
             "secondary": Colors.PRIMARY,
@@ -71,44 +46,29 @@ class GamingButton(QPushButton):
         }
         
         color = QColor(shadow_colors.get(self.variant, Colors.PRIMARY_LIGHT))
-        color.setAlpha(0)  # Start with no shadow
+        color.setAlpha(0)  # Start with no glow
         
-        self.shadow.setBlurRadius(20)
-        self.shadow.setOffset(0, 0)
-        self.shadow.setColor(color)
-        self.setGraphicsEffect(self.shadow)
-    
-    def _setup_animation(self):
-        """Setup hover animation"""
-        self._anim = QPropertyAnimation(self, b"glowIntensity")
-        self._anim.setDuration(200)
-        self._anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.glow = GlowSource(self, color, blur=20, radius=8)
     
     def _get_glow_intensity(self) -> int:
         return self._glow_intensity
     
     def _set_glow_intensity(self, value: int):
-        self._glow_intensity = value
-        color = self.shadow.color()
-        color.setAlpha(value)
-        self.shadow.setColor(color)
+        self._glow_intensity = int(value)
+        self.glow.set_alpha(self._glow_intensity)
     
     glowIntensity = pyqtProperty(int, _get_glow_intensity, _set_glow_intensity)
     
     def enterEvent(self, event):
         """Mouse enter - animate glow in"""
-        self._anim.stop()
-        self._anim.setStartValue(self._glow_intensity)
-        self._anim.setEndValue(150)
-        self._anim.start()
+        AnimationClock.instance().animate(self, "glow", self._glow_intensity, 150, 200,
+                                          self._set_glow_intensity)
         super().enterEvent(event)
     
     def leaveEvent(self, event):
         """Mouse leave - animate glow out"""
-        self._anim.stop()
-        self._anim.setStartValue(self._glow_intensity)
-        self._anim.setEndValue(0)
-        self._anim.start()
+        AnimationClock.instance().animate(self, "glow", self._glow_intensity, 0, 200,
+                                          self._set_glow_intensity)
         super().leaveEvent(event)
 
 
@@ -130,11 +90,8 @@ class IconButton(QPushButton):
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         
         # Add shadow
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(15)
-        shadow.setOffset(0, 2)
-        shadow.setColor(QColor(0, 0, 0, 80))
-        self.setGraphicsEffect(shadow)
+        self.shadow = GlowSource(self, QColor(0, 0, 0, 80), blur=15,
+                                 offset=QPoint(0, 2), radius=size / 2)
 
 
 class ToggleButton(QPushButton):
@@ -155,40 +112,8 @@ class ToggleButton(QPushButton):
     
     def _update_style(self):
         """Update style berdasarkan state"""
-        if self._is_on:
-            self.setText(self.text_on)
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background: {Colors.GRADIENT_ACCENT};
-                    color: {Colors.SECONDARY_DARKEST};
-                    border: none;
-                    border-radius: 8px;
-                    padding: 12px 24px;
-                    font-weight: 700;
-                    font-size: 12px;
-                }}
-                QPushButton:hover {{
-                    background: {Colors.ACCENT_LIGHT};
-                }}
-            """)
-        else:
-            self.setText(self.text_off)
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background: {Colors.SECONDARY_DARK};
-                    color: {Colors.TEXT_SECONDARY};
-                    border: 2px solid {Colors.BORDER_DEFAULT};
-                    border-radius: 8px;
-                    padding: 10px 22px;
-                    font-weight: 600;
-                    font-size: 12px;
-                }}
-                QPushButton:hover {{
-                    background: {Colors.SECONDARY};
-                    border-color: {Colors.SECONDARY_LIGHT};
-                    color: {Colors.TEXT_PRIMARY};
-                }}
-            """)
+        self.setText(self.text_on if self._is_on else self.text_off)
+        ThemeEngine.set_state(self, "on", self._is_on)
     
     def _on_toggle(self):
         self._is_on = not self._is_on
@@ -2,13 +2,13 @@
 Card Components untuk Gaming Tool
 """
 from PyQt6.QtWidgets import (QFrame, QVBoxLayout, QHBoxLayout, QLabel, 
-                              QGraphicsDropShadowEffect, QSizePolicy)
-from PyQt6.QtCore import Qt
+                              QSizePolicy)
+from PyQt6.QtCore import Qt, QPoint
 from PyQt6.QtGui import QColor
 
 import sys
 sys.path.append('..')
-from src.theme import Colors
+from src.theme import Colors, GlowSource
 
 
 class GamingCard(QFrame):
@@ -23,29 +23,11 @@ class GamingCard(QFrame):
         self._setup_layout()
     
     def _setup_style(self):
-        if self.highlighted:
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background: {Colors.PRIMARY_DARKEST};
-                    border: 2px solid {Colors.PRIMARY};
-                    border-radius: 12px;
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background: {Colors.SECONDARY_DARK};
-                    border: 1px solid {Colors.BORDER_DEFAULT};
-                    border-radius: 12px;
-                }}
-            """)
+        self.setProperty("highlighted", self.highlighted)
     
     def _setup_shadow(self):
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(20)
-        self.shadow.setOffset(0, 4)
-        self.shadow.setColor(QColor(0, 0, 0, 60))
-        self.setGraphicsEffect(self.shadow)
+        self.shadow = GlowSource(self, QColor(0, 0, 0, 60), blur=20,
+                                 offset=QPoint(0, 4), radius=12)
     
     def _setup_layout(self):
         self.layout = QVBoxLayout(self)
@@ -72,14 +54,8 @@ class StatCard(QFrame):
         self._setup_shadow()
     
     def _setup_style(self):
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: {Colors.SECONDARY_DARK};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: 16px;
-                border-left: 4px solid {self.accent_color};
-            }}
-        """)
+        # Hanya aksen (per instance) yang inline, sisanya rule StatCard di ThemeEngine
+        self.setStyleSheet(f"StatCard {{ border-left: 4px solid {self.accent_color}; }}")
         self.setMinimumHeight(110)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
     
@@ -90,27 +66,11 @@ class StatCard(QFrame):
         
         # Title
         title_label = QLabel(title)
-        title_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_SECONDARY};
-                font-size: 12px;
-                font-weight: 500;
-                background: transparent;
-                border: none;
-            }}
-        """)
+        title_label.setObjectName("statTitle")
         
         # Value
         self.value_label = QLabel(value)
-        self.value_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_PRIMARY};
-                font-size: 32px;
-                font-weight: 700;
-                background: transparent;
-                border: none;
-            }}
-        """)
+        self.value_label.setObjectName("statValue")
         
         layout.addWidget(title_label)
         layout.addWidget(self.value_label)
@@ -129,11 +89,8 @@ class StatCard(QFrame):
             layout.addWidget(subtitle_label)
     
     def _setup_shadow(self):
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setOffset(0, 4)
-        shadow.setColor(QColor(0, 0, 0, 50))
-        self.setGraphicsEffect(shadow)
+        self.shadow = GlowSource(self, QColor(0, 0, 0, 50), blur=20,
+                                 offset=QPoint(0, 4), radius=16)
 
 
 class FeatureCard(QFrame):
@@ -148,19 +105,6 @@ class FeatureCard(QFrame):
         self._setup_shadow()
     
     def _setup_style(self):
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 {Colors.SECONDARY_DARK}, stop:1 {Colors.SECONDARY_DARKER});
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: 16px;
-            }}
-            QFrame:hover {{
-                border-color: {Colors.PRIMARY};
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 {Colors.PRIMARY_DARKEST}, stop:1 {Colors.SECONDARY_DARK});
-            }}
-        """)
         self.setMinimumHeight(180)
         self.setMinimumWidth(200)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -175,41 +119,16 @@ class FeatureCard(QFrame):
         icon_label = QLabel(icon_text)
         icon_label.setFixedSize(52, 52)
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        icon_label.setStyleSheet(f"""
-            QLabel {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 {Colors.PRIMARY}, stop:1 {Colors.ACCENT});
-                color: {Colors.TEXT_PRIMARY};
-                font-size: 24px;
-                border-radius: 14px;
-                border: none;
-            }}
-        """)
+        icon_label.setObjectName("featureIcon")
         
         # Title
         title_label = QLabel(title)
-        title_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_PRIMARY};
-                font-size: 15px;
-                font-weight: 700;
-                background: transparent;
-                border: none;
-            }}
-        """)
+        title_label.setObjectName("featureTitle")
         
         # Description
         desc_label = QLabel(description)
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_MUTED};
-                font-size: 12px;
-                line-height: 1.4;
-                background: transparent;
-                border: none;
-            }}
-        """)
+        desc_label.setObjectName("featureDescription")
         
         layout.addWidget(icon_label)
         layout.addWidget(title_label)
@@ -217,8 +136,5 @@ class FeatureCard(QFrame):
         layout.addStretch()
     
     def _setup_shadow(self):
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(25)
-        shadow.setOffset(0, 6)
-        shadow.setColor(QColor(0, 0, 0, 60))
-        self.setGraphicsEffect(shadow)
+        self.shadow = GlowSource(self, QColor(0, 0, 0, 60), blur=25,
+                                 offset=QPoint(0, 6), radius=16)
@@ -3,12 +3,12 @@ Form Controls - Checkbox, Radio, Slider (Custom Painted)
 """
 from PyQt6.QtWidgets import (QWidget, QSlider, QVBoxLayout, QHBoxLayout, 
                               QLabel, QButtonGroup, QSizePolicy)
-from PyQt6.QtCore import Qt, pyqtSignal, QRectF
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QPainterPath
+from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QEvent
+from PyQt6.QtGui import QPainter, QPainterPath, QFont
 
 import sys
 sys.path.append('..')
-from src.theme import Colors
+from src.theme import Colors, PaintCache
 
 
 class GamingCheckbox(QWidget):
@@ -21,42 +21,59 @@ class GamingCheckbox(QWidget):
         self._checked = checked
         self._text = text
         self._hovered = False
+        self._font = None
         
         self.setFixedHeight(28)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setMouseTracking(True)
     
+    BOX_SIZE = 20
+    
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Box dimensions
-        box_size = 20
+        # Box (glyph di-cache per state, margin 2px untuk pen)
         box_x = 4
-        box_y = (self.height() - box_size) // 2
-        box_rect = QRectF(box_x, box_y, box_size, box_size)
-        
-        # Draw box
+        box_y = (self.height() - self.BOX_SIZE) // 2
         if self._checked:
-            painter.setBrush(QBrush(QColor(Colors.PRIMARY)))
-            painter.setPen(QPen(QColor(Colors.PRIMARY), 2))
+            state = "checked"
+        else:
+            state = "hover" if self._hovered else "normal"
+        glyph = PaintCache.pixmap("checkbox", state, self.BOX_SIZE + 4, self.BOX_SIZE + 4,
+                                  self.devicePixelRatioF(),
+                                  lambda p: self._render_box(p, state))
+        painter.drawPixmap(box_x - 2, box_y - 2, glyph)
+        
+        # Draw text
+        painter.setPen(PaintCache.pen(Colors.TEXT_PRIMARY))
+        painter.setFont(self._label_font())
+        
+        text_x = box_x + self.BOX_SIZE + 12
+        text_rect = QRectF(text_x, 0, self.width() - text_x, self.height())
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter, self._text)
+    
+    @classmethod
+    def _render_box(cls, painter: QPainter, state: str):
+        """Render box + checkmark ke pixmap cache"""
+        box_size = cls.BOX_SIZE
+        box_rect = QRectF(2, 2, box_size, box_size)
+        
+        if state == "checked":
+            painter.setBrush(PaintCache.brush(Colors.PRIMARY))
+            painter.setPen(PaintCache.pen(Colors.PRIMARY, 2))
         else:
             painter.setBrush(Qt.BrushStyle.NoBrush)
-            if self._hovered:
-                painter.setPen(QPen(QColor(Colors.PRIMARY), 2))
-            else:
-                painter.setPen(QPen(QColor(Colors.SECONDARY_LIGHT), 2))
+            color = Colors.PRIMARY if state == "hover" else Colors.SECONDARY_LIGHT
+            painter.setPen(PaintCache.pen(color, 2))
         
         painter.drawRoundedRect(box_rect, 4, 4)
         
         # Draw checkmark
-        if self._checked:
-            painter.setPen(QPen(QColor(Colors.TEXT_PRIMARY), 2.5, Qt.PenStyle.SolidLine, 
-                               Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin))
+        if state == "checked":
+            painter.setPen(PaintCache.pen(Colors.TEXT_PRIMARY, 2.5, round_cap=True))
             
-            # Checkmark path
-            check_x = box_x + 5
-            check_y = box_y + box_size // 2
+            check_x = 2 + 5
+            check_y = 2 + box_size // 2
             
             path = QPainterPath()
             path.moveTo(check_x, check_y)
@@ -64,15 +81,16 @@ class GamingCheckbox(QWidget):
             path.lineTo(check_x + 10, check_y - 4)
             painter.drawPath(path)
         
-        # Draw text
-        painter.setPen(QColor(Colors.TEXT_PRIMARY))
-        font = painter.font()
-        font.setPointSize(10)
-        painter.setFont(font)
+    def _label_font(self) -> QFont:
+        if self._font is None:
+            self._font = QFont(self.font())
+            self._font.setPointSize(10)
+        return self._font
         
-        text_x = box_x + box_size + 12
-        text_rect = QRectF(text_x, 0, self.width() - text_x, self.height())
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter, self._text)
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.FontChange:
+            self._font = None
+        super().changeEvent(event)
     
     def mousePressEvent(self, event):
         self._checked = not self._checked
@@ -110,47 +128,64 @@ class GamingRadio(QWidget):
         self._text = text
         self._hovered = False
         self._group = None
+        self._font = None
         
         self.setFixedHeight(28)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setMouseTracking(True)
     
+    CIRCLE_SIZE = 20
+    
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Circle dimensions
-        circle_size = 20
+        # Circle (glyph di-cache per state, margin 2px untuk pen)
         circle_x = 4
-        circle_y = (self.height() - circle_size) // 2
+        circle_y = (self.height() - self.CIRCLE_SIZE) // 2
+        state = f"{'on' if self._checked else 'off'}-{'hover' if self._hovered else 'normal'}"
+        glyph = PaintCache.pixmap("radio", state, self.CIRCLE_SIZE + 4, self.CIRCLE_SIZE + 4,
+                                  self.devicePixelRatioF(),
+                                  lambda p: self._render_circle(p, self._checked, self._hovered))
+        painter.drawPixmap(circle_x - 2, circle_y - 2, glyph)
+        
+        # Draw text
+        painter.setPen(PaintCache.pen(Colors.TEXT_PRIMARY))
+        painter.setFont(self._label_font())
+        
+        text_x = circle_x + self.CIRCLE_SIZE + 12
+        text_rect = QRectF(text_x, 0, self.width() - text_x, self.height())
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter, self._text)
+    
+    @classmethod
+    def _render_circle(cls, painter: QPainter, checked: bool, hovered: bool):
+        """Render lingkaran luar + dalam ke pixmap cache"""
+        circle_size = cls.CIRCLE_SIZE
         
         # Outer circle
-        if self._hovered:
-            painter.setPen(QPen(QColor(Colors.PRIMARY), 2))
-        else:
-            painter.setPen(QPen(QColor(Colors.SECONDARY_LIGHT), 2))
+        color = Colors.PRIMARY if hovered else Colors.SECONDARY_LIGHT
+        painter.setPen(PaintCache.pen(color, 2))
         painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.drawEllipse(circle_x, circle_y, circle_size, circle_size)
+        painter.drawEllipse(2, 2, circle_size, circle_size)
         
         # Inner circle (when checked)
-        if self._checked:
+        if checked:
             inner_size = 10
-            inner_x = circle_x + (circle_size - inner_size) // 2
-            inner_y = circle_y + (circle_size - inner_size) // 2
+            inner_pos = 2 + (circle_size - inner_size) // 2
             
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QBrush(QColor(Colors.PRIMARY)))
-            painter.drawEllipse(inner_x, inner_y, inner_size, inner_size)
+            painter.setBrush(PaintCache.brush(Colors.PRIMARY))
+            painter.drawEllipse(inner_pos, inner_pos, inner_size, inner_size)
         
-        # Draw text
-        painter.setPen(QColor(Colors.TEXT_PRIMARY))
-        font = painter.font()
-        font.setPointSize(10)
-        painter.setFont(font)
+    def _label_font(self) -> QFont:
+        if self._font is None:
+            self._font = QFont(self.font())
+            self._font.setPointSize(10)
+        return self._font
         
-        text_x = circle_x + circle_size + 12
-        text_rect = QRectF(text_x, 0, self.width() - text_x, self.height())
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter, self._text)
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.FontChange:
+            self._font = None
+        super().changeEvent(event)
     
     def mousePressEvent(self, event):
         if not self._checked:
@@ -199,15 +234,7 @@ class GamingRadioGroup(QWidget):
         
         if self.label_text:
             label = QLabel(self.label_text)
-            label.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_SECONDARY};
-                    font-size: 12px;
-                    font-weight: 600;
-                    background: transparent;
-                    border: none;
-                }}
-            """)
+            label.setProperty("role", "fieldLabel")
             layout.addWidget(label)
         
         for i, option in enumerate(self.options):
@@ -252,29 +279,14 @@ class GamingSlider(QWidget):
         
         if self.label_text:
             label = QLabel(self.label_text)
-            label.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_SECONDARY};
-                    font-size: 12px;
-                    font-weight: 600;
-                    background: transparent;
-                    border: none;
-                }}
-            """)
+            label.setProperty("role", "fieldLabel")
             header.addWidget(label)
         
         header.addStretch()
         
         self.value_label = QLabel(f"{default}{self.suffix}")
-        self.value_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.ACCENT_LIGHT};
-                font-size: 13px;
-                font-weight: 700;
-                background: transparent;
-                border: none;
-            }}
-        """)
+        self.value_label.setObjectName("sliderValue")
+        
         header.addWidget(self.value_label)
         layout.addLayout(header)
         
@@ -285,29 +297,6 @@ class GamingSlider(QWidget):
         self.slider.setValue(default)
         self.slider.valueChanged.connect(self._on_value_change)
         
-        self.slider.setStyleSheet(f"""
-            QSlider::groove:horizontal {{
-                background: {Colors.SECONDARY_DARK};
-                height: 6px;
-                border-radius: 3px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {Colors.ACCENT_LIGHT};
-                width: 18px;
-                height: 18px;
-                margin: -6px 0;
-                border-radius: 9px;
-            }}
-            QSlider::handle:horizontal:hover {{
-                background: {Colors.ACCENT_LIGHTER};
-            }}
-            QSlider::sub-page:horizontal {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                    stop:0 {Colors.PRIMARY}, stop:1 {Colors.ACCENT});
-                border-radius: 3px;
-            }}
-        """)
-        
         layout.addWidget(self.slider)
     
     def _on_value_change(self, value: int):
@@ -341,15 +330,7 @@ class ChecklistGroup(QWidget):
         
         if self.label_text:
             label = QLabel(self.label_text)
-            label.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_SECONDARY};
-                    font-size: 12px;
-                    font-weight: 600;
-                    background: transparent;
-                    border: none;
-                }}
-            """)
+            label.setProperty("role", "fieldLabel")
             layout.addWidget(label)
         
         for option in self.options:
@@ -8,10 +8,6 @@ from PyQt6.QtWidgets import (QLineEdit, QTextEdit, QSpinBox, QDoubleSpinBox,
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor
 
-import sys
-sys.path.append('..')
-from src.theme import Colors, Styles
-
 
 class GamingInput(QFrame):
     """
@@ -24,7 +20,6 @@ class GamingInput(QFrame):
         self.label_text = label
         
         self._setup_ui(placeholder, password)
-        self._setup_style()
     
     def _setup_ui(self, placeholder: str, password: bool):
         """Setup UI components"""
@@ -35,15 +30,7 @@ class GamingInput(QFrame):
         # Label
         if self.label_text:
             label = QLabel(self.label_text)
-            label.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_SECONDARY};
-                    font-size: 12px;
-                    font-weight: 600;
-                    background: transparent;
-                    border: none;
-                }}
-            """)
+            label.setProperty("role", "fieldLabel")
             layout.addWidget(label)
         
         # Input
@@ -51,13 +38,8 @@ class GamingInput(QFrame):
         self.input.setPlaceholderText(placeholder)
         if password:
             self.input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.input.setStyleSheet(Styles.input_default())
         layout.addWidget(self.input)
     
-    def _setup_style(self):
-        """Style the container"""
-        self.setStyleSheet("background: transparent; border: none;")
-    
     def text(self) -> str:
         """Get input text"""
         return self.input.text()
@@ -95,25 +77,14 @@ class GamingTextArea(QFrame):
         # Label
         if self.label_text:
             label = QLabel(self.label_text)
-            label.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_SECONDARY};
-                    font-size: 12px;
-                    font-weight: 600;
-                    background: transparent;
-                    border: none;
-                }}
-            """)
+            label.setProperty("role", "fieldLabel")
             layout.addWidget(label)
         
         # Text area
         self.textarea = QTextEdit()
         self.textarea.setPlaceholderText(placeholder)
-        self.textarea.setStyleSheet(Styles.textarea_default())
         self.textarea.setMinimumHeight(100)
         layout.addWidget(self.textarea)
-        
-        self.setStyleSheet("background: transparent; border: none;")
     
     def toPlainText(self) -> str:
         """Get text"""
@@ -149,15 +120,7 @@ class GamingSpinBox(QFrame):
         # Label
         if label:
             lbl = QLabel(label)
-            lbl.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_SECONDARY};
-                    font-size: 12px;
-                    font-weight: 600;
-                    background: transparent;
-                    border: none;
-                }}
-            """)
+            lbl.setProperty("role", "fieldLabel")
             layout.addWidget(lbl)
         
         # Spin box
@@ -166,10 +129,7 @@ class GamingSpinBox(QFrame):
         self.spinbox.setValue(default)
         if suffix:
             self.spinbox.setSuffix(f" {suffix}")
-        self.spinbox.setStyleSheet(Styles.spinbox_default())
         layout.addWidget(self.spinbox)
-        
-        self.setStyleSheet("background: transparent; border: none;")
     
     def value(self) -> int:
         """Get value"""
@@ -199,24 +159,13 @@ class GamingComboBox(QFrame):
         # Label
         if label:
             lbl = QLabel(label)
-            lbl.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_SECONDARY};
-                    font-size: 12px;
-                    font-weight: 600;
-                    background: transparent;
-                    border: none;
-                }}
-            """)
+            lbl.setProperty("role", "fieldLabel")
             layout.addWidget(lbl)
         
         # Combo box
         self.combobox = QComboBox()
         self.combobox.addItems(items)
-        self.combobox.setStyleSheet(Styles.combobox_default())
         layout.addWidget(self.combobox)
-        
-        self.setStyleSheet("background: transparent; border: none;")
     
     def currentText(self) -> str:
         """Get current text"""
@@ -1,13 +1,13 @@
 """
 Label Components untuk Gaming Tool
 """
-from PyQt6.QtWidgets import QLabel, QGraphicsDropShadowEffect, QFrame, QHBoxLayout
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtProperty
+from PyQt6.QtWidgets import QLabel, QFrame, QHBoxLayout
+from PyQt6.QtCore import Qt, pyqtProperty
 from PyQt6.QtGui import QColor
 
 import sys
 sys.path.append('..')
-from src.theme import Colors
+from src.theme import Colors, ThemeEngine, TextGlowSource
 
 
 class GlowLabel(QLabel):
@@ -33,13 +33,9 @@ class GlowLabel(QLabel):
         """)
     
     def _setup_glow(self):
-        self.glow = QGraphicsDropShadowEffect(self)
-        self.glow.setBlurRadius(20)
-        self.glow.setOffset(0, 0)
         color = QColor(self.glow_color_hex)
         color.setAlpha(self._glow_intensity)
-        self.glow.setColor(color)
-        self.setGraphicsEffect(self.glow)
+        self.glow = TextGlowSource(self, color, blur=20)
 
 
 class TitleLabel(QLabel):
@@ -51,21 +47,8 @@ class TitleLabel(QLabel):
         self._setup_style()
     
     def _setup_style(self):
-        sizes = {1: 28, 2: 24, 3: 20, 4: 16, 5: 14, 6: 12}
-        weights = {1: 800, 2: 700, 3: 700, 4: 600, 5: 600, 6: 500}
-        
-        size = sizes.get(self.level, 20)
-        weight = weights.get(self.level, 600)
-        
-        self.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_PRIMARY};
-                font-size: {size}px;
-                font-weight: {weight};
-                background: transparent;
-                border: none;
-            }}
-        """)
+        # Ukuran & weight per level ada di ThemeEngine (TitleLabel[level="n"])
+        self.setProperty("level", self.level if self.level in range(1, 7) else 3)
 
 
 class BadgeLabel(QFrame):
@@ -96,25 +79,7 @@ class BadgeLabel(QFrame):
         layout.addWidget(self.label)
     
     def _setup_style(self):
-        bg_color, text_color = self.VARIANTS.get(self.variant, self.VARIANTS["primary"])
-        
-        self.setStyleSheet(f"""
-            BadgeLabel {{
-                background: {bg_color};
-                border-radius: 14px;
-                border: none;
-            }}
-        """)
-        
-        self.label.setStyleSheet(f"""
-            QLabel {{
-                color: {text_color};
-                font-size: 11px;
-                font-weight: 700;
-                background: transparent;
-                border: none;
-            }}
-        """)
+        self.setProperty("variant", self.variant if self.variant in self.VARIANTS else "primary")
     
     def setText(self, text: str):
         self.label.setText(text)
@@ -130,24 +95,11 @@ class StatusIndicator(QFrame):
         self._setup_style()
     
     def _setup_style(self):
-        colors = {
-            "online": Colors.SUCCESS,
-            "offline": Colors.SECONDARY_LIGHT,
-            "away": Colors.WARNING,
-            "busy": Colors.ERROR
-        }
-        
-        color = colors.get(self.status, colors["offline"])
-        
+        # Radius bergantung ukuran -> satu kali inline, warna status via property
         self.setFixedSize(self.indicator_size, self.indicator_size)
-        self.setStyleSheet(f"""
-            StatusIndicator {{
-                background: {color};
-                border-radius: {self.indicator_size // 2}px;
-                border: 2px solid {Colors.SECONDARY_DARK};
-            }}
-        """)
+        self.setStyleSheet(f"StatusIndicator {{ border-radius: {self.indicator_size // 2}px; }}")
+        self.setProperty("status", self.status)
     
     def set_status(self, status: str):
         self.status = status
-        self._setup_style()
+        ThemeEngine.set_state(self, "status", status)
@@ -2,13 +2,13 @@
 Panel Components untuk Gaming Tool
 """
 from PyQt6.QtWidgets import (QFrame, QVBoxLayout, QHBoxLayout, QLabel,
-                              QGraphicsDropShadowEffect, QScrollArea, QWidget)
-from PyQt6.QtCore import Qt, pyqtSignal
+                              QScrollArea, QWidget)
+from PyQt6.QtCore import Qt, pyqtSignal, QPoint
 from PyQt6.QtGui import QColor
 
 import sys
 sys.path.append('..')
-from src.theme import Colors
+from src.theme import ThemeEngine, GlowSource
 
 
 class GamingPanel(QFrame):
@@ -18,19 +18,9 @@ class GamingPanel(QFrame):
         super().__init__(parent)
         self.title_text = title
         
-        self._setup_style()
         self._setup_layout()
         self._setup_shadow()
     
-    def _setup_style(self):
-        self.setStyleSheet(f"""
-            GamingPanel {{
-                background: {Colors.SECONDARY_DARKER};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: 16px;
-            }}
-        """)
-    
     def _setup_layout(self):
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(24, 24, 24, 24)
@@ -38,27 +28,19 @@ class GamingPanel(QFrame):
         
         if self.title_text:
             title_container = QWidget()
-            title_container.setStyleSheet("background: transparent;")
+            title_container.setObjectName("panelTitleContainer")
             title_layout = QVBoxLayout(title_container)
             title_layout.setContentsMargins(0, 0, 0, 12)
             title_layout.setSpacing(0)
             
             title_label = QLabel(self.title_text)
-            title_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_PRIMARY};
-                    font-size: 16px;
-                    font-weight: 700;
-                    background: transparent;
-                    border: none;
-                }}
-            """)
+            title_label.setObjectName("panelTitle")
             title_layout.addWidget(title_label)
             
             # Separator line
             separator = QFrame()
             separator.setFixedHeight(1)
-            separator.setStyleSheet(f"background: {Colors.BORDER_DEFAULT};")
+            separator.setObjectName("panelSeparator")
             title_layout.addWidget(separator)
             
             self.main_layout.addWidget(title_container)
@@ -68,11 +50,8 @@ class GamingPanel(QFrame):
         self.main_layout.addLayout(self.content_layout)
     
     def _setup_shadow(self):
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setOffset(0, 4)
-        shadow.setColor(QColor(0, 0, 0, 50))
-        self.setGraphicsEffect(shadow)
+        self.shadow = GlowSource(self, QColor(0, 0, 0, 50), blur=20,
+                                 offset=QPoint(0, 4), radius=16)
     
     def add_widget(self, widget):
         self.content_layout.addWidget(widget)
@@ -89,18 +68,8 @@ class GlassPanel(QFrame):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._setup_style()
         self._setup_layout()
     
-    def _setup_style(self):
-        self.setStyleSheet(f"""
-            GlassPanel {{
-                background: {Colors.GLASS_BACKGROUND};
-                border: 1px solid {Colors.rgba(Colors.PRIMARY_LIGHT, 0.3)};
-                border-radius: 20px;
-            }}
-        """)
-    
     def _setup_layout(self):
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(24, 24, 24, 24)
@@ -119,17 +88,8 @@ class SidebarPanel(QFrame):
     def __init__(self, parent=None, width: int = 260):
         super().__init__(parent)
         self.setFixedWidth(width)
-        self._setup_style()
         self._setup_layout()
     
-    def _setup_style(self):
-        self.setStyleSheet(f"""
-            SidebarPanel {{
-                background: {Colors.SECONDARY_DARKEST};
-                border-right: 1px solid {Colors.BORDER_DEFAULT};
-            }}
-        """)
-    
     def _setup_layout(self):
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -137,13 +97,7 @@ class SidebarPanel(QFrame):
         
         # Header
         self.header_widget = QFrame()
-        self.header_widget.setStyleSheet(f"""
-            QFrame {{
-                background: transparent;
-                border: none;
-                border-bottom: 1px solid {Colors.BORDER_DEFAULT};
-            }}
-        """)
+        self.header_widget.setObjectName("sidebarHeader")
         self.header_layout = QVBoxLayout(self.header_widget)
         self.header_layout.setContentsMargins(24, 24, 24, 24)
         main_layout.addWidget(self.header_widget)
@@ -153,18 +107,9 @@ class SidebarPanel(QFrame):
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet(f"""
-            QScrollArea {{
-                background: transparent;
-                border: none;
-            }}
-            QScrollArea > QWidget > QWidget {{
-                background: transparent;
-            }}
-        """)
+        scroll_area.setObjectName("sidebarScroll")
         
         scroll_content = QWidget()
-        scroll_content.setStyleSheet("background: transparent;")
         self.content_layout = QVBoxLayout(scroll_content)
         self.content_layout.setContentsMargins(16, 20, 16, 20)
         self.content_layout.setSpacing(6)
@@ -175,13 +120,7 @@ class SidebarPanel(QFrame):
         
         # Footer
         self.footer_widget = QFrame()
-        self.footer_widget.setStyleSheet(f"""
-            QFrame {{
-                background: transparent;
-                border: none;
-                border-top: 1px solid {Colors.BORDER_DEFAULT};
-            }}
-        """)
+        self.footer_widget.setObjectName("sidebarFooter")
         self.footer_layout = QVBoxLayout(self.footer_widget)
         self.footer_layout.setContentsMargins(24, 16, 24, 16)
         main_layout.addWidget(self.footer_widget)
@@ -234,70 +173,20 @@ class NavItem(QFrame):
         layout.setSpacing(14)
         
         self.icon_label = QLabel(self.icon_text)
+        self.icon_label.setObjectName("navIcon")
         self.icon_label.setFixedWidth(24)
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         self.text_label = QLabel(self.text)
+        self.text_label.setObjectName("navText")
         
         layout.addWidget(self.icon_label)
         layout.addWidget(self.text_label)
         layout.addStretch()
     
     def _update_style(self):
-        if self._active:
-            self.setStyleSheet(f"""
-                NavItem {{
-                    background: {Colors.PRIMARY_DARK};
-                    border-radius: 12px;
-                    border: none;
-                    border-left: 3px solid {Colors.ACCENT_LIGHT};
-                }}
-            """)
-            self.icon_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.ACCENT_LIGHT};
-                    font-size: 16px;
-                    background: transparent;
-                    border: none;
-                }}
-            """)
-            self.text_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_PRIMARY};
-                    font-size: 14px;
-                    font-weight: 600;
-                    background: transparent;
-                    border: none;
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                NavItem {{
-                    background: transparent;
-                    border-radius: 12px;
-                    border: none;
-                }}
-                NavItem:hover {{
-                    background: {Colors.rgba(Colors.PRIMARY, 0.15)};
-                }}
-            """)
-            self.icon_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_MUTED};
-                    font-size: 16px;
-                    background: transparent;
-                    border: none;
-                }}
-            """)
-            self.text_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_SECONDARY};
-                    font-size: 14px;
-                    font-weight: 500;
-                    background: transparent;
-                    border: none;
-                }}
-            """)
+        # Rule NavItem[active] (termasuk label di dalamnya) ada di ThemeEngine
+        ThemeEngine.set_state(self, "active", self._active, recursive=True)
     
     @property
     def active(self) -> bool:
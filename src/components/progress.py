@@ -3,12 +3,12 @@ Progress Components untuk Gaming Tool
 """
 from PyQt6.QtWidgets import (QProgressBar, QWidget, QVBoxLayout, QHBoxLayout, 
                               QLabel, QSizePolicy)
-from PyQt6.QtCore import Qt, pyqtProperty
-from PyQt6.QtGui import QPainter, QColor, QPen
+from PyQt6.QtCore import Qt, pyqtProperty, QRect, QEvent
+from PyQt6.QtGui import QPainter, QFont
 
 import sys
 sys.path.append('..')
-from src.theme import Colors
+from src.theme import Colors, PaintCache
 
 
 class GamingProgressBar(QWidget):
@@ -45,34 +45,12 @@ class GamingProgressBar(QWidget):
             self.percent_label = QLabel("0%")
             self.percent_label.setFixedWidth(45)
             self.percent_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.percent_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_PRIMARY};
-                    font-size: 13px;
-                    font-weight: 600;
-                    background: transparent;
-                    border: none;
-                }}
-            """)
+            self.percent_label.setObjectName("progressPercent")
             layout.addWidget(self.percent_label)
     
     def _apply_bar_style(self):
-        if self.variant == "accent":
-            chunk_bg = Colors.GRADIENT_ACCENT
-        else:
-            chunk_bg = Colors.GRADIENT_PRIMARY
-        
-        self.bar.setStyleSheet(f"""
-            QProgressBar {{
-                background: {Colors.SECONDARY_DARK};
-                border: none;
-                border-radius: 6px;
-            }}
-            QProgressBar::chunk {{
-                background: {chunk_bg};
-                border-radius: 6px;
-            }}
-        """)
+        # Rule chunk per variant ada di ThemeEngine
+        self.setProperty("variant", self.variant)
     
     def setValue(self, value: int):
         self._value = max(0, min(100, value))
@@ -92,6 +70,7 @@ class CircularProgress(QWidget):
         self._progress = 0
         self._size = size
         self._thickness = thickness
+        self._font = None
         self.setFixedSize(size, size)
     
     def _get_progress(self) -> int:
@@ -105,39 +84,45 @@ class CircularProgress(QWidget):
     
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
         rect = self.rect()
-        adjusted_rect = rect.adjusted(
-            self._thickness // 2 + 2, 
-            self._thickness // 2 + 2,
-            -self._thickness // 2 - 2, 
-            -self._thickness // 2 - 2
-        )
+        
+        # Ring (background + arc) di-cache per nilai progress
+        ring = PaintCache.pixmap("circular-progress", f"{self._progress}-t{self._thickness}",
+                                 self._size, self._size, self.devicePixelRatioF(),
+                                 self._render_ring)
+        painter.drawPixmap(0, 0, ring)
+        
+        # Text
+        painter.setPen(PaintCache.pen(Colors.TEXT_PRIMARY))
+        painter.setFont(self._text_font())
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, f"{self._progress}%")
+    
+    def _render_ring(self, painter: QPainter):
+        """Render ring ke pixmap cache"""
+        inset = self._thickness // 2 + 2
+        adjusted_rect = QRect(0, 0, self._size, self._size).adjusted(inset, inset, -inset, -inset)
         
         # Background circle
-        bg_pen = QPen(QColor(Colors.SECONDARY_DARK))
-        bg_pen.setWidth(self._thickness)
-        bg_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        painter.setPen(bg_pen)
+        painter.setPen(PaintCache.pen(Colors.SECONDARY_DARK, self._thickness, round_cap=True))
         painter.drawArc(adjusted_rect, 0, 360 * 16)
         
         # Progress arc
         if self._progress > 0:
-            progress_pen = QPen(QColor(Colors.ACCENT_LIGHT))
-            progress_pen.setWidth(self._thickness)
-            progress_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-            painter.setPen(progress_pen)
+            painter.setPen(PaintCache.pen(Colors.ACCENT_LIGHT, self._thickness, round_cap=True))
             span = int(-self._progress * 360 / 100 * 16)
             painter.drawArc(adjusted_rect, 90 * 16, span)
         
-        # Text
-        painter.setPen(QColor(Colors.TEXT_PRIMARY))
-        font = painter.font()
-        font.setPointSize(self._size // 5)
-        font.setBold(True)
-        painter.setFont(font)
-        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, f"{self._progress}%")
+    def _text_font(self) -> QFont:
+        if self._font is None:
+            self._font = QFont(self.font())
+            self._font.setPointSize(self._size // 5)
+            self._font.setBold(True)
+        return self._font
+    
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.FontChange:
+            self._font = None
+        super().changeEvent(event)
 
 
 class LabeledProgress(QWidget):
@@ -153,22 +138,18 @@ class LabeledProgress(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
         
-        if label:
-            label_widget = QLabel(label)
-            label_widget.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_SECONDARY};
-                    font-size: 12px;
-                    font-weight: 500;
-                    background: transparent;
-                    border: none;
-                }}
-            """)
-            layout.addWidget(label_widget)
+        self.label_widget = QLabel(label)
+        self.label_widget.setObjectName("progressLabel")
+        self.label_widget.setVisible(bool(label))
+        layout.addWidget(self.label_widget)
         
         self.progress = GamingProgressBar(variant=variant)
         layout.addWidget(self.progress)
     
+    def setLabel(self, text: str):
+        self.label_widget.setText(text)
+        self.label_widget.setVisible(bool(text))
+    
     def setValue(self, value: int):
         self.progress.setValue(value)
     
@@ -3,12 +3,12 @@ Switch Components untuk Gaming Tool
 Toggle switches dengan animasi
 """
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtProperty, pyqtSignal, QRectF
-from PyQt6.QtGui import QPainter, QColor, QBrush
+from PyQt6.QtCore import Qt, pyqtProperty, pyqtSignal, QRectF
+from PyQt6.QtGui import QPainter
 
 import sys
 sys.path.append('..')
-from src.theme import Colors
+from src.theme import Colors, PaintCache, AnimationClock
 
 
 class GamingSwitch(QWidget):
@@ -23,7 +23,6 @@ class GamingSwitch(QWidget):
         self.label_text = label
         
         self._setup_ui()
-        self._setup_animation()
         self.setCursor(Qt.CursorShape.PointingHandCursor)
     
     def _setup_ui(self):
@@ -33,7 +32,7 @@ class GamingSwitch(QWidget):
             layout.setSpacing(12)
             
             label = QLabel(self.label_text)
-            label.setStyleSheet(f"color: {Colors.TEXT_PRIMARY}; background: transparent;")
+            label.setObjectName("switchLabel")
             layout.addWidget(label)
             layout.addStretch()
             
@@ -41,51 +40,47 @@ class GamingSwitch(QWidget):
         else:
             self.setFixedSize(52, 28)
     
-    def _setup_animation(self):
-        self._anim = QPropertyAnimation(self, b"handlePosition")
-        self._anim.setDuration(150)
-        self._anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-    
     def _get_handle_position(self) -> int:
         return self._handle_position
     
     def _set_handle_position(self, value: int):
-        self._handle_position = value
+        self._handle_position = int(value)
         self.update()
     
     handlePosition = pyqtProperty(int, _get_handle_position, _set_handle_position)
     
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        dpr = self.devicePixelRatioF()
         
         # Calculate switch area
-        if self.label_text:
-            switch_x = self.width() - 52
-            switch_rect = QRectF(switch_x, 0, 52, 28)
-        else:
-            switch_rect = QRectF(0, 0, 52, 28)
+        switch_x = self.width() - 52 if self.label_text else 0
         
-        # Background
-        if self._checked:
-            painter.setBrush(QBrush(QColor(Colors.ACCENT)))
-        else:
-            painter.setBrush(QBrush(QColor(Colors.SECONDARY_LIGHT)))
+        # Track + handle di-cache, frame animasi cukup dua blit
+        state = "on" if self._checked else "off"
+        track = PaintCache.pixmap("switch-track", state, 52, 28, dpr,
+                                  lambda p: self._render_track(p, self._checked))
+        handle = PaintCache.pixmap("switch-handle", "normal", 20, 20, dpr, self._render_handle)
+        painter.drawPixmap(switch_x, 0, track)
+        painter.drawPixmap(switch_x + self._handle_position, 4, handle)
+    
+    @staticmethod
+    def _render_track(painter: QPainter, checked: bool):
+        painter.setBrush(PaintCache.brush(Colors.ACCENT if checked else Colors.SECONDARY_LIGHT))
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(switch_rect, 14, 14)
+        painter.drawRoundedRect(QRectF(0, 0, 52, 28), 14, 14)
         
-        # Handle
-        handle_x = switch_rect.x() + self._handle_position
-        handle_rect = QRectF(handle_x, 4, 20, 20)
-        painter.setBrush(QBrush(QColor(Colors.TEXT_PRIMARY)))
-        painter.drawEllipse(handle_rect)
+    @staticmethod
+    def _render_handle(painter: QPainter):
+        painter.setBrush(PaintCache.brush(Colors.TEXT_PRIMARY))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawEllipse(QRectF(0, 0, 20, 20))
     
     def mousePressEvent(self, event):
         self._checked = not self._checked
-        self._anim.stop()
-        self._anim.setStartValue(self._handle_position)
-        self._anim.setEndValue(28 if self._checked else 4)
-        self._anim.start()
+        AnimationClock.instance().animate(self, "handle", self._handle_position,
+                                          28 if self._checked else 4, 150,
+                                          self._set_handle_position)
         self.toggled.emit(self._checked)
     
     @property
@@ -94,5 +89,6 @@ class GamingSwitch(QWidget):
     
     def setChecked(self, checked: bool):
         self._checked = checked
+        AnimationClock.instance().stop(self, "handle")
         self._handle_position = 28 if checked else 4
         self.update()
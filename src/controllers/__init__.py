@@ -1,4 +1,5 @@
 # Controllers Module
 from .hotkey_controller import HotkeyController
+from .event_bridge import EngineEventBridge
 
-__all__ = ['HotkeyController']
+__all__ = ['HotkeyController', 'EngineEventBridge']
@@ -0,0 +1,104 @@
+"""
+Event Bridge - Event engine (hook / worker thread) -> UI (Qt thread)
+Engine cukup append ke deque (atomic di CPython, tidak pernah menunggu Qt).
+Qt thread menguras queue paling sering sekali per frame: trigger per binding
+digabung jadi hitungan, status hanya nilai terakhir yang di-emit.
+"""
+from collections import deque
+from typing import Callable, Dict, Optional
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+
+class EngineEventBridge(QObject):
+    """Queue engine -> UI yang di-drain dengan rate terbatas (~60 Hz)"""
+    
+    statusChanged = pyqtSignal(bool)  # Status terakhir dalam satu frame
+    bindingsTriggered = pyqtSignal(dict)  # {binding_id: jumlah trigger} per frame
+    
+    # Internal: bangunkan Qt thread (maksimal satu emit per frame)
+    _wake = pyqtSignal()
+    
+    FRAME_INTERVAL_MS = 16
+    
+    _STATUS = 0
+    _TRIGGER = 1
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._queue = deque()
+        self._wake_pending = False
+        self._poll_source: Optional[Callable[[], object]] = None
+        
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.FRAME_INTERVAL_MS)
+        self._timer.timeout.connect(self.drain)
+        # Emit dari thread lain -> queued ke thread bridge (Qt thread)
+        self._wake.connect(self._schedule)
+    
+    # ===================
+    # ENGINE SIDE (thread mana saja)
+    # ===================
+    
+    def post_status(self, active: bool):
+        self._queue.append((self._STATUS, active))
+        self._request_drain()
+    
+    def post_trigger(self, binding_id: str):
+        self._queue.append((self._TRIGGER, binding_id))
+        self._request_drain()
+    
+    def _request_drain(self):
+        # Race di flag ini aman: paling buruk satu wake ekstra
+        if not self._wake_pending:
+            self._wake_pending = True
+            self._wake.emit()
+    
+    # ===================
+    # UI SIDE (Qt thread)
+    # ===================
+    
+    def set_poll_source(self, poll: Optional[Callable[[], object]]):
+        """
+        Sumber event tanpa notifikasi (ring buffer engine process):
+        dipanggil tiap frame sebelum queue di-drain, timer jalan terus.
+        """
+        self._poll_source = poll
+        self._timer.setSingleShot(poll is None)
+        if poll is not None:
+            self._timer.start()
+    
+    def stop(self):
+        self._poll_source = None
+        self._timer.stop()
+        self._timer.setSingleShot(True)
+    
+    def _schedule(self):
+        if not self._timer.isActive():
+            self._timer.start()
+    
+    def drain(self):
+        """Emit semua event yang terkumpul sejak frame sebelumnya"""
+        if self._poll_source is not None:
+            self._poll_source()
+        
+        # Reset sebelum pop: event yang masuk selama drain membangunkan frame berikutnya
+        self._wake_pending = False
+        status = None
+        counts: Dict[str, int] = {}
+        queue = self._queue
+        while True:
+            try:
+                kind, value = queue.popleft()
+            except IndexError:
+                break
+            if kind == self._TRIGGER:
+                counts[value] = counts.get(value, 0) + 1
+            else:
+                status = value
+        
+        if status is not None:
+            self.statusChanged.emit(status)
+        if counts:
+            self.bindingsTriggered.emit(counts)
@@ -5,11 +5,32 @@ Mengelola state dan business logic untuk Hotkey Page
 import uuid
 import json
 import os
-import sys
-from typing import Optional, Callable, List
+import threading
+from contextlib import contextmanager
+from typing import Optional, Callable, Dict, List, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal
 
-from src.core.hotkey_manager import HotkeyManager, HotkeyBinding, KeyAction, ActionType
+from src.controllers.event_bridge import EngineEventBridge
+from src.core.models import HotkeyBinding, KeyAction, ActionType, Layer, ProfileRule
+from src.core.bulk_import import BulkImportResult, parse_files_parallel
+from src.core.persistence import (
+    default_data_dir, DATA_FILE_NAME, PROFILE_RULES_FILE_NAME, load_profile, save_profile,
+    read_profile_data, load_profile_rules, save_profile_rules
+)
+from src.core.startup_profiler import startup_profiler
+
+
+def parse_hotkey_file(filepath: str) -> HotkeyBinding:
+    """Parse & validasi satu file hotkey (aman dipanggil dari thread pool)"""
+    with open(filepath, 'r') as f:
+        data = json.load(f)
+    
+    # Basic Validation check
+    # Just check if critical keys exist
+    if not isinstance(data, dict) or not ("actions" in data or "trigger_keys" in data or "trigger_key" in data):
+        raise ValueError("Invalid format: Not a hotkey file")
+    
+    return HotkeyBinding.from_dict(data)
 
 
 class HotkeyController(QObject):
@@ -19,28 +40,197 @@ class HotkeyController(QObject):
     """
     
     # Signals untuk update UI
-    bindingsChanged = pyqtSignal()  # Emit saat list berubah
+    bindingsChanged = pyqtSignal()  # Emit saat list berubah (coarse, sekali per batch)
+    bindingAdded = pyqtSignal(str)  # Emit saat binding ditambah (binding_id)
+    bindingUpdated = pyqtSignal(str)  # Emit saat binding diubah/toggle (binding_id)
+    bindingRemoved = pyqtSignal(str)  # Emit saat binding dihapus (binding_id)
+    bindingsReset = pyqtSignal()  # Emit saat seluruh list harus dibaca ulang
     statusChanged = pyqtSignal(bool)  # Emit saat status aktif/nonaktif berubah
-    bindingTriggered = pyqtSignal(str)  # Emit saat binding dieksekusi (binding_id)
+    bindingTriggered = pyqtSignal(str)  # Emit saat binding dieksekusi (binding_id, sekali per frame)
+    bindingsTriggered = pyqtSignal(dict)  # Emit per frame: {binding_id: jumlah trigger}
     error = pyqtSignal(str)  # Emit saat terjadi error
     success = pyqtSignal(str)  # Emit saat operasi berhasil
+    importProgress = pyqtSignal(int, int)  # Emit progress bulk import (done, total)
+    bulkImportFinished = pyqtSignal(int, list)  # Emit saat bulk import selesai (imported, errors)
+    ready = pyqtSignal()  # Emit sekali saat data sudah di-load & hook terpasang
+    profileChanged = pyqtSignal(str)  # Emit saat profile aktif diganti otomatis (path data file)
+    presetActivated = pyqtSignal(str)  # Emit saat preset dipasang ke profile aktif (nama preset)
+    
+    # Internal: hasil parse dari worker thread -> diterapkan di Qt thread
+    _bulkParsed = pyqtSignal(object)
+    # Internal: background init selesai -> _finish_initialize di Qt thread
+    _initialized = pyqtSignal()
+    # Internal: window watcher (thread provider) -> profile cocok, diterapkan di Qt thread
+    _profileMatched = pyqtSignal(object)
+    # Internal: preset selesai di-compile di worker thread (nama, Preset.data)
+    _presetWarmed = pyqtSignal(str, object)
+    
+    # Jenis perubahan binding
+    CHANGE_ADDED = "added"
+    CHANGE_UPDATED = "updated"
+    CHANGE_REMOVED = "removed"
+    
+    # Batch dengan perubahan lebih dari ini di-collapse jadi satu bindingsReset
+    BATCH_RESET_THRESHOLD = 50
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, deferred: bool = False, data_file: Optional[str] = None,
+                 engine_process: bool = False, preset_store: str = "json"):
+        """
+        deferred=True: engine (pynput), load data & install hook ditunda sampai
+        initialize_async() / initialize() dipanggil - window bisa tampil duluan.
+        data_file: profile JSON lain selain default appdata (--profile).
+        engine_process=True: HotkeyManager jalan di child process (--engine-process).
+        preset_store: "json" (folder preset, PresetManager) atau "sqlite"
+        (SQLitePresetStore, --preset-store sqlite).
+        """
         super().__init__(parent)
         
-        # Core managers
-        self._hotkey_manager = HotkeyManager()
+        # Core managers (dibuat saat initialize)
+        self._hotkey_manager = None
+        self._ready = False
+        self._init_thread: Optional[threading.Thread] = None
+        self._init_result = None  # (manager, error) atau exception dari worker
+        self._engine_process = engine_process
+        self._initialized.connect(self._finish_initialize)
+        
+        # Event engine (hook / worker thread) -> Qt thread, di-drain per frame
+        self._events = EngineEventBridge(self)
+        self._events.statusChanged.connect(self.statusChanged)
+        self._events.bindingsTriggered.connect(self._on_bindings_triggered)
+        
+        # Change batching
+        self._batch_depth = 0
+        self._pending_changes: Dict[str, str] = {}  # binding_id -> jenis perubahan
+        self._pending_reset = False
         
         # Persistence Setup
         self._init_data_file()
-        self._load_data()
+        if data_file:
+            self.data_file = os.path.abspath(data_file)
+        self.home_data_file = self.data_file  # Profile saat tidak ada rule yang cocok
+        
+        # Auto-switch profile per aplikasi
+        self._watcher = None
+        self._profile_rules: List[ProfileRule] = []
+        self._warm_keys = set()
+        self._profileMatched.connect(self._on_profile_matched)
+        
+        # Preset (store dibuat saat pertama dipakai)
+        self._preset_store = preset_store
+        self._preset_manager = None
+        self._pending_preset: Optional[str] = None
+        self._presetWarmed.connect(self._on_preset_warmed)
+        
+        # Bulk import
+        self._bulk_import_thread = None
+        self._bulkParsed.connect(self._apply_bulk_import)
+        
+        if not deferred:
+            self.initialize()
+    
+    # ==================
+    # INITIALIZATION
+    # ==================
+    
+    @property
+    def is_ready(self) -> bool:
+        """Data sudah di-load dan hook sudah terpasang"""
+        return self._ready
+    
+    def initialize(self):
+        """Load data + install hook secara sinkron (tunggu background init jika sedang jalan)"""
+        if self._ready:
+            return
+        if self._init_thread is not None:
+            self._init_thread.join()
+        else:
+            self._init_result = self._build_manager()
+        self._finish_initialize()
+    
+    def initialize_async(self):
+        """Load data + install hook di background thread, emit ready setelah selesai"""
+        if self._ready or self._init_thread is not None:
+            return
+        
+        def run():
+            try:
+                self._init_result = self._build_manager()
+            except Exception as e:
+                # Diteruskan ke Qt thread (sama seperti gagal init sinkron)
+                self._init_result = e
+            self._initialized.emit()
+        
+        self._init_thread = threading.Thread(target=run, name="startup", daemon=True)
+        self._init_thread.start()
+    
+    def _build_manager(self) -> Tuple[object, Optional[str]]:
+        """Import engine, load data file, start listeners (aman di worker thread)"""
+        startup_profiler.start_stage()
+        if self._engine_process:
+            from src.core.engine_process import EngineProcess
+            manager = EngineProcess()
+            manager.launch()
+            startup_profiler.mark("spawn engine process")
+        else:
+            from src.core.hotkey_manager import HotkeyManager
+            startup_profiler.mark("import engine (pynput)")
+            manager = HotkeyManager()
+        
+        error = self._load_data(manager)
+        startup_profiler.mark("load data file")
         
         # Start background listeners (for global toggles)
-        self._hotkey_manager.start_listeners()
+        try:
+            manager.start_listeners()
+        except Exception as e:
+            print(f"[ERROR] Starting input hooks failed: {e}")
+            error = error or f"Failed to start input hooks: {str(e)}"
+        startup_profiler.mark("install input hooks")
+        return manager, error
+    
+    def _finish_initialize(self):
+        """Pasang manager hasil init di Qt thread, lalu emit ready"""
+        if self._ready or self._init_result is None:
+            return
+        result, self._init_result = self._init_result, None
+        if isinstance(result, Exception):
+            raise result
+        manager, error = result
+        self._hotkey_manager = manager
         
         # Connect core callbacks to signals
-        self._hotkey_manager.on_status_changed = self._on_status_changed
-        self._hotkey_manager.on_binding_triggered = self._on_binding_triggered
+        manager.on_status_changed = self._on_status_changed
+        manager.on_binding_triggered = self._on_binding_triggered
+        
+        # Engine process: ring buffer shared memory dibaca tiap frame
+        if self._engine_process:
+            self._events.set_poll_source(manager.dispatch_events)
+        
+        self._ready = True
+        manager.set_current_profile(self.data_file)
+        self._load_profile_rules()
+        self._notify_reset()
+        self.ready.emit()
+        if error:
+            self.error.emit(error)
+    
+    def shutdown(self):
+        """Lepas hook & hentikan engine (dipanggil saat window ditutup)"""
+        self._events.stop()
+        if self._watcher is not None:
+            self._watcher.stop()
+        if self._preset_store == "sqlite" and self._preset_manager is not None:
+            self._preset_manager.close()
+        if self._ready:
+            try:
+                self._hotkey_manager.shutdown()
+            except Exception as e:
+                print(f"[ERROR] Engine shutdown failed: {e}")
+    
+    def _ensure_ready(self):
+        """Operasi yang butuh engine sebelum ready -> selesaikan init secara sinkron"""
+        if not self._ready:
+            self.initialize()
     
     # ==================
     # PROPERTIES
@@ -49,24 +239,30 @@ class HotkeyController(QObject):
     @property
     def is_active(self) -> bool:
         """Apakah hotkey system sedang aktif"""
-        return self._hotkey_manager.is_active
+        return self._ready and self._hotkey_manager.is_active
     
     @property
     def bindings(self) -> List[HotkeyBinding]:
-        """Get list of active bindings"""
-        return self._hotkey_manager.bindings
+        """Get list of active bindings (kosong sebelum ready)"""
+        return self._hotkey_manager.bindings if self._ready else []
     
     @property
     def binding_count(self) -> int:
         """Jumlah binding aktif"""
         return len(self.bindings)
         
+    @property
+    def layers(self) -> List[Layer]:
+        """Definisi layer keymap (kosong sebelum ready)"""
+        return self._hotkey_manager.layers if self._ready else []
+    
     # ==================
     # CORE OPERATIONS
     # ==================
     
     def toggle_active(self):
         """Toggle global status start/stop"""
+        self._ensure_ready()
         if self.is_active:
             self.stop()
         else:
@@ -74,6 +270,7 @@ class HotkeyController(QObject):
     
     def start(self):
         """Start hotkey system"""
+        self._ensure_ready()
         try:
             self._hotkey_manager.start()
         except Exception as e:
@@ -81,6 +278,7 @@ class HotkeyController(QObject):
             
     def stop(self):
         """Stop hotkey system"""
+        self._ensure_ready()
         try:
             self._hotkey_manager.stop()
         except Exception as e:
@@ -88,8 +286,12 @@ class HotkeyController(QObject):
 
     def add_binding(self, name: str, trigger_keys: List[str], 
                    actions: List[KeyAction], repeat: bool = False, 
-                   repeat_delay: int = 100, block_input: bool = False) -> Optional[str]:
+                   repeat_delay: int = 100, block_input: bool = False,
+                   hotstring_erase: bool = False,
+                   trigger_mode: str = "press", hold_ms: int = 250,
+                   layer: str = "") -> Optional[str]:
         """Tambah binding baru"""
+        self._ensure_ready()
         try:
             binding_id = str(uuid.uuid4())
             binding = HotkeyBinding(
@@ -100,11 +302,15 @@ class HotkeyController(QObject):
                 enabled=True,
                 repeat=repeat,
                 repeat_delay=repeat_delay,
-                block_input=block_input
+                block_input=block_input,
+                hotstring_erase=hotstring_erase,
+                trigger_mode=trigger_mode,
+                hold_ms=hold_ms,
+                layer=layer
             )
             
             if self._hotkey_manager.add_binding(binding):
-                self.bindingsChanged.emit()
+                self._notify_change(self.CHANGE_ADDED, binding.id)
                 self._save_data()
                 return binding.id
             else:
@@ -116,8 +322,12 @@ class HotkeyController(QObject):
     
     def update_binding(self, binding_id: str, name: str, trigger_keys: List[str], 
                        actions: List[KeyAction], repeat: bool = False, 
-                       repeat_delay: int = 100, block_input: bool = False) -> bool:
+                       repeat_delay: int = 100, block_input: bool = False,
+                       hotstring_erase: bool = False,
+                       trigger_mode: str = "press", hold_ms: int = 250,
+                       layer: str = "") -> bool:
         """Update binding yang ada"""
+        self._ensure_ready()
         try:
             binding = HotkeyBinding(
                 id=binding_id,
@@ -127,11 +337,15 @@ class HotkeyController(QObject):
                 enabled=True,
                 repeat=repeat,
                 repeat_delay=repeat_delay,
-                block_input=block_input
+                block_input=block_input,
+                hotstring_erase=hotstring_erase,
+                trigger_mode=trigger_mode,
+                hold_ms=hold_ms,
+                layer=layer
             )
             
             self._hotkey_manager.update_binding(binding)
-            self.bindingsChanged.emit()
+            self._notify_change(self.CHANGE_UPDATED, binding_id)
             self._save_data()
             return True
         except Exception as e:
@@ -140,9 +354,10 @@ class HotkeyController(QObject):
     
     def remove_binding(self, binding_id: str) -> bool:
         """Hapus binding"""
+        self._ensure_ready()
         try:
             self._hotkey_manager.remove_binding(binding_id)
-            self.bindingsChanged.emit()
+            self._notify_change(self.CHANGE_REMOVED, binding_id)
             self._save_data()
             return True
         except Exception as e:
@@ -151,21 +366,30 @@ class HotkeyController(QObject):
     
     def get_binding(self, binding_id: str) -> Optional[HotkeyBinding]:
         """Get binding by ID"""
-        return self._hotkey_manager.get_binding(binding_id)
+        return self._hotkey_manager.get_binding(binding_id) if self._ready else None
     
     def toggle_binding(self, binding_id: str, enabled: bool):
         """Toggle enabled/disabled pada binding tertentu"""
+        self._ensure_ready()
         self._hotkey_manager.toggle_binding(binding_id, enabled)
+        self._notify_change(self.CHANGE_UPDATED, binding_id)
         self._save_data()
     
     def set_master_triggers(self, keys: List[str]):
         """Set keys untuk global toggle"""
+        self._ensure_ready()
         self._hotkey_manager.set_master_triggers(keys)
         self._save_data()
+    
+    def set_layers(self, layers: List[Layer]):
+        """Set definisi layer (nama + hold/toggle keys)"""
+        self._ensure_ready()
+        self._hotkey_manager.set_layers(layers)
+        self._save_data()
         
     @property
     def master_triggers(self) -> List[str]:
-        return self._hotkey_manager.master_trigger_keys
+        return self._hotkey_manager.master_trigger_keys if self._ready else []
     
     # ==================
     # IMPORT / EXPORT OPERATIONS (Per Item)
@@ -190,75 +414,340 @@ class HotkeyController(QObject):
             
     def import_hotkey(self, filepath: str) -> bool:
         """Import single hotkey from file and add to list"""
+        self._ensure_ready()
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            # Import as new binding
+            binding = parse_hotkey_file(filepath)
             
-            # Basic Validation check
-            # Just check if critical keys exist
-            if "actions" in data or "trigger_keys" in data or "trigger_key" in data:
-                # Import as new binding
-                binding = HotkeyBinding.from_dict(data)
-                
-                # Prevent duplicate ID
-                if self.get_binding(binding.id):
-                    binding.id = str(uuid.uuid4())
-                    binding.name = f"{binding.name} (Imported)"
+            # Prevent duplicate ID
+            if self.get_binding(binding.id):
+                binding.id = str(uuid.uuid4())
+                binding.name = f"{binding.name} (Imported)"
                 
-                self._hotkey_manager.add_binding(binding)
-                self.bindingsChanged.emit()
-                self._save_data()
-                self.success.emit(f"Hotkey '{binding.name}' imported!")
-                return True
-            else:
-                 raise ValueError("Invalid format: Not a hotkey file")
+            self._hotkey_manager.add_binding(binding)
+            self._notify_change(self.CHANGE_ADDED, binding.id)
+            self._save_data()
+            self.success.emit(f"Hotkey '{binding.name}' imported!")
+            return True
             
         except Exception as e:
             self.error.emit(f"Failed to import hotkey: {str(e)}")
             return False
     
+    def import_hotkeys(self, filepaths: List[str]) -> bool:
+        """
+        Bulk import banyak file hotkey.
+        Parse & validasi jalan di thread pool (background), progress dilaporkan
+        lewat importProgress. Hasil diterapkan sekali: satu rebuild index,
+        satu save, dan satu batch notifikasi. Selesai -> bulkImportFinished.
+        """
+        if self._bulk_import_thread and self._bulk_import_thread.is_alive():
+            self.error.emit("Another import is still running.")
+            return False
+        
+        filepaths = list(filepaths)
+        
+        def run():
+            result = parse_files_parallel(filepaths, parse_hotkey_file, self.importProgress.emit)
+            self._bulkParsed.emit(result)
+        
+        self.importProgress.emit(0, len(filepaths))
+        self._bulk_import_thread = threading.Thread(target=run, daemon=True)
+        self._bulk_import_thread.start()
+        return True
+    
+    def _apply_bulk_import(self, result: BulkImportResult):
+        """Terapkan hasil bulk import dalam satu transaksi (Qt thread)"""
+        self._ensure_ready()
+        existing_ids = {b.id for b in self.bindings}
+        bindings = []
+        for _, binding in result.items:
+            # Prevent duplicate ID (dengan list lama maupun sesama file import)
+            if binding.id in existing_ids:
+                binding.id = str(uuid.uuid4())
+                binding.name = f"{binding.name} (Imported)"
+            existing_ids.add(binding.id)
+            bindings.append(binding)
+        
+        if bindings:
+            try:
+                self._hotkey_manager.add_bindings(bindings)
+                with self.batch_updates():
+                    for binding in bindings:
+                        self._notify_change(self.CHANGE_ADDED, binding.id)
+                self._save_data()
+            except Exception as e:
+                self.error.emit(f"Failed to import hotkeys: {str(e)}")
+                bindings = []
+        
+        self.bulkImportFinished.emit(len(bindings), result.error_messages())
+    
+    # ==================
+    # CHANGE NOTIFICATION
+    # ==================
+    
+    @contextmanager
+    def batch_updates(self):
+        """
+        Kumpulkan notifikasi perubahan dan emit sekali di akhir block (boleh nested).
+        Perubahan untuk id yang sama digabung; burst besar jadi satu bindingsReset.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_changes()
+    
+    def _notify_change(self, kind: str, binding_id: str):
+        """Catat perubahan satu binding (langsung emit jika tidak sedang batch)"""
+        previous = self._pending_changes.get(binding_id)
+        if previous is None:
+            self._pending_changes[binding_id] = kind
+        elif previous == self.CHANGE_ADDED:
+            # added + updated = added, added + removed = tidak ada perubahan
+            if kind == self.CHANGE_REMOVED:
+                del self._pending_changes[binding_id]
+        elif previous == self.CHANGE_UPDATED:
+            self._pending_changes[binding_id] = kind
+        else:
+            # removed lalu added lagi -> posisi berubah, lebih aman reset
+            self._pending_reset = True
+        
+        if self._batch_depth == 0:
+            self._flush_changes()
+    
+    def _notify_reset(self):
+        """Seluruh list berubah (load, import besar, dll)"""
+        self._pending_reset = True
+        if self._batch_depth == 0:
+            self._flush_changes()
+    
+    def _flush_changes(self):
+        """Emit semua perubahan yang tertunda"""
+        changes, reset = self._pending_changes, self._pending_reset
+        self._pending_changes = {}
+        self._pending_reset = False
+        if not changes and not reset:
+            return
+        
+        if reset or len(changes) > self.BATCH_RESET_THRESHOLD:
+            self.bindingsReset.emit()
+        else:
+            signals = {
+                self.CHANGE_ADDED: self.bindingAdded,
+                self.CHANGE_UPDATED: self.bindingUpdated,
+                self.CHANGE_REMOVED: self.bindingRemoved,
+            }
+            for binding_id, kind in changes.items():
+                signals[kind].emit(binding_id)
+        self.bindingsChanged.emit()
+    
+    # ==================
+    # PROFILE AUTO-SWITCH
+    # ==================
+    
+    @property
+    def profile_rules(self) -> List[ProfileRule]:
+        return list(self._profile_rules)
+    
+    @property
+    def active_profile(self) -> str:
+        """Path data file profile yang sedang dipasang"""
+        return self.data_file
+    
+    def set_profile_rules(self, rules: List[ProfileRule]):
+        """Simpan rule proses/window -> profile dan terapkan ke watcher"""
+        self._ensure_ready()
+        self._profile_rules = list(rules)
+        try:
+            save_profile_rules(self.rules_file, [r.to_dict() for r in self._profile_rules])
+        except Exception as e:
+            print(f"[ERROR] Saving profile rules failed: {e}")
+            self.error.emit(f"Failed to save profile rules: {str(e)}")
+        self._apply_profile_rules()
+    
+    def _load_profile_rules(self):
+        try:
+            self._profile_rules = [ProfileRule.from_dict(d) for d in load_profile_rules(self.rules_file)]
+        except Exception as e:
+            print(f"[ERROR] Loading profile rules failed: {e}")
+            self._profile_rules = []
+        self._apply_profile_rules()
+    
+    def _apply_profile_rules(self):
+        """Warm semua profile yang di-map (background), lalu jalankan / hentikan watcher"""
+        paths = {os.path.abspath(rule.profile) for rule in self._profile_rules}
+        if paths:
+            paths.add(self.home_data_file)
+        for stale in self._warm_keys - paths:
+            self._hotkey_manager.drop_profile(stale)
+        self._warm_keys = paths
+        if paths:
+            threading.Thread(target=self._warm_profiles, args=(sorted(paths),),
+                             name="profile-warm", daemon=True).start()
+        
+        if not self._profile_rules:
+            if self._watcher is not None:
+                self._watcher.stop()
+            self._on_profile_matched(None)
+            return
+        if self._watcher is None:
+            from src.core.window_watcher import WindowWatcher, default_provider
+            self._watcher = WindowWatcher(default_provider(), self._profileMatched.emit)
+            print(f"[DEBUG] Profile watcher: {type(self._watcher.provider).__name__}")
+        self._watcher.set_rules(self._profile_rules)
+        self._watcher.start()
+    
+    def _warm_profiles(self, paths: List[str]):
+        """Worker thread: baca + compile profile supaya switch cukup swap"""
+        for path in paths:
+            if path == self.data_file:
+                continue  # Sudah terpasang (versi terbaru ada di engine)
+            try:
+                self._hotkey_manager.warm_profile(path, read_profile_data(path))
+            except Exception as e:
+                print(f"[ERROR] Warming profile {path} failed: {e}")
+    
+    def _on_profile_matched(self, profile: Optional[str]):
+        """Qt thread: pasang profile untuk window aktif (None = profile default)"""
+        target = os.path.abspath(profile) if profile else self.home_data_file
+        if target == self.data_file or not self._ready:
+            return
+        manager = self._hotkey_manager
+        try:
+            if not manager.activate_profile(target):
+                # Belum sempat di-warm: compile sekarang (tetap tanpa stop / restart hook)
+                manager.warm_profile(target, read_profile_data(target))
+                manager.activate_profile(target)
+        except Exception as e:
+            print(f"[ERROR] Switching profile failed: {e}")
+            self.error.emit(f"Failed to switch profile: {str(e)}")
+            return
+        
+        self.data_file = target
+        print(f"[DEBUG] Auto-switched profile -> {target}")
+        self._notify_reset()
+        self.profileChanged.emit(target)
+    
+    # ==================
+    # PRESETS
+    # ==================
+    
+    @property
+    def preset_manager(self):
+        """PresetManager atau SQLitePresetStore (API sama, + search & paging)"""
+        if self._preset_manager is None:
+            if self._preset_store == "sqlite":
+                from src.core.preset_store import SQLitePresetStore
+                store = SQLitePresetStore()
+                # One-shot: preset JSON lama dipindah ke database (marker di tabel meta)
+                store.migrate_from_directory()
+                self._preset_manager = store
+            else:
+                from src.core.preset_manager import PresetManager
+                self._preset_manager = PresetManager()
+        return self._preset_manager
+    
+    def save_preset(self, name: str, description: str = "", tags: List[str] = None):
+        """Simpan bindings + master keys profile aktif sebagai preset"""
+        self._ensure_ready()
+        data = self._hotkey_manager.to_dict()
+        data["master_trigger_keys"] = list(self._hotkey_manager.master_trigger_keys)
+        preset = self.preset_manager.save_preset(name, description, data, tags)
+        # Versi standby lama sudah basi
+        self._hotkey_manager.drop_preset(name)
+        return preset
+    
+    def delete_preset(self, name: str) -> bool:
+        self._ensure_ready()
+        self._hotkey_manager.drop_preset(name)
+        return self.preset_manager.delete_preset(name)
+    
+    def activate_preset(self, name: str) -> bool:
+        """
+        Pasang preset ke profile aktif tanpa stop() / restart hook.
+        Preset standby (LRU) langsung di-swap; jika belum ada, dikompilasi di
+        background (hook tetap jalan dengan index lama) lalu di-swap (presetActivated).
+        Isi preset hanya dibaca di worker thread, bukan di Qt thread.
+        """
+        self._ensure_ready()
+        info = self.preset_manager.get_preset_info(name)
+        if info is None:
+            self.error.emit(f"Preset '{name}' not found")
+            return False
+        if self._hotkey_manager.is_preset_warm(name) and self._hotkey_manager.activate_preset(name):
+            self._pending_preset = None
+            self._finish_preset(name, info)
+        else:
+            self._pending_preset = name
+            self._warm_preset_async(name, info)
+        return True
+    
+    def _warm_preset_async(self, name: str, info):
+        def run():
+            try:
+                preset = self.preset_manager.load_preset(info)
+                if preset is None:
+                    print(f"[ERROR] Loading preset {name} failed")
+                    return
+                self._hotkey_manager.warm_preset(name, preset.data)
+            except Exception as e:
+                print(f"[ERROR] Compiling preset {name} failed: {e}")
+                return
+            self._presetWarmed.emit(name, info)
+        
+        threading.Thread(target=run, name="preset-compile", daemon=True).start()
+    
+    def _on_preset_warmed(self, name: str, info):
+        """Qt thread: compile selesai -> swap jika preset ini masih yang diminta"""
+        if name != self._pending_preset:
+            return
+        self._pending_preset = None
+        if self._hotkey_manager.activate_preset(name):
+            self._finish_preset(name, info)
+    
+    def _finish_preset(self, name: str, info):
+        self._save_data()
+        self._notify_reset()
+        self.presetActivated.emit(name)
+        self.success.emit(f"Preset '{name}' activated")
+        # Standby diisi ulang (body dibaca di worker) supaya switch berikutnya tetap instan
+        self._warm_preset_async(name, info)
+    
     # ==================
     # PERSISTENCE
     # ==================
     
     def _init_data_file(self):
         """Initialize data file path in appdata folder"""
-        if getattr(sys, 'frozen', False):
-            # If EXE, use folder of executable
-            base_path = os.path.dirname(sys.executable)
-        else:
-            # If DEV, use project root (assuming main.py is in root)
-            # Current file: src/controllers/hotkey_controller.py
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            base_path = os.path.abspath(os.path.join(current_dir, "..", ".."))
-            
-        self.app_data_dir = os.path.join(base_path, "appdata")
+        self.app_data_dir = default_data_dir()
         os.makedirs(self.app_data_dir, exist_ok=True)
-        self.data_file = os.path.join(self.app_data_dir, "tobelsoft_macro_data.json")
+        self.data_file = os.path.join(self.app_data_dir, DATA_FILE_NAME)
+        self.rules_file = os.path.join(self.app_data_dir, PROFILE_RULES_FILE_NAME)
         print(f"[DEBUG] Data file path: {self.data_file}")
 
-    def _load_data(self):
-        """Load data from JSON file"""
+    def _load_data(self, manager) -> Optional[str]:
+        """
+        Load data from JSON file ke manager (boleh dari worker thread, tanpa emit).
+        Return pesan error atau None.
+        """
         if os.path.exists(self.data_file):
             try:
                 print(f"[DEBUG] Loading data from {self.data_file}")
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    self._hotkey_manager.from_dict(data)
-                    self._hotkey_manager.set_master_triggers(data.get("master_trigger_keys", []))
-                self.bindingsChanged.emit()
+                # Listener belum jalan -> tidak perlu restart service (hemat sleep 100 ms)
+                load_profile(manager, self.data_file)
             except Exception as e:
                 print(f"[ERROR] Loading data failed: {e}")
-                self.error.emit(f"Failed to load data: {str(e)}")
+                return f"Failed to load data: {str(e)}"
+        return None
 
     def _save_data(self):
         """Save data to JSON file"""
         try:
             print(f"[DEBUG] Saving data to {self.data_file}")
-            data = self._hotkey_manager.to_dict()
-            data["master_trigger_keys"] = self._hotkey_manager.master_trigger_keys
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=4)
+            save_profile(self._hotkey_manager, self.data_file)
         except Exception as e:
             print(f"[ERROR] Saving data failed: {e}")
             self.error.emit(f"Failed to save data: {str(e)}")
@@ -268,12 +757,18 @@ class HotkeyController(QObject):
     # ==================
     
     def _on_status_changed(self, active: bool):
-        """Callback dari HotkeyManager"""
-        self.statusChanged.emit(active)
+        """Callback dari HotkeyManager (thread engine) - hanya antri, tidak emit"""
+        self._events.post_status(active)
     
     def _on_binding_triggered(self, binding: HotkeyBinding):
-        """Callback saat binding dieksekusi"""
-        self.bindingTriggered.emit(binding.id)
+        """Callback saat binding dieksekusi (worker thread) - hanya antri"""
+        self._events.post_trigger(binding.id)
+    
+    def _on_bindings_triggered(self, counts: Dict[str, int]):
+        """Trigger yang sudah digabung per frame (Qt thread)"""
+        self.bindingsTriggered.emit(counts)
+        for binding_id in counts:
+            self.bindingTriggered.emit(binding_id)
     
     # ==================
     # HELPER METHODS
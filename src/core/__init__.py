@@ -1,10 +1,34 @@
 # Core Module
-from .hotkey_manager import HotkeyManager, HotkeyBinding, KeyAction, ActionType
-from .preset_manager import PresetManager
-from .input_capture import UnifiedInputCapture, CapturedInput, InputType
-
-__all__ = [
-    'HotkeyManager', 'HotkeyBinding', 'KeyAction', 'ActionType',
-    'PresetManager',
-    'UnifiedInputCapture', 'CapturedInput', 'InputType'
-]
+# Lazy exports: submodule (dan pynput) baru di-import saat nama pertama kali diakses,
+# supaya "from src.core.models import ..." tidak ikut memuat hook/engine.
+import importlib
+
+_EXPORTS = {
+    'HotkeyManager': '.hotkey_manager',
+    'HotkeyBinding': '.models',
+    'KeyAction': '.models',
+    'ActionType': '.models',
+    'PresetManager': '.preset_manager',
+    'Preset': '.preset_manager',
+    'PresetInfo': '.preset_manager',
+    'SQLitePresetStore': '.preset_store',
+    'MacroRecorder': '.macro_recorder',
+    'UnifiedInputCapture': '.input_capture',
+    'CapturedInput': '.input_capture',
+    'InputType': '.input_capture',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,193 @@
+"""
+Action Optimizer - Peephole pass untuk action list binding
+
+Action list dari editor / recorder dijabarkan jadi langkah primitif
+(key event, sleep, click, action lain) lalu dirapikan sekali saat binding
+di-index (bukan per eksekusi):
+  - action tanpa efek dibuang (DELAY 0, key kosong, KEY_DOWN/UP mouse, teks kosong)
+  - sleep berurutan digabung jadi satu (DELAY + DELAY, jeda antar key + DELAY)
+  - jeda kecil dihapus (jeda implisit 1 ms antar key KEY_PRESS / KEY_SEQUENCE,
+    DELAY kecil) selama total yang dihapus per program <= tolerance_ms: event
+    mana pun bergeser paling banyak tolerance_ms dari jadwal aslinya.
+    Durasi tahan KEY_PRESS / KEY_HOLD tidak pernah dipangkas.
+  - run key down/up tanpa jeda dikirim sekaligus (satu SendInput);
+    KEY_DOWN langsung diikuti KEY_UP key yang sama jadi tap dalam satu batch
+"""
+from typing import List
+
+from src.core.models import ActionType, KeyAction
+
+DEFAULT_TOLERANCE_MS = 1.0
+
+# Jenis langkah program
+STEP_KEYS = 0  # payload: tuple (key, is_key_up), dikirim sekaligus
+STEP_SLEEP = 1  # payload: detik
+STEP_CLICK = 2  # payload: key mouse_* dari KEY_PRESS / KEY_SEQUENCE
+STEP_ACTION = 3  # payload: KeyAction (MOUSE_MOVE / TYPE_TEXT, pakai plan masing-masing)
+
+
+class OptimizerStats:
+    """Hasil optimasi (per program, atau dijumlah untuk seluruh bindings)"""
+    
+    __slots__ = ("actions", "ops_before", "ops_after", "noops_dropped",
+                 "delays_merged", "gaps_elided", "taps_folded", "wall_ms_saved")
+    
+    def __init__(self):
+        self.actions = 0
+        self.ops_before = 0  # Call input / sleep tanpa optimasi
+        self.ops_after = 0
+        self.noops_dropped = 0
+        self.delays_merged = 0
+        self.gaps_elided = 0
+        self.taps_folded = 0
+        self.wall_ms_saved = 0.0  # Total sleep yang dihapus (nominal, per eksekusi)
+    
+    def add(self, other: "OptimizerStats"):
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+    
+    def snapshot(self) -> dict:
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["ops_saved"] = self.ops_before - self.ops_after
+        return data
+
+
+def _keys(action: KeyAction) -> List[str]:
+    return [key.lower().strip() for key in action.keys]
+
+
+class ActionProgram:
+    """Action list binding yang sudah dioptimasi"""
+    
+    __slots__ = ("actions", "steps", "stats")
+    
+    def __init__(self, actions: List[KeyAction], tolerance_ms: float,
+                 press_ms: float, inter_key_ms: float):
+        self.actions = actions
+        self.stats = OptimizerStats()
+        self.stats.actions = len(actions)
+        steps = self._expand(actions, press_ms, inter_key_ms)
+        steps = self._merge_sleeps(steps)
+        steps = self._elide_gaps(steps, tolerance_ms)
+        steps = self._merge_keys(steps)
+        self.steps = [(kind, payload / 1000.0 if kind == STEP_SLEEP else payload)
+                      for kind, payload, _ in steps]
+        self.stats.ops_after = len(self.steps)
+    
+    def _expand(self, actions: List[KeyAction], press_ms: float, inter_key_ms: float) -> list:
+        """
+        Action -> langkah [kind, payload, hard] persis seperti eksekusi lama.
+        hard = sleep yang tidak boleh dihapus (durasi tahan key).
+        """
+        stats = self.stats
+        steps = []
+        for action in actions:
+            kind = action.action_type
+            if kind in (ActionType.KEY_PRESS, ActionType.KEY_SEQUENCE):
+                for key in _keys(action):
+                    if not key:
+                        stats.ops_before += 1
+                        stats.noops_dropped += 1
+                    elif 'mouse_' in key:
+                        stats.ops_before += 1
+                        steps.append([STEP_CLICK, key, True])
+                    else:
+                        stats.ops_before += 3
+                        steps.append([STEP_KEYS, ((key, False),), True])
+                        steps.append([STEP_SLEEP, press_ms, True])
+                        steps.append([STEP_KEYS, ((key, True),), True])
+                    stats.ops_before += 1
+                    steps.append([STEP_SLEEP, inter_key_ms, False])
+            elif kind in (ActionType.KEY_DOWN, ActionType.KEY_UP):
+                up = kind == ActionType.KEY_UP
+                for key in _keys(action):
+                    stats.ops_before += 1
+                    if not key or 'mouse_' in key:
+                        stats.noops_dropped += 1
+                    else:
+                        steps.append([STEP_KEYS, ((key, up),), True])
+            elif kind == ActionType.KEY_HOLD:
+                if not action.keys:
+                    stats.ops_before += 1
+                    stats.noops_dropped += 1
+                    continue
+                key = _keys(action)[0]
+                # Key kosong / mouse: down & up tidak mengirim apa pun, durasinya tetap ditunggu
+                sends = bool(key) and 'mouse_' not in key
+                stats.ops_before += 3
+                if sends:
+                    steps.append([STEP_KEYS, ((key, False),), True])
+                else:
+                    stats.noops_dropped += 2
+                steps.append([STEP_SLEEP, max(action.duration, 0), True])
+                if sends:
+                    steps.append([STEP_KEYS, ((key, True),), True])
+            elif kind == ActionType.DELAY:
+                stats.ops_before += 1
+                steps.append([STEP_SLEEP, max(action.duration, 0), False])
+            elif kind == ActionType.MOUSE_MOVE:
+                stats.ops_before += 1
+                if not action.absolute and not action.x and not action.y and action.duration <= 0:
+                    stats.noops_dropped += 1
+                else:
+                    steps.append([STEP_ACTION, action, True])
+            elif kind == ActionType.TYPE_TEXT:
+                stats.ops_before += 1
+                if not action.text:
+                    stats.noops_dropped += 1
+                else:
+                    steps.append([STEP_ACTION, action, True])
+        return steps
+    
+    def _merge_sleeps(self, steps: list) -> list:
+        """Sleep berurutan -> satu sleep; sleep 0 dibuang"""
+        out = []
+        for step in steps:
+            if step[0] == STEP_SLEEP:
+                if step[1] <= 0:
+                    self.stats.noops_dropped += 1
+                    continue
+                if out and out[-1][0] == STEP_SLEEP:
+                    out[-1][1] += step[1]
+                    out[-1][2] = out[-1][2] or step[2]
+                    self.stats.delays_merged += 1
+                    continue
+            out.append(list(step))
+        return out
+    
+    def _elide_gaps(self, steps: list, tolerance_ms: float) -> list:
+        """Hapus jeda non-hard selama total jeda yang dihapus masih <= tolerance (budget per program)"""
+        out = []
+        elided = 0.0
+        for step in steps:
+            if step[0] == STEP_SLEEP and not step[2] and elided + step[1] <= tolerance_ms:
+                elided += step[1]
+                self.stats.gaps_elided += 1
+                self.stats.wall_ms_saved += step[1]
+                continue
+            out.append(step)
+        return out
+    
+    def _merge_keys(self, steps: list) -> list:
+        """Run key event tanpa jeda -> satu batch"""
+        out = []
+        for step in steps:
+            if step[0] == STEP_KEYS and out and out[-1][0] == STEP_KEYS:
+                out[-1][1] = out[-1][1] + step[1]
+                continue
+            out.append(step)
+        for step in out:
+            if step[0] != STEP_KEYS:
+                continue
+            events = step[1]
+            for (key, up), (next_key, next_up) in zip(events, events[1:]):
+                if key == next_key and not up and next_up:
+                    self.stats.taps_folded += 1
+        return out
+
+
+def compile_programs(action_lists: List[List[KeyAction]], tolerance_ms: float,
+                     press_ms: float, inter_key_ms: float) -> dict:
+    """id(action list) -> ActionProgram untuk setiap action list binding"""
+    return {id(actions): ActionProgram(actions, tolerance_ms, press_ms, inter_key_ms)
+            for actions in action_lists}
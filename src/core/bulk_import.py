@@ -0,0 +1,64 @@
+"""
+Bulk Import - Parse & validasi banyak file secara paralel (thread pool)
+Dipakai untuk import hotkey dan preset dalam jumlah besar.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Tuple
+
+
+@dataclass
+class BulkImportResult:
+    """Hasil bulk import: item yang valid + error per file"""
+    items: List[Tuple[str, Any]] = field(default_factory=list)  # (filepath, parsed item)
+    errors: List[Tuple[str, str]] = field(default_factory=list)  # (filepath, error message)
+    
+    @property
+    def imported_count(self) -> int:
+        return len(self.items)
+    
+    def error_messages(self) -> List[str]:
+        return [f"{os.path.basename(path)}: {message}" for path, message in self.errors]
+
+
+def parse_files_parallel(filepaths: List[str], parse_fn: Callable[[str], Any],
+                         progress: Optional[Callable[[int, int], None]] = None,
+                         max_workers: int = None) -> BulkImportResult:
+    """
+    Jalankan parse_fn(filepath) untuk semua file di thread pool.
+    Exception dari parse_fn dicatat sebagai error untuk file tersebut.
+    Hasil dikembalikan sesuai urutan filepaths (bukan urutan selesai).
+    progress(done, total) dipanggil setiap satu file selesai.
+    """
+    total = len(filepaths)
+    result = BulkImportResult()
+    if not total:
+        return result
+    
+    if max_workers is None:
+        max_workers = min(8, (os.cpu_count() or 1) + 4, total)
+    
+    parsed: List[Any] = [None] * total
+    failed: List[Optional[str]] = [None] * total
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(parse_fn, path): i for i, path in enumerate(filepaths)}
+        done = 0
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                parsed[i] = future.result()
+            except Exception as e:
+                failed[i] = str(e) or e.__class__.__name__
+            done += 1
+            if progress:
+                progress(done, total)
+    
+    for i, path in enumerate(filepaths):
+        if failed[i] is not None:
+            result.errors.append((path, failed[i]))
+        else:
+            result.items.append((path, parsed[i]))
+    
+    return result
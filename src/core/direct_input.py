@@ -14,6 +14,8 @@ from ctypes import wintypes
 from pynput.keyboard import Key, Controller as KeyboardController
 from pynput.mouse import Button, Controller as MouseController
 
+from src.core.text_input import foreground_layout
+
 # Fallback controllers
 keyboard = KeyboardController()
 mouse = MouseController()
@@ -93,6 +95,26 @@ class DirectInputSender:
     _KEYEVENTF_KEYUP = 0x0002
     _KEYEVENTF_SCANCODE = 0x0008
     _MAPVK_VK_TO_VSC = 0
+    _MOUSEEVENTF_WHEEL = 0x0800
+    _MOUSEEVENTF_HWHEEL = 0x1000
+    _WHEEL_DELTA = 120
+
+    # Mouse button -> (down flag, up flag, mouseData)
+    MOUSE_BUTTONS = {
+        "left": (0x0002, 0x0004, 0),
+        "right": (0x0008, 0x0010, 0),
+        "middle": (0x0020, 0x0040, 0),
+        "x1": (0x0080, 0x0100, 0x0001),
+        "x2": (0x0080, 0x0100, 0x0002),
+    }
+
+    # Wheel action -> (horizontal, arah); satu action = satu notch
+    WHEEL_DIRECTIONS = {
+        "wheel_up": (False, 1),
+        "wheel_down": (False, -1),
+        "wheel_right": (True, 1),
+        "wheel_left": (True, -1),
+    }
 
     # Better defaults for game input reliability.
     DEFAULT_PRESS_DURATION = 0.01
@@ -191,11 +213,7 @@ class DirectInputSender:
         return None
 
     @classmethod
-    def _send_key_event(cls, vk: int, is_key_up: bool):
-        """Send a keyboard event using SendInput."""
-        if not cls._is_windows:
-            return False
-
+    def _make_key_input(cls, vk: int, is_key_up: bool):
         scan = cls._MapVirtualKeyW(vk, cls._MAPVK_VK_TO_VSC)
         flags = cls._KEYEVENTF_SCANCODE
         if is_key_up:
@@ -203,7 +221,7 @@ class DirectInputSender:
         if vk in cls.EXTENDED_VKS:
             flags |= cls._KEYEVENTF_EXTENDEDKEY
 
-        inp = cls._INPUT(
+        return cls._INPUT(
             type=cls._INPUT_KEYBOARD,
             ki=cls._KEYBDINPUT(
                 wVk=0,
@@ -213,6 +231,14 @@ class DirectInputSender:
                 dwExtraInfo=0,
             ),
         )
+
+    @classmethod
+    def _send_key_event(cls, vk: int, is_key_up: bool):
+        """Send a keyboard event using SendInput."""
+        if not cls._is_windows:
+            return False
+
+        inp = cls._make_key_input(vk, is_key_up)
         sent = cls._SendInput(1, ctypes.byref(inp), ctypes.sizeof(inp))
         return sent == 1
 
@@ -223,36 +249,103 @@ class DirectInputSender:
             return False
 
         button = cls._normalize_key(button)
-        mapping = {
-            "left": (0x0002, 0x0004),
-            "right": (0x0008, 0x0010),
-            "middle": (0x0020, 0x0040),
-        }
-
-        if button not in mapping:
+        if button not in cls.MOUSE_BUTTONS:
             return False
 
-        down_flag, up_flag = mapping[button]
-
-        def make_input(flags):
-            return cls._INPUT(
-                type=cls._INPUT_MOUSE,
-                mi=cls._MOUSEINPUT(
-                    dx=0,
-                    dy=0,
-                    mouseData=0,
-                    dwFlags=flags,
-                    time=0,
-                    dwExtraInfo=0,
-                ),
-            )
-
-        down = make_input(down_flag)
-        up = make_input(up_flag)
+        down_flag, up_flag, data = cls.MOUSE_BUTTONS[button]
+        down = cls._make_mouse_input(down_flag, data)
+        up = cls._make_mouse_input(up_flag, data)
         down_sent = cls._SendInput(1, ctypes.byref(down), ctypes.sizeof(down))
         up_sent = cls._SendInput(1, ctypes.byref(up), ctypes.sizeof(up))
         return down_sent == 1 and up_sent == 1
 
+    @classmethod
+    def _make_mouse_input(cls, flags: int, data: int = 0):
+        return cls._INPUT(
+            type=cls._INPUT_MOUSE,
+            mi=cls._MOUSEINPUT(
+                dx=0,
+                dy=0,
+                # mouseData DWORD: delta wheel negatif dikirim sebagai two's complement
+                mouseData=data & 0xFFFFFFFF,
+                dwFlags=flags,
+                time=0,
+                dwExtraInfo=0,
+            ),
+        )
+
+    @classmethod
+    def cursor_pos(cls):
+        """Posisi kursor (koordinat virtual desktop)"""
+        if cls._is_windows:
+            point = wintypes.POINT()
+            if cls._user32.GetCursorPos(ctypes.byref(point)):
+                return point.x, point.y
+        x, y = mouse.position
+        return int(x), int(y)
+
+    @classmethod
+    def mouse_move(cls, plan):
+        """
+        Mainkan MovePlan (src.core.mouse_path): satu SendInput per batch,
+        batch dikirim pada deadline tetap dari awal gerak (tanpa drift).
+        Lock hanya dipegang per batch supaya key action lain tidak tertahan.
+        """
+        start = cls.cursor_pos() if plan.absolute else (0, 0)
+        if cls._is_windows:
+            batches = plan.input_batches(cls._INPUT, start)
+            size = ctypes.sizeof(cls._INPUT)
+
+            def send(batch):
+                cls._SendInput(len(batch), batch, size)
+        else:
+            xs, ys = plan.points_from(start)
+            batches = plan.batches(xs, ys)
+
+            def send(batch):
+                for x, y in zip(*batch):
+                    if plan.absolute:
+                        mouse.position = (x, y)
+                    else:
+                        mouse.move(x, y)
+
+        t0 = time.perf_counter()
+        for index, batch in enumerate(batches):
+            if index:
+                cls.sleep_precise(t0 + index * plan.batch_interval - time.perf_counter())
+            with cls._lock:
+                send(batch)
+
+    @classmethod
+    def type_text(cls, plan):
+        """
+        Ketik TextPlan (src.core.text_input): satu SendInput per batch karakter.
+        Dengan rate limit, tiap karakter dikirim pada deadline tetap dari awal.
+        """
+        if cls._is_windows:
+            layout = foreground_layout() if plan.mode == "keys" else None
+            batches = plan.input_batches(cls._INPUT, layout)
+            size = ctypes.sizeof(cls._INPUT)
+
+            def send(batch):
+                cls._SendInput(len(batch), batch, size)
+        else:
+            batches = plan.chunks()
+
+            def send(chunk):
+                try:
+                    keyboard.type(chunk)
+                except Exception as exc:
+                    print(f"Error typing text: {exc}")
+
+        interval = plan.char_interval
+        t0 = time.perf_counter()
+        for index, batch in enumerate(batches):
+            if index and interval:
+                cls.sleep_precise(t0 + index * interval - time.perf_counter())
+            with cls._lock:
+                send(batch)
+
     @classmethod
     def _fallback_key_down(cls, key_obj):
         try:
@@ -379,6 +472,30 @@ class DirectInputSender:
             if key_obj is not None:
                 cls._fallback_key_up(key_obj)
 
+    @classmethod
+    def key_events(cls, events):
+        """
+        Kirim run key down/up tanpa jeda (hasil action_optimizer) sesuai urutan:
+        satu SendInput untuk seluruh run di Windows, per event di fallback.
+        events: [(key, is_key_up)]
+        """
+        with cls._lock:
+            if cls._is_windows:
+                vks = [cls._resolve_vk(key) for key, _ in events]
+                if None not in vks:
+                    inputs = (cls._INPUT * len(vks))(*(
+                        cls._make_key_input(vk, up) for vk, (_, up) in zip(vks, events)))
+                    sent = cls._SendInput(len(vks), inputs, ctypes.sizeof(cls._INPUT))
+                    if sent == len(vks):
+                        return
+                    events = events[sent:]  # Sisa yang tidak masuk lewat fallback
+
+            for key, up in events:
+                if up:
+                    cls.key_up(key)
+                else:
+                    cls.key_down(key)
+
     @classmethod
     def press(cls, key: str, duration: float = None):
         """Tap a key with a slightly longer hold to improve game detection."""
@@ -391,10 +508,36 @@ class DirectInputSender:
             cls.sleep_precise(duration)
             cls.key_up(key)
 
+    @classmethod
+    def mouse_scroll(cls, direction: str, notches: int = 1):
+        """Scroll wheel ('wheel_up', 'wheel_down', 'wheel_left', 'wheel_right')."""
+        direction = cls._normalize_key(direction)
+        if direction not in cls.WHEEL_DIRECTIONS:
+            return False
+        horizontal, sign = cls.WHEEL_DIRECTIONS[direction]
+        with cls._lock:
+            if cls._is_windows:
+                flags = cls._MOUSEEVENTF_HWHEEL if horizontal else cls._MOUSEEVENTF_WHEEL
+                inp = cls._make_mouse_input(flags, sign * notches * cls._WHEEL_DELTA)
+                if cls._SendInput(1, ctypes.byref(inp), ctypes.sizeof(inp)) == 1:
+                    return True
+
+            try:
+                if horizontal:
+                    mouse.scroll(sign * notches, 0)
+                else:
+                    mouse.scroll(0, sign * notches)
+                return True
+            except Exception as exc:
+                print(f"Error scrolling {direction}: {exc}")
+                return False
+
     @classmethod
     def mouse_click(cls, button: str = "left"):
-        """Click a mouse button."""
+        """Click a mouse button (wheel_* = satu notch scroll)."""
         button = button.lower().strip()
+        if button.startswith("wheel_"):
+            return cls.mouse_scroll(button)
         with cls._lock:
             if cls._is_windows and cls._send_mouse_event(button):
                 return True
@@ -404,6 +547,11 @@ class DirectInputSender:
                 btn = Button.right
             elif button == "middle":
                 btn = Button.middle
+            elif button in ("x1", "x2"):
+                # Button.x1/x2 hanya ada di backend win32 pynput
+                btn = getattr(Button, button, None)
+                if btn is None:
+                    return False
 
             try:
                 mouse.press(btn)
@@ -0,0 +1,510 @@
+"""
+Engine Process - HotkeyManager di child process terpisah (--engine-process)
+
+Hook pynput, worker macro, dan event loop Qt tidak lagi berbagi satu GIL:
+repaint / rebuild list yang berat di UI tidak bisa menunda callback
+low-level hook (Windows diam-diam melepas hook yang melewati LowLevelHooksTimeout).
+    
+    UI process                           Engine process
+    EngineProcess (proxy) --- Pipe --->  command loop -> HotkeyManager
+    dispatch_events()  <-- shared mem -- EventRing (status, binding triggered)
+
+Command: request/reply lewat multiprocessing Pipe (jarang, dari UI).
+Event: ring buffer di shared memory - engine menulis tanpa menunggu UI
+(tidak ada syscall / pickling di hook thread), UI membaca di timer.
+"""
+import multiprocessing
+import struct
+import threading
+from collections import OrderedDict
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.core.models import HotkeyBinding, Layer
+from src.core.mouse_wheel import normalize_mouse_trigger
+
+# ===================
+# EVENT RING (shared memory)
+# ===================
+
+EVENT_STATUS = 1  # value = 1 aktif / 0 pause
+EVENT_TRIGGERED = 2  # payload = binding id
+
+
+class EventRing:
+    """
+    Ring buffer single-reader di shared memory.
+    
+    Header: write_seq (Q), active (B, offset 16)
+    Slot:   seq (Q), kind (B), length (B), value (i), payload (48 bytes)
+    
+    Writer tidak pernah menunggu reader: jika reader tertinggal satu putaran
+    penuh, slot lama ditimpa dan reader menghitungnya sebagai event hilang.
+    Slot seq ditulis terakhir (dan dicek ulang oleh reader) supaya slot yang
+    sedang ditimpa tidak terbaca setengah jadi.
+    """
+    
+    HEADER_SIZE = 32
+    SLOT = struct.Struct("<QBBxxi")
+    SLOT_SIZE = 64
+    PAYLOAD_SIZE = SLOT_SIZE - SLOT.size
+    
+    def __init__(self, shm: shared_memory.SharedMemory, capacity: int):
+        self.shm = shm
+        self.capacity = capacity
+        self._buf = shm.buf
+        self._write_lock = threading.Lock()  # beberapa thread engine bisa menulis
+        self._read_seq = 0
+        self.lost = 0
+    
+    @classmethod
+    def size_for(cls, capacity: int) -> int:
+        return cls.HEADER_SIZE + capacity * cls.SLOT_SIZE
+    
+    @classmethod
+    def create(cls, capacity: int = 1024) -> "EventRing":
+        shm = shared_memory.SharedMemory(create=True, size=cls.size_for(capacity))
+        shm.buf[:cls.HEADER_SIZE] = bytes(cls.HEADER_SIZE)
+        return cls(shm, capacity)
+    
+    @classmethod
+    def attach(cls, name: str, capacity: int) -> "EventRing":
+        return cls(shared_memory.SharedMemory(name=name), capacity)
+    
+    @property
+    def name(self) -> str:
+        return self.shm.name
+    
+    # ===================
+    # WRITER (engine process)
+    # ===================
+    
+    def push(self, kind: int, value: int = 0, payload: str = ""):
+        data = payload.encode("utf-8")[:self.PAYLOAD_SIZE]
+        buf = self._buf
+        with self._write_lock:
+            write_seq = struct.unpack_from("<Q", buf, 0)[0]
+            offset = self.HEADER_SIZE + (write_seq % self.capacity) * self.SLOT_SIZE
+            # Invalidate -> isi -> publish seq slot -> publish write_seq
+            struct.pack_into("<Q", buf, offset, 0)
+            buf[offset + self.SLOT.size:offset + self.SLOT.size + len(data)] = data
+            self.SLOT.pack_into(buf, offset, write_seq + 1, kind, len(data), value)
+            struct.pack_into("<Q", buf, 0, write_seq + 1)
+    
+    def set_active(self, active: bool):
+        """Status terkini (selalu terbaca, walaupun event status hilang)"""
+        self._buf[16] = 1 if active else 0
+    
+    # ===================
+    # READER (UI process)
+    # ===================
+    
+    def is_active(self) -> bool:
+        return bool(self._buf[16])
+    
+    def read(self) -> List[Tuple[int, int, str]]:
+        """Ambil semua event baru: [(kind, value, payload)]"""
+        buf = self._buf
+        write_seq = struct.unpack_from("<Q", buf, 0)[0]
+        if write_seq == self._read_seq:
+            return []
+        
+        # Reader tertinggal lebih dari satu putaran -> lompat ke slot tertua yang masih ada
+        if write_seq - self._read_seq > self.capacity:
+            self.lost += write_seq - self._read_seq - self.capacity
+            self._read_seq = write_seq - self.capacity
+        
+        events = []
+        for seq in range(self._read_seq, write_seq):
+            offset = self.HEADER_SIZE + (seq % self.capacity) * self.SLOT_SIZE
+            slot_seq, kind, length, value = self.SLOT.unpack_from(buf, offset)
+            start = offset + self.SLOT.size
+            payload = bytes(buf[start:start + length])
+            # Slot ditimpa writer selama dibaca -> event ini hilang
+            if slot_seq != seq + 1 or struct.unpack_from("<Q", buf, offset)[0] != slot_seq:
+                self.lost += 1
+                continue
+            events.append((kind, value, payload.decode("utf-8", "replace")))
+        self._read_seq = write_seq
+        return events
+    
+    def close(self, unlink: bool = False):
+        self._buf = None
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+# ===================
+# ENGINE PROCESS (child)
+# ===================
+
+# Command yang boleh dipanggil dari UI: nama -> fungsi (manager, *args)
+_COMMANDS: Dict[str, Callable] = {
+    "start": lambda m: m.start(),
+    "stop": lambda m: m.stop(),
+    "start_listeners": lambda m: m.start_listeners(),
+    "restart_service": lambda m: m.restart_service(),
+    "add_binding": lambda m, d: m.add_binding(HotkeyBinding.from_dict(d)),
+    "add_bindings": lambda m, ds: m.add_bindings([HotkeyBinding.from_dict(d) for d in ds]),
+    "update_binding": lambda m, d: m.update_binding(HotkeyBinding.from_dict(d)),
+    "remove_binding": lambda m, binding_id: m.remove_binding(binding_id),
+    "toggle_binding": lambda m, binding_id, enabled: m.toggle_binding(binding_id, enabled),
+    "set_master_triggers": lambda m, keys, restart: m.set_master_triggers(keys, restart=restart),
+    "from_dict": lambda m, data: m.from_dict(data),
+    "hook_stats": lambda m: m.hook_stats(),
+    "set_wheel_policy": lambda m, detent, max_rate_hz: m.set_wheel_policy(detent, max_rate_hz),
+    "set_trigger_timing": lambda m, sequence_ms, chord_ms: m.set_trigger_timing(sequence_ms, chord_ms),
+    "set_tap_timing": lambda m, double_tap_ms: m.set_tap_timing(double_tap_ms),
+    "set_optimizer_tolerance": lambda m, tolerance_ms: m.set_optimizer_tolerance(tolerance_ms),
+    "set_layers": lambda m, ds: m.set_layers([Layer.from_dict(d) for d in ds]),
+    "activate_layer": lambda m, name: m.activate_layer(name),
+    "deactivate_layer": lambda m, name: m.deactivate_layer(name),
+    "active_layers": lambda m: m.active_layers,
+    "set_current_profile": lambda m, key: m.set_current_profile(key),
+    "warm_profile": lambda m, key, data: m.warm_profile(key, data),
+    "drop_profile": lambda m, key: m.drop_profile(key),
+    "activate_profile": lambda m, key: m.activate_profile(key),
+    "warm_preset": lambda m, name, data: m.warm_preset(name, data),
+    "drop_preset": lambda m, name: m.drop_preset(name),
+    "activate_preset": lambda m, name: m.activate_preset(name),
+    "ping": lambda m: True,
+}
+
+
+def _engine_main(conn, ring_name: str, capacity: int):
+    """Entry point child process: HotkeyManager + command loop"""
+    from src.core.hotkey_manager import HotkeyManager
+    
+    ring = EventRing.attach(ring_name, capacity)
+    manager = HotkeyManager()
+    
+    def on_status_changed(active: bool):
+        ring.set_active(active)
+        ring.push(EVENT_STATUS, 1 if active else 0)
+    
+    manager.on_status_changed = on_status_changed
+    manager.on_binding_triggered = lambda binding: ring.push(EVENT_TRIGGERED, 0, binding.id)
+    
+    print("[DEBUG] Engine process started.")
+    shutdown_requested = False
+    try:
+        while True:
+            try:
+                command, args = conn.recv()
+            except (EOFError, OSError):
+                # UI process hilang -> lepas hook dan keluar
+                break
+            if command == "shutdown":
+                shutdown_requested = True
+                break
+            try:
+                result = _COMMANDS[command](manager, *args)
+                conn.send((True, result if isinstance(result, (bool, dict, list, type(None))) else None))
+            except Exception as e:
+                conn.send((False, f"{type(e).__name__}: {e}"))
+    finally:
+        manager.shutdown()
+        ring.close()
+        print("[DEBUG] Engine process stopped.")
+    
+    # Balas setelah hook benar-benar dilepas
+    if shutdown_requested:
+        conn.send((True, None))
+
+
+# ===================
+# PROXY (UI process)
+# ===================
+
+class EngineProcess:
+    """
+    Pengganti HotkeyManager di UI process (API yang sama untuk HotkeyController).
+    Bindings & master keys di-mirror lokal supaya UI membaca tanpa round-trip;
+    setiap perubahan dikirim ke engine process. Event dari engine diteruskan ke
+    on_status_changed / on_binding_triggered saat dispatch_events() dipanggil.
+    """
+    
+    RING_CAPACITY = 1024
+    COMMAND_TIMEOUT = 5.0
+    PRESET_CACHE_SIZE = 4
+    
+    def __init__(self):
+        self.bindings: List[HotkeyBinding] = []
+        self.layers: List[Layer] = []
+        self.master_trigger_keys: List[str] = []
+        self.on_status_changed: Optional[Callable[[bool], None]] = None
+        self.on_binding_triggered: Optional[Callable[[HotkeyBinding], None]] = None
+        
+        self._by_id: Dict[str, HotkeyBinding] = {}
+        # Mirror profile warm: key -> (bindings, layers, master keys)
+        self._profile_key: Optional[str] = None
+        self._profiles: Dict[str, tuple] = {}
+        # Dipegang selama command profile + update mirror (worker warm vs Qt thread)
+        self._profile_lock = threading.Lock()
+        # Mirror preset standby, LRU sama dengan HotkeyManager.PRESET_CACHE_SIZE
+        self._presets: "OrderedDict[str, tuple]" = OrderedDict()
+        self._preset_lock = threading.Lock()  # Worker preset-compile vs Qt thread
+        self._call_lock = threading.Lock()
+        self._ring: Optional[EventRing] = None
+        self._conn = None
+        self._process = None
+    
+    # ===================
+    # LIFECYCLE
+    # ===================
+    
+    def launch(self):
+        """Buat shared memory + spawn engine process"""
+        if self._process is not None:
+            return
+        # spawn: aman dengan thread Qt yang sudah jalan (fork tidak), sama di semua OS
+        context = multiprocessing.get_context("spawn")
+        self._ring = EventRing.create(self.RING_CAPACITY)
+        try:
+            self._conn, child_conn = context.Pipe()
+            self._process = context.Process(
+                target=_engine_main, name="engine",
+                args=(child_conn, self._ring.name, self.RING_CAPACITY), daemon=True)
+            self._process.start()
+            child_conn.close()
+            self._call("ping")
+        except Exception:
+            self._release()
+            raise
+        print(f"[DEBUG] Engine process running (pid {self._process.pid}).")
+    
+    def shutdown(self):
+        """Lepas hook di engine process, tunggu exit, bebaskan shared memory"""
+        if self._process is None:
+            return
+        try:
+            self._call("shutdown")
+        except RuntimeError as e:
+            print(f"[ERROR] Engine shutdown: {e}")
+        self._release()
+    
+    def _release(self):
+        """Tunggu / matikan engine process, tutup pipe, hapus shared memory"""
+        if self._process is not None and self._process.pid is not None:
+            self._process.join(2.0)
+            if self._process.is_alive():
+                self._process.terminate()
+        if self._conn is not None:
+            self._conn.close()
+        if self._ring is not None:
+            self._ring.close(unlink=True)
+        self._process = self._conn = self._ring = None
+    
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+    
+    def _call(self, command: str, *args):
+        """Kirim command ke engine process dan tunggu balasan"""
+        with self._call_lock:
+            if self._conn is None:
+                raise RuntimeError("Engine process is not running")
+            try:
+                self._conn.send((command, args))
+                if not self._conn.poll(self.COMMAND_TIMEOUT):
+                    raise RuntimeError(f"Engine process not responding ({command})")
+                ok, result = self._conn.recv()
+            except (EOFError, OSError, BrokenPipeError):
+                raise RuntimeError("Engine process exited unexpectedly")
+        if not ok:
+            raise RuntimeError(result)
+        return result
+    
+    # ===================
+    # EVENTS
+    # ===================
+    
+    def dispatch_events(self) -> int:
+        """Baca event baru dari ring dan panggil callback (dari thread UI). Return jumlah event."""
+        if self._ring is None:
+            return 0
+        events = self._ring.read()
+        for kind, value, payload in events:
+            if kind == EVENT_STATUS:
+                if self.on_status_changed:
+                    self.on_status_changed(bool(value))
+            elif kind == EVENT_TRIGGERED:
+                binding = self._by_id.get(payload)
+                if binding and self.on_binding_triggered:
+                    self.on_binding_triggered(binding)
+        return len(events)
+    
+    @property
+    def is_active(self) -> bool:
+        return self._ring is not None and self._ring.is_active()
+    
+    # ===================
+    # HOTKEYMANAGER API
+    # ===================
+    
+    def start_listeners(self):
+        self._call("start_listeners")
+    
+    def restart_service(self):
+        self._call("restart_service")
+    
+    def start(self):
+        self._call("start")
+    
+    def stop(self):
+        self._call("stop")
+    
+    def hook_stats(self) -> dict:
+        return self._call("hook_stats")
+    
+    def set_wheel_policy(self, detent: float, max_rate_hz: float):
+        self._call("set_wheel_policy", detent, max_rate_hz)
+    
+    def set_trigger_timing(self, sequence_timeout_ms: int, chord_window_ms: int):
+        self._call("set_trigger_timing", sequence_timeout_ms, chord_window_ms)
+    
+    def set_tap_timing(self, double_tap_ms: int):
+        self._call("set_tap_timing", double_tap_ms)
+    
+    def set_optimizer_tolerance(self, tolerance_ms: float):
+        self._call("set_optimizer_tolerance", tolerance_ms)
+    
+    def set_layers(self, layers: List[Layer]):
+        self._call("set_layers", [layer.to_dict() for layer in layers])
+        self.layers = list(layers)
+    
+    def activate_layer(self, name: str) -> bool:
+        return self._call("activate_layer", name)
+    
+    def deactivate_layer(self, name: str) -> bool:
+        return self._call("deactivate_layer", name)
+    
+    @property
+    def active_layers(self) -> List[str]:
+        return self._call("active_layers")
+    
+    def set_current_profile(self, key: str):
+        with self._profile_lock:
+            self._call("set_current_profile", key)
+            self._profile_key = key
+    
+    def warm_profile(self, key: str, data: dict) -> bool:
+        mirror = (
+            [HotkeyBinding.from_dict(b) for b in data.get("bindings", [])],
+            [Layer.from_dict(layer) for layer in data.get("layers", [])],
+            [normalize_mouse_trigger(k) for k in data.get("master_trigger_keys", [])],
+        )
+        with self._profile_lock:
+            # Mirror hanya diisi jika engine benar-benar menyimpan snapshot-nya
+            stored = self._call("warm_profile", key, data)
+            if stored:
+                self._profiles[key] = mirror
+            return stored
+    
+    def drop_profile(self, key: str):
+        with self._profile_lock:
+            self._call("drop_profile", key)
+            self._profiles.pop(key, None)
+    
+    def activate_profile(self, key: str) -> bool:
+        with self._profile_lock:
+            if key == self._profile_key:
+                return True
+            if key not in self._profiles or not self._call("activate_profile", key):
+                return False
+            if self._profile_key is not None:
+                self._profiles[self._profile_key] = (self.bindings, self.layers, self.master_trigger_keys)
+            self.bindings, self.layers, self.master_trigger_keys = self._profiles.pop(key)
+            self._profile_key = key
+        self._rebuild_index()
+        return True
+    
+    def warm_preset(self, name: str, data: dict):
+        masters = data.get("master_trigger_keys")
+        mirror = (
+            [HotkeyBinding.from_dict(b) for b in data.get("bindings", [])],
+            [Layer.from_dict(layer) for layer in data.get("layers", [])],
+            [normalize_mouse_trigger(k) for k in masters] if masters is not None else None,
+        )
+        # Command + update LRU dalam satu lock supaya urutan LRU sama dengan engine
+        with self._preset_lock:
+            self._call("warm_preset", name, data)
+            self._presets[name] = mirror
+            self._presets.move_to_end(name)
+            while len(self._presets) > self.PRESET_CACHE_SIZE:
+                self._presets.popitem(last=False)
+    
+    def is_preset_warm(self, name: str) -> bool:
+        with self._preset_lock:
+            return name in self._presets
+    
+    def drop_preset(self, name: str):
+        with self._preset_lock:
+            self._call("drop_preset", name)
+            self._presets.pop(name, None)
+    
+    def activate_preset(self, name: str) -> bool:
+        with self._preset_lock:
+            if name not in self._presets or not self._call("activate_preset", name):
+                return False
+            self.bindings, self.layers, masters = self._presets.pop(name)
+            if masters is not None:
+                self.master_trigger_keys = masters
+        self._rebuild_index()
+        return True
+    
+    def set_master_triggers(self, keys: List[str], restart: bool = True):
+        self._call("set_master_triggers", list(keys), restart)
+        self.master_trigger_keys = [normalize_mouse_trigger(k) for k in keys]
+    
+    def add_binding(self, binding: HotkeyBinding):
+        self._call("add_binding", binding.to_dict())
+        self.bindings = [b for b in self.bindings if b.id != binding.id] + [binding]
+        self._rebuild_index()
+        return True
+    
+    def add_bindings(self, bindings: List[HotkeyBinding]):
+        self._call("add_bindings", [b.to_dict() for b in bindings])
+        new_ids = {b.id for b in bindings}
+        self.bindings = [b for b in self.bindings if b.id not in new_ids] + list(bindings)
+        self._rebuild_index()
+        return True
+    
+    def update_binding(self, binding: HotkeyBinding):
+        """Ganti binding di posisi yang sama (urutan/prioritas tidak berubah)"""
+        self._call("update_binding", binding.to_dict())
+        if binding.id not in self._by_id:
+            self.bindings = self.bindings + [binding]
+        else:
+            self.bindings = [binding if b.id == binding.id else b for b in self.bindings]
+        self._rebuild_index()
+    
+    def remove_binding(self, binding_id: str):
+        self._call("remove_binding", binding_id)
+        self.bindings = [b for b in self.bindings if b.id != binding_id]
+        self._rebuild_index()
+    
+    def toggle_binding(self, binding_id: str, enabled: bool):
+        self._call("toggle_binding", binding_id, enabled)
+        binding = self.get_binding(binding_id)
+        if binding:
+            binding.enabled = enabled
+    
+    def get_binding(self, binding_id: str) -> Optional[HotkeyBinding]:
+        return self._by_id.get(binding_id)
+    
+    def to_dict(self) -> dict:
+        return {
+            "bindings": [b.to_dict() for b in self.bindings],
+            "layers": [layer.to_dict() for layer in self.layers]
+        }
+    
+    def from_dict(self, data: dict):
+        self._call("from_dict", data)
+        self.bindings = [HotkeyBinding.from_dict(b) for b in data.get("bindings", [])]
+        self.layers = [Layer.from_dict(layer) for layer in data.get("layers", [])]
+        self._rebuild_index()
+    
+    def _rebuild_index(self):
+        self._by_id = {b.id: b for b in self.bindings}
@@ -0,0 +1,36 @@
+"""
+Engine Snapshot - Semua index terkompilasi untuk satu set bindings
+
+Dibuat HotkeyManager._compile (tanpa menyentuh state engine) lalu dipasang
+dengan _install (swap reference). Snapshot profile yang sering dipakai
+disimpan "warm" supaya ganti profile = install saja, tanpa compile ulang,
+tanpa stop() dan tanpa restart hook.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from src.core.models import HotkeyBinding, Layer
+
+
+@dataclass
+class EngineSnapshot:
+    bindings: List[HotkeyBinding]
+    layers: List[Layer]
+    master_trigger_keys: Optional[List[str]]  # None = pakai master keys yang sedang aktif (preset)
+    indexes: Dict[str, object]  # nama layer -> LayerIndex
+    layer_keys: Dict[str, tuple]  # combo -> (nama layer, "hold"/"toggle")
+    by_id: Dict[str, HotkeyBinding]
+    hotstrings: object  # HotstringMatcher
+    move_plans: Dict[int, object] = field(default_factory=dict)
+    text_plans: Dict[int, object] = field(default_factory=dict)
+    programs: Dict[int, object] = field(default_factory=dict)  # id(actions) -> ActionProgram
+    
+    @property
+    def dual_role_layers(self) -> tuple:
+        """Layer yang punya binding tap/hold/release (menerima key up)"""
+        return tuple(index for index in self.indexes.values() if index.tap_hold)
+    
+    def close(self):
+        """Snapshot dilepas dari engine: batalkan timer tap/hold yang masih menunggu"""
+        for index in self.indexes.values():
+            index.tap_hold.close()
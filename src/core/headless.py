@@ -0,0 +1,76 @@
+"""
+Headless Runner - Jalankan HotkeyManager tanpa UI (tidak meng-import PyQt6)
+    
+    python main.py --headless --profile path/to/profile.json [--start-active]
+
+Master toggle tetap bekerja (ditangani HotkeyManager). Berhenti dengan
+Ctrl+C / SIGTERM: macro di-pause, listener di-unhook, lalu exit.
+"""
+import os
+import signal
+import threading
+from typing import Optional
+
+from src.core.persistence import default_data_file, load_profile
+from src.core.startup_profiler import startup_profiler
+
+# Signal yang memicu shutdown (yang tersedia di platform ini)
+SHUTDOWN_SIGNALS = ("SIGINT", "SIGTERM", "SIGBREAK", "SIGHUP")
+
+
+def run_headless(profile_path: Optional[str] = None, start_active: bool = False) -> int:
+    """Jalankan engine sampai menerima signal shutdown. Return exit code."""
+    path = profile_path or default_data_file()
+    if profile_path and not os.path.exists(path):
+        print(f"[ERROR] Profile not found: {path}")
+        return 1
+    
+    startup_profiler.start_stage()
+    from src.core.hotkey_manager import HotkeyManager
+    startup_profiler.mark("import engine (pynput)")
+    
+    manager = HotkeyManager()
+    if os.path.exists(path):
+        try:
+            load_profile(manager, path)
+        except Exception as e:
+            print(f"[ERROR] Loading profile failed: {e}")
+            return 1
+    startup_profiler.mark("load profile")
+    
+    manager.on_status_changed = lambda active: print(
+        f"[HEADLESS] Macros {'ACTIVE' if active else 'PAUSED'}")
+    
+    # Signal handler hanya set flag; shutdown dilakukan di main thread
+    stop_event = threading.Event()
+    
+    def request_shutdown(signum, frame):
+        print(f"[HEADLESS] Received {signal.Signals(signum).name}, shutting down...")
+        stop_event.set()
+    
+    for name in SHUTDOWN_SIGNALS:
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), request_shutdown)
+    
+    try:
+        manager.start_listeners()
+    except Exception as e:
+        print(f"[ERROR] Starting input hooks failed: {e}")
+        return 1
+    startup_profiler.mark("install input hooks")
+    
+    if start_active:
+        manager.start()
+    
+    print(f"[HEADLESS] Profile: {path}")
+    print(f"[HEADLESS] {len(manager.bindings)} bindings, master keys: "
+          f"{', '.join(manager.master_trigger_keys) or '-'}. Press Ctrl+C to exit.")
+    startup_profiler.print_report()
+    
+    # wait() dengan timeout supaya signal tetap diproses di Windows
+    while not stop_event.wait(0.5):
+        pass
+    
+    manager.shutdown()
+    print("[HEADLESS] Stopped.")
+    return 0
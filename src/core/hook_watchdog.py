@@ -0,0 +1,229 @@
+"""
+Hook Watchdog - Time budget untuk callback hook + deteksi hook mati
+
+Windows diam-diam melepas low-level hook yang callback-nya melewati
+LowLevelHooksTimeout, tanpa error apa pun ke aplikasi. Watchdog ini:
+  - mengukur setiap callback (win32_event_filter, key press/release, mouse)
+    terhadap budget, dan menyimpan statistik per callback
+  - men-shed pekerjaan opsional (log, histogram) saat callback mendekati budget
+  - mendeteksi hook mati: thread listener sudah exit, atau OS melaporkan
+    input baru tapi hook tidak menerima event apa pun - lalu re-arm otomatis
+Tidak bergantung pada Qt / pynput; bisa dites dengan callback & listener palsu.
+"""
+import ctypes
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+# Batas atas histogram durasi (ms); bucket terakhir = di atas semua batas
+HISTOGRAM_BOUNDS_MS = (0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 50.0)
+
+
+class CallbackStats:
+    """Statistik durasi satu callback hook"""
+    
+    __slots__ = ("count", "total_ms", "max_ms", "last_ms", "over_budget", "avg_ms", "histogram")
+    
+    # Bobot EWMA durasi terbaru
+    EWMA_ALPHA = 0.2
+    
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+        self.over_budget = 0
+        self.avg_ms = 0.0  # EWMA, dipakai untuk keputusan shedding
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+    
+    def record(self, duration_ms: float, budget_ms: float, detailed: bool):
+        self.count += 1
+        self.last_ms = duration_ms
+        self.avg_ms += (duration_ms - self.avg_ms) * self.EWMA_ALPHA
+        if duration_ms > budget_ms:
+            self.over_budget += 1
+        if not detailed:
+            return
+        # Metrik opsional (di-skip saat shedding)
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+        for i, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+            if duration_ms <= bound:
+                self.histogram[i] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+    
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.avg_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "last_ms": round(self.last_ms, 3),
+            "over_budget": self.over_budget,
+            "histogram": list(self.histogram),
+        }
+
+
+def os_input_idle_ms() -> Optional[float]:
+    """Milidetik sejak input terakhir menurut OS (GetLastInputInfo), None jika tidak didukung"""
+    if os.name != "nt":
+        return None
+    
+    class LASTINPUTINFO(ctypes.Structure):
+        _fields_ = [("cbSize", ctypes.c_uint), ("dwTime", ctypes.c_uint)]
+    
+    info = LASTINPUTINFO()
+    info.cbSize = ctypes.sizeof(LASTINPUTINFO)
+    if not ctypes.windll.user32.GetLastInputInfo(ctypes.byref(info)):
+        return None
+    # GetTickCount wrap tiap ~49 hari -> hitung dalam 32 bit
+    return float((ctypes.windll.kernel32.GetTickCount() - info.dwTime) & 0xFFFFFFFF)
+
+
+class HookWatchdog:
+    """
+    Watchdog untuk listener HotkeyManager.
+    
+    get_listeners(): listener yang seharusnya hidup (objek dengan is_alive()).
+    rearm(): pasang ulang hook (HotkeyManager.restart_service).
+    input_idle_ms(): umur input terakhir menurut OS (None = cek ini dilewati).
+    """
+    
+    # Budget callback (ms). LowLevelHooksTimeout default Windows jauh lebih besar,
+    # tapi callback yang lambat sudah menambah latency ke seluruh input sistem.
+    DEFAULT_BUDGET_MS = 5.0
+    # Shed pekerjaan opsional saat rata-rata callback melewati rasio budget ini
+    SHED_RATIO = 0.5
+    CHECK_INTERVAL = 1.0
+    # Input OS terbaru tapi hook diam selama lebih dari ini -> hook dianggap mati
+    STALL_TIMEOUT = 3.0
+    # Jeda minimum antar re-arm (hindari restart loop)
+    REARM_COOLDOWN = 5.0
+    
+    def __init__(self, get_listeners: Callable[[], List[object]], rearm: Callable[[], None],
+                 budget_ms: float = DEFAULT_BUDGET_MS,
+                 input_idle_ms: Optional[Callable[[], Optional[float]]] = os_input_idle_ms,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.budget_ms = budget_ms
+        self.stats: Dict[str, CallbackStats] = {}
+        self.rearm_count = 0
+        self.last_rearm_reason: Optional[str] = None
+        
+        self._get_listeners = get_listeners
+        self._rearm = rearm
+        self._input_idle_ms = input_idle_ms
+        self._clock = clock
+        self._last_event = clock()
+        self._last_rearm = float("-inf")
+        self._shedding = False
+        
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+    
+    # ===================
+    # CALLBACK TIMING (hook thread)
+    # ===================
+    
+    @property
+    def shedding(self) -> bool:
+        """True saat callback mendekati budget: lewati log & metrik opsional"""
+        return self._shedding
+    
+    def timed(self, name: str, callback: Callable) -> Callable:
+        """Bungkus callback hook: ukur durasi, catat statistik, return value diteruskan"""
+        stats = self.stats.setdefault(name, CallbackStats())
+        clock = self._clock
+        shed_ms = self.budget_ms * self.SHED_RATIO
+        
+        def wrapper(*args):
+            start = clock()
+            try:
+                return callback(*args)
+            finally:
+                end = clock()
+                self._last_event = end
+                stats.record((end - start) * 1000.0, self.budget_ms, not self._shedding)
+                if stats.avg_ms > shed_ms:
+                    self._shedding = True
+                elif self._shedding:
+                    self._shedding = any(s.avg_ms > shed_ms for s in self.stats.values())
+        
+        wrapper.__name__ = getattr(callback, "__name__", name)
+        return wrapper
+    
+    def beat(self, *args):
+        """Heartbeat dari event hook yang tidak perlu ditimer (mis. mouse move)"""
+        self._last_event = self._clock()
+    
+    def snapshot(self) -> dict:
+        return {
+            "budget_ms": self.budget_ms,
+            "shedding": self._shedding,
+            "rearm_count": self.rearm_count,
+            "last_rearm_reason": self.last_rearm_reason,
+            "callbacks": {name: s.to_dict() for name, s in self.stats.items()},
+        }
+    
+    # ===================
+    # HEALTH CHECK
+    # ===================
+    
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._last_event = self._clock()
+        self._thread = threading.Thread(target=self._run, name="hook-watchdog", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        self._stop_event.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(self.CHECK_INTERVAL * 2)
+    
+    def _run(self):
+        while not self._stop_event.wait(self.CHECK_INTERVAL):
+            try:
+                self.check()
+            except Exception as e:
+                print(f"[ERROR] Hook watchdog check failed: {e}")
+    
+    def diagnose(self) -> Optional[str]:
+        """Alasan hook dianggap mati, atau None jika sehat"""
+        listeners = [l for l in self._get_listeners() if l is not None]
+        if not listeners:
+            return None  # Hook memang sedang tidak dipasang
+        
+        for listener in listeners:
+            if not listener.is_alive():
+                return f"listener thread exited ({type(listener).__name__})"
+        
+        if self._input_idle_ms is not None:
+            idle_ms = self._input_idle_ms()
+            if idle_ms is not None:
+                silent = self._clock() - self._last_event
+                # OS melihat input setelah event hook terakhir, dan sudah cukup lama
+                if silent - idle_ms / 1000.0 > self.STALL_TIMEOUT:
+                    return f"no hook events for {silent:.1f}s while OS reports input"
+        return None
+    
+    def check(self) -> bool:
+        """Satu putaran pengecekan; return True jika hook di-re-arm"""
+        reason = self.diagnose()
+        if reason is None:
+            return False
+        now = self._clock()
+        if now - self._last_rearm < self.REARM_COOLDOWN:
+            return False
+        
+        self._last_rearm = now
+        self.rearm_count += 1
+        self.last_rearm_reason = reason
+        print(f"[WATCHDOG] Hook unhealthy: {reason}. Re-arming (#{self.rearm_count})...")
+        self._rearm()
+        self._last_event = self._clock()
+        return True
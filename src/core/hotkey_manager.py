@@ -3,16 +3,32 @@ Hotkey Manager - Core logic untuk gaming hotkey automation
 Supports keyboard AND mouse triggers
 Uses PYNPUT for both Listener (Input Detection) and Actor (Input sending)
 """
+import os
 import time
 import threading
 import ctypes
-from dataclasses import dataclass, field
+from collections import OrderedDict
 from typing import List, Optional, Callable, Set, Dict
-from enum import Enum
 from pynput import keyboard, mouse
 from pynput.keyboard import Key, KeyCode
 
+from src.core.action_optimizer import (
+    DEFAULT_TOLERANCE_MS, STEP_CLICK, STEP_KEYS, STEP_SLEEP, ActionProgram, OptimizerStats, compile_programs
+)
 from src.core.direct_input import DirectInputSender
+from src.core.engine_snapshot import EngineSnapshot
+from src.core.hook_watchdog import HookWatchdog
+from src.core.hotstrings import HotstringMatcher, hotstring_text, is_hotstring
+from src.core.layers import BASE_LAYER, LayerIndex, LayerStack
+from src.core.mouse_path import MovePlan, compile_actions
+from src.core.mouse_wheel import WHEEL_TRIGGERS, WheelCoalescer, WheelPolicy, normalize_mouse_trigger
+from src.core.tap_hold import DEFAULT_DOUBLE_TAP_MS, TapHoldResolver, TapLatencyStats
+from src.core.text_input import TextPlan, compile_text_actions
+from src.core.timer_scheduler import TimerScheduler
+from src.core.trigger_automaton import (
+    DEFAULT_CHORD_WINDOW_MS, DEFAULT_SEQUENCE_TIMEOUT_MS, TriggerAutomaton, is_stateful_trigger
+)
+from src.core.models import ActionType, KeyAction, HotkeyBinding, Layer
 
 # VK Constants for manual mapping if needed
 VK_MAP = {
@@ -27,86 +43,20 @@ VK_MAP = {
 }
 
 
-class ActionType(Enum):
-    """Tipe aksi yang bisa dilakukan"""
-    KEY_PRESS = "key_press"      # Tekan dan lepas
-    KEY_DOWN = "key_down"        # Hanya tekan (tidak lepas)
-    KEY_UP = "key_up"            # Hanya lepas
-    KEY_HOLD = "key_hold"        # Tahan selama durasi
-    KEY_SEQUENCE = "key_sequence"  # Urutan tombol
-    DELAY = "delay"              # Tunggu
-    
-
-@dataclass
-class KeyAction:
-    """Single action dalam sequence"""
-    action_type: ActionType
-    keys: List[str] = field(default_factory=list)
-    duration: int = 0
-    
-    def to_dict(self) -> dict:
-        return {
-            "action_type": self.action_type.value,
-            "keys": self.keys,
-            "duration": self.duration
-        }
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> 'KeyAction':
-        return cls(
-            action_type=ActionType(data["action_type"]),
-            keys=data.get("keys", []),
-            duration=data.get("duration", 0)
-        )
-
-
-@dataclass
-class HotkeyBinding:
-    """Single hotkey binding dengan multiple triggers"""
-    id: str
-    name: str
-    trigger_keys: List[str] = field(default_factory=list)
-    actions: List[KeyAction] = field(default_factory=list)
-    enabled: bool = True
-    repeat: bool = False
-    repeat_delay: int = 100
-    block_input: bool = False
-    
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "trigger_keys": self.trigger_keys,
-            "actions": [a.to_dict() for a in self.actions],
-            "enabled": self.enabled,
-            "repeat": self.repeat,
-            "repeat_delay": self.repeat_delay,
-            "block_input": self.block_input
-        }
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> 'HotkeyBinding':
-        trigger_keys = data.get("trigger_keys", [])
-        if not trigger_keys and "trigger_key" in data:
-            trigger_keys = [data["trigger_key"]]
-        
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            trigger_keys=trigger_keys,
-            actions=[KeyAction.from_dict(a) for a in data.get("actions", [])],
-            enabled=data.get("enabled", True),
-            repeat=data.get("repeat", False),
-            repeat_delay=data.get("repeat_delay", 100),
-            block_input=data.get("block_input", False)
-        )
-
-
 class HotkeyManager:
     """Manager untuk semua hotkey bindings - supports keyboard and mouse triggers via PYNPUT"""
     
-    def __init__(self):
+    # Jumlah preset terkompilasi yang disimpan standby (LRU)
+    PRESET_CACHE_SIZE = 4
+    
+    def __init__(self, hook_budget_ms: float = HookWatchdog.DEFAULT_BUDGET_MS,
+                 wheel_policy: Optional[WheelPolicy] = None,
+                 sequence_timeout_ms: int = DEFAULT_SEQUENCE_TIMEOUT_MS,
+                 chord_window_ms: int = DEFAULT_CHORD_WINDOW_MS,
+                 double_tap_ms: int = DEFAULT_DOUBLE_TAP_MS,
+                 optimizer_tolerance_ms: float = DEFAULT_TOLERANCE_MS):
         self.bindings: List[HotkeyBinding] = []
+        self.layers: List[Layer] = []
         self._active = False
         self.on_status_changed: Optional[Callable[[bool], None]] = None
         self.on_binding_triggered: Optional[Callable[[HotkeyBinding], None]] = None
@@ -127,6 +77,57 @@ class HotkeyManager:
         # Repeat logic
         self._repeat_threads = {}
         self._stop_repeat = {}
+        
+        # Index per layer: combo -> [(posisi, binding)] sesuai urutan bindings
+        # (= tabel root automaton layer; sequence & chord ada di automaton yang sama)
+        self._sequence_timeout_ms = sequence_timeout_ms
+        self._chord_window_ms = chord_window_ms
+        self._by_id: Dict[str, HotkeyBinding] = {}
+        # MOUSE_MOVE terkompilasi: id(action) -> MovePlan (dibangun di _rebuild_index)
+        self._move_plans: Dict[int, MovePlan] = {}
+        # TYPE_TEXT terkompilasi: id(action) -> TextPlan
+        self._text_plans: Dict[int, TextPlan] = {}
+        # Action list teroptimasi: id(binding.actions) -> ActionProgram
+        self._programs: Dict[int, ActionProgram] = {}
+        self._optimizer_tolerance_ms = optimizer_tolerance_ms
+        
+        # Hotstring: abbreviation -> [(posisi, binding)] dalam satu automaton
+        self._hotstrings = HotstringMatcher({})
+        self._hotstring_window = None  # Foreground window terakhir (ganti = reset buffer)
+        self._erase_plans: Dict[int, TextPlan] = {}
+        self._injected = False  # Event keyboard terakhir dari SendInput (flag LLKHF_INJECTED)
+        
+        # Trigger mode release/tap/hold/double_tap: diputuskan lewat timer scheduler
+        self._scheduler = TimerScheduler()
+        self._double_tap_ms = double_tap_ms
+        self._tap_stats = TapLatencyStats()
+        
+        # Layer: stack aktif (swap tuple) + layer key -> (nama layer, "hold"/"toggle")
+        self._layers = LayerStack({BASE_LAYER: self._build_layer_index(BASE_LAYER, {}, {})})
+        self._dual_role_layers: tuple = ()  # Layer yang punya binding tap/hold/release
+        self._layer_keys: Dict[str, tuple] = {}
+        self._held_layers: Dict[str, str] = {}  # Key dasar yang ditahan -> layer
+        
+        # Profile: snapshot terkompilasi yang dipasang + snapshot warm per profile key
+        self._snapshot: Optional[EngineSnapshot] = None
+        self._warm_profiles: Dict[str, EngineSnapshot] = {}
+        self._profile_key: Optional[str] = None
+        # _warm_profiles ditulis worker warm (controller) dan Qt thread (activate)
+        self._profile_lock = threading.Lock()
+        self._profile_seq = 0  # Naik setiap activate_profile menyimpan snapshot profile lama
+        self._profile_stored: Dict[str, int] = {}  # key -> _profile_seq saat disimpan activate_profile
+        # Snapshot preset standby (LRU, paling baru dipakai di akhir)
+        self._warm_presets: "OrderedDict[str, EngineSnapshot]" = OrderedDict()
+        self._preset_lock = threading.Lock()
+        
+        # Watchdog: budget callback hook + re-arm otomatis jika hook mati
+        self._watchdog = HookWatchdog(
+            get_listeners=lambda: [self._keyboard_listener, self._mouse_listener],
+            rearm=self.restart_service,
+            budget_ms=hook_budget_ms,
+        )
+        # Scroll mentah -> trigger mouse_wheel_* (detent + rate limit)
+        self._wheel = WheelCoalescer(wheel_policy)
 
     def _stop_listeners(self):
         """Stop low-level listeners"""
@@ -163,21 +164,27 @@ class HotkeyManager:
                 self._mouse_listener and getattr(self._mouse_listener, "running", False)
             )
 
+            # Semua callback diukur watchdog terhadap budget
+            timed = self._watchdog.timed
+            
             # NOTE: win32_event_filter only works on Windows and allows us to BLOCK input
             if not keyboard_running:
                 self._keyboard_listener = keyboard.Listener(
-                    on_press=self._on_key_press,
-                    on_release=self._on_key_release,
-                    win32_event_filter=self._win32_event_filter
+                    on_press=timed("key_press", self._on_key_press),
+                    on_release=timed("key_release", self._on_key_release),
+                    win32_event_filter=timed("win32_event_filter", self._win32_event_filter)
                 )
                 self._keyboard_listener.start()
 
             if not mouse_running:
                 self._mouse_listener = mouse.Listener(
-                    on_click=self._on_mouse_click)
+                    on_click=timed("mouse_click", self._on_mouse_click),
+                    on_scroll=timed("mouse_scroll", self._on_mouse_scroll),
+                    on_move=self._watchdog.beat)
                 self._mouse_listener.start()
 
             print("[DEBUG] Pynput Listeners started (Service).")
+        self._watchdog.start()
 
     def start(self):
         """Aktifkan listeners & logic macro"""
@@ -211,13 +218,209 @@ class HotkeyManager:
         # Notify UI
         if self.on_status_changed:
             self.on_status_changed(False)
+    
+    def shutdown(self):
+        """Pause macro & lepas semua hook (dipanggil saat aplikasi keluar)"""
+        self.stop()
+        self._watchdog.stop()
+        if self._snapshot is not None:
+            self._snapshot.close()
+        self._scheduler.stop()
+        self._stop_listeners()
+        print("[DEBUG] HotkeyManager shut down.")
+    
+    def hook_stats(self) -> dict:
+        """Statistik callback hook & re-arm dari watchdog (+ coalescing wheel)"""
+        stats = self._watchdog.snapshot()
+        stats["wheel"] = self._wheel.snapshot()
+        tap_hold = self._tap_stats.snapshot()
+        tap_hold["double_tap_ms"] = self._double_tap_ms
+        tap_hold["timer_lateness_max_ms"] = self._scheduler.max_lateness_ms
+        stats["tap_hold"] = tap_hold
+        stats["layers"] = list(self._layers.names)
+        optimizer = OptimizerStats()
+        for program in self._programs.values():
+            optimizer.add(program.stats)
+        stats["optimizer"] = dict(optimizer.snapshot(), tolerance_ms=self._optimizer_tolerance_ms)
+        return stats
+    
+    def set_trigger_timing(self, sequence_timeout_ms: int, chord_window_ms: int):
+        """Jeda maksimum antar langkah sequence dan window chord (ms)"""
+        self._sequence_timeout_ms = sequence_timeout_ms
+        self._chord_window_ms = chord_window_ms
+        self._rebuild_index()
+        self._recompile_warm()
+    
+    def set_tap_timing(self, double_tap_ms: int):
+        """Double-tap window (ms) = latency tambahan tap di key yang juga punya double-tap"""
+        self._double_tap_ms = double_tap_ms
+        self._rebuild_index()
+        self._recompile_warm()
+    
+    def set_optimizer_tolerance(self, tolerance_ms: float):
+        """Total jeda (ms) per action list yang boleh dihapus action optimizer (pergeseran maksimum event)"""
+        self._optimizer_tolerance_ms = tolerance_ms
+        self._rebuild_index()
+        self._recompile_warm()
+    
+    def set_layers(self, layers: List[Layer]):
+        """Ganti definisi layer (nama + hold/toggle keys)"""
+        self.layers = list(layers)
+        self._rebuild_index()
+    
+    def activate_layer(self, name: str) -> bool:
+        """Aktifkan layer (swap stack, tanpa rebuild index)"""
+        return self._layers.push(name)
+    
+    def deactivate_layer(self, name: str) -> bool:
+        return self._layers.remove(name)
+    
+    @property
+    def active_layers(self) -> List[str]:
+        """Layer aktif bawah -> atas (base layer = "")"""
+        return list(self._layers.names)
+    
+    # ===================
+    # PROFILES
+    # ===================
+    
+    def set_current_profile(self, key: str):
+        """Tandai bindings yang sedang dipasang sebagai profile `key` (mis. path data file)"""
+        with self._profile_lock:
+            self._profile_key = key
+    
+    def warm_profile(self, key: str, data: dict) -> bool:
+        """
+        Compile profile (format data file) dan simpan siap pakai untuk activate_profile.
+        Compile di luar lock; hasilnya dibuang jika selama compile profile itu
+        dipasang atau disimpan activate_profile (versi engine lebih baru dari disk).
+        Return True jika snapshot disimpan.
+        """
+        with self._profile_lock:
+            if key == self._profile_key:
+                return False  # Profile yang sedang dipasang selalu versi terbaru
+            started = self._profile_seq
+        snapshot = self._compile_data(data, data.get("master_trigger_keys", []))
+        with self._profile_lock:
+            if key == self._profile_key or self._profile_stored.get(key, -1) > started:
+                snapshot.close()
+                return False
+            self._warm_profiles[key] = snapshot
+            return True
+    
+    def _compile_data(self, data: dict, masters: Optional[List[str]]) -> EngineSnapshot:
+        bindings = [HotkeyBinding.from_dict(b) for b in data.get("bindings", [])]
+        layers = [Layer.from_dict(layer) for layer in data.get("layers", [])]
+        if masters is not None:
+            masters = [normalize_mouse_trigger(k) for k in masters]
+        return self._compile(bindings, layers, masters)
+    
+    def drop_profile(self, key: str):
+        with self._profile_lock:
+            self._warm_profiles.pop(key, None)
+            self._profile_stored.pop(key, None)
+    
+    def activate_profile(self, key: str) -> bool:
+        """
+        Pasang profile warm: swap index, tanpa stop() dan tanpa restart hook.
+        False jika profile belum di-warm (pemanggil fallback ke load biasa).
+        """
+        with self._profile_lock:
+            if key == self._profile_key:
+                return True
+            snapshot = self._warm_profiles.pop(key, None)
+            if snapshot is None:
+                return False
+            # Profile lama tetap warm (dengan edit terakhirnya) untuk switch balik
+            current = self._snapshot
+            if current is not None and self._profile_key is not None:
+                current.master_trigger_keys = list(self.master_trigger_keys)
+                self._profile_seq += 1
+                self._warm_profiles[self._profile_key] = current
+                self._profile_stored[self._profile_key] = self._profile_seq
+            self._install(snapshot)
+            self.master_trigger_keys = list(snapshot.master_trigger_keys)
+            self._profile_key = key
+        print(f"[DEBUG] Profile activated: {key} ({len(snapshot.bindings)} bindings)")
+        return True
+    
+    def _recompile_warm(self):
+        """Timing global berubah -> snapshot warm dikompilasi ulang dengan setting baru"""
+        self._recompile_cache(self._warm_profiles, self._profile_lock)
+        self._recompile_cache(self._warm_presets, self._preset_lock)
+    
+    def _recompile_cache(self, cache: Dict[str, EngineSnapshot], lock: threading.Lock):
+        """Compile di luar lock; entry yang diganti thread lain selama compile tidak ditimpa"""
+        with lock:
+            items = list(cache.items())
+        for key, old in items:
+            snapshot = self._compile(old.bindings, old.layers, old.master_trigger_keys)
+            with lock:
+                if cache.get(key) is old:
+                    cache[key] = snapshot
+                else:
+                    snapshot.close()
+    
+    # ===================
+    # PRESETS
+    # ===================
+    
+    def warm_preset(self, name: str, data: dict):
+        """
+        Compile preset (Preset.data) ke snapshot standby - aman dari worker thread,
+        engine tetap memakai snapshot aktif selama compile berjalan.
+        Preset tanpa master_trigger_keys memakai master keys yang sedang aktif.
+        """
+        snapshot = self._compile_data(data, data.get("master_trigger_keys"))
+        with self._preset_lock:
+            self._warm_presets[name] = snapshot
+            self._warm_presets.move_to_end(name)
+            while len(self._warm_presets) > self.PRESET_CACHE_SIZE:
+                self._warm_presets.popitem(last=False)
+    
+    def is_preset_warm(self, name: str) -> bool:
+        return name in self._warm_presets
+    
+    def drop_preset(self, name: str):
+        with self._preset_lock:
+            self._warm_presets.pop(name, None)
+    
+    def activate_preset(self, name: str) -> bool:
+        """
+        Pasang preset standby ke profile aktif: swap index, tanpa stop() dan tanpa restart hook.
+        Snapshot diambil dari cache (bindings-nya sekarang milik engine); pemanggil
+        boleh warm_preset lagi supaya preset tetap siap untuk switch berikutnya.
+        False jika preset belum di-warm.
+        """
+        with self._preset_lock:
+            snapshot = self._warm_presets.pop(name, None)
+        if snapshot is None:
+            return False
+        self._install(snapshot)
+        if snapshot.master_trigger_keys is not None:
+            self.master_trigger_keys = list(snapshot.master_trigger_keys)
+        print(f"[DEBUG] Preset activated: {name} ({len(snapshot.bindings)} bindings)")
+        return True
+    
+    def set_wheel_policy(self, detent: float, max_rate_hz: float):
+        """Atur berapa step scroll per trigger dan trigger maksimum per detik"""
+        self._wheel.set_policy(WheelPolicy(detent=detent, max_rate_hz=max_rate_hz))
+    
+    def _hook_log(self, message: str):
+        """Log dari hook thread - di-skip saat callback mendekati budget"""
+        if not self._watchdog.shedding:
+            print(message)
             
-    def set_master_triggers(self, keys: List[str]):
-        """Set key yang digunakan untuk toggle On/Off global"""
-        self.master_trigger_keys = keys
+    def set_master_triggers(self, keys: List[str], restart: bool = True):
+        """
+        Set key yang digunakan untuk toggle On/Off global.
+        restart=False saat load awal (listener belum jalan, start_listeners menyusul).
+        """
+        self.master_trigger_keys = [normalize_mouse_trigger(k) for k in keys]
         print(f"[DEBUG] Master triggers set: {keys}")
-        # Force restart service to ensure new keys are picked up by the hook
-        self.restart_service()
+        if restart:
+            # Force restart service to ensure new keys are picked up by the hook
+            self.restart_service()
             
 
 
@@ -247,6 +450,9 @@ class HotkeyManager:
         Low-level hook filter to allow blocking input.
         Returns False to suppress event, None to allow.
         """
+        # Input buatan (SendInput, termasuk action kita sendiri) tidak diumpan ke hotstring
+        self._injected = bool(data.flags & 0x10)
+        
         # WM_KEYDOWN=0x0100, WM_SYSKEYDOWN=0x0104
         if msg not in (0x0100, 0x0104):
             return None
@@ -274,14 +480,14 @@ class HotkeyManager:
                 combo = key_name
                 
         # DEBUG: Print what we see
-        print(f"[FILTER] Combo: {combo}, Masters: {self.master_trigger_keys}")
+        self._hook_log(f"[FILTER] Combo: {combo}, Masters: {self.master_trigger_keys}")
                 
         # 1. CHECK MASTER TOGGLE (Highest Priority)
         # Check if matched ANY master trigger
         if combo in self.master_trigger_keys:
             # Toggle Active State
             self._active = not self._active
-            print(f"[Master] Toggle Active State -> {self._active}")
+            self._hook_log(f"[Master] Toggle Active State -> {self._active}")
             if self.on_status_changed:
                 self.on_status_changed(self._active)
             return False # Consume/Block the toggle key
@@ -290,18 +496,23 @@ class HotkeyManager:
         if not self._active:
             return None
                 
-        # Check matching blocking bindings
-        for binding in self.bindings:
-            if not binding.enabled or not binding.block_input:
-                continue
+        # Check matching blocking bindings (exact match via index, layer atas dulu)
+        for layer in self._layers.top_down:
+            shadowed = False
+            for _, binding in layer.single.get(combo, ()):
+                if not binding.enabled:
+                    continue
+                shadowed = True
+                if not binding.block_input:
+                    continue
             
-            # Check exact match
-            if combo in binding.trigger_keys:
                 # Found a blocking binding!
                 # Execute it (in thread to avoid blocking hook)
-                print(f"[BlockInput] Blocked original input for: {combo}")
+                self._hook_log(f"[BlockInput] Blocked original input for: {combo}")
                 self._execute_binding(binding)
                 return False # BLOCK
+            if shadowed:
+                break  # Layer ini menutupi layer di bawahnya
         
         return None  # ALLOW
 
@@ -333,13 +544,16 @@ class HotkeyManager:
             return '+'.join(modifiers) + '+' + trigger_key_name
         return trigger_key_name
 
-    def _check_bindings(self, trigger: str):
-        """Check apakah trigger match dengan binding apapun"""
+    def _check_bindings(self, trigger: str, repeat: bool = False):
+        """
+        Check apakah trigger match dengan binding apapun.
+        repeat=True (auto-repeat key yang ditahan): hanya exact match, sequence/chord tidak maju.
+        """
             
         # Fallback check for Master Toggle (in case win32 filter didn't catch it / mouse trigger)
         if trigger in self.master_trigger_keys:
              self._active = not self._active
-             print(f"[Master-Check] Toggle Active State -> {self._active}")
+             self._hook_log(f"[Master-Check] Toggle Active State -> {self._active}")
              if self.on_status_changed:
                 self.on_status_changed(self._active)
              return
@@ -347,41 +561,119 @@ class HotkeyManager:
         if not self._active:
             return
             
-        print(f"[DEBUG] Trigger detected: {trigger}")
+        self._hook_log(f"[DEBUG] Trigger detected: {trigger}")
         
-        for binding in self.bindings:
-            if not binding.enabled:
-                continue
-            
-            # If blocking is enabled, we already handled it in win32_event_filter!
-            # So we should SKIP it here to prevent double execution.
-            if binding.block_input:
-                continue
+        layer_key = self._layer_keys.get(trigger)
+        if layer_key is not None:
+            if not repeat:
+                self._on_layer_key(trigger, *layer_key)
+            return
+        
+        stack = self._layers
+        if not repeat:
+            for automaton in stack.automata:
+                self._advance_automaton(automaton, trigger)
+        for resolver in stack.resolvers:
+            if resolver.handles(trigger):
+                resolver.on_down(trigger, time.perf_counter())
+                break
             
+        base_mouse = None
+        if 'mouse_' in trigger:
+            base_mouse = trigger.split('+')[-1] # Get 'mouse_left' from 'ctrl+mouse_left'
+            if base_mouse == trigger:
+                base_mouse = None
+        for layer in stack.top_down:
             # 1. Exact Match
-            if trigger in binding.trigger_keys:
-                print(f"[DEBUG] EXECUTE: {binding.name} (Trigger: {trigger})")
+            exact = self._first_candidate(layer, trigger)
+        
+            # 2. Loose Match for Mouse (e.g. trigger 'ctrl+mouse_left' matches 'mouse_left' binding)
+            loose = None
+            if base_mouse:
+                loose = self._first_candidate(layer, base_mouse)
+            
+            # Binding yang paling awal di list menang (sama seperti linear scan)
+            if exact and (not loose or exact[0] <= loose[0]):
+                binding = exact[1]
+                self._hook_log(f"[DEBUG] EXECUTE: {binding.name} (Trigger: {trigger})")
                 self._execute_binding(binding)
                 return
-            
-            # 2. Loose Match for Mouse (e.g. trigger 'ctrl+mouse_left' matches 'mouse_left' binding)
-            if 'mouse_' in trigger:
-                base_mouse = trigger.split('+')[-1] # Get 'mouse_left' from 'ctrl+mouse_left'
-                if base_mouse in binding.trigger_keys:
-                     print(f"[DEBUG] EXECUTE (Loose): {binding.name} (Base: {base_mouse})")
-                     self._execute_binding(binding)
-                     return
+            elif loose:
+                binding = loose[1]
+                self._hook_log(f"[DEBUG] EXECUTE (Loose): {binding.name} (Base: {base_mouse})")
+                self._execute_binding(binding)
+                return
+    
+    def _on_layer_key(self, trigger: str, name: str, mode: str):
+        """Layer key ditekan: hold = aktif sampai key dilepas, toggle = aktif/nonaktif"""
+        if mode == "hold":
+            if self._layers.push(name):
+                self._held_layers[trigger.rsplit('+', 1)[-1]] = name
+        else:
+            self._layers.toggle(name)
+        self._hook_log(f"[Layer] {trigger} -> active layers {self._layers.names}")
+    
+    def _release_trigger(self, key_name: str):
+        """Key / tombol mouse dilepas: lepas hold layer + key up untuk tap/hold"""
+        layer = self._held_layers.pop(key_name, None)
+        if layer is not None:
+            self._layers.remove(layer)
+            self._hook_log(f"[Layer] {key_name} released -> active layers {self._layers.names}")
+        if self._dual_role_layers:
+            now = time.perf_counter()
+            # Semua layer (bukan hanya yang aktif): layer bisa lepas saat key masih ditahan
+            for index in self._dual_role_layers:
+                index.tap_hold.on_up(key_name, now)
+    
+    def _advance_automaton(self, automaton: TriggerAutomaton, trigger: str):
+        """Chord yang lengkap + sequence yang selesai oleh event ini"""
+        now = time.perf_counter()
+        self._run_first_enabled(automaton.advance(trigger, now), f"Sequence ...{trigger}")
+        # Chord dimajukan setelah key terakhirnya, supaya key itu tidak memutus langkah chord
+        for symbol in automaton.chord_symbols(trigger, now):
+            self._run_first_enabled([automaton.single.get(symbol, ())], f"Chord {symbol}")
+            self._run_first_enabled(automaton.advance(symbol, now), f"Sequence ...{symbol}")
+    
+    def _fire_dual_role(self, binding: HotkeyBinding, mode: str):
+        """Callback TapHoldResolver (hook thread atau thread scheduler)"""
+        if not self._active:
+            return
+        self._hook_log(f"[DEBUG] EXECUTE ({mode}): {binding.name}")
+        # Repeat hanya masuk akal untuk hold (key masih ditahan)
+        self._execute_binding(binding, allow_repeat=(mode == "hold"))
+    
+    def _run_first_enabled(self, matches: List[list], label: str):
+        """Jalankan binding enabled pertama dari tiap daftar entries (sekali, tanpa repeat)"""
+        for entries in matches:
+            for _, binding in entries:
+                if binding.enabled:
+                    self._hook_log(f"[DEBUG] EXECUTE ({label}): {binding.name}")
+                    self._execute_binding(binding, allow_repeat=False)
+                    break
+    
+    def _first_candidate(self, layer: LayerIndex, combo: str) -> Optional[tuple]:
+        """Binding pertama (posisi, binding) yang enabled & non-blocking untuk combo di layer"""
+        for entry in layer.single.get(combo, ()):
+            binding = entry[1]
+            # If blocking is enabled, we already handled it in win32_event_filter!
+            # So we should SKIP it here to prevent double execution.
+            if binding.enabled and not binding.block_input:
+                return entry
+        return None
 
     def _on_key_press(self, key):
         try:
             key_name = self._get_key_name(key)
             if not key_name:
                 return
+            is_repeat = key_name in self._pressed_keys  # Auto-repeat OS
             self._pressed_keys.add(key_name)
             
             # Build trigger combo
             combo = self._build_current_combo(key_name)
-            self._check_bindings(combo)
+            self._check_bindings(combo, repeat=is_repeat)
+            if self._hotstrings.pattern_count:
+                self._feed_hotstring(key, combo)
             
         except AttributeError:
             pass
@@ -392,6 +684,7 @@ class HotkeyManager:
             if not key_name:
                 return
             self._pressed_keys.discard(key_name)
+            self._release_trigger(key_name)
             
             # Handle modifiers cleanup (ctrl_l vs ctrl)
             if 'ctrl' in key_name: self._pressed_keys.discard('ctrl') 
@@ -402,23 +695,79 @@ class HotkeyManager:
             pass
 
     def _on_mouse_click(self, x, y, button, pressed):
-        btn_name = f"mouse_{button.name}" # mouse_left, mouse_right
+        btn_name = f"mouse_{button.name}" # mouse_left, mouse_right, mouse_x1, mouse_x2
         
         if pressed:
+            self._hotstrings.reset()  # Klik memindah caret
             self._pressed_mouse.add(btn_name)
             combo = self._build_current_combo(btn_name)
             self._check_bindings(combo)
         else:
             self._pressed_mouse.discard(btn_name)
+            self._release_trigger(btn_name)
+    
+    def _on_mouse_scroll(self, x, y, dx, dy):
+        # Sebagian besar event free-spin berhenti di coalescer
+        for wheel_name in self._wheel.feed(dx, dy):
+            self._check_bindings(self._build_current_combo(wheel_name))
 
-    def _execute_binding(self, binding: HotkeyBinding):
-        """Execute binding actions"""
+    def _feed_hotstring(self, key, combo: str):
+        """Umpan satu keystroke ke automaton hotstring (hook thread)"""
+        matcher = self._hotstrings
+        if not self._active or self._injected:
+            return
+        if os.name == "nt":
+            window = ctypes.windll.user32.GetForegroundWindow()
+            if window != self._hotstring_window:
+                self._hotstring_window = window
+                matcher.reset()
+        
+        if key == Key.backspace:
+            matcher.backspace()
+            return
+        char = ' ' if key == Key.space else getattr(key, 'char', None)
+        if not char:
+            # Modifier saja tidak memindah caret; key lain (Enter, panah, Tab, ...) reset
+            if key not in (Key.shift, Key.shift_l, Key.shift_r, Key.caps_lock):
+                matcher.reset()
+            return
+        # Shortcut Ctrl/Alt bukan teks (AltGr = Ctrl+Alt tetap teks)
+        if ('ctrl+' in combo) != ('alt+' in combo):
+            matcher.reset()
+            return
+        
+        layers = self._layers
+        for text, entries in matcher.feed(char):
+            for _, binding in entries:
+                if binding.enabled and layers.is_active(binding.layer):
+                    matcher.reset()
+                    self._hook_log(f"[DEBUG] Hotstring: {text!r} -> {binding.name}")
+                    erase = len(text) if binding.hotstring_erase else 0
+                    self._execute_binding(binding, erase_chars=erase, allow_repeat=False)
+                    return
+    
+    def _erase_plan(self, count: int) -> TextPlan:
+        """count x Backspace dalam satu batch SendInput (di-cache per panjang)"""
+        plan = self._erase_plans.get(count)
+        if plan is None:
+            plan = self._erase_plans[count] = TextPlan(
+                KeyAction(ActionType.TYPE_TEXT, text="\b" * count))
+        return plan
+    
+    def _execute_binding(self, binding: HotkeyBinding, erase_chars: int = 0, allow_repeat: bool = True):
+        """
+        Execute binding actions.
+        erase_chars: jumlah Backspace sebelum action (hotstring dengan hotstring_erase).
+        """
         def run_in_thread():
             with self._action_lock:
                 if self.on_binding_triggered:
                     self.on_binding_triggered(binding)
                 
-                if binding.repeat:
+                if erase_chars:
+                    DirectInputSender.type_text(self._erase_plan(erase_chars))
+                
+                if binding.repeat and allow_repeat:
                     self._start_repeat(binding)
                 else:
                     self._execute_actions(binding.actions)
@@ -427,37 +776,63 @@ class HotkeyManager:
     
     def _execute_actions(self, actions: List[KeyAction]):
         """Execute logic menggunakan DirectInputSender (Pynput based)"""
+        program = self._programs.get(id(actions))
         with self._action_lock:
-            for action in actions:
-                if action.action_type == ActionType.KEY_PRESS:
-                    for key in action.keys:
-                        self._send_single_action_key(
-                            key,
-                            press_duration=DirectInputSender.DEFAULT_PRESS_DURATION
-                        )
-                        DirectInputSender.sleep_precise(DirectInputSender.DEFAULT_INTER_KEY_DELAY)
-                elif action.action_type == ActionType.KEY_SEQUENCE:
-                    for key in action.keys:
-                        self._send_single_action_key(
-                            key,
-                            press_duration=DirectInputSender.DEFAULT_PRESS_DURATION
-                        )
-                        DirectInputSender.sleep_precise(DirectInputSender.DEFAULT_INTER_KEY_DELAY)
-                elif action.action_type == ActionType.KEY_DOWN:
-                    for key in action.keys:
-                        self._send_single_action_key(key, press_duration=None, key_down_only=True)
-                elif action.action_type == ActionType.KEY_UP:
-                    for key in action.keys:
-                        self._send_single_action_key(key, press_duration=None, key_up_only=True)
-                elif action.action_type == ActionType.KEY_HOLD:
-                    if not action.keys:
-                        continue
-                    key = action.keys[0]
-                    self._send_single_action_key(key, press_duration=None, key_down_only=True)
-                    DirectInputSender.sleep_precise(max(action.duration, 0) / 1000.0)
-                    self._send_single_action_key(key, press_duration=None, key_up_only=True)
-                elif action.action_type == ActionType.DELAY:
-                    DirectInputSender.sleep_precise(action.duration / 1000.0)
+            if program is None or program.actions is not actions:
+                for action in actions:
+                    self._execute_action(action)
+                return
+            # Program hasil action_optimizer (delay digabung, run key tanpa jeda = satu batch)
+            for kind, payload in program.steps:
+                if kind == STEP_KEYS:
+                    DirectInputSender.key_events(payload)
+                elif kind == STEP_SLEEP:
+                    DirectInputSender.sleep_precise(payload)
+                elif kind == STEP_CLICK:
+                    self._send_single_action_key(payload)
+                else:
+                    self._execute_action(payload)
+    
+    def _execute_action(self, action: KeyAction):
+        if action.action_type == ActionType.KEY_PRESS:
+            for key in action.keys:
+                self._send_single_action_key(
+                    key,
+                    press_duration=DirectInputSender.DEFAULT_PRESS_DURATION
+                )
+                DirectInputSender.sleep_precise(DirectInputSender.DEFAULT_INTER_KEY_DELAY)
+        elif action.action_type == ActionType.KEY_SEQUENCE:
+            for key in action.keys:
+                self._send_single_action_key(
+                    key,
+                    press_duration=DirectInputSender.DEFAULT_PRESS_DURATION
+                )
+                DirectInputSender.sleep_precise(DirectInputSender.DEFAULT_INTER_KEY_DELAY)
+        elif action.action_type == ActionType.KEY_DOWN:
+            for key in action.keys:
+                self._send_single_action_key(key, press_duration=None, key_down_only=True)
+        elif action.action_type == ActionType.KEY_UP:
+            for key in action.keys:
+                self._send_single_action_key(key, press_duration=None, key_up_only=True)
+        elif action.action_type == ActionType.KEY_HOLD:
+            if not action.keys:
+                return
+            key = action.keys[0]
+            self._send_single_action_key(key, press_duration=None, key_down_only=True)
+            DirectInputSender.sleep_precise(max(action.duration, 0) / 1000.0)
+            self._send_single_action_key(key, press_duration=None, key_up_only=True)
+        elif action.action_type == ActionType.DELAY:
+            DirectInputSender.sleep_precise(action.duration / 1000.0)
+        elif action.action_type == ActionType.MOUSE_MOVE:
+            plan = self._move_plans.get(id(action))
+            if plan is None or plan.action is not action:
+                plan = MovePlan(action)
+            DirectInputSender.mouse_move(plan)
+        elif action.action_type == ActionType.TYPE_TEXT:
+            plan = self._text_plans.get(id(action))
+            if plan is None or plan.action is not action:
+                plan = TextPlan(action)
+            DirectInputSender.type_text(plan)
 
     def _send_single_action_key(
         self,
@@ -484,7 +859,8 @@ class HotkeyManager:
             return
 
         if 'mouse_' in key:
-            btn = key.replace('mouse_', '')
+            # mouse_x1/x2 dan mouse_wheel_* (satu notch) juga lewat mouse_click
+            btn = normalize_mouse_trigger(key).replace('mouse_', '')
             DirectInputSender.mouse_click(btn)
             return
 
@@ -518,18 +894,118 @@ class HotkeyManager:
         self._repeat_threads[binding.id] = t
         t.start()
         
+    def _rebuild_index(self):
+        """Bangun ulang trigger index (per layer) dari list bindings"""
+        self._install(self._compile(self.bindings, self.layers, self.master_trigger_keys))
+    
+    def _compile(self, bindings: List[HotkeyBinding], layers: List[Layer],
+                 master_trigger_keys: Optional[List[str]]) -> EngineSnapshot:
+        """Kompilasi semua index untuk bindings (tidak menyentuh state engine)"""
+        triggers: Dict[str, Dict[str, List[tuple]]] = {layer.name: {} for layer in layers}
+        dual_role: Dict[str, Dict[str, List[tuple]]] = {}
+        hotstrings: Dict[str, List[tuple]] = {}
+        for position, binding in enumerate(bindings):
+            for trigger in binding.trigger_keys:
+                if is_hotstring(trigger):
+                    hotstrings.setdefault(hotstring_text(trigger), []).append((position, binding))
+                elif self._is_dual_role(binding, trigger):
+                    dual_role.setdefault(binding.layer, {}).setdefault(
+                        normalize_mouse_trigger(trigger), []).append((position, binding))
+                else:
+                    triggers.setdefault(binding.layer, {}).setdefault(trigger, []).append((position, binding))
+        
+        names = {BASE_LAYER} | set(triggers) | set(dual_role)
+        indexes = {name: self._build_layer_index(name, triggers.get(name, {}), dual_role.get(name, {}))
+                   for name in names}
+        layer_keys: Dict[str, tuple] = {}
+        for layer in layers:
+            for key in layer.hold_keys:
+                layer_keys[normalize_mouse_trigger(key)] = (layer.name, "hold")
+            for key in layer.toggle_keys:
+                layer_keys[normalize_mouse_trigger(key)] = (layer.name, "toggle")
+        
+        actions = [a for b in bindings for a in b.actions]
+        return EngineSnapshot(
+            bindings=bindings,
+            layers=layers,
+            master_trigger_keys=list(master_trigger_keys) if master_trigger_keys is not None else None,
+            indexes=indexes,
+            layer_keys=layer_keys,
+            by_id={b.id: b for b in bindings},
+            hotstrings=HotstringMatcher(hotstrings),
+            move_plans=compile_actions(actions),
+            text_plans=compile_text_actions(actions),
+            programs=compile_programs(
+                [b.actions for b in bindings], self._optimizer_tolerance_ms,
+                DirectInputSender.DEFAULT_PRESS_DURATION * 1000.0,
+                DirectInputSender.DEFAULT_INTER_KEY_DELAY * 1000.0),
+        )
+    
+    def _install(self, snapshot: EngineSnapshot):
+        """Pasang snapshot: swap reference (atomic) supaya hook thread tidak melihat index setengah jadi"""
+        old = self._snapshot
+        self.bindings = snapshot.bindings
+        self.layers = snapshot.layers
+        self._layers.rebind(snapshot.indexes)
+        self._dual_role_layers = snapshot.dual_role_layers
+        self._layer_keys = snapshot.layer_keys
+        self._by_id = snapshot.by_id
+        self._hotstrings = snapshot.hotstrings
+        self._move_plans = snapshot.move_plans
+        self._text_plans = snapshot.text_plans
+        self._programs = snapshot.programs
+        self._snapshot = snapshot
+        if old is not None and old is not snapshot:
+            old.close()
+    
+    def _build_layer_index(self, name: str, triggers: Dict[str, List[tuple]],
+                           dual_role: Dict[str, List[tuple]]) -> LayerIndex:
+        automaton = TriggerAutomaton(triggers, self._sequence_timeout_ms, self._chord_window_ms)
+        tap_hold = TapHoldResolver(dual_role, self._scheduler, self._fire_dual_role,
+                                   self._double_tap_ms, self._tap_stats)
+        return LayerIndex(name, automaton, tap_hold)
+    
+    @staticmethod
+    def _is_dual_role(binding: HotkeyBinding, trigger: str) -> bool:
+        """
+        Trigger mode selain press hanya untuk key/tombol tunggal (punya key up).
+        Sequence, chord, dan wheel tetap dipicu saat down.
+        """
+        if binding.trigger_mode == "press":
+            return False
+        if trigger.rsplit("+", 1)[-1] in WHEEL_TRIGGERS:
+            return False
+        return not is_stateful_trigger(trigger)
+    
     def add_binding(self, binding: HotkeyBinding):
         # Prevent duplicate bindings
         self.bindings = [b for b in self.bindings if b.id != binding.id]
         self.bindings.append(binding)
+        self._rebuild_index()
         # Pynput doesn't need explicit register like 'keyboard' lib
         return True
     
+    def add_bindings(self, bindings: List[HotkeyBinding]):
+        """Tambah banyak binding sekaligus dengan satu kali rebuild index"""
+        new_ids = {b.id for b in bindings}
+        self.bindings = [b for b in self.bindings if b.id not in new_ids] + list(bindings)
+        self._rebuild_index()
+        return True
+    
     def update_binding(self, binding: HotkeyBinding):
+        """Ganti binding di posisi yang sama (urutan/prioritas tidak berubah)"""
+        for i, b in enumerate(self.bindings):
+            if b.id == binding.id:
+                bindings = list(self.bindings)
+                bindings[i] = binding
+                self.bindings = bindings
+                self._rebuild_index()
+                return
         self.add_binding(binding)
         
     def remove_binding(self, binding_id: str):
         self.bindings = [b for b in self.bindings if b.id != binding_id]
+        self._rebuild_index()
         
     def toggle_binding(self, binding_id: str, enabled: bool):
         binding = self.get_binding(binding_id)
@@ -537,20 +1013,23 @@ class HotkeyManager:
             binding.enabled = enabled
         
     def get_binding(self, binding_id: str) -> Optional[HotkeyBinding]:
-        for b in self.bindings:
-            if b.id == binding_id:
-                return b
-        return None
+        return self._by_id.get(binding_id)
     
     def clear_bindings(self):
         self.bindings.clear()
+        self._rebuild_index()
 
     def to_dict(self) -> dict:
-        return {"bindings": [b.to_dict() for b in self.bindings]}
+        return {
+            "bindings": [b.to_dict() for b in self.bindings],
+            "layers": [layer.to_dict() for layer in self.layers]
+        }
     
     def from_dict(self, data: dict):
         self.stop()
         self.bindings = [HotkeyBinding.from_dict(b) for b in data.get("bindings", [])]
+        self.layers = [Layer.from_dict(layer) for layer in data.get("layers", [])]
+        self._rebuild_index()
 
     @property
     def is_active(self) -> bool:
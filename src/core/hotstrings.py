@@ -0,0 +1,98 @@
+"""
+Hotstrings - Trigger teks (mis. mengetik ";gg") dengan automaton Aho-Corasick
+
+Semua abbreviation dikompilasi jadi satu DFA: setiap state punya tabel
+transisi lengkap (goto + failure sudah dilipat), jadi satu keystroke = satu
+lookup dict, O(1) berapa pun jumlah hotstring. Riwayat state disimpan di
+deque terbatas (panjang abbreviation terpanjang) supaya backspace cukup pop.
+Matching case-insensitive.
+"""
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+# Prefix trigger_keys untuk hotstring: "text:;gg"
+HOTSTRING_PREFIX = "text:"
+
+
+def is_hotstring(trigger: str) -> bool:
+    return trigger.startswith(HOTSTRING_PREFIX)
+
+
+def hotstring_text(trigger: str) -> str:
+    """'text:;gg' -> ';gg' (abbreviation tanpa prefix, lowercase)"""
+    return trigger[len(HOTSTRING_PREFIX):].lower()
+
+
+def trigger_display(trigger: str) -> str:
+    """Teks trigger untuk UI: hotstring ditampilkan apa adanya dalam kutip"""
+    if is_hotstring(trigger):
+        return f'"{trigger[len(HOTSTRING_PREFIX):]}"'
+    return trigger.upper()
+
+
+class HotstringMatcher:
+    """
+    DFA Aho-Corasick untuk abbreviation -> entries (mis. [(posisi, binding)]).
+    Dibangun sekali per rebuild index; feed() dipanggil dari hook thread.
+    """
+    
+    def __init__(self, patterns: Dict[str, list]):
+        patterns = {text: entries for text, entries in patterns.items() if text}
+        self.pattern_count = len(patterns)
+        self.max_length = max((len(text) for text in patterns), default=0)
+        
+        # Trie
+        goto: List[Dict[str, int]] = [{}]
+        depth = [0]
+        terminal: Dict[int, str] = {}
+        for text in patterns:
+            state = 0
+            for char in text:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][char] = nxt
+                    goto.append({})
+                    depth.append(depth[state] + 1)
+                state = nxt
+            terminal[state] = text
+        
+        # BFS: failure link -> transisi lengkap per state + output (terpanjang dulu)
+        self._delta: List[Dict[str, int]] = [dict(goto[0])] + [None] * (len(goto) - 1)
+        self._output: List[Tuple[Tuple[str, list], ...]] = [()] * len(goto)
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta = dict(self._delta[fail[state]])
+            delta.update(goto[state])
+            self._delta[state] = delta
+            own = ((terminal[state], patterns[terminal[state]]),) if state in terminal else ()
+            self._output[state] = own + self._output[fail[state]]
+            for char, child in goto[state].items():
+                # Failure child = transisi dari failure state parent
+                fail[child] = self._delta[fail[state]].get(char, 0)
+                queue.append(child)
+        
+        self.state_count = len(goto)
+        self._state = 0
+        self._history = deque(maxlen=max(self.max_length, 1))
+    
+    def reset(self):
+        """Caret pindah / konteks berubah: buffer dikosongkan"""
+        self._state = 0
+        self._history.clear()
+    
+    def feed(self, char: str) -> Tuple[Tuple[str, list], ...]:
+        """Satu karakter diketik -> (abbreviation, entries) yang selesai di sini, terpanjang dulu"""
+        if not self.pattern_count:
+            return ()
+        self._history.append(self._state)
+        self._state = state = self._delta[self._state].get(char.lower(), 0)
+        return self._output[state]
+    
+    def backspace(self):
+        if self._history:
+            self._state = self._history.pop()
+        else:
+            self._state = 0
@@ -66,6 +66,17 @@ MOUSE_BUTTON_MAP = {
     mouse.Button.right: ('mouse_right', '🖱️ Right Click'),
     mouse.Button.middle: ('mouse_middle', '🖱️ Middle Click'),
 }
+# Tombol samping (back/forward) hanya ada di backend win32 pynput
+if hasattr(mouse.Button, 'x1'):
+    MOUSE_BUTTON_MAP[mouse.Button.x1] = ('mouse_x1', '🖱️ Back (X1)')
+    MOUSE_BUTTON_MAP[mouse.Button.x2] = ('mouse_x2', '🖱️ Forward (X2)')
+
+WHEEL_DISPLAY = {
+    'mouse_wheel_up': '🖱️ Wheel Up',
+    'mouse_wheel_down': '🖱️ Wheel Down',
+    'mouse_wheel_left': '🖱️ Wheel Left',
+    'mouse_wheel_right': '🖱️ Wheel Right',
+}
 
 
 class UnifiedInputCapture(QObject):
@@ -103,7 +114,8 @@ class UnifiedInputCapture(QObject):
         
         # Mouse listener
         self._mouse_listener = mouse.Listener(
-            on_click=self._on_mouse_click
+            on_click=self._on_mouse_click,
+            on_scroll=self._on_mouse_scroll
         )
         self._mouse_listener.start()
     
@@ -166,26 +178,40 @@ class UnifiedInputCapture(QObject):
             return
         
         if button in MOUSE_BUTTON_MAP:
-            key_name, display = MOUSE_BUTTON_MAP[button]
+            self._emit_mouse(*MOUSE_BUTTON_MAP[button])
             
-            # Add modifiers
-            parts = []
-            if 'ctrl' in self._modifiers:
-                parts.append('ctrl')
-            if 'shift' in self._modifiers:
-                parts.append('shift')
-            if 'alt' in self._modifiers:
-                parts.append('alt')
+    def _on_mouse_scroll(self, x, y, dx, dy):
+        """Handle mouse wheel (arah saja, tanpa coalescing)"""
+        if not self._capturing or self._captured:
+            return
             
-            if parts:
-                key_name = '+'.join(parts) + '+' + key_name
-                display = ' + '.join(p.upper() for p in parts) + ' + ' + display
+        if dy:
+            key_name = 'mouse_wheel_up' if dy > 0 else 'mouse_wheel_down'
+        elif dx:
+            key_name = 'mouse_wheel_right' if dx > 0 else 'mouse_wheel_left'
+        else:
+            return
+        self._emit_mouse(key_name, WHEEL_DISPLAY[key_name])
             
-            self._emit_result(CapturedInput(
-                input_type=InputType.MOUSE,
-                key_name=key_name,
-                display_name=display
-            ))
+    def _emit_mouse(self, key_name: str, display: str):
+        # Add modifiers
+        parts = []
+        if 'ctrl' in self._modifiers:
+            parts.append('ctrl')
+        if 'shift' in self._modifiers:
+            parts.append('shift')
+        if 'alt' in self._modifiers:
+            parts.append('alt')
+        
+        if parts:
+            key_name = '+'.join(parts) + '+' + key_name
+            display = ' + '.join(p.upper() for p in parts) + ' + ' + display
+        
+        self._emit_result(CapturedInput(
+            input_type=InputType.MOUSE,
+            key_name=key_name,
+            display_name=display
+        ))
     
     def _get_key_name(self, key) -> Optional[str]:
         """Convert pynput key to string name"""
@@ -0,0 +1,89 @@
+"""
+Layers - Keymap berlapis (gaya QMK) untuk HotkeyManager
+
+Setiap layer punya index sendiri (automaton trigger + resolver tap/hold)
+yang dikompilasi sekali saat rebuild. Stack layer aktif disimpan sebagai
+tuple LayerIndex atas -> bawah; lookup berjalan dari atas dan berhenti di
+layer pertama yang punya binding (layer atas menutupi layer bawah, key tanpa
+binding "tembus" ke bawah). Ganti layer = tuple baru di-assign (swap
+reference), tanpa rebuild index dan tanpa restart hook.
+"""
+import threading
+from typing import Dict, Tuple
+
+from src.core.tap_hold import TapHoldResolver
+from src.core.trigger_automaton import TriggerAutomaton
+
+BASE_LAYER = ""
+
+
+class LayerIndex:
+    """Index terkompilasi satu layer"""
+    
+    __slots__ = ("name", "automaton", "single", "tap_hold")
+    
+    def __init__(self, name: str, automaton: TriggerAutomaton, tap_hold: TapHoldResolver):
+        self.name = name
+        self.automaton = automaton
+        self.single = automaton.single  # combo -> [(posisi, binding)]
+        self.tap_hold = tap_hold
+
+
+class LayerStack:
+    """
+    Layer aktif. Base layer selalu paling bawah dan tidak bisa dilepas.
+    Ditulis dari hook thread (layer key) atau command UI; dibaca hook thread tanpa lock.
+    """
+    
+    def __init__(self, indexes: Dict[str, LayerIndex]):
+        self._lock = threading.Lock()
+        self._indexes = indexes
+        self._swap((BASE_LAYER,))
+    
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Nama layer aktif, bawah -> atas"""
+        return self._names
+    
+    @property
+    def indexes(self) -> Dict[str, LayerIndex]:
+        return self._indexes
+    
+    def is_active(self, name: str) -> bool:
+        return name in self._names
+    
+    def _swap(self, names: Tuple[str, ...]):
+        indexes = self._indexes
+        top_down = tuple(indexes[n] for n in reversed(names))
+        # Dihitung sekali per swap supaya hook tidak loop layer yang tidak perlu
+        self.automata = tuple(i.automaton for i in top_down if i.automaton.stateful)
+        self.resolvers = tuple(i.tap_hold for i in top_down if i.tap_hold)
+        self._names = names
+        self.top_down = top_down
+    
+    def push(self, name: str) -> bool:
+        """Aktifkan layer di atas stack (sudah aktif = tidak berubah)"""
+        with self._lock:
+            if name not in self._indexes or name in self._names:
+                return False
+            self._swap(self._names + (name,))
+            return True
+    
+    def remove(self, name: str) -> bool:
+        with self._lock:
+            if name == BASE_LAYER or name not in self._names:
+                return False
+            self._swap(tuple(n for n in self._names if n != name))
+            return True
+    
+    def toggle(self, name: str) -> bool:
+        """Return True jika layer sekarang aktif"""
+        if self.remove(name):
+            return False
+        return self.push(name)
+    
+    def rebind(self, indexes: Dict[str, LayerIndex]):
+        """Index baru setelah rebuild; layer aktif yang masih ada tetap aktif"""
+        with self._lock:
+            self._indexes = indexes
+            self._swap(tuple(n for n in self._names if n in indexes))
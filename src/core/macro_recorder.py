@@ -0,0 +1,269 @@
+"""
+Macro Recorder - Rekam input keyboard/mouse jadi list KeyAction
+
+Event mentah disimpan di kolom array (timestamp perf_counter_ns, down/up, key id)
+dengan tabel nama key yang di-intern, bukan list object per event. Auto-repeat
+OS (key-down berulang selama key ditahan) dibuang saat capture.
+
+Kompresi ke action:
+  - pasangan down/up yang berurutan -> KEY_PRESS (singkat) / KEY_HOLD (lama)
+  - down/up yang bertumpuk (mis. Ctrl + A) -> KEY_DOWN ... KEY_UP
+  - jeda dikuantisasi, jeda idle panjang dipotong, jeda kecil dibuang
+  - KEY_PRESS berturut-turut tanpa jeda -> satu KEY_SEQUENCE
+"""
+import threading
+import time
+import uuid
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from pynput import keyboard, mouse
+
+from src.core.models import ActionType, HotkeyBinding, KeyAction
+
+# Nama pynput Key -> nama key yang dipakai action (DirectInputSender)
+_KEY_ALIASES = {
+    "ctrl_l": "ctrl", "ctrl_r": "ctrl",
+    "shift_l": "shift", "shift_r": "shift",
+    "alt_l": "alt", "alt_r": "alt", "alt_gr": "alt",
+    "cmd": "win", "cmd_l": "win", "cmd_r": "win",
+    "page_up": "pageup", "page_down": "pagedown",
+    "caps_lock": "capslock", "num_lock": "numlock", "scroll_lock": "scrolllock",
+    "print_screen": "printscreen",
+}
+
+
+def key_to_name(key) -> Optional[str]:
+    """Normalisasi key pynput ke nama action ('a', 'space', 'ctrl', 'f1', ...)"""
+    name = getattr(key, "name", None)
+    if name:
+        return _KEY_ALIASES.get(name, name)
+    char = getattr(key, "char", None)
+    if char:
+        return char.lower()
+    vk = getattr(key, "vk", None)
+    if vk is not None:
+        if 96 <= vk <= 105:
+            return f"num{vk - 96}"
+        if 112 <= vk <= 123:
+            return f"f{vk - 111}"
+    return None
+
+
+class MacroRecording:
+    """Event hasil rekaman dalam kolom array (compact, append-only)"""
+    
+    def __init__(self):
+        self.timestamps = array("q")  # ns relatif terhadap awal rekaman
+        self.pressed = array("B")  # 1 = down, 0 = up
+        self.key_ids = array("H")  # index ke self.keys
+        self.keys: List[str] = []
+        self._key_index: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    @property
+    def nbytes(self) -> int:
+        """Ukuran kolom event (tanpa tabel key)"""
+        return sum(col.itemsize * len(col) for col in (self.timestamps, self.pressed, self.key_ids))
+    
+    def key_id(self, name: str) -> int:
+        key_id = self._key_index.get(name)
+        if key_id is None:
+            key_id = self._key_index[name] = len(self.keys)
+            self.keys.append(name)
+        return key_id
+    
+    def append(self, t_ns: int, key_id: int, down: bool):
+        self.timestamps.append(t_ns)
+        self.pressed.append(1 if down else 0)
+        self.key_ids.append(key_id)
+    
+    def truncate(self, length: int):
+        for col in (self.timestamps, self.pressed, self.key_ids):
+            del col[length:]
+    
+    def events(self):
+        """Iterasi (t_ns, key_name, down)"""
+        keys = self.keys
+        for t_ns, key_id, down in zip(self.timestamps, self.key_ids, self.pressed):
+            yield t_ns, keys[key_id], bool(down)
+
+
+def compress_recording(recording: MacroRecording,
+                       quantum_ms: int = 10,
+                       idle_cap_ms: int = 1000,
+                       press_max_ms: int = 120) -> List[KeyAction]:
+    """
+    Ubah event rekaman jadi list KeyAction.
+    quantum_ms: jeda/durasi dibulatkan ke kelipatan ini (jeda < quantum/2 dibuang)
+    idle_cap_ms: jeda lebih panjang dari ini dipotong jadi idle_cap_ms
+    press_max_ms: down/up berurutan sependek ini -> KEY_PRESS, lebih lama -> KEY_HOLD
+    """
+    def quantize(ns: int) -> int:
+        ms = ns / 1_000_000
+        return int(round(ms / quantum_ms)) * quantum_ms if quantum_ms > 0 else int(round(ms))
+    
+    events = list(recording.events())
+    actions: List[KeyAction] = []
+    last_end: Optional[int] = None
+    
+    def emit(action: KeyAction, start_ns: int, end_ns: int):
+        nonlocal last_end
+        if last_end is not None:
+            delay = min(quantize(start_ns - last_end), idle_cap_ms)
+            if delay > 0:
+                if actions and actions[-1].action_type == ActionType.DELAY:
+                    actions[-1].duration += delay
+                else:
+                    actions.append(KeyAction(action_type=ActionType.DELAY, duration=delay))
+        
+        # KEY_PRESS tanpa jeda sebelumnya -> gabung ke sequence
+        previous = actions[-1] if actions else None
+        if (action.action_type == ActionType.KEY_PRESS and previous is not None
+                and previous.action_type in (ActionType.KEY_PRESS, ActionType.KEY_SEQUENCE)):
+            previous.action_type = ActionType.KEY_SEQUENCE
+            previous.keys.extend(action.keys)
+        else:
+            actions.append(action)
+        last_end = end_ns
+    
+    i = 0
+    while i < len(events):
+        t_ns, key, down = events[i]
+        following = events[i + 1] if i + 1 < len(events) else None
+        
+        if down and following is not None and following[1] == key and not following[2]:
+            # Down langsung diikuti up key yang sama -> satu action
+            held_ms = quantize(following[0] - t_ns)
+            if held_ms <= press_max_ms or key.startswith("mouse_"):
+                # Mouse: executor hanya bisa klik, bukan tahan
+                emit(KeyAction(action_type=ActionType.KEY_PRESS, keys=[key]), t_ns, following[0])
+            else:
+                emit(KeyAction(action_type=ActionType.KEY_HOLD, keys=[key], duration=held_ms),
+                     t_ns, following[0])
+            i += 2
+            continue
+        
+        action_type = ActionType.KEY_DOWN if down else ActionType.KEY_UP
+        emit(KeyAction(action_type=action_type, keys=[key]), t_ns, t_ns)
+        i += 1
+    
+    return actions
+
+
+class MacroRecorder:
+    """
+    Rekam keyboard + mouse button lewat listener pynput.
+    Callback listener hanya append ke kolom array (murah, thread-safe via lock).
+    """
+    
+    def __init__(self):
+        self.recording = MacroRecording()
+        self._down = set()  # key id yang sedang ditekan (filter auto-repeat)
+        self._lock = threading.Lock()
+        self._start_ns = 0
+        self._keyboard_listener = None
+        self._mouse_listener = None
+        self.raw_event_count = 0  # Termasuk auto-repeat yang dibuang
+    
+    @property
+    def is_recording(self) -> bool:
+        return self._keyboard_listener is not None
+    
+    @property
+    def event_count(self) -> int:
+        return len(self.recording)
+    
+    def start(self):
+        if self.is_recording:
+            return
+        self.recording = MacroRecording()
+        self._down.clear()
+        self.raw_event_count = 0
+        self._start_ns = time.perf_counter_ns()
+        
+        self._keyboard_listener = keyboard.Listener(
+            on_press=lambda key: self._on_key(key, True),
+            on_release=lambda key: self._on_key(key, False))
+        self._mouse_listener = mouse.Listener(on_click=self._on_click, on_scroll=self._on_scroll)
+        self._keyboard_listener.start()
+        self._mouse_listener.start()
+        print("[DEBUG] Macro recording started.")
+    
+    def stop(self, discard_last_click: bool = False) -> MacroRecording:
+        """
+        Hentikan rekaman.
+        discard_last_click=True: buang klik kiri terakhir (klik tombol Stop di UI).
+        """
+        for listener in (self._keyboard_listener, self._mouse_listener):
+            if listener is not None:
+                listener.stop()
+        self._keyboard_listener = self._mouse_listener = None
+        
+        with self._lock:
+            if discard_last_click:
+                self._trim_last_click()
+        print(f"[DEBUG] Macro recording stopped: {len(self.recording)} events "
+              f"({self.raw_event_count} raw, {self.recording.nbytes} bytes)")
+        return self.recording
+    
+    def to_actions(self, **options) -> List[KeyAction]:
+        """Action hasil kompresi (lihat compress_recording)"""
+        return compress_recording(self.recording, **options)
+    
+    def to_binding(self, name: str, trigger_keys: List[str], **options) -> HotkeyBinding:
+        return HotkeyBinding(id=str(uuid.uuid4()), name=name, trigger_keys=list(trigger_keys),
+                             actions=self.to_actions(**options))
+    
+    # ===================
+    # LISTENER CALLBACKS
+    # ===================
+    
+    def _record(self, name: str, down: bool):
+        t_ns = time.perf_counter_ns() - self._start_ns
+        with self._lock:
+            self.raw_event_count += 1
+            key_id = self.recording.key_id(name)
+            if down:
+                if key_id in self._down:
+                    return  # Auto-repeat
+                self._down.add(key_id)
+            else:
+                if key_id not in self._down:
+                    return  # Up tanpa down (mis. tombol yang memulai rekaman)
+                self._down.discard(key_id)
+            self.recording.append(t_ns, key_id, down)
+    
+    def _on_key(self, key, down: bool):
+        name = key_to_name(key)
+        if name:
+            self._record(name, down)
+    
+    def _on_click(self, x, y, button, pressed):
+        self._record(f"mouse_{button.name}", pressed)
+    
+    def _on_scroll(self, x, y, dx, dy):
+        # Satu notch = down + up -> dikompres jadi KEY_PRESS mouse_wheel_*
+        if dy:
+            name = "mouse_wheel_up" if dy > 0 else "mouse_wheel_down"
+        elif dx:
+            name = "mouse_wheel_right" if dx > 0 else "mouse_wheel_left"
+        else:
+            return
+        self._record(name, True)
+        self._record(name, False)
+    
+    def _trim_last_click(self):
+        """Buang mouse_left down terakhir (+ up-nya) jika tidak ada event lain sesudahnya"""
+        recording = self.recording
+        left = recording._key_index.get("mouse_left")
+        if left is None:
+            return
+        for index in range(len(recording) - 1, -1, -1):
+            if recording.key_ids[index] != left:
+                return
+            if recording.pressed[index]:
+                recording.truncate(index)
+                return
@@ -0,0 +1,192 @@
+"""
+Models - Data class hotkey (tanpa dependency pynput / Qt)
+Dipakai UI, persistence dan engine; import modul ini murah.
+"""
+from dataclasses import dataclass, field
+from typing import List
+from enum import Enum
+
+
+class ActionType(Enum):
+    """Tipe aksi yang bisa dilakukan"""
+    KEY_PRESS = "key_press"      # Tekan dan lepas
+    KEY_DOWN = "key_down"        # Hanya tekan (tidak lepas)
+    KEY_UP = "key_up"            # Hanya lepas
+    KEY_HOLD = "key_hold"        # Tahan selama durasi
+    KEY_SEQUENCE = "key_sequence"  # Urutan tombol
+    DELAY = "delay"              # Tunggu
+    MOUSE_MOVE = "mouse_move"    # Gerak kursor (relatif/absolut, opsional halus)
+    TYPE_TEXT = "type_text"      # Ketik teks Unicode
+
+
+# Kurva gerak mouse untuk MOUSE_MOVE dengan duration > 0
+MOVE_CURVES = ("linear", "bezier")
+
+# Mode TYPE_TEXT: "unicode" = KEYEVENTF_UNICODE, "keys" = key fisik sesuai layout aktif
+TEXT_MODES = ("unicode", "keys")
+
+# Mode trigger binding: kapan key trigger dianggap "terjadi"
+#   press      = saat key down (perilaku lama)
+#   release    = saat key up
+#   tap        = key up sebelum hold_ms (ditunda jika key yang sama punya double_tap)
+#   hold       = key masih ditahan setelah hold_ms
+#   double_tap = key down kedua dalam double-tap window setelah tap pertama
+TRIGGER_MODES = ("press", "release", "tap", "hold", "double_tap")
+
+
+@dataclass
+class KeyAction:
+    """
+    Single action dalam sequence.
+    MOUSE_MOVE: x/y = delta (relatif) atau posisi layar (absolute=True),
+    duration > 0 = gerak halus sepanjang curve selama duration ms.
+    TYPE_TEXT: text diketik dengan text_mode; duration = jeda per karakter (ms, 0 = sekaligus).
+    """
+    action_type: ActionType
+    keys: List[str] = field(default_factory=list)
+    duration: int = 0
+    x: int = 0
+    y: int = 0
+    absolute: bool = False
+    curve: str = "linear"
+    text: str = ""
+    text_mode: str = "unicode"
+    
+    def to_dict(self) -> dict:
+        data = {
+            "action_type": self.action_type.value,
+            "keys": self.keys,
+            "duration": self.duration
+        }
+        if self.action_type == ActionType.MOUSE_MOVE:
+            data.update(x=self.x, y=self.y, absolute=self.absolute, curve=self.curve)
+        elif self.action_type == ActionType.TYPE_TEXT:
+            data.update(text=self.text, text_mode=self.text_mode)
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'KeyAction':
+        return cls(
+            action_type=ActionType(data["action_type"]),
+            keys=data.get("keys", []),
+            duration=data.get("duration", 0),
+            x=data.get("x", 0),
+            y=data.get("y", 0),
+            absolute=data.get("absolute", False),
+            curve=data.get("curve", "linear"),
+            text=data.get("text", ""),
+            text_mode=data.get("text_mode", "unicode")
+        )
+
+
+@dataclass
+class HotkeyBinding:
+    """Single hotkey binding dengan multiple triggers"""
+    id: str
+    name: str
+    trigger_keys: List[str] = field(default_factory=list)
+    actions: List[KeyAction] = field(default_factory=list)
+    enabled: bool = True
+    repeat: bool = False
+    repeat_delay: int = 100
+    block_input: bool = False
+    hotstring_erase: bool = False  # Hapus abbreviation yang diketik sebelum action jalan
+    trigger_mode: str = "press"  # Salah satu TRIGGER_MODES
+    hold_ms: int = 250  # Batas tap/hold (ms) untuk mode tap & hold
+    layer: str = ""  # Nama layer ("" = base layer, selalu aktif)
+    
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "trigger_keys": self.trigger_keys,
+            "actions": [a.to_dict() for a in self.actions],
+            "enabled": self.enabled,
+            "repeat": self.repeat,
+            "repeat_delay": self.repeat_delay,
+            "block_input": self.block_input,
+            "hotstring_erase": self.hotstring_erase,
+            "trigger_mode": self.trigger_mode,
+            "hold_ms": self.hold_ms,
+            "layer": self.layer
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'HotkeyBinding':
+        trigger_keys = data.get("trigger_keys", [])
+        if not trigger_keys and "trigger_key" in data:
+            trigger_keys = [data["trigger_key"]]
+        
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            trigger_keys=trigger_keys,
+            actions=[KeyAction.from_dict(a) for a in data.get("actions", [])],
+            enabled=data.get("enabled", True),
+            repeat=data.get("repeat", False),
+            repeat_delay=data.get("repeat_delay", 100),
+            block_input=data.get("block_input", False),
+            hotstring_erase=data.get("hotstring_erase", False),
+            trigger_mode=data.get("trigger_mode", "press"),
+            hold_ms=data.get("hold_ms", 250),
+            layer=data.get("layer", "")
+        )
+
+
+@dataclass
+class Layer:
+    """
+    Layer keymap (gaya QMK): binding dengan layer == name hanya jalan saat layer aktif.
+    hold_keys: layer aktif selama key ditahan; toggle_keys: tekan = aktif/nonaktif
+    """
+    name: str
+    hold_keys: List[str] = field(default_factory=list)
+    toggle_keys: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "hold_keys": self.hold_keys,
+            "toggle_keys": self.toggle_keys
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Layer':
+        return cls(
+            name=data["name"],
+            hold_keys=data.get("hold_keys", []),
+            toggle_keys=data.get("toggle_keys", [])
+        )
+
+
+@dataclass
+class ProfileRule:
+    """
+    Auto-switch profile: jika window aktif cocok, profile (path data file) dipasang.
+    process: nama exe (case-insensitive, kosong = semua); title: substring judul window.
+    """
+    profile: str
+    process: str = ""
+    title: str = ""
+    
+    def matches(self, process: str, title: str) -> bool:
+        if not self.process and not self.title:
+            return False
+        if self.process and self.process.lower() != process.lower():
+            return False
+        return not self.title or self.title.lower() in title.lower()
+    
+    def to_dict(self) -> dict:
+        return {
+            "profile": self.profile,
+            "process": self.process,
+            "title": self.title
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ProfileRule':
+        return cls(
+            profile=data["profile"],
+            process=data.get("process", ""),
+            title=data.get("title", "")
+        )
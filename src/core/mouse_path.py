@@ -0,0 +1,156 @@
+"""
+Mouse Path - Kompilasi MOUSE_MOVE jadi titik path + batch INPUT siap kirim
+
+Path dihitung sekali saat binding di-load (bukan per eksekusi):
+  - sampel path (PATH_RATE_HZ) disimpan di array('i'), bukan list tuple
+  - titik dikelompokkan per batch; playback mengirim satu SendInput per batch
+    pada jadwal deadline tetap (BATCH_RATE_HZ), jadi path 500 Hz = 125 call/detik
+  - koordinat absolut dinormalisasi ke virtual desktop (semua monitor, 0..65535)
+Gerak absolut yang halus butuh posisi kursor saat mulai: bentuk kurva tetap
+di-precompute, titiknya di-materialize sekali di awal playback.
+"""
+import ctypes
+import math
+import os
+from array import array
+from typing import List, Optional, Tuple
+
+from src.core.models import ActionType, KeyAction
+
+PATH_RATE_HZ = 500
+BATCH_RATE_HZ = 125
+
+# Lengkungan bezier: offset control point tegak lurus arah gerak (x jarak)
+BEZIER_CURVATURE = 0.2
+
+# SendInput mouse flags
+MOUSEEVENTF_MOVE = 0x0001
+MOUSEEVENTF_VIRTUALDESK = 0x4000
+MOUSEEVENTF_ABSOLUTE = 0x8000
+
+# GetSystemMetrics: virtual screen (gabungan semua monitor)
+_SM_XVIRTUALSCREEN, _SM_YVIRTUALSCREEN = 76, 77
+_SM_CXVIRTUALSCREEN, _SM_CYVIRTUALSCREEN = 78, 79
+
+
+def virtual_screen() -> Tuple[int, int, int, int]:
+    """(left, top, width, height) virtual desktop; monitor kiri/atas bisa negatif"""
+    if os.name == "nt":
+        metrics = ctypes.windll.user32.GetSystemMetrics
+        return (metrics(_SM_XVIRTUALSCREEN), metrics(_SM_YVIRTUALSCREEN),
+                max(1, metrics(_SM_CXVIRTUALSCREEN)), max(1, metrics(_SM_CYVIRTUALSCREEN)))
+    return 0, 0, 65536, 65536
+
+
+def curve_shape(samples: int, curve: str) -> Tuple[array, array]:
+    """
+    Bentuk kurva ternormalisasi untuk gerak (0,0) -> (1,0):
+    u = progres sepanjang arah gerak, v = offset tegak lurus (x jarak).
+    """
+    us, vs = array("d"), array("d")
+    c = BEZIER_CURVATURE
+    for i in range(1, samples + 1):
+        t = i / samples
+        if curve == "bezier":
+            # Ease in-out + cubic bezier P0=(0,0) P1=(1/3,c) P2=(2/3,c) P3=(1,0)
+            s = t * t * (3 - 2 * t)
+            a, b = 3 * s * (1 - s) ** 2, 3 * s * s * (1 - s)
+            us.append(a / 3 + b * 2 / 3 + s ** 3)
+            vs.append((a + b) * c)
+        else:
+            us.append(t)
+            vs.append(0.0)
+    return us, vs
+
+
+class MovePlan:
+    """MOUSE_MOVE yang sudah dikompilasi"""
+    
+    def __init__(self, action: KeyAction, rate_hz: int = PATH_RATE_HZ,
+                 batch_hz: int = BATCH_RATE_HZ):
+        self.action = action
+        self.absolute = action.absolute
+        samples = max(1, round(max(action.duration, 0) / 1000.0 * rate_hz))
+        self.samples = samples
+        per_batch = max(1, round(rate_hz / batch_hz))
+        self.batch_size = per_batch
+        self.batch_interval = per_batch / rate_hz if samples > 1 else 0.0
+        self.shape = curve_shape(samples, action.curve)
+        
+        # Relatif: delta per sampel langsung final (posisi awal tidak relevan)
+        self.points: Optional[Tuple[array, array]] = None
+        if not self.absolute:
+            self.points = self._materialize(0, 0, action.x, action.y, relative=True)
+        self._win_batches = None
+    
+    @property
+    def batch_count(self) -> int:
+        return math.ceil(self.samples / self.batch_size)
+    
+    def _materialize(self, x0: int, y0: int, x1: int, y1: int, relative: bool) -> Tuple[array, array]:
+        """Titik path absolut (atau delta antar sampel jika relative)"""
+        us, vs = self.shape
+        dx, dy = x1 - x0, y1 - y0
+        xs, ys = array("i"), array("i")
+        prev_x, prev_y = x0, y0
+        for u, v in zip(us, vs):
+            # Pembulatan posisi kumulatif: total delta selalu tepat (tanpa drift)
+            x = round(x0 + dx * u - dy * v)
+            y = round(y0 + dy * u + dx * v)
+            if relative:
+                xs.append(x - prev_x)
+                ys.append(y - prev_y)
+                prev_x, prev_y = x, y
+            else:
+                xs.append(x)
+                ys.append(y)
+        return xs, ys
+    
+    def points_from(self, start: Tuple[int, int]) -> Tuple[array, array]:
+        """Titik untuk playback (absolut: dari posisi kursor saat ini)"""
+        if self.points is not None:
+            return self.points
+        return self._materialize(start[0], start[1], self.action.x, self.action.y, relative=False)
+    
+    def batches(self, xs: array, ys: array) -> List[Tuple[array, array]]:
+        size = self.batch_size
+        return [(xs[i:i + size], ys[i:i + size]) for i in range(0, len(xs), size)]
+    
+    # ===================
+    # WINDOWS (SendInput)
+    # ===================
+    
+    def input_batches(self, input_type, start: Tuple[int, int]) -> list:
+        """
+        Batch ctypes INPUT array (satu SendInput per batch).
+        Relatif: dibangun sekali dan di-cache; absolut: per playback.
+        """
+        if self._win_batches is not None:
+            return self._win_batches
+        xs, ys = self.points_from(start)
+        flags = MOUSEEVENTF_MOVE
+        if self.absolute:
+            flags |= MOUSEEVENTF_ABSOLUTE | MOUSEEVENTF_VIRTUALDESK
+            left, top, width, height = virtual_screen()
+            # Normalisasi ke 0..65535 di seluruh virtual desktop
+            sx, sy = 65535.0 / max(1, width - 1), 65535.0 / max(1, height - 1)
+            xs = array("i", (round((x - left) * sx) for x in xs))
+            ys = array("i", (round((y - top) * sy) for y in ys))
+        
+        batches = []
+        for bx, by in self.batches(xs, ys):
+            inputs = (input_type * len(bx))()
+            for item, x, y in zip(inputs, bx, by):
+                item.type = 0  # INPUT_MOUSE
+                item.mi.dx = x
+                item.mi.dy = y
+                item.mi.dwFlags = flags
+            batches.append(inputs)
+        if not self.absolute:
+            self._win_batches = batches
+        return batches
+
+
+def compile_actions(actions: List[KeyAction]) -> dict:
+    """id(action) -> MovePlan untuk semua MOUSE_MOVE di list"""
+    return {id(a): MovePlan(a) for a in actions if a.action_type == ActionType.MOUSE_MOVE}
@@ -0,0 +1,103 @@
+"""
+Mouse Wheel - Trigger scroll (mouse_wheel_up/down/left/right) dengan coalescing
+
+Wheel free-spin / high-resolution bisa mengirim ratusan event per detik dari
+hook. Event diakumulasi per sumbu dan baru jadi trigger setelah `detent` step;
+trigger per arah dibatasi `max_rate_hz`, step yang datang di antaranya
+digabung (tidak antre), jadi dispatcher tidak pernah kebanjiran.
+"""
+import time
+from dataclasses import dataclass
+from typing import Callable, List
+
+WHEEL_UP = "mouse_wheel_up"
+WHEEL_DOWN = "mouse_wheel_down"
+WHEEL_LEFT = "mouse_wheel_left"
+WHEEL_RIGHT = "mouse_wheel_right"
+WHEEL_TRIGGERS = (WHEEL_UP, WHEEL_DOWN, WHEEL_LEFT, WHEEL_RIGHT)
+
+# Nama lama dari dialog capture Qt -> nama yang dilaporkan hook (pynput x1/x2)
+MOUSE_ALIASES = {
+    "mouse_back": "mouse_x1",
+    "mouse_forward": "mouse_x2",
+}
+
+
+def normalize_mouse_trigger(trigger: str) -> str:
+    """'ctrl+mouse_back' -> 'ctrl+mouse_x1' (trigger lain tidak berubah)"""
+    base = trigger.rsplit("+", 1)[-1]
+    alias = MOUSE_ALIASES.get(base)
+    if alias is None:
+        return trigger
+    return trigger[:len(trigger) - len(base)] + alias
+
+
+@dataclass
+class WheelPolicy:
+    """
+    detent: jumlah step wheel (1 = satu notch) per trigger
+    max_rate_hz: trigger maksimum per detik per arah (0 = tanpa batas)
+    """
+    detent: float = 1.0
+    max_rate_hz: float = 20.0
+
+
+class WheelCoalescer:
+    """Ubah event scroll mentah (dx, dy) jadi trigger wheel; dipanggil dari hook thread"""
+    
+    def __init__(self, policy: WheelPolicy = None, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._accum = [0.0, 0.0]  # sumbu x, y
+        self._last_fire = {name: float("-inf") for name in WHEEL_TRIGGERS}
+        self.events = 0
+        self.fired = 0
+        self.coalesced = 0  # Step yang digabung karena rate limit
+        self.set_policy(policy or WheelPolicy())
+    
+    def set_policy(self, policy: WheelPolicy):
+        self.policy = policy
+        self._detent = max(policy.detent, 1e-6)
+        self._min_interval = 1.0 / policy.max_rate_hz if policy.max_rate_hz > 0 else 0.0
+        self._accum = [0.0, 0.0]
+    
+    def feed(self, dx: float, dy: float) -> List[str]:
+        """Satu event scroll -> trigger yang harus dijalankan (maksimal satu per sumbu)"""
+        self.events += 1
+        fired = []
+        # pynput: dy > 0 = scroll up, dx > 0 = scroll right
+        for axis, delta, positive, negative in ((1, dy, WHEEL_UP, WHEEL_DOWN),
+                                                (0, dx, WHEEL_RIGHT, WHEEL_LEFT)):
+            if not delta:
+                continue
+            accum = self._accum[axis]
+            # Ganti arah: sisa akumulasi arah lama dibuang
+            if accum * delta < 0:
+                accum = 0.0
+            accum += delta
+            if abs(accum) < self._detent:
+                self._accum[axis] = accum
+                continue
+            
+            name = positive if accum > 0 else negative
+            now = self._clock()
+            if now - self._last_fire[name] < self._min_interval:
+                # Rate limit: tahan tepat satu detent (trigger berikutnya langsung
+                # jalan saat interval lewat), sisanya digabung
+                self.coalesced += 1
+                self._accum[axis] = self._detent if accum > 0 else -self._detent
+                continue
+            
+            self._last_fire[name] = now
+            self._accum[axis] = 0.0
+            self.fired += 1
+            fired.append(name)
+        return fired
+    
+    def snapshot(self) -> dict:
+        return {
+            "detent": self.policy.detent,
+            "max_rate_hz": self.policy.max_rate_hz,
+            "events": self.events,
+            "fired": self.fired,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,64 @@
+"""
+Persistence - Lokasi & format data file / profile (tanpa Qt)
+Dipakai HotkeyController (GUI) dan headless runner.
+"""
+import json
+import os
+import sys
+
+DATA_FILE_NAME = "tobelsoft_macro_data.json"
+PROFILE_RULES_FILE_NAME = "profile_rules.json"
+
+
+def default_data_dir() -> str:
+    """Folder appdata (di samping EXE, atau project root saat development)"""
+    if getattr(sys, 'frozen', False):
+        # If EXE, use folder of executable
+        base_path = os.path.dirname(sys.executable)
+    else:
+        # If DEV, use project root (current file: src/core/persistence.py)
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        base_path = os.path.abspath(os.path.join(current_dir, "..", ".."))
+    return os.path.join(base_path, "appdata")
+
+
+def default_data_file() -> str:
+    return os.path.join(default_data_dir(), DATA_FILE_NAME)
+
+
+def load_profile(manager, path: str):
+    """
+    Load bindings + master trigger keys dari file ke HotkeyManager.
+    Listener belum/tidak perlu di-restart (start_listeners dipanggil sesudahnya).
+    """
+    with open(path, 'r') as f:
+        data = json.load(f)
+    manager.from_dict(data)
+    manager.set_master_triggers(data.get("master_trigger_keys", []), restart=False)
+
+
+def save_profile(manager, path: str):
+    """Simpan bindings + master trigger keys milik HotkeyManager ke file"""
+    data = manager.to_dict()
+    data["master_trigger_keys"] = manager.master_trigger_keys
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=4)
+
+
+def read_profile_data(path: str) -> dict:
+    """Isi profile mentah (bindings, layers, master keys) untuk di-warm engine"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def load_profile_rules(path: str) -> list:
+    """Rule auto-switch profile (list dict ProfileRule); kosong jika file belum ada"""
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r') as f:
+        return json.load(f).get("rules", [])
+
+
+def save_profile_rules(path: str, rules: list):
+    with open(path, 'w') as f:
+        json.dump({"rules": rules}, f, indent=4)
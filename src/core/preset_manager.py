@@ -4,10 +4,15 @@ Preset Manager - Save/Load/Import/Export presets
 import json
 import os
 from pathlib import Path
-from typing import List, Optional
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 
+from src.core.bulk_import import BulkImportResult, parse_files_parallel
+
+
+INDEX_VERSION = 1
+
 
 @dataclass
 class Preset:
@@ -16,12 +21,14 @@ class Preset:
     description: str
     created_at: str
     data: dict  # Hotkey bindings data
+    tags: List[str] = field(default_factory=list)
     
     def to_dict(self) -> dict:
         return {
             "name": self.name,
             "description": self.description,
             "created_at": self.created_at,
+            "tags": self.tags,
             "data": self.data
         }
     
@@ -31,10 +38,58 @@ class Preset:
             name=data.get("name", "Unnamed"),
             description=data.get("description", ""),
             created_at=data.get("created_at", ""),
-            data=data.get("data", {})
+            data=data.get("data", {}),
+            tags=data.get("tags", [])
         )
 
 
+@dataclass
+class PresetInfo:
+    """Metadata preset (tanpa body) yang disimpan di index"""
+    name: str
+    description: str
+    created_at: str
+    size: int
+    mtime_ns: int
+    path: str
+    tags: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "created_at": self.created_at,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "path": self.path,
+            "tags": self.tags
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PresetInfo':
+        return cls(
+            name=data.get("name", "Unnamed"),
+            description=data.get("description", ""),
+            created_at=data.get("created_at", ""),
+            size=data.get("size", 0),
+            mtime_ns=data.get("mtime_ns", 0),
+            path=data.get("path", ""),
+            tags=data.get("tags", [])
+        )
+
+
+def parse_preset_file(filepath: str) -> Preset:
+    """Parse & validasi satu file preset (dipanggil dari thread pool)"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or not isinstance(data.get("data", {}), dict):
+        raise ValueError("Invalid format: Not a preset file")
+    preset = Preset.from_dict(data)
+    if not preset.created_at:
+        preset.created_at = datetime.now().isoformat()
+    return preset
+
+
 class PresetManager:
     """Manager untuk preset storage"""
     
@@ -46,56 +101,327 @@ class PresetManager:
             self.presets_dir = Path.home() / ".tobelsoft_macro" / "presets"
         
         self.presets_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Index disimpan di samping folder preset (bukan di dalamnya),
+        # supaya menulis index tidak mengubah mtime folder preset.
+        self.index_file = self.presets_dir.with_name(self.presets_dir.name + ".index.json")
+        
+        # Metadata cache: filename -> PresetInfo
+        self._entries: Dict[str, PresetInfo] = {}
+        # File .json yang gagal di-parse: filename -> (size, mtime_ns), dicoba lagi saat stat berubah
+        self._unparsed: Dict[str, Tuple[int, int]] = {}
+        # Lookup O(1) berdasarkan nama (preset terbaru jika nama duplikat)
+        self._by_name: Dict[str, PresetInfo] = {}
+        self._sorted: Optional[List[PresetInfo]] = None
+        self._dir_mtime_ns = -1
+        
+        self._load_index()
+    
+    # ==================
+    # INDEX
+    # ==================
+    
+    def _load_index(self):
+        """Load persistent index dari disk (jika ada & valid)"""
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                return
+            self._dir_mtime_ns = data.get("dir_mtime_ns", -1)
+            for filename, entry in data.get("entries", {}).items():
+                self._entries[filename] = PresetInfo.from_dict(entry)
+            for filename, (size, mtime_ns) in data.get("unparsed", {}).items():
+                self._unparsed[filename] = (size, mtime_ns)
+            self._rebuild_lookup()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading preset index: {e}")
+            self._entries.clear()
+            self._unparsed.clear()
+            self._dir_mtime_ns = -1
+    
+    def _save_index(self):
+        """Tulis index secara atomic (tmp file + replace)"""
+        data = {
+            "version": INDEX_VERSION,
+            "dir_mtime_ns": self._dir_mtime_ns,
+            "entries": {name: info.to_dict() for name, info in self._entries.items()},
+            "unparsed": {name: list(stat) for name, stat in self._unparsed.items()}
+        }
+        tmp_file = self.index_file.with_name(self.index_file.name + ".tmp")
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_file, self.index_file)
+        except Exception as e:
+            print(f"Error saving preset index: {e}")
+    
+    def _rebuild_lookup(self):
+        """Bangun ulang lookup nama -> preset terbaru"""
+        self._by_name.clear()
+        for info in self._entries.values():
+            current = self._by_name.get(info.name)
+            if current is None or info.created_at > current.created_at:
+                self._by_name[info.name] = info
+        self._sorted = None
+    
+    def _read_info(self, path: Path, stat: os.stat_result) -> Optional[PresetInfo]:
+        """Parse satu file preset untuk mengambil metadata-nya"""
+        preset = self._parse_file(path)
+        if preset is None:
+            return None
+        return PresetInfo(
+            name=preset.name,
+            description=preset.description,
+            created_at=preset.created_at,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            path=str(path),
+            tags=preset.tags
+        )
+    
+    @staticmethod
+    def _parse_file(path: Path) -> Optional[Preset]:
+        """Baca file preset; None jika tidak bisa dibaca / bukan object preset"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("Invalid format: Not a preset file")
+            return Preset.from_dict(data)
+        except Exception as e:
+            print(f"Error loading preset {path}: {e}")
+            return None
+    
+    def _refresh_index(self):
+        """
+        Validasi index terhadap folder preset.
+        Jika mtime folder tidak berubah (tidak ada file ditambah/dihapus), hanya
+        file yang ada di index yang di-stat - file yang diedit di tempat
+        (size / mtime berubah) di-parse ulang, file yang hilang dibuang.
+        Jika berubah, folder di-scan ulang dan hanya file yang stat-nya berubah
+        yang di-parse.
+        """
+        try:
+            dir_mtime_ns = self.presets_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            self.presets_dir.mkdir(parents=True, exist_ok=True)
+            dir_mtime_ns = self.presets_dir.stat().st_mtime_ns
+        
+        if dir_mtime_ns == self._dir_mtime_ns:
+            self._revalidate_entries()
+            return
+        
+        entries: Dict[str, PresetInfo] = {}
+        unparsed: Dict[str, Tuple[int, int]] = {}
+        with os.scandir(self.presets_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                cached = self._entries.get(entry.name)
+                if cached and cached.size == stat.st_size and cached.mtime_ns == stat.st_mtime_ns:
+                    entries[entry.name] = cached
+                    continue
+                info = self._read_info(Path(entry.path), stat)
+                if info:
+                    entries[entry.name] = info
+                else:
+                    unparsed[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        
+        self._entries = entries
+        self._unparsed = unparsed
+        self._dir_mtime_ns = dir_mtime_ns
+        self._rebuild_lookup()
+        self._save_index()
+    
+    def _revalidate_entries(self):
+        """Stat ulang tiap file di index (tanpa parse); re-read hanya yang berubah"""
+        changed = False
+        for filename, cached in list(self._entries.items()):
+            path = Path(cached.path)
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                del self._entries[filename]
+                changed = True
+                continue
+            if cached.size == stat.st_size and cached.mtime_ns == stat.st_mtime_ns:
+                continue
+            info = self._read_info(path, stat)
+            if info:
+                # Gagal parse (mis. sedang ditulis) -> entry lama dipakai, dicoba lagi nanti
+                self._entries[filename] = info
+                changed = True
+        
+        # File yang belum bisa di-parse (mis. masih di-copy): coba lagi jika stat berubah
+        for filename, last_stat in list(self._unparsed.items()):
+            path = self.presets_dir / filename
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                del self._unparsed[filename]
+                changed = True
+                continue
+            if (stat.st_size, stat.st_mtime_ns) == last_stat:
+                continue
+            info = self._read_info(path, stat)
+            if info:
+                del self._unparsed[filename]
+                self._entries[filename] = info
+            else:
+                self._unparsed[filename] = (stat.st_size, stat.st_mtime_ns)
+            changed = True
+        
+        if changed:
+            self._rebuild_lookup()
+            self._save_index()
+    
+    def _store_entry(self, filepath: Path, preset: Preset, save_index: bool = True):
+        """Update index setelah menulis file preset"""
+        stat = filepath.stat()
+        info = PresetInfo(
+            name=preset.name,
+            description=preset.description,
+            created_at=preset.created_at,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            path=str(filepath),
+            tags=preset.tags
+        )
+        self._entries[filepath.name] = info
+        current = self._by_name.get(info.name)
+        if current is None or info.created_at >= current.created_at:
+            self._by_name[info.name] = info
+        self._sorted = None
+        if save_index:
+            self._dir_mtime_ns = self.presets_dir.stat().st_mtime_ns
+            self._save_index()
+    
+    def _load_body(self, info: PresetInfo) -> Optional[Preset]:
+        """Load isi lengkap preset dari file yang ditunjuk index"""
+        return self._parse_file(Path(info.path))
+    
+    # ==================
+    # PUBLIC API
+    # ==================
+    
+    def list_presets(self, limit: int = None, offset: int = 0) -> List[PresetInfo]:
+        """List metadata preset (terbaru dulu) tanpa membaca isi file"""
+        self._refresh_index()
+        if self._sorted is None:
+            # Sort by created_at descending
+            self._sorted = sorted(self._entries.values(), key=lambda p: p.created_at, reverse=True)
+        end = None if limit is None else offset + limit
+        return self._sorted[offset:end]
+    
+    def _matches(self, query: str, tag: str) -> List[PresetInfo]:
+        """Filter metadata di index: prefix nama / teks di description, dan tag"""
+        presets = self.list_presets()
+        query = query.strip().lower()
+        if tag:
+            presets = [p for p in presets if tag in p.tags]
+        if query:
+            presets = [p for p in presets
+                       if p.name.lower().startswith(query) or query in p.description.lower()]
+        return presets
+    
+    def search(self, query: str = "", tag: str = None,
+               limit: int = None, offset: int = 0) -> List[PresetInfo]:
+        """Search preset (name/description) dan/atau tag, dengan paging (API SQLitePresetStore)"""
+        end = None if limit is None else offset + limit
+        return self._matches(query, tag)[offset:end]
+    
+    def count(self, query: str = "", tag: str = None) -> int:
+        """Jumlah preset yang cocok (untuk paging)"""
+        return len(self._matches(query, tag))
+    
+    def get_preset_info(self, name: str) -> Optional[PresetInfo]:
+        """Lookup metadata preset berdasarkan nama"""
+        self._refresh_index()
+        return self._by_name.get(name)
+    
+    def get_preset(self, name: str) -> Optional[Preset]:
+        """Load satu preset lengkap berdasarkan nama"""
+        info = self.get_preset_info(name)
+        if not info:
+            return None
+        return self._load_body(info)
+    
+    def load_preset(self, info: PresetInfo) -> Optional[Preset]:
+        """Load isi preset dari info tanpa menyentuh index (aman dipanggil dari worker thread)"""
+        return self._load_body(info)
     
     def get_presets(self) -> List[Preset]:
         """Get semua preset yang tersimpan"""
         presets = []
         
-        for file in self.presets_dir.glob("*.json"):
-            try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    presets.append(Preset.from_dict(data))
-            except Exception as e:
-                print(f"Error loading preset {file}: {e}")
-        
-        # Sort by created_at descending
-        presets.sort(key=lambda p: p.created_at, reverse=True)
+        for info in self.list_presets():
+            preset = self._load_body(info)
+            if preset:
+                presets.append(preset)
+        
         return presets
     
-    def save_preset(self, name: str, description: str, hotkey_data: dict) -> Preset:
+    def save_preset(self, name: str, description: str, hotkey_data: dict,
+                    tags: List[str] = None) -> Preset:
         """Save preset baru"""
         preset = Preset(
             name=name,
             description=description,
             created_at=datetime.now().isoformat(),
-            data=hotkey_data
+            data=hotkey_data,
+            tags=list(tags or [])
         )
         
+        # Pastikan index sinkron dulu, supaya perubahan dari luar tidak tertutup
+        self._refresh_index()
+        
+        filepath = self._write_preset_file(preset)
+        self._store_entry(filepath, preset)
+        return preset
+    
+    def _write_preset_file(self, preset: Preset) -> Path:
+        """Tulis preset ke file baru di folder preset"""
         # Generate safe filename
-        safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
+        safe_name = "".join(c for c in preset.name if c.isalnum() or c in (' ', '-', '_')).strip()
         safe_name = safe_name.replace(' ', '_')
-        filename = f"{safe_name}_{int(datetime.now().timestamp())}.json"
+        base = f"{safe_name}_{int(datetime.now().timestamp())}"
         
-        filepath = self.presets_dir / filename
+        # Hindari menimpa file lain yang disimpan di detik yang sama
+        filepath = self.presets_dir / f"{base}.json"
+        counter = 1
+        while filepath.name in self._entries or filepath.exists():
+            filepath = self.presets_dir / f"{base}_{counter}.json"
+            counter += 1
         
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(preset.to_dict(), f, indent=2, ensure_ascii=False)
         
-        return preset
+        return filepath
     
     def delete_preset(self, preset_name: str) -> bool:
         """Hapus preset"""
-        for file in self.presets_dir.glob("*.json"):
-            try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if data.get("name") == preset_name:
-                        file.unlink()
-                        return True
-            except:
-                pass
-        return False
+        info = self.get_preset_info(preset_name)
+        if not info:
+            return False
+        
+        path = Path(info.path)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error deleting preset {path}: {e}")
+            return False
+        
+        self._entries.pop(path.name, None)
+        self._rebuild_lookup()
+        self._dir_mtime_ns = self.presets_dir.stat().st_mtime_ns
+        self._save_index()
+        return True
     
     def export_preset(self, preset: Preset, filepath: str) -> bool:
         """Export preset ke file external"""
@@ -116,13 +442,32 @@ class PresetManager:
             preset = Preset.from_dict(data)
             
             # Save to local presets
-            self.save_preset(preset.name, preset.description, preset.data)
+            self.save_preset(preset.name, preset.description, preset.data, preset.tags)
             
             return preset
         except Exception as e:
             print(f"Error importing preset: {e}")
             return None
     
+    def import_presets(self, filepaths: List[str],
+                       progress: Callable[[int, int], None] = None) -> BulkImportResult:
+        """
+        Import banyak preset sekaligus.
+        File di-parse paralel, lalu ditulis dengan satu kali update index.
+        """
+        result = parse_files_parallel(filepaths, parse_preset_file, progress)
+        
+        self._refresh_index()
+        for _, preset in result.items:
+            filepath = self._write_preset_file(preset)
+            self._store_entry(filepath, preset, save_index=False)
+        
+        if result.items:
+            self._dir_mtime_ns = self.presets_dir.stat().st_mtime_ns
+            self._save_index()
+        
+        return result
+    
     def export_to_string(self, hotkey_data: dict) -> str:
         """Export ke JSON string (untuk clipboard)"""
         return json.dumps(hotkey_data, indent=2)
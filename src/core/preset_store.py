@@ -0,0 +1,371 @@
+"""
+SQLite Preset Store - Preset library untuk ribuan preset
+API sama dengan PresetManager (save/get/delete/import/export),
+ditambah search & paging yang tidak perlu membaca body preset.
+"""
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional
+from datetime import datetime
+
+from src.core.bulk_import import BulkImportResult, parse_files_parallel
+from src.core.preset_manager import Preset, PresetInfo, parse_preset_file
+
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS presets (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL DEFAULT '',
+    size INTEGER NOT NULL DEFAULT 0,
+    body TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_presets_name ON presets(name);
+CREATE INDEX IF NOT EXISTS idx_presets_name_nocase ON presets(name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_presets_created_at ON presets(created_at);
+
+CREATE TABLE IF NOT EXISTS preset_tags (
+    tag TEXT NOT NULL,
+    preset_id INTEGER NOT NULL REFERENCES presets(id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, preset_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_preset_tags_preset ON preset_tags(preset_id);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS presets_fts USING fts5(
+    description, content='presets', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS presets_ai AFTER INSERT ON presets BEGIN
+    INSERT INTO presets_fts(rowid, description) VALUES (new.id, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS presets_ad AFTER DELETE ON presets BEGIN
+    INSERT INTO presets_fts(presets_fts, rowid, description) VALUES ('delete', old.id, old.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS presets_au AFTER UPDATE ON presets BEGIN
+    INSERT INTO presets_fts(presets_fts, rowid, description) VALUES ('delete', old.id, old.description);
+    INSERT INTO presets_fts(rowid, description) VALUES (new.id, new.description);
+END;
+"""
+
+# Kolom metadata saja - body tidak pernah ikut di-select untuk listing/search
+INFO_COLUMNS = (
+    "p.id, p.name, p.description, p.created_at, p.size, "
+    "(SELECT group_concat(tag, char(31)) FROM preset_tags WHERE preset_id = p.id) AS tags"
+)
+TAG_SEPARATOR = "\x1f"
+
+
+class SQLitePresetStore:
+    """
+    Preset storage berbasis SQLite.
+    Drop-in pengganti PresetManager untuk library preset yang besar.
+    """
+    
+    def __init__(self, db_path: str = None):
+        if db_path:
+            self.db_path = Path(db_path)
+        else:
+            # Default: di folder user/.tobelsoft_macro/presets.db
+            self.db_path = Path.home() / ".tobelsoft_macro" / "presets.db"
+        
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._has_fts = False
+        self._init_schema()
+    
+    def _init_schema(self):
+        """Buat tabel, index, dan FTS (jika SQLite mendukung FTS5)"""
+        with self._lock, self._conn:
+            self._conn.executescript(SCHEMA)
+            try:
+                self._conn.executescript(FTS_SCHEMA)
+                self._has_fts = True
+            except sqlite3.OperationalError as e:
+                # FTS5 tidak tersedia -> search fallback ke LIKE
+                print(f"[DEBUG] FTS5 not available, using LIKE search: {e}")
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta(key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),)
+            )
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+    
+    # ==================
+    # HELPERS
+    # ==================
+    
+    def _row_to_info(self, row: sqlite3.Row) -> PresetInfo:
+        tags = sorted(row["tags"].split(TAG_SEPARATOR)) if row["tags"] else []
+        return PresetInfo(
+            name=row["name"],
+            description=row["description"],
+            created_at=row["created_at"],
+            size=row["size"],
+            mtime_ns=0,
+            path=f"{self.db_path}#{row['id']}",
+            tags=tags
+        )
+    
+    def _row_to_preset(self, row: sqlite3.Row) -> Preset:
+        info = self._row_to_info(row)
+        return Preset(
+            name=info.name,
+            description=info.description,
+            created_at=info.created_at,
+            data=json.loads(row["body"]),
+            tags=info.tags
+        )
+    
+    def _insert(self, preset: Preset) -> int:
+        """Insert satu preset (harus dipanggil di dalam transaksi)"""
+        body = json.dumps(preset.data, ensure_ascii=False)
+        cur = self._conn.execute(
+            "INSERT INTO presets(name, description, created_at, size, body) VALUES (?, ?, ?, ?, ?)",
+            (preset.name, preset.description, preset.created_at, len(body), body)
+        )
+        preset_id = cur.lastrowid
+        if preset.tags:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO preset_tags(tag, preset_id) VALUES (?, ?)",
+                [(tag, preset_id) for tag in preset.tags]
+            )
+        return preset_id
+    
+    def _search_clause(self, query: str, tag: str):
+        """Bangun WHERE clause + params untuk search/count"""
+        joins = ""
+        where = []
+        params = []
+        
+        if tag:
+            joins += " JOIN preset_tags t ON t.preset_id = p.id"
+            where.append("t.tag = ?")
+            params.append(tag)
+        
+        query = (query or "").strip()
+        if query:
+            # Prefix nama case-insensitive (sama dengan PresetManager.search), pakai index NOCASE
+            name_clause = "(p.name >= ? COLLATE NOCASE AND p.name < ? COLLATE NOCASE)"
+            tokens = query.replace('"', ' ').split()
+            if self._has_fts and tokens:
+                # Token prefix match di description, atau prefix match di name
+                fts_query = " ".join(f'"{token}"*' for token in tokens)
+                where.append(
+                    "(p.id IN (SELECT rowid FROM presets_fts WHERE presets_fts MATCH ?)"
+                    f" OR {name_clause})"
+                )
+                params.extend([fts_query, query, query + "\uffff"])
+            elif self._has_fts:
+                where.append(name_clause)
+                params.extend([query, query + "\uffff"])
+            else:
+                where.append("(p.description LIKE ? OR p.name LIKE ?)")
+                params.extend([f"%{query}%", f"{query}%"])
+        
+        clause = joins
+        if where:
+            clause += " WHERE " + " AND ".join(where)
+        return clause, params
+    
+    # ==================
+    # PUBLIC API (sama dengan PresetManager)
+    # ==================
+    
+    def list_presets(self, limit: int = None, offset: int = 0) -> List[PresetInfo]:
+        """List metadata preset (terbaru dulu) tanpa membaca body"""
+        return self.search(limit=limit, offset=offset)
+    
+    def search(self, query: str = "", tag: str = None,
+               limit: int = None, offset: int = 0) -> List[PresetInfo]:
+        """Search preset berdasarkan teks (name/description) dan/atau tag, dengan paging"""
+        clause, params = self._search_clause(query, tag)
+        sql = f"SELECT {INFO_COLUMNS} FROM presets p{clause} ORDER BY p.created_at DESC"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+        
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            return [self._row_to_info(row) for row in rows]
+    
+    def count(self, query: str = "", tag: str = None) -> int:
+        """Jumlah preset yang cocok (untuk paging)"""
+        clause, params = self._search_clause(query, tag)
+        with self._lock:
+            row = self._conn.execute(f"SELECT COUNT(*) FROM presets p{clause}", params).fetchone()
+            return row[0]
+    
+    def get_tags(self) -> List[str]:
+        """Semua tag yang dipakai"""
+        with self._lock:
+            return [r["tag"] for r in self._conn.execute("SELECT DISTINCT tag FROM preset_tags ORDER BY tag")]
+    
+    def get_preset_info(self, name: str) -> Optional[PresetInfo]:
+        """Lookup metadata preset berdasarkan nama"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {INFO_COLUMNS} FROM presets p WHERE p.name = ? ORDER BY p.created_at DESC LIMIT 1",
+                (name,)
+            ).fetchone()
+            return self._row_to_info(row) if row else None
+    
+    def get_preset(self, name: str) -> Optional[Preset]:
+        """Load satu preset lengkap berdasarkan nama"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {INFO_COLUMNS}, p.body FROM presets p WHERE p.name = ? ORDER BY p.created_at DESC LIMIT 1",
+                (name,)
+            ).fetchone()
+            return self._row_to_preset(row) if row else None
+    
+    def load_preset(self, info: PresetInfo) -> Optional[Preset]:
+        """Load isi preset dari info (API PresetManager, aman dari worker thread)"""
+        return self.get_preset(info.name)
+    
+    def get_presets(self) -> List[Preset]:
+        """Get semua preset yang tersimpan"""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {INFO_COLUMNS}, p.body FROM presets p ORDER BY p.created_at DESC"
+            ).fetchall()
+            return [self._row_to_preset(row) for row in rows]
+    
+    def save_preset(self, name: str, description: str, hotkey_data: dict,
+                    tags: List[str] = None) -> Preset:
+        """Save preset baru"""
+        preset = Preset(
+            name=name,
+            description=description,
+            created_at=datetime.now().isoformat(),
+            data=hotkey_data,
+            tags=list(tags or [])
+        )
+        with self._lock, self._conn:
+            self._insert(preset)
+        return preset
+    
+    def delete_preset(self, preset_name: str) -> bool:
+        """Hapus preset (yang terbaru jika nama duplikat)"""
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "DELETE FROM presets WHERE id = ("
+                "SELECT id FROM presets WHERE name = ? ORDER BY created_at DESC LIMIT 1)",
+                (preset_name,)
+            )
+            return cur.rowcount > 0
+    
+    def export_preset(self, preset: Preset, filepath: str) -> bool:
+        """Export preset ke file external"""
+        try:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(preset.to_dict(), f, indent=2, ensure_ascii=False)
+            return True
+        except Exception as e:
+            print(f"Error exporting preset: {e}")
+            return False
+    
+    def import_preset(self, filepath: str) -> Optional[Preset]:
+        """Import preset dari file external"""
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            preset = Preset.from_dict(data)
+            
+            # Save to local presets
+            self.save_preset(preset.name, preset.description, preset.data, preset.tags)
+            
+            return preset
+        except Exception as e:
+            print(f"Error importing preset: {e}")
+            return None
+    
+    def import_presets(self, filepaths: List[str],
+                       progress: Callable[[int, int], None] = None) -> BulkImportResult:
+        """
+        Import banyak preset sekaligus.
+        File di-parse paralel, lalu di-insert dalam satu transaksi.
+        """
+        result = parse_files_parallel(filepaths, parse_preset_file, progress)
+        
+        with self._lock, self._conn:
+            for _, preset in result.items:
+                self._insert(preset)
+        
+        return result
+    
+    def export_to_string(self, hotkey_data: dict) -> str:
+        """Export ke JSON string (untuk clipboard)"""
+        return json.dumps(hotkey_data, indent=2)
+    
+    def import_from_string(self, json_string: str) -> Optional[dict]:
+        """Import dari JSON string"""
+        try:
+            return json.loads(json_string)
+        except:
+            return None
+    
+    # ==================
+    # MIGRATION
+    # ==================
+    
+    def migrate_from_directory(self, presets_dir: str = None) -> int:
+        """
+        Migrasi one-shot dari folder preset JSON (format PresetManager).
+        Dijalankan sekali per folder; return jumlah preset yang dimigrasi.
+        """
+        if presets_dir:
+            source = Path(presets_dir)
+        else:
+            source = Path.home() / ".tobelsoft_macro" / "presets"
+        
+        marker = f"migrated:{source.resolve()}"
+        
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM meta WHERE key = ?", (marker,)).fetchone():
+                return 0
+            if not source.is_dir():
+                return 0
+            
+            presets = []
+            for file in source.glob("*.json"):
+                try:
+                    with open(file, 'r', encoding='utf-8') as f:
+                        presets.append(Preset.from_dict(json.load(f)))
+                except Exception as e:
+                    print(f"Error migrating preset {file}: {e}")
+            
+            # Satu transaksi untuk semua preset + marker
+            with self._conn:
+                for preset in presets:
+                    self._insert(preset)
+                self._conn.execute(
+                    "INSERT INTO meta(key, value) VALUES (?, ?)",
+                    (marker, datetime.now().isoformat())
+                )
+        
+        print(f"[DEBUG] Migrated {len(presets)} presets from {source}")
+        return len(presets)
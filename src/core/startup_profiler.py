@@ -0,0 +1,58 @@
+"""
+Startup Profiler - Timing per fase startup (--profile-startup)
+Thread-safe: fase background (load data, install hook) boleh mark dari worker thread.
+"""
+import threading
+import time
+from typing import List, Optional, Tuple
+
+
+class StartupProfiler:
+    """Catat durasi tiap fase startup relatif terhadap titik awal"""
+    
+    def __init__(self):
+        self.enabled = False
+        self._origin = time.perf_counter()
+        self._last = {}  # thread name -> timestamp mark terakhir
+        self._phases: List[Tuple[str, str, float, float]] = []  # (thread, fase, durasi, t)
+        self._lock = threading.Lock()
+    
+    def enable(self, origin: Optional[float] = None):
+        """Aktifkan profiler (origin = perf_counter() paling awal di main.py)"""
+        self.enabled = True
+        if origin is not None:
+            self._origin = origin
+        self._last = {threading.current_thread().name: self._origin}
+    
+    def mark(self, phase: str):
+        """Tutup fase: durasi dihitung dari mark sebelumnya di thread yang sama"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        thread = threading.current_thread().name
+        with self._lock:
+            previous = self._last.get(thread, self._origin)
+            self._last[thread] = now
+            self._phases.append((thread, phase, now - previous, now - self._origin))
+    
+    def start_stage(self):
+        """Awal fase di thread baru (worker) - reset titik awal thread ini"""
+        if self.enabled:
+            with self._lock:
+                self._last[threading.current_thread().name] = time.perf_counter()
+    
+    def report(self) -> str:
+        lines = ["[PROFILE] Startup phases:"]
+        with self._lock:
+            phases = list(self._phases)
+        for thread, phase, duration, at in phases:
+            stage = "" if thread == "MainThread" else f" [{thread}]"
+            lines.append(f"[PROFILE]   {phase:<32s}{duration * 1000:9.2f} ms  (t={at * 1000:8.2f} ms){stage}")
+        return "\n".join(lines)
+    
+    def print_report(self):
+        if self.enabled:
+            print(self.report())
+
+
+startup_profiler = StartupProfiler()
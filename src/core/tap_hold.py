@@ -0,0 +1,196 @@
+"""
+Tap / Hold - Binding dual-role per key (tap = A, tahan = B, lepas = C, double-tap = D)
+
+Binding dengan trigger_mode selain "press" tidak masuk tabel exact-match;
+hook hanya mencatat key down/up di sini, keputusan tap/hold/double-tap
+diambil oleh timer di TimerScheduler (tanpa thread yang sleep):
+  - hold:       timer di down + hold_ms, batal jika key dilepas duluan
+  - tap:        key up sebelum batas hold. Jika key yang sama punya binding
+                double_tap, tap ditunda double_tap_ms (= latency tambahan tap)
+  - double_tap: key down kedua dalam double_tap_ms setelah tap pertama
+  - release:    setiap key up
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from src.core.models import HotkeyBinding
+from src.core.timer_scheduler import TimerHandle, TimerScheduler
+
+DEFAULT_DOUBLE_TAP_MS = 200
+
+
+def _first_enabled(entries: Optional[list]) -> Optional[HotkeyBinding]:
+    for _, binding in entries or ():
+        if binding.enabled:
+            return binding
+    return None
+
+
+class TapLatencyStats:
+    """Latency tap = key up -> action dijalankan (tidak reset saat index di-rebuild)"""
+    
+    def __init__(self):
+        self.taps = 0
+        self.deferred_taps = 0  # Tap yang menunggu double-tap window
+        self.holds = 0
+        self.double_taps = 0
+        self.releases = 0
+        self._latency_total = 0.0
+        self.latency_max_ms = 0.0
+    
+    def record_tap(self, latency_ms: float, deferred: bool):
+        self.taps += 1
+        self.deferred_taps += deferred
+        self._latency_total += latency_ms
+        if latency_ms > self.latency_max_ms:
+            self.latency_max_ms = latency_ms
+    
+    def snapshot(self) -> dict:
+        return {
+            "taps": self.taps,
+            "deferred_taps": self.deferred_taps,
+            "holds": self.holds,
+            "double_taps": self.double_taps,
+            "releases": self.releases,
+            "tap_latency_avg_ms": self._latency_total / self.taps if self.taps else 0.0,
+            "tap_latency_max_ms": self.latency_max_ms,
+        }
+
+
+class _KeyPress:
+    __slots__ = ("combo", "pressed_at", "hold_timer", "hold_fired", "consumed")
+    
+    def __init__(self, combo: str, pressed_at: float):
+        self.combo = combo
+        self.pressed_at = pressed_at
+        self.hold_timer: Optional[TimerHandle] = None
+        self.hold_fired = False
+        self.consumed = False  # Press kedua double-tap: up-nya bukan tap
+
+
+class TapHoldResolver:
+    """
+    triggers: combo -> entries [(posisi, binding)] dengan trigger_mode != "press".
+    fire(binding, mode) dipanggil dari hook thread (down/up) atau thread scheduler (timer).
+    """
+    
+    def __init__(self, triggers: Dict[str, list], scheduler: TimerScheduler,
+                 fire: Callable[[HotkeyBinding, str], None],
+                 double_tap_ms: int = DEFAULT_DOUBLE_TAP_MS,
+                 stats: Optional[TapLatencyStats] = None,
+                 clock: Callable[[], float] = time.perf_counter):
+        self._modes: Dict[str, Dict[str, list]] = {}
+        for combo, entries in triggers.items():
+            modes = self._modes.setdefault(combo, {})
+            for entry in sorted(entries, key=lambda e: e[0]):
+                modes.setdefault(entry[1].trigger_mode, []).append(entry)
+        self._scheduler = scheduler
+        self._fire = fire
+        self._window = double_tap_ms / 1000.0
+        self.stats = stats or TapLatencyStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._down: Dict[str, _KeyPress] = {}  # key dasar -> press yang sedang ditahan
+        self._pending: Dict[str, tuple] = {}  # combo -> (waktu key up, timer) tap yang ditunda
+    
+    def __bool__(self):
+        return bool(self._modes)
+    
+    def handles(self, combo: str) -> bool:
+        return combo in self._modes
+    
+    def close(self):
+        """Batalkan semua timer (index diganti / engine berhenti)"""
+        with self._lock:
+            for press in self._down.values():
+                if press.hold_timer is not None:
+                    press.hold_timer.cancel()
+            for _, timer in self._pending.values():
+                timer.cancel()
+            self._down.clear()
+            self._pending.clear()
+    
+    def on_down(self, combo: str, now: float) -> bool:
+        """Key down (hook thread); False jika combo tidak punya binding dual-role"""
+        modes = self._modes.get(combo)
+        if modes is None:
+            return False
+        key = combo.rpartition("+")[2]
+        with self._lock:
+            if key in self._down:
+                return True  # Auto-repeat OS
+            press = self._down[key] = _KeyPress(combo, now)
+            
+            pending = self._pending.pop(combo, None)
+            if pending is not None:
+                released_at, timer = pending
+                timer.cancel()
+                double = _first_enabled(modes.get("double_tap"))
+                if double is not None and now - released_at <= self._window:
+                    press.consumed = True
+                    self.stats.double_taps += 1
+                    self._fire(double, "double_tap")
+                    return True
+                # Timer telat / double-tap dinonaktifkan: tap pertama tetap jalan
+                self._fire_tap(modes, released_at, deferred=True)
+            
+            hold = _first_enabled(modes.get("hold"))
+            if hold is not None:
+                press.hold_timer = self._scheduler.call_at(
+                    now + hold.hold_ms / 1000.0, self._on_hold_timer, key, press, hold)
+        return True
+    
+    def on_up(self, key: str, now: float):
+        """Key up (hook thread); key = nama key dasar tanpa modifier"""
+        with self._lock:
+            press = self._down.pop(key, None)
+            if press is None:
+                return
+            if press.hold_timer is not None:
+                press.hold_timer.cancel()
+            modes = self._modes.get(press.combo, {})
+            
+            release = _first_enabled(modes.get("release"))
+            if release is not None:
+                self.stats.releases += 1
+                self._fire(release, "release")
+            if press.consumed or press.hold_fired:
+                return
+            
+            tap = _first_enabled(modes.get("tap"))
+            double = _first_enabled(modes.get("double_tap"))
+            if tap is None and double is None:
+                return
+            limit = (_first_enabled(modes.get("hold")) or tap or double).hold_ms / 1000.0
+            if now - press.pressed_at >= limit:
+                return  # Ditahan terlalu lama -> bukan tap
+            
+            if double is not None:
+                timer = self._scheduler.call_at(now + self._window, self._on_tap_timer, press.combo, now)
+                self._pending[press.combo] = (now, timer)
+                return
+            self._fire_tap(modes, now, deferred=False)
+    
+    def _fire_tap(self, modes: dict, released_at: float, deferred: bool):
+        tap = _first_enabled(modes.get("tap"))
+        if tap is None:
+            return
+        self.stats.record_tap((self._clock() - released_at) * 1000.0, deferred)
+        self._fire(tap, "tap")
+    
+    def _on_hold_timer(self, key: str, press: _KeyPress, binding: HotkeyBinding):
+        with self._lock:
+            if self._down.get(key) is not press or press.consumed:
+                return
+            press.hold_fired = True
+            self.stats.holds += 1
+            self._fire(binding, "hold")
+    
+    def _on_tap_timer(self, combo: str, released_at: float):
+        with self._lock:
+            pending = self._pending.get(combo)
+            if pending is None or pending[0] != released_at:
+                return
+            del self._pending[combo]
+            self._fire_tap(self._modes.get(combo, {}), released_at, deferred=True)
@@ -0,0 +1,161 @@
+"""
+Text Input - Kompilasi TYPE_TEXT jadi event keyboard siap kirim
+
+Mode "unicode": tiap karakter = down/up KEYEVENTF_UNICODE per UTF-16 unit
+(emoji / non-BMP = surrogate pair), tanpa VkKeyScan dan tanpa jeda press.
+Event dihitung sekali saat binding di-load; tanpa rate limit, karakter
+dikirim MAX_BATCH_CHARS sekaligus dalam satu SendInput.
+
+Mode "keys" (untuk game yang mengabaikan input unicode): karakter dipetakan
+ke key fisik + Shift/Ctrl/Alt lewat layout keyboard window aktif
+(VkKeyScanExW), jadi benar di layout apa pun. Karakter yang tidak ada di
+layout tersebut tetap dikirim sebagai unicode.
+"""
+import ctypes
+import os
+from ctypes import wintypes
+from typing import Dict, List, Optional, Tuple
+
+from src.core.models import TEXT_MODES, ActionType, KeyAction
+
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+KEYEVENTF_SCANCODE = 0x0008
+MAPVK_VK_TO_VSC = 0
+
+# Karakter per SendInput saat tanpa rate limit
+MAX_BATCH_CHARS = 64
+
+# Karakter kontrol dikirim sebagai VK (Enter/Tab unicode diabaikan banyak aplikasi)
+_CONTROL_VKS = {"\n": 0x0D, "\t": 0x09, "\b": 0x08}
+
+# Bit shift state VkKeyScanExW -> VK modifier
+_SHIFT_STATE_VKS = ((0x01, 0x10), (0x02, 0x11), (0x04, 0x12))
+
+# (wVk, wScan, dwFlags) per event
+KeyEvent = Tuple[int, int, int]
+
+if os.name == "nt":
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _user32.GetForegroundWindow.restype = wintypes.HWND
+    _user32.GetWindowThreadProcessId.argtypes = (wintypes.HWND, ctypes.c_void_p)
+    _user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+    _user32.GetKeyboardLayout.argtypes = (wintypes.DWORD,)
+    _user32.GetKeyboardLayout.restype = ctypes.c_void_p
+    _user32.VkKeyScanExW.argtypes = (wintypes.WCHAR, ctypes.c_void_p)
+    _user32.VkKeyScanExW.restype = wintypes.SHORT
+    _user32.MapVirtualKeyExW.argtypes = (wintypes.UINT, wintypes.UINT, ctypes.c_void_p)
+    _user32.MapVirtualKeyExW.restype = wintypes.UINT
+
+
+def foreground_layout() -> Optional[int]:
+    """HKL layout keyboard milik window aktif (bukan thread engine)"""
+    if os.name != "nt":
+        return None
+    thread_id = _user32.GetWindowThreadProcessId(_user32.GetForegroundWindow(), None)
+    return _user32.GetKeyboardLayout(thread_id)
+
+
+def unicode_events(char: str) -> List[KeyEvent]:
+    """Down/up KEYEVENTF_UNICODE untuk satu karakter (surrogate pair jika perlu)"""
+    encoded = char.encode("utf-16-le")
+    units = [int.from_bytes(encoded[i:i + 2], "little") for i in range(0, len(encoded), 2)]
+    downs = [(0, unit, KEYEVENTF_UNICODE) for unit in units]
+    ups = [(0, unit, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP) for unit in units]
+    return downs + ups
+
+
+def _vk_tap(vk: int) -> List[KeyEvent]:
+    return [(vk, 0, 0), (vk, 0, KEYEVENTF_KEYUP)]
+
+
+def layout_events(char: str, layout) -> List[KeyEvent]:
+    """Key fisik (scancode) + modifier untuk char di layout; unicode jika tidak ada"""
+    if len(char) != 1 or ord(char) > 0xFFFF:
+        return unicode_events(char)
+    result = _user32.VkKeyScanExW(char, layout)
+    if result == -1:
+        return unicode_events(char)
+    
+    vk, shift_state = result & 0xFF, (result >> 8) & 0xFF
+    modifiers = [mod_vk for bit, mod_vk in _SHIFT_STATE_VKS if shift_state & bit]
+    
+    def scan(code: int) -> int:
+        return _user32.MapVirtualKeyExW(code, MAPVK_VK_TO_VSC, layout)
+    
+    events = [(0, scan(mod), KEYEVENTF_SCANCODE) for mod in modifiers]
+    events.append((0, scan(vk), KEYEVENTF_SCANCODE))
+    events.append((0, scan(vk), KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP))
+    events.extend((0, scan(mod), KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP) for mod in reversed(modifiers))
+    return events
+
+
+class TextPlan:
+    """TYPE_TEXT yang sudah dikompilasi"""
+    
+    def __init__(self, action: KeyAction):
+        self.action = action
+        self.text = action.text.replace("\r\n", "\n").replace("\r", "\n")
+        self.mode = action.text_mode if action.text_mode in TEXT_MODES else "unicode"
+        self.char_interval = max(action.duration, 0) / 1000.0
+        
+        # Event unicode per karakter tidak bergantung layout -> langsung final
+        self._unicode_chars: Optional[List[List[KeyEvent]]] = None
+        if self.mode == "unicode":
+            self._unicode_chars = [self._char_events(c, None) for c in self.text]
+        self._win_batches: Dict[object, list] = {}
+    
+    def _char_events(self, char: str, layout) -> List[KeyEvent]:
+        vk = _CONTROL_VKS.get(char)
+        if vk is not None:
+            return _vk_tap(vk)
+        if self.mode == "keys":
+            return layout_events(char, layout)
+        return unicode_events(char)
+    
+    def char_events(self, layout=None) -> List[List[KeyEvent]]:
+        """Event per karakter (mode keys: untuk layout yang diberikan)"""
+        if self._unicode_chars is not None:
+            return self._unicode_chars
+        return [self._char_events(c, layout) for c in self.text]
+    
+    def chunks(self) -> List[str]:
+        """Potongan teks per kiriman (fallback pynput): per karakter jika ada rate limit"""
+        if self.char_interval > 0:
+            return list(self.text)
+        return [self.text[i:i + MAX_BATCH_CHARS] for i in range(0, len(self.text), MAX_BATCH_CHARS)]
+    
+    # ===================
+    # WINDOWS (SendInput)
+    # ===================
+    
+    def input_batches(self, input_type, layout=None) -> list:
+        """
+        Batch ctypes INPUT array (satu SendInput per batch), di-cache per layout.
+        Rate limit aktif: satu karakter per batch.
+        """
+        key = layout if self.mode == "keys" else None
+        cached = self._win_batches.get(key)
+        if cached is not None:
+            return cached
+        
+        per_batch = 1 if self.char_interval > 0 else MAX_BATCH_CHARS
+        chars = self.char_events(layout)
+        batches = []
+        for start in range(0, len(chars), per_batch):
+            events = [event for char in chars[start:start + per_batch] for event in char]
+            inputs = (input_type * len(events))()
+            for item, (vk, scan, flags) in zip(inputs, events):
+                item.type = INPUT_KEYBOARD
+                item.ki.wVk = vk
+                item.ki.wScan = scan
+                item.ki.dwFlags = flags
+            batches.append(inputs)
+        self._win_batches[key] = batches
+        return batches
+
+
+def compile_text_actions(actions: List[KeyAction]) -> dict:
+    """id(action) -> TextPlan untuk semua TYPE_TEXT di list"""
+    return {id(a): TextPlan(a) for a in actions if a.action_type == ActionType.TYPE_TEXT}
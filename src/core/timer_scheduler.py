@@ -0,0 +1,96 @@
+"""
+Timer Scheduler - Satu thread untuk semua timer engine
+
+Timer disimpan di heap (deadline, urutan); thread scheduler tidur sampai
+deadline terdekat lalu menjalankan callback. Pengganti thread per timer yang
+sleep: cancel cukup menandai handle (dibuang saat keluar dari heap).
+Callback jalan di thread scheduler, jadi harus singkat (mis. spawn eksekusi).
+"""
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Optional
+
+
+class TimerHandle:
+    """Timer yang sudah dijadwalkan; cancel() aman dipanggil dari thread mana saja"""
+    
+    __slots__ = ("deadline", "callback", "args", "cancelled")
+    
+    def __init__(self, deadline: float, callback: Callable, args: tuple):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+    
+    def cancel(self):
+        self.cancelled = True
+
+
+class TimerScheduler:
+    """Heap timer + satu worker thread (dibuat saat timer pertama dijadwalkan)"""
+    
+    def __init__(self, name: str = "engine-timers", clock: Callable[[], float] = time.perf_counter):
+        self.name = name
+        self._clock = clock
+        self._heap = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self.fired = 0
+        self.max_lateness_ms = 0.0  # Keterlambatan terbesar callback dari deadline
+    
+    def call_at(self, deadline: float, callback: Callable, *args) -> TimerHandle:
+        handle = TimerHandle(deadline, callback, args)
+        with self._cond:
+            self._stopped = False
+            heapq.heappush(self._heap, (deadline, next(self._counter), handle))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            # Bangunkan worker hanya jika timer ini jadi yang paling awal
+            if self._heap[0][2] is handle:
+                self._cond.notify()
+        return handle
+    
+    def call_later(self, delay: float, callback: Callable, *args) -> TimerHandle:
+        return self.call_at(self._clock() + delay, callback, *args)
+    
+    def stop(self):
+        """Batalkan semua timer dan hentikan worker"""
+        with self._cond:
+            self._stopped = True
+            self._heap.clear()
+            self._cond.notify()
+            thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(1.0)
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopped:
+                        return
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    deadline, _, handle = self._heap[0]
+                    wait = deadline - self._clock()
+                    if wait > 0:
+                        self._cond.wait(wait)
+                        continue
+                    heapq.heappop(self._heap)
+                    if not handle.cancelled:
+                        break
+            
+            lateness_ms = (self._clock() - handle.deadline) * 1000.0
+            if lateness_ms > self.max_lateness_ms:
+                self.max_lateness_ms = lateness_ms
+            self.fired += 1
+            try:
+                handle.callback(*handle.args)
+            except Exception as e:
+                print(f"[ERROR] Timer callback failed: {e}")
@@ -0,0 +1,168 @@
+"""
+Trigger Automaton - Trigger sequence ("g g") dan chord ("a+s") dalam satu state machine
+
+Sintaks trigger:
+  - "ctrl+g"              combo biasa (satu langkah, exact match seperti sebelumnya)
+  - "g g", "up up down"   sequence: langkah dipisah spasi, jeda antar langkah
+                          maksimal sequence_timeout_ms ("g g@200" = override per trigger)
+  - "a+s", "ctrl+q+w"     chord: >= 2 key non-modifier ditekan dalam chord_window_ms
+Chord juga bisa jadi langkah sequence ("a+s d").
+
+Semua trigger dikompilasi jadi trie langkah. Root = tabel exact-match (sama
+dengan index lama, satu lookup dict). Sequence yang sedang berjalan disimpan
+sebagai state aktif + deadline; tiap event memajukan semua state aktif sekali.
+Tanpa sequence/chord (stateful = False) hanya lookup root yang terjadi.
+"""
+import re
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from src.core.mouse_wheel import normalize_mouse_trigger
+
+MODIFIERS = ("ctrl", "shift", "alt")
+
+DEFAULT_SEQUENCE_TIMEOUT_MS = 300
+DEFAULT_CHORD_WINDOW_MS = 40
+
+_TIMEOUT_SUFFIX = re.compile(r"@(\d+)$")
+
+
+def parse_step(step: str) -> Tuple[str, Optional[frozenset], str]:
+    """
+    Satu langkah -> (simbol, chord keys atau None, modifier prefix).
+    Simbol chord kanonik: modifier (urutan ctrl, shift, alt) + key chord terurut.
+    """
+    parts = step.split("+")
+    keys = [p for p in parts if p not in MODIFIERS]
+    if len(keys) < 2:
+        return normalize_mouse_trigger(step), None, ""
+    keys = sorted(normalize_mouse_trigger(k) for k in keys)
+    mods = "+".join(m for m in MODIFIERS if m in parts)
+    return "+".join(([mods] if mods else []) + keys), frozenset(keys), mods
+
+
+def parse_trigger(trigger: str) -> Tuple[List[str], Optional[int], List[tuple]]:
+    """Trigger -> (simbol per langkah, timeout override ms, chord [(keys, mods, simbol)])"""
+    timeout = None
+    steps = trigger.split()
+    if len(steps) > 1:
+        match = _TIMEOUT_SUFFIX.search(steps[-1])
+        if match:
+            timeout = int(match.group(1))
+            steps[-1] = steps[-1][:match.start()]
+    symbols, chords = [], []
+    for step in steps:
+        symbol, chord_keys, mods = parse_step(step)
+        symbols.append(symbol)
+        if chord_keys is not None:
+            chords.append((chord_keys, mods, symbol))
+    return symbols, timeout, chords
+
+
+def is_stateful_trigger(trigger: str) -> bool:
+    """True untuk sequence/chord (tidak bisa 'repeat while held')"""
+    symbols, _, chords = parse_trigger(trigger)
+    return len(symbols) > 1 or bool(chords)
+
+
+class TriggerAutomaton:
+    """
+    triggers: trigger string -> entries [(posisi, binding)].
+    single: simbol -> entries untuk trigger satu langkah (exact match).
+    """
+    
+    def __init__(self, triggers: Dict[str, list],
+                 sequence_timeout_ms: int = DEFAULT_SEQUENCE_TIMEOUT_MS,
+                 chord_window_ms: int = DEFAULT_CHORD_WINDOW_MS):
+        self.single: Dict[str, list] = {}
+        self._trans: List[Dict[str, int]] = [{}]  # state 0 = root
+        self._output: List[list] = [[]]
+        self._timeout: List[float] = [0.0]
+        self._chords_by_key: Dict[str, List[tuple]] = {}
+        self._chord_window = chord_window_ms / 1000.0
+        
+        for trigger, entries in triggers.items():
+            symbols, timeout_ms, chords = parse_trigger(trigger)
+            if not symbols:
+                continue
+            for chord in chords:
+                for key in chord[0]:
+                    if chord not in self._chords_by_key.setdefault(key, []):
+                        self._chords_by_key[key].append(chord)
+            if len(symbols) == 1:
+                self.single.setdefault(symbols[0], []).extend(entries)
+                continue
+            
+            timeout = (timeout_ms if timeout_ms is not None else sequence_timeout_ms) / 1000.0
+            state = 0
+            for symbol in symbols:
+                nxt = self._trans[state].get(symbol)
+                if nxt is None:
+                    nxt = self._trans[state][symbol] = len(self._trans)
+                    self._trans.append({})
+                    self._output.append([])
+                    self._timeout.append(0.0)
+                # Prefix bersama: pakai timeout terpanjang supaya tidak ada trigger yang kalah
+                self._timeout[state] = max(self._timeout[state], timeout)
+                state = nxt
+            self._output[state].extend(entries)
+        
+        # Urutan bindings = prioritas (sama seperti linear scan)
+        for entries in list(self.single.values()) + self._output:
+            entries.sort(key=lambda entry: entry[0])
+        
+        self._root = self._trans[0]
+        self.stateful = bool(self._root) or bool(self._chords_by_key)
+        self._active: Dict[int, float] = {}  # state -> deadline
+        self._recent = deque()  # (waktu, key) key-down dalam chord window
+    
+    def reset(self):
+        self._active = {}
+        self._recent.clear()
+    
+    def chord_symbols(self, combo: str, now: float) -> List[str]:
+        """Catat key-down; return simbol chord yang lengkap dalam window"""
+        if not self._chords_by_key:
+            return []
+        mods, _, key = combo.rpartition("+")
+        recent = self._recent
+        while recent and now - recent[0][0] > self._chord_window:
+            recent.popleft()
+        recent.append((now, key))
+        
+        chords = self._chords_by_key.get(key)
+        if not chords:
+            return []
+        held = {k for _, k in recent}
+        completed = [symbol for keys, chord_mods, symbol in chords if chord_mods == mods and keys <= held]
+        if completed:
+            recent.clear()  # Satu chord = satu trigger
+        return completed
+    
+    def advance(self, symbol: str, now: float) -> List[list]:
+        """Majukan semua sequence aktif dengan satu simbol; return entries sequence yang selesai"""
+        completed = []
+        active: Dict[int, float] = {}
+        trans, output, timeout = self._trans, self._output, self._timeout
+        
+        for state, deadline in self._active.items():
+            if now > deadline:
+                continue
+            nxt = trans[state].get(symbol)
+            if nxt is None:
+                # Menekan modifier (untuk langkah "ctrl+x") tidak memutus sequence
+                if symbol in MODIFIERS:
+                    active[state] = deadline
+                continue
+            if output[nxt]:
+                completed.append(output[nxt])
+            if trans[nxt]:
+                active[nxt] = now + timeout[nxt]
+        
+        nxt = self._root.get(symbol)
+        if nxt is not None and trans[nxt]:
+            active[nxt] = max(active.get(nxt, 0.0), now + timeout[nxt])
+        
+        # Sequence selesai -> mulai dari awal (g g g tidak memicu dua kali)
+        self._active = {} if completed else active
+        return completed
@@ -0,0 +1,309 @@
+"""
+Window Watcher - Auto-switch profile berdasarkan window / proses aktif
+
+Provider (bisa diganti) melaporkan window foreground:
+  - Win32ForegroundProvider: event-driven lewat SetWinEventHook
+    (EVENT_SYSTEM_FOREGROUND), tanpa polling sama sekali
+  - X11ForegroundProvider: polling xprop, dibatasi interval (default 0.5 s)
+  - ManualForegroundProvider: stub (Linux tanpa X / test), di-set manual
+WindowWatcher mencocokkan window ke ProfileRule lewat cache
+(proses, judul) -> profile, dan memanggil on_profile hanya saat profile berubah.
+"""
+import ctypes
+import os
+import shutil
+import subprocess
+import threading
+from ctypes import wintypes
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from src.core.models import ProfileRule
+
+
+class ForegroundInfo(NamedTuple):
+    process: str  # Nama exe / comm, lowercase
+    title: str
+    pid: int = 0
+
+
+class ForegroundProvider:
+    """Sumber info window aktif; callback(info) dipanggil dari thread provider saat berubah"""
+    
+    event_driven = False
+    
+    def start(self, callback: Callable[[ForegroundInfo], None]):
+        raise NotImplementedError
+    
+    def stop(self):
+        pass
+    
+    def current(self) -> Optional[ForegroundInfo]:
+        return None
+
+
+class ManualForegroundProvider(ForegroundProvider):
+    """Stub: foreground di-set dari luar (test / platform tanpa provider)"""
+    
+    def __init__(self):
+        self._callback = None
+        self._info: Optional[ForegroundInfo] = None
+    
+    def start(self, callback):
+        self._callback = callback
+    
+    def stop(self):
+        self._callback = None
+    
+    def current(self) -> Optional[ForegroundInfo]:
+        return self._info
+    
+    def set_foreground(self, process: str, title: str = "", pid: int = 0):
+        self._info = ForegroundInfo(process.lower(), title, pid)
+        if self._callback:
+            self._callback(self._info)
+
+
+class PollingForegroundProvider(ForegroundProvider):
+    """Panggil current() tiap interval detik, callback hanya jika window berubah"""
+    
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self, callback):
+        self._stop.clear()
+        
+        def run():
+            last = None
+            while not self._stop.is_set():
+                try:
+                    info = self.current()
+                except Exception as e:
+                    print(f"[ERROR] Foreground query failed: {e}")
+                    info = None
+                if info is not None and info[:2] != last:
+                    last = info[:2]
+                    callback(info)
+                self._stop.wait(self.interval)
+        
+        self._thread = threading.Thread(target=run, name="foreground-poll", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(1.0)
+            self._thread = None
+
+
+class X11ForegroundProvider(PollingForegroundProvider):
+    """_NET_ACTIVE_WINDOW lewat xprop (X11 tidak punya event foreground tanpa Xlib)"""
+    
+    @staticmethod
+    def _xprop(*args) -> str:
+        return subprocess.run(["xprop", *args], capture_output=True, text=True, timeout=1.0).stdout
+    
+    def current(self) -> Optional[ForegroundInfo]:
+        active = self._xprop("-root", "_NET_ACTIVE_WINDOW").strip().split()
+        if not active or not active[-1].startswith("0x") or int(active[-1], 16) == 0:
+            return None
+        props = self._xprop("-id", active[-1], "_NET_WM_PID", "_NET_WM_NAME")
+        pid, title = 0, ""
+        for line in props.splitlines():
+            if line.startswith("_NET_WM_PID") and "=" in line:
+                pid = int(line.split("=", 1)[1])
+            elif line.startswith("_NET_WM_NAME") and "=" in line:
+                title = line.split("=", 1)[1].strip().strip('"')
+        process = ""
+        if pid:
+            try:
+                with open(f"/proc/{pid}/comm") as f:
+                    process = f.read().strip().lower()
+            except OSError:
+                pass
+        return ForegroundInfo(process, title, pid)
+
+
+if os.name == "nt":
+    EVENT_SYSTEM_FOREGROUND = 0x0003
+    WINEVENT_OUTOFCONTEXT = 0x0000
+    WINEVENT_SKIPOWNPROCESS = 0x0002
+    WM_QUIT = 0x0012
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    
+    _WinEventProc = ctypes.WINFUNCTYPE(
+        None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+        wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+    _user32.SetWinEventHook.argtypes = (
+        wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, _WinEventProc,
+        wintypes.DWORD, wintypes.DWORD, wintypes.DWORD)
+    _user32.SetWinEventHook.restype = wintypes.HANDLE
+    _user32.UnhookWinEvent.argtypes = (wintypes.HANDLE,)
+    _user32.GetForegroundWindow.restype = wintypes.HWND
+    _user32.GetWindowThreadProcessId.argtypes = (wintypes.HWND, ctypes.POINTER(wintypes.DWORD))
+    _user32.GetWindowTextW.argtypes = (wintypes.HWND, wintypes.LPWSTR, ctypes.c_int)
+    _user32.GetMessageW.argtypes = (ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT)
+    _user32.PostThreadMessageW.argtypes = (wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+    _kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    _kernel32.QueryFullProcessImageNameW.argtypes = (
+        wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD))
+
+
+class Win32ForegroundProvider(ForegroundProvider):
+    """EVENT_SYSTEM_FOREGROUND via SetWinEventHook di thread sendiri (butuh message loop)"""
+    
+    event_driven = True
+    
+    def __init__(self):
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id = 0
+        self._proc = None  # Referensi WINFUNCTYPE harus hidup selama hook terpasang
+    
+    @staticmethod
+    def window_info(hwnd) -> Optional[ForegroundInfo]:
+        if not hwnd:
+            return None
+        pid = wintypes.DWORD()
+        _user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+        title = ctypes.create_unicode_buffer(512)
+        _user32.GetWindowTextW(hwnd, title, 512)
+        
+        process = ""
+        handle = _kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid.value)
+        if handle:
+            path = ctypes.create_unicode_buffer(1024)
+            size = wintypes.DWORD(1024)
+            if _kernel32.QueryFullProcessImageNameW(handle, 0, path, ctypes.byref(size)):
+                process = os.path.basename(path.value).lower()
+            _kernel32.CloseHandle(handle)
+        return ForegroundInfo(process, title.value, pid.value)
+    
+    def current(self) -> Optional[ForegroundInfo]:
+        return self.window_info(_user32.GetForegroundWindow())
+    
+    def start(self, callback):
+        ready = threading.Event()
+        
+        def on_event(hook, event, hwnd, id_object, id_child, thread, time_ms):
+            info = self.window_info(hwnd)
+            if info is not None:
+                callback(info)
+        
+        def run():
+            self._thread_id = _kernel32.GetCurrentThreadId()
+            self._proc = _WinEventProc(on_event)
+            hook = _user32.SetWinEventHook(
+                EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND, None, self._proc,
+                0, 0, WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS)
+            ready.set()
+            if not hook:
+                print("[ERROR] SetWinEventHook failed, profile auto-switch disabled")
+                return
+            info = self.current()
+            if info is not None:
+                callback(info)
+            msg = wintypes.MSG()
+            while _user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                pass
+            _user32.UnhookWinEvent(hook)
+        
+        self._thread = threading.Thread(target=run, name="foreground-hook", daemon=True)
+        self._thread.start()
+        ready.wait(1.0)
+    
+    def stop(self):
+        if self._thread is not None:
+            _user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+            self._thread.join(1.0)
+            self._thread = None
+
+
+def default_provider() -> ForegroundProvider:
+    """Win32 (event) di Windows, xprop (polling) di X11, selain itu stub manual"""
+    if os.name == "nt":
+        return Win32ForegroundProvider()
+    if os.environ.get("DISPLAY") and shutil.which("xprop"):
+        return X11ForegroundProvider()
+    return ManualForegroundProvider()
+
+
+class WindowWatcher:
+    """
+    Cocokkan window aktif ke ProfileRule (rule pertama yang cocok menang).
+    on_profile(path atau None = profile default) dipanggil dari thread provider.
+    """
+    
+    CACHE_SIZE = 256
+    _UNSET = object()
+    
+    def __init__(self, provider: ForegroundProvider, on_profile: Callable[[Optional[str]], None]):
+        self.provider = provider
+        self._on_profile = on_profile
+        self._rules: List[ProfileRule] = []
+        self._cache: Dict[tuple, Optional[str]] = {}
+        self._by_title = False
+        self._current = self._UNSET
+        self._running = False
+        self.events = 0
+        self.cache_hits = 0
+        self.switches = 0
+    
+    def set_rules(self, rules: List[ProfileRule]):
+        self._rules = list(rules)
+        # Tanpa rule berbasis judul, cache cukup per proses (judul tab browser dll. tidak ikut)
+        self._by_title = any(rule.title for rule in self._rules)
+        self._cache = {}
+        self._current = self._UNSET
+        info = self.provider.current() if self._running else None
+        if info is not None:
+            self._on_foreground(info)
+    
+    def resolve(self, process: str, title: str) -> Optional[str]:
+        key = (process, title if self._by_title else "")
+        cache = self._cache
+        if key in cache:
+            self.cache_hits += 1
+            return cache[key]
+        profile = next((rule.profile for rule in self._rules if rule.matches(process, title)), None)
+        if len(cache) >= self.CACHE_SIZE:
+            cache.clear()
+        cache[key] = profile
+        return profile
+    
+    def start(self):
+        if not self._running:
+            self._running = True
+            self.provider.start(self._on_foreground)
+    
+    def stop(self):
+        if self._running:
+            self._running = False
+            self.provider.stop()
+    
+    def _on_foreground(self, info: ForegroundInfo):
+        self.events += 1
+        # Window aplikasi ini sendiri (UI macro) tidak mengganti profile
+        if info.pid and info.pid == os.getpid():
+            return
+        profile = self.resolve(info.process, info.title)
+        if profile == self._current:
+            return
+        self._current = profile
+        self.switches += 1
+        self._on_profile(profile)
+    
+    def snapshot(self) -> dict:
+        return {
+            "provider": type(self.provider).__name__,
+            "event_driven": self.provider.event_driven,
+            "rules": len(self._rules),
+            "events": self.events,
+            "cache_hits": self.cache_hits,
+            "switches": self.switches,
+        }
@@ -3,16 +3,18 @@ Hotkey Page - UI Layer
 Hanya berisi layout dan binding ke controller, tidak ada business logic
 """
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea,
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QFileDialog, QMessageBox, QInputDialog
 )
 from PyQt6.QtCore import Qt
 
-from src.theme import Colors
+from src.theme import ThemeEngine
 from src.components.buttons import GamingButton, ToggleButton
 from src.components.labels import TitleLabel
+from src.components.progress import LabeledProgress
 from src.controllers.hotkey_controller import HotkeyController
-from src.widgets.hotkey_widgets import HotkeyItemWidget, AddEditHotkeyDialog
+from src.widgets.hotkey_widgets import AddEditHotkeyDialog
+from src.widgets.hotkey_list import HotkeyListModel, HotkeyListView
 
 
 class HotkeyPage(QWidget):
@@ -33,7 +35,7 @@ class HotkeyPage(QWidget):
     
     def _setup_ui(self):
         """Setup UI layout"""
-        self.setStyleSheet(f"background: {Colors.SECONDARY_DARKEST};")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(32, 32, 32, 32)
@@ -45,6 +47,11 @@ class HotkeyPage(QWidget):
         # Toolbar Section
         self._create_toolbar(layout)
         
+        # Bulk import progress (hidden sampai ada import berjalan)
+        self.import_progress = LabeledProgress("Importing hotkeys...")
+        self.import_progress.hide()
+        layout.addWidget(self.import_progress)
+        
         # Content Section (Hotkey List)
         self._create_content(layout)
     
@@ -59,6 +66,7 @@ class HotkeyPage(QWidget):
         
         # Status
         self.status_label = QLabel("● Inactive")
+        self.status_label.setObjectName("hotkeyStatus")
         self._update_status_style(False)
         header.addWidget(self.status_label)
         
@@ -94,31 +102,38 @@ class HotkeyPage(QWidget):
         parent_layout.addLayout(toolbar)
     
     def _create_content(self, parent_layout: QVBoxLayout):
-        """Create scrollable content area"""
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("QScrollArea { background: transparent; border: none; }")
+        """Create hotkey list (model/view, hanya baris terlihat yang di-paint)"""
+        self.list_model = HotkeyListModel(self)
+        self.list_view = HotkeyListView()
+        self.list_view.setModel(self.list_model)
         
-        self.list_container = QWidget()
-        self.list_container.setStyleSheet("background: transparent;")
-        self.list_layout = QVBoxLayout(self.list_container)
-        self.list_layout.setContentsMargins(0, 0, 0, 0)
-        self.list_layout.setSpacing(12)
-        self.list_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        delegate = self.list_view.item_delegate
+        delegate.editClicked.connect(self._on_edit_clicked)
+        delegate.deleteClicked.connect(self._on_delete_clicked)
+        delegate.exportClicked.connect(self._on_export_item)
+        delegate.toggleClicked.connect(self._on_item_toggle)
+        parent_layout.addWidget(self.list_view, 1)
         
-        scroll.setWidget(self.list_container)
-        parent_layout.addWidget(scroll, 1)
+        # Empty state
+        self.empty_label = QLabel("No hotkeys configured yet.\nClick '+ Add Hotkey' to create your first hotkey.")
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty_label.setObjectName("emptyState")
+        parent_layout.addWidget(self.empty_label, 1)
         
         # Initial refresh
         self._refresh_list()
     
     def _connect_signals(self):
         """Connect controller signals ke UI handlers"""
-        self.controller.bindingsChanged.connect(self._refresh_list)
+        self.controller.bindingsReset.connect(self._refresh_list)
+        self.controller.bindingAdded.connect(self._on_binding_added)
+        self.controller.bindingUpdated.connect(self._on_binding_updated)
+        self.controller.bindingRemoved.connect(self._on_binding_removed)
         self.controller.statusChanged.connect(self._on_status_changed)
         self.controller.error.connect(self._show_error)
         self.controller.success.connect(self._show_success)
+        self.controller.importProgress.connect(self._on_import_progress)
+        self.controller.bulkImportFinished.connect(self._on_bulk_import_finished)
     
     # ===================
     # UI UPDATE METHODS
@@ -126,61 +141,37 @@ class HotkeyPage(QWidget):
     
     def _refresh_list(self):
         """Refresh hotkey list dari controller"""
-        # Clear current items
-        while self.list_layout.count():
-            item = self.list_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        bindings = self.controller.bindings
+        self.list_model.set_bindings(self.controller.bindings)
+        self._update_empty_state()
         
-        if not bindings:
-            # Empty state
-            empty_label = QLabel("No hotkeys configured yet.\nClick '+ Add Hotkey' to create your first hotkey.")
-            empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_MUTED};
-                    font-size: 14px;
-                    padding: 60px;
-                    background: transparent;
-                }}
-            """)
-            self.list_layout.addWidget(empty_label)
-        else:
-            # Add items
-            for binding in bindings:
-                item = HotkeyItemWidget(binding)
-                item.editClicked.connect(self._on_edit_clicked)
-                item.deleteClicked.connect(self._on_delete_clicked)
-                item.exportClicked.connect(self._on_export_item)
-                item.toggleClicked.connect(self._on_item_toggle)
-                self.list_layout.addWidget(item)
-            
-            self.list_layout.addStretch()
+    def _update_empty_state(self):
+        """Tampilkan empty label jika list kosong"""
+        has_items = self.list_model.rowCount() > 0
+        self.list_view.setVisible(has_items)
+        self.empty_label.setVisible(not has_items)
+    
+    def _on_binding_added(self, binding_id: str):
+        """Tambah satu baris"""
+        binding = self.controller.get_binding(binding_id)
+        if binding:
+            self.list_model.append_binding(binding)
+            self._update_empty_state()
+    
+    def _on_binding_updated(self, binding_id: str):
+        """Update satu baris (edit / toggle)"""
+        binding = self.controller.get_binding(binding_id)
+        if binding:
+            self.list_model.update_binding(binding)
+    
+    def _on_binding_removed(self, binding_id: str):
+        """Hapus satu baris"""
+        self.list_model.remove_binding(binding_id)
+        self._update_empty_state()
     
     def _update_status_style(self, active: bool):
         """Update status label style"""
-        if active:
-            self.status_label.setText("● Active")
-            self.status_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.SUCCESS};
-                    font-size: 13px;
-                    font-weight: 500;
-                    background: transparent;
-                }}
-            """)
-        else:
-            self.status_label.setText("● Inactive")
-            self.status_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_MUTED};
-                    font-size: 13px;
-                    font-weight: 500;
-                    background: transparent;
-                }}
-            """)
+        self.status_label.setText("● Active" if active else "● Inactive")
+        ThemeEngine.set_state(self.status_label, "active", active)
     
     def _show_error(self, message: str):
         """Show error message"""
@@ -202,9 +193,15 @@ class HotkeyPage(QWidget):
         """Handle master toggle click"""
         self.controller.toggle_active()
     
+    def _layer_names(self):
+        """Nama layer yang sudah didefinisikan + yang dipakai binding"""
+        names = [layer.name for layer in self.controller.layers]
+        names += [b.layer for b in self.controller.bindings if b.layer and b.layer not in names]
+        return names
+    
     def _on_add_clicked(self):
         """Handle add button click"""
-        dialog = AddEditHotkeyDialog(parent=self)
+        dialog = AddEditHotkeyDialog(layers=self._layer_names(), parent=self)
         if dialog.exec() and dialog.result_data:
             data = dialog.result_data
             self.controller.add_binding(
@@ -213,14 +210,18 @@ class HotkeyPage(QWidget):
                 actions=data["actions"],
                 repeat=data["repeat"],
                 repeat_delay=data["repeat_delay"],
-                block_input=data["block_input"]
+                block_input=data["block_input"],
+                hotstring_erase=data["hotstring_erase"],
+                trigger_mode=data["trigger_mode"],
+                hold_ms=data["hold_ms"],
+                layer=data["layer"]
             )
     
     def _on_edit_clicked(self, binding_id: str):
         """Handle edit button click"""
         binding = self.controller.get_binding(binding_id)
         if binding:
-            dialog = AddEditHotkeyDialog(binding, parent=self)
+            dialog = AddEditHotkeyDialog(binding, layers=self._layer_names(), parent=self)
             if dialog.exec() and dialog.result_data:
                 data = dialog.result_data
                 self.controller.update_binding(
@@ -230,7 +231,11 @@ class HotkeyPage(QWidget):
                     actions=data["actions"],
                     repeat=data["repeat"],
                     repeat_delay=data["repeat_delay"],
-                    block_input=data["block_input"]
+                    block_input=data["block_input"],
+                    hotstring_erase=data["hotstring_erase"],
+                    trigger_mode=data["trigger_mode"],
+                    hold_ms=data["hold_ms"],
+                    layer=data["layer"]
                 )
     
     def _on_delete_clicked(self, binding_id: str):
@@ -248,12 +253,35 @@ class HotkeyPage(QWidget):
         self.controller.toggle_binding(binding_id, enabled)
     
     def _on_import(self):
-        """Handle import single hotkey click"""
-        filepath, _ = QFileDialog.getOpenFileName(
+        """Handle import hotkey click (satu atau banyak file)"""
+        filepaths, _ = QFileDialog.getOpenFileNames(
             self, "Import Hotkey", "", "JSON Files (*.json)"
         )
-        if filepath:
-            self.controller.import_hotkey(filepath)
+        if len(filepaths) == 1:
+            self.controller.import_hotkey(filepaths[0])
+        elif filepaths:
+            self.controller.import_hotkeys(filepaths)
+    
+    def _on_import_progress(self, done: int, total: int):
+        """Update progress bulk import"""
+        self.import_progress.setLabel(f"Importing hotkeys... ({done}/{total})")
+        self.import_progress.setValue(int(done * 100 / total) if total else 100)
+        self.import_progress.show()
+    
+    def _on_bulk_import_finished(self, imported: int, errors: list):
+        """Tampilkan ringkasan bulk import"""
+        self.import_progress.hide()
+        
+        if not errors:
+            self._show_success(f"{imported} hotkey(s) imported!")
+            return
+        
+        # Batasi jumlah error yang ditampilkan
+        shown = errors[:10]
+        message = f"{imported} hotkey(s) imported, {len(errors)} file(s) failed:\n\n" + "\n".join(shown)
+        if len(errors) > len(shown):
+            message += f"\n... and {len(errors) - len(shown)} more"
+        self._show_error(message)
 
     def _on_export_item(self, binding_id: str):
         """Handle export item click"""
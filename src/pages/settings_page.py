@@ -2,14 +2,17 @@
 Settings Page
 Manages global configurations including Keymapping.
 """
+import os
+
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QListWidget, QMessageBox
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QListWidget, QMessageBox, QInputDialog, QFileDialog,
+    QLineEdit
 )
 from PyQt6.QtCore import Qt
 
-from src.theme import Colors
 from src.components.labels import TitleLabel
 from src.components.buttons import GamingButton
+from src.core.models import Layer, ProfileRule
 from src.widgets.hotkey_widgets import InputCaptureDialog
 
 
@@ -17,14 +20,28 @@ class SettingsPage(QWidget):
     """
     Halaman Settings yang menerima controller dari luar
     """
+    
+    # Preset per halaman list (library besar tidak di-load sekaligus)
+    PRESET_PAGE_SIZE = 50
+    
     def __init__(self, controller, parent=None):
         super().__init__(parent)
         self.controller = controller
+        self._preset_page = 0
         self._setup_ui()
+        
+        # Deferred startup: master keys baru tersedia setelah controller ready
+        self.controller.ready.connect(self._load_data)
+        self.controller.profileChanged.connect(lambda _: self._load_data())
+        self.controller.presetActivated.connect(lambda _: self._load_data())
+    
+    def showEvent(self, event):
+        """Page di-cache oleh MainWindow, refresh data setiap kali ditampilkan"""
+        super().showEvent(event)
         self._load_data()
         
     def _setup_ui(self):
-        self.setStyleSheet(f"background: {Colors.SECONDARY_DARKEST};")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(32, 32, 32, 32)
         layout.setSpacing(24)
@@ -38,7 +55,7 @@ class SettingsPage(QWidget):
         self.keymap_panel = GamingPanel(title="Global Trigger Keys")
         
         desc = QLabel("Set hotkeys to toggle the main macro system (Start/Stop).\nMultiple keys can be assigned. Pressing ANY of them will toggle the state.")
-        desc.setStyleSheet(f"color: {Colors.TEXT_MUTED}; font-size: 13px; line-height: 1.4; margin-bottom: 10px;")
+        desc.setObjectName("settingsDescription")
         desc.setWordWrap(True)
         self.keymap_panel.add_widget(desc)
         
@@ -50,34 +67,8 @@ class SettingsPage(QWidget):
         self.keys_list.setSpacing(8)
         self.keys_list.setMinimumHeight(140)
         
-        # Keycap Style
-        self.keys_list.setStyleSheet(f"""
-            QListWidget {{ 
-                background: transparent; 
-                border: none; 
-                outline: none;
-            }}
-            QListWidget::item {{ 
-                background: {Colors.SECONDARY_DARK}; 
-                color: {Colors.ACCENT};
-                border: 1px solid {Colors.ACCENT_DARK};
-                border-radius: 6px; 
-                width: 100px; 
-                height: 40px;
-                margin: 4px;
-                font-weight: bold;
-                font-size: 14px;
-            }}
-            QListWidget::item:selected {{ 
-                background: {Colors.PRIMARY_DARK}; 
-                border: 1px solid {Colors.PRIMARY_LIGHT};
-                color: white;
-            }}
-            QListWidget::item:hover {{ 
-                border: 1px solid {Colors.ACCENT};
-                background: {Colors.SECONDARY_DARKER};
-            }}
-        """)
+        # Keycap Style (rule #masterKeysList di ThemeEngine)
+        self.keys_list.setObjectName("masterKeysList")
         self.keymap_panel.add_widget(self.keys_list)
         
         # Buttons
@@ -97,6 +88,118 @@ class SettingsPage(QWidget):
         self.keymap_panel.add_layout(btns)
         layout.addWidget(self.keymap_panel)
         
+        # LAYERS SECTION
+        self.layers_panel = GamingPanel(title="Layers")
+        
+        layers_desc = QLabel("Hold or toggle a layer key to switch to that layer's hotkeys.\nHotkeys on an active layer override the base layer; unassigned keys fall through.")
+        layers_desc.setObjectName("settingsDescription")
+        layers_desc.setWordWrap(True)
+        self.layers_panel.add_widget(layers_desc)
+        
+        self.layers_list = QListWidget()
+        self.layers_list.setMinimumHeight(100)
+        self.layers_panel.add_widget(self.layers_list)
+        
+        layer_btns = QHBoxLayout()
+        layer_btns.setSpacing(12)
+        
+        add_layer_btn = GamingButton("+ Add Layer Key", "primary", "small")
+        add_layer_btn.clicked.connect(self._add_layer_key)
+        
+        del_layer_btn = GamingButton("Remove Layer", "secondary", "small")
+        del_layer_btn.clicked.connect(self._remove_layer)
+        
+        layer_btns.addWidget(add_layer_btn)
+        layer_btns.addWidget(del_layer_btn)
+        layer_btns.addStretch()
+        
+        self.layers_panel.add_layout(layer_btns)
+        layout.addWidget(self.layers_panel)
+        
+        # AUTO PROFILES SECTION
+        self.profiles_panel = GamingPanel(title="Auto Profiles")
+        
+        profiles_desc = QLabel("Switch to another profile file automatically when a game's window is focused.\nOther windows use the default profile.")
+        profiles_desc.setObjectName("settingsDescription")
+        profiles_desc.setWordWrap(True)
+        self.profiles_panel.add_widget(profiles_desc)
+        
+        self.active_profile_label = QLabel()
+        self.active_profile_label.setProperty("role", "hint")
+        self.profiles_panel.add_widget(self.active_profile_label)
+        
+        self.rules_list = QListWidget()
+        self.rules_list.setMinimumHeight(100)
+        self.profiles_panel.add_widget(self.rules_list)
+        
+        rule_btns = QHBoxLayout()
+        rule_btns.setSpacing(12)
+        
+        add_rule_btn = GamingButton("+ Add Rule", "primary", "small")
+        add_rule_btn.clicked.connect(self._add_profile_rule)
+        
+        del_rule_btn = GamingButton("Remove Rule", "secondary", "small")
+        del_rule_btn.clicked.connect(self._remove_profile_rule)
+        
+        rule_btns.addWidget(add_rule_btn)
+        rule_btns.addWidget(del_rule_btn)
+        rule_btns.addStretch()
+        
+        self.profiles_panel.add_layout(rule_btns)
+        layout.addWidget(self.profiles_panel)
+        
+        # PRESETS SECTION
+        self.presets_panel = GamingPanel(title="Presets")
+        
+        presets_desc = QLabel("Activate a saved preset to replace the hotkeys of the active profile.\nMacros keep running while the preset is applied.")
+        presets_desc.setObjectName("settingsDescription")
+        presets_desc.setWordWrap(True)
+        self.presets_panel.add_widget(presets_desc)
+        
+        self.preset_search = QLineEdit()
+        self.preset_search.setPlaceholderText("Search presets...")
+        self.preset_search.textChanged.connect(self._on_preset_search)
+        self.presets_panel.add_widget(self.preset_search)
+        
+        self.presets_list = QListWidget()
+        self.presets_list.setMinimumHeight(100)
+        self.presets_list.itemDoubleClicked.connect(lambda _: self._activate_preset())
+        self.presets_panel.add_widget(self.presets_list)
+        
+        page_row = QHBoxLayout()
+        page_row.setSpacing(12)
+        
+        self.prev_page_btn = GamingButton("< Prev", "secondary", "small")
+        self.prev_page_btn.clicked.connect(lambda: self._change_preset_page(-1))
+        
+        self.preset_page_label = QLabel()
+        self.preset_page_label.setProperty("role", "hint")
+        
+        self.next_page_btn = GamingButton("Next >", "secondary", "small")
+        self.next_page_btn.clicked.connect(lambda: self._change_preset_page(1))
+        
+        page_row.addWidget(self.prev_page_btn)
+        page_row.addWidget(self.preset_page_label)
+        page_row.addWidget(self.next_page_btn)
+        page_row.addStretch()
+        self.presets_panel.add_layout(page_row)
+        
+        preset_btns = QHBoxLayout()
+        preset_btns.setSpacing(12)
+        
+        activate_preset_btn = GamingButton("Activate", "primary", "small")
+        activate_preset_btn.clicked.connect(self._activate_preset)
+        
+        save_preset_btn = GamingButton("Save Current as Preset", "secondary", "small")
+        save_preset_btn.clicked.connect(self._save_preset)
+        
+        preset_btns.addWidget(activate_preset_btn)
+        preset_btns.addWidget(save_preset_btn)
+        preset_btns.addStretch()
+        
+        self.presets_panel.add_layout(preset_btns)
+        layout.addWidget(self.presets_panel)
+        
         layout.addStretch()
         
     def _load_data(self):
@@ -107,6 +210,45 @@ class SettingsPage(QWidget):
             item = QListWidgetItem(key.upper()) # Display as Uppercase
             item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             self.keys_list.addItem(item)
+        
+        self.layers_list.clear()
+        for layer in self.controller.layers:
+            keys = [f"hold {k.upper()}" for k in layer.hold_keys]
+            keys += [f"toggle {k.upper()}" for k in layer.toggle_keys]
+            self.layers_list.addItem(f"{layer.name}  -  {', '.join(keys) or 'no keys'}")
+        
+        self.rules_list.clear()
+        for rule in self.controller.profile_rules:
+            match = " + ".join(filter(None, [rule.process, f'"{rule.title}"' if rule.title else ""]))
+            self.rules_list.addItem(f"{match}  ->  {os.path.basename(rule.profile)}")
+        self.active_profile_label.setText(f"Active profile: {os.path.basename(self.controller.active_profile)}")
+        
+        self._load_presets()
+    
+    def _load_presets(self):
+        """Satu halaman hasil search (hanya metadata; body preset tidak dibaca)"""
+        store = self.controller.preset_manager
+        query = self.preset_search.text().strip()
+        total = store.count(query)
+        pages = max(1, -(-total // self.PRESET_PAGE_SIZE))
+        self._preset_page = min(self._preset_page, pages - 1)
+        
+        self.presets_list.clear()
+        for info in store.search(query, limit=self.PRESET_PAGE_SIZE,
+                                 offset=self._preset_page * self.PRESET_PAGE_SIZE):
+            self.presets_list.addItem(info.name)
+        
+        self.preset_page_label.setText(f"Page {self._preset_page + 1} / {pages}  ({total} presets)")
+        self.prev_page_btn.setEnabled(self._preset_page > 0)
+        self.next_page_btn.setEnabled(self._preset_page < pages - 1)
+    
+    def _on_preset_search(self, _text: str):
+        self._preset_page = 0
+        self._load_presets()
+    
+    def _change_preset_page(self, step: int):
+        self._preset_page = max(0, self._preset_page + step)
+        self._load_presets()
             
     def _add_key(self):
         """Open capture dialog to add key"""
@@ -136,3 +278,86 @@ class SettingsPage(QWidget):
                 self._load_data()
         else:
             QMessageBox.information(self, "Info", "Please select a key to remove.")
+
+    def _add_layer_key(self):
+        """Tambah layer baru / key baru untuk layer yang sudah ada"""
+        names = [layer.name for layer in self.controller.layers]
+        name, ok = QInputDialog.getItem(self, "Layer", "Layer name:", names, 0, True)
+        name = name.strip()
+        if not ok or not name:
+            return
+        mode, ok = QInputDialog.getItem(self, "Layer Key", "Activate layer by:", ["Hold", "Toggle"], 0, False)
+        if not ok:
+            return
+        dialog = InputCaptureDialog(title=f"Press key for layer '{name}'...", parent=self)
+        if not dialog.exec() or not dialog.captured_key:
+            return
+        
+        key = dialog.captured_key
+        layers = [Layer(l.name, list(l.hold_keys), list(l.toggle_keys)) for l in self.controller.layers]
+        layer = next((l for l in layers if l.name == name), None)
+        if layer is None:
+            layer = Layer(name)
+            layers.append(layer)
+        keys = layer.hold_keys if mode == "Hold" else layer.toggle_keys
+        if key in layer.hold_keys + layer.toggle_keys:
+            QMessageBox.warning(self, "Duplicate", f"Key '{key}' is already assigned to this layer.")
+            return
+        keys.append(key)
+        self.controller.set_layers(layers)
+        self._load_data()
+    
+    def _remove_layer(self):
+        """Hapus definisi layer (binding di layer itu tetap ada)"""
+        row = self.layers_list.currentRow()
+        if row < 0:
+            QMessageBox.information(self, "Info", "Please select a layer to remove.")
+            return
+        layers = list(self.controller.layers)
+        del layers[row]
+        self.controller.set_layers(layers)
+        self._load_data()
+
+    def _add_profile_rule(self):
+        """Rule baru: nama proses (dan/atau judul window) -> file profile"""
+        process, ok = QInputDialog.getText(self, "Auto Profile", "Process name (e.g. game.exe):")
+        if not ok:
+            return
+        title, ok = QInputDialog.getText(self, "Auto Profile", "Window title contains (optional):")
+        if not ok:
+            return
+        if not process.strip() and not title.strip():
+            QMessageBox.warning(self, "Error", "Enter a process name or window title.")
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "Select Profile", "", "Profile (*.json)")
+        if not path:
+            return
+        rules = self.controller.profile_rules
+        rules.append(ProfileRule(profile=path, process=process.strip(), title=title.strip()))
+        self.controller.set_profile_rules(rules)
+        self._load_data()
+    
+    def _remove_profile_rule(self):
+        row = self.rules_list.currentRow()
+        if row < 0:
+            QMessageBox.information(self, "Info", "Please select a rule to remove.")
+            return
+        rules = self.controller.profile_rules
+        del rules[row]
+        self.controller.set_profile_rules(rules)
+        self._load_data()
+
+    def _activate_preset(self):
+        item = self.presets_list.currentItem()
+        if item is None:
+            QMessageBox.information(self, "Info", "Please select a preset to activate.")
+            return
+        self.controller.activate_preset(item.text())
+    
+    def _save_preset(self):
+        name, ok = QInputDialog.getText(self, "Save Preset", "Preset name:")
+        name = name.strip()
+        if not ok or not name:
+            return
+        self.controller.save_preset(name)
+        self._load_data()
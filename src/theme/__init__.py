@@ -2,5 +2,10 @@
 from .colors import Colors
 from .styles import Styles
 from .fonts import Fonts
+from .engine import ThemeEngine
+from .paint_cache import PaintCache
+from .animation import AnimationClock
+from .glow import GlowRenderer, GlowSource, TextGlowSource
 
-__all__ = ['Colors', 'Styles', 'Fonts']
+__all__ = ['Colors', 'Styles', 'Fonts', 'ThemeEngine', 'PaintCache', 'AnimationClock',
+           'GlowRenderer', 'GlowSource', 'TextGlowSource']
@@ -0,0 +1,108 @@
+"""
+Animation Clock - Satu QTimer bersama untuk semua transisi (hover glow, switch, dst)
+Menggantikan QPropertyAnimation per widget: N widget animasi = 1 timer tick.
+"""
+import time
+from typing import Callable, Dict, Tuple
+
+from PyQt6.QtCore import QObject, QTimer, QEasingCurve
+
+
+class _Track:
+    """State satu transisi"""
+    
+    __slots__ = ("start", "end", "started_at", "duration", "setter", "curve")
+    
+    def __init__(self, start: float, end: float, duration: float,
+                 setter: Callable[[float], None], curve: QEasingCurve):
+        self.start = start
+        self.end = end
+        self.started_at = time.perf_counter()
+        self.duration = duration
+        self.setter = setter
+        self.curve = curve
+
+
+class AnimationClock(QObject):
+    """
+    Driver animasi global (~60 fps).
+    Timer hanya jalan selama ada track aktif.
+    """
+    
+    INTERVAL_MS = 16
+    
+    _instance = None
+    
+    def __init__(self):
+        super().__init__()
+        self._tracks: Dict[Tuple[int, str], _Track] = {}
+        self._curves: Dict[QEasingCurve.Type, QEasingCurve] = {}
+        self._watched = set()
+        
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.INTERVAL_MS)
+        self._timer.timeout.connect(self._tick)
+    
+    @classmethod
+    def instance(cls) -> "AnimationClock":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def animate(self, owner: QObject, name: str, start: float, end: float,
+                duration_ms: int, setter: Callable[[float], None],
+                easing: QEasingCurve.Type = QEasingCurve.Type.OutCubic):
+        """
+        Mulai (atau ganti) transisi owner/name dari start ke end.
+        setter(value) dipanggil tiap tick, terakhir dengan value == end.
+        """
+        key = (id(owner), name)
+        if start == end or duration_ms <= 0:
+            self._tracks.pop(key, None)
+            setter(end)
+            return
+        
+        if key[0] not in self._watched:
+            self._watched.add(key[0])
+            owner.destroyed.connect(lambda _=None, oid=key[0]: self.cancel_all(oid))
+        
+        curve = self._curves.get(easing)
+        if curve is None:
+            curve = self._curves[easing] = QEasingCurve(easing)
+        
+        self._tracks[key] = _Track(start, end, duration_ms / 1000.0, setter, curve)
+        if not self._timer.isActive():
+            self._timer.start()
+    
+    def stop(self, owner: QObject, name: str):
+        """Hentikan transisi tanpa loncat ke nilai akhir"""
+        self._tracks.pop((id(owner), name), None)
+    
+    def cancel_all(self, owner_id: int):
+        self._watched.discard(owner_id)
+        for key in [k for k in self._tracks if k[0] == owner_id]:
+            del self._tracks[key]
+    
+    def is_running(self, owner: QObject, name: str) -> bool:
+        return (id(owner), name) in self._tracks
+    
+    def _tick(self):
+        now = time.perf_counter()
+        finished = []
+        
+        for key, track in list(self._tracks.items()):
+            progress = min(1.0, (now - track.started_at) / track.duration)
+            value = track.start + (track.end - track.start) * track.curve.valueForProgress(progress)
+            try:
+                track.setter(track.end if progress >= 1.0 else value)
+            except RuntimeError:
+                # Widget sudah dihapus (C++ object deleted)
+                progress = 1.0
+            if progress >= 1.0:
+                finished.append(key)
+        
+        for key in finished:
+            self._tracks.pop(key, None)
+        
+        if not self._tracks:
+            self._timer.stop()
@@ -0,0 +1,99 @@
+"""
+Theme Engine - Compile Colors + Styles sekali jadi satu application stylesheet
+Widget cukup memakai objectName / dynamic property, perubahan state
+cukup flip property (tanpa parse ulang QSS per widget).
+"""
+import re
+from typing import Any, Optional
+
+from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtCore import Qt
+
+from .styles import Styles
+from .paint_cache import PaintCache
+
+
+class ThemeEngine:
+    """Compiler + helper untuk application-level stylesheet"""
+    
+    # Variant GamingButton -> template di Styles (selector QPushButton di-scope)
+    BUTTON_VARIANTS = {
+        "primary": Styles.button_primary,
+        "secondary": Styles.button_secondary,
+        "accent": Styles.button_accent,
+        "danger": Styles.button_danger,
+        "ghost": Styles.button_ghost,
+    }
+    
+    # Template input di Styles yang dipakai komponen input (type selector -> selector ter-scope)
+    SCOPED_TEMPLATES = (
+        (Styles.input_default, {"QLineEdit": "GamingInput QLineEdit"}),
+        (Styles.textarea_default, {"QTextEdit": "GamingTextArea QTextEdit",
+                                   "QPlainTextEdit": "GamingTextArea QPlainTextEdit"}),
+        (Styles.spinbox_default, {"QSpinBox": "GamingSpinBox QSpinBox",
+                                  "QDoubleSpinBox": "GamingSpinBox QDoubleSpinBox"}),
+        (Styles.combobox_default, {"QComboBox": "GamingComboBox QComboBox"}),
+    )
+    
+    _stylesheet: Optional[str] = None
+    
+    @staticmethod
+    def scope(qss: str, type_name: str, selector: str) -> str:
+        """Ganti type selector (mis. QPushButton) dengan selector yang lebih spesifik"""
+        return re.sub(rf"\b{type_name}\b", selector, qss)
+    
+    @classmethod
+    def compile(cls) -> str:
+        """Stylesheet lengkap (di-cache setelah compile pertama)"""
+        if cls._stylesheet is None:
+            parts = [Styles.app_stylesheet()]
+            for variant, template in cls.BUTTON_VARIANTS.items():
+                parts.append(cls.scope(template(), "QPushButton", f'GamingButton[variant="{variant}"]'))
+            for template, selectors in cls.SCOPED_TEMPLATES:
+                qss = template()
+                for type_name, selector in selectors.items():
+                    qss = cls.scope(qss, type_name, selector)
+                parts.append(qss)
+            parts.append(Styles.component_rules())
+            parts.append(Styles.hotkey_widget_rules())
+            parts.append(Styles.window_rules())
+            cls._stylesheet = "\n".join(parts)
+        return cls._stylesheet
+    
+    @classmethod
+    def invalidate(cls):
+        """Buang cache (mis. setelah Colors diubah)"""
+        cls._stylesheet = None
+        PaintCache.invalidate()
+    
+    @classmethod
+    def apply(cls, app: QApplication = None):
+        """Pasang stylesheet ke QApplication (satu kali parse)"""
+        app = app or QApplication.instance()
+        if app is not None:
+            app.setStyleSheet(cls.compile())
+    
+    @staticmethod
+    def set_state(widget: QWidget, name: str, value: Any, recursive: bool = False) -> bool:
+        """
+        Set dynamic property dan re-polish widget (tanpa setStyleSheet).
+        recursive=True untuk rule yang memakai property parent (mis. NavItem[active] QLabel).
+        Return False jika value tidak berubah.
+        """
+        if widget.property(name) == value:
+            return False
+        widget.setProperty(name, value)
+        
+        # Belum pernah di-polish (mis. masih di constructor) -> cukup set property
+        if not widget.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+            return True
+        
+        targets = [widget]
+        if recursive:
+            targets.extend(widget.findChildren(QWidget))
+        style = widget.style()
+        for target in targets:
+            style.unpolish(target)
+            style.polish(target)
+        widget.update()
+        return True
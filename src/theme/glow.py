@@ -0,0 +1,232 @@
+"""
+Glow Renderer - Pengganti QGraphicsDropShadowEffect
+Bayangan/glow di-blur sekali per (shape, size, color, blur, dpr) lalu di-cache;
+parent widget meng-composite pixmap itu di belakang child saat paint.
+Graphics effect memaksa render offscreen + blur ulang tiap repaint, ini cukup blit.
+"""
+from typing import List, Optional
+
+from PyQt6.QtWidgets import (QWidget, QGraphicsScene, QGraphicsPixmapItem,
+                              QGraphicsBlurEffect)
+from PyQt6.QtCore import Qt, QObject, QEvent, QRect, QRectF, QPoint
+from PyQt6.QtGui import QPainter, QPixmap, QPixmapCache, QColor, QImage
+
+from .paint_cache import PaintCache
+
+
+class GlowRenderer:
+    """Render + cache pixmap glow yang sudah di-blur"""
+    
+    # blurRadius QGraphicsDropShadowEffect ~ 0.4x radius QGraphicsBlurEffect
+    # (dikalibrasi supaya falloff sama dengan effect lama)
+    RADIUS_SCALE = 0.4
+    
+    @staticmethod
+    def blur(image: QImage, radius: float) -> QImage:
+        """Gaussian blur (sama dengan blur milik QGraphicsDropShadowEffect)"""
+        scene = QGraphicsScene()
+        item = QGraphicsPixmapItem(QPixmap.fromImage(image))
+        effect = QGraphicsBlurEffect()
+        effect.setBlurRadius(radius)
+        effect.setBlurHints(QGraphicsBlurEffect.BlurHint.PerformanceHint)
+        item.setGraphicsEffect(effect)
+        scene.addItem(item)
+        
+        result = QImage(image.size(), QImage.Format.Format_ARGB32_Premultiplied)
+        result.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(result)
+        scene.render(painter, QRectF(result.rect()), QRectF(image.rect()))
+        painter.end()
+        return result
+    
+    @classmethod
+    def pixmap(cls, shape_key: str, width: int, height: int, color: QColor,
+               blur: int, dpr: float, render_shape) -> QPixmap:
+        """
+        Pixmap glow berukuran (width + 2*blur, height + 2*blur).
+        render_shape(painter) menggambar siluet (warna apa saja, alpha dipakai)
+        di koordinat logical (0, 0, width, height).
+        """
+        key = (f"glow|{shape_key}|{width}x{height}|{color.name()}|b{blur}"
+               f"@{dpr:g}|{PaintCache.theme_key()}")
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+        
+        full_w, full_h = width + blur * 2, height + blur * 2
+        image = QImage(max(1, round(full_w * dpr)), max(1, round(full_h * dpr)),
+                       QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        
+        # Siluet -> diwarnai -> blur
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.scale(dpr, dpr)
+        painter.translate(blur, blur)
+        render_shape(painter)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+        painter.fillRect(QRectF(-blur, -blur, full_w, full_h), QColor(color.rgb()))
+        painter.end()
+        
+        pixmap = QPixmap.fromImage(cls.blur(image, blur * dpr * cls.RADIUS_SCALE))
+        pixmap.setDevicePixelRatio(dpr)
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+
+class GlowSource(QObject):
+    """
+    Glow / drop shadow untuk satu widget (siluet rounded rect).
+    Di-paint oleh parent, di belakang widget - seperti QGraphicsDropShadowEffect.
+    Alpha warna = intensitas (bisa dianimasikan via set_alpha).
+    """
+    
+    def __init__(self, widget: QWidget, color: QColor, blur: int = 20,
+                 offset: QPoint = QPoint(0, 0), radius: float = 8):
+        super().__init__(widget)
+        self.widget = widget
+        self.color = QColor(color)
+        self.blur = blur
+        self.offset = QPoint(offset)
+        self.radius = radius
+        self._host: Optional["_GlowHost"] = None
+        
+        widget.installEventFilter(self)
+        self._attach_host()
+    
+    # ===================
+    # PUBLIC API
+    # ===================
+    
+    def alpha(self) -> int:
+        return self.color.alpha()
+    
+    def set_alpha(self, value: int):
+        value = max(0, min(255, int(value)))
+        if value != self.color.alpha():
+            self.color.setAlpha(value)
+            self.update()
+    
+    def set_color(self, color: QColor):
+        self.color = QColor(color)
+        self.update()
+    
+    def glow_rect(self) -> QRect:
+        """Area glow di koordinat parent"""
+        b = self.blur
+        return self.widget.geometry().adjusted(-b, -b, b, b).translated(self.offset)
+    
+    def update(self):
+        parent = self.widget.parentWidget()
+        if parent is not None and self.widget.isVisible():
+            parent.update(self.glow_rect())
+    
+    # ===================
+    # SHAPE (override di subclass)
+    # ===================
+    
+    def shape_key(self) -> str:
+        return f"rrect{self.radius:g}"
+    
+    def render_shape(self, painter: QPainter):
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(Qt.GlobalColor.black)
+        painter.drawRoundedRect(QRectF(0, 0, self.widget.width(), self.widget.height()),
+                                self.radius, self.radius)
+    
+    # ===================
+    # INTERNAL
+    # ===================
+    
+    def paint(self, painter: QPainter):
+        """Dipanggil _GlowHost saat parent paint"""
+        widget = self.widget
+        if self.color.alpha() == 0 or not widget.isVisible() or widget.width() <= 0:
+            return
+        pixmap = GlowRenderer.pixmap(self.shape_key(), widget.width(), widget.height(),
+                                     self.color, self.blur, widget.devicePixelRatioF(),
+                                     self.render_shape)
+        top_left = widget.pos() + self.offset - QPoint(self.blur, self.blur)
+        painter.setOpacity(self.color.alphaF())
+        painter.drawPixmap(top_left, pixmap)
+    
+    def _attach_host(self):
+        host = _GlowHost.for_parent(self.widget.parentWidget())
+        if host is self._host:
+            return
+        if self._host is not None:
+            self._host.remove(self)
+        self._host = host
+        if host is not None:
+            host.add(self)
+    
+    def eventFilter(self, obj, event):
+        etype = event.type()
+        if etype == QEvent.Type.ParentChange:
+            self._attach_host()
+        elif etype == QEvent.Type.Move:
+            self._update_area(QRect(event.oldPos(), self.widget.geometry().size()))
+            self._update_area(self.widget.geometry())
+        elif etype == QEvent.Type.Resize:
+            self._update_area(QRect(self.widget.pos(), event.oldSize()))
+            self._update_area(self.widget.geometry())
+        elif etype in (QEvent.Type.Show, QEvent.Type.Hide):
+            self._update_area(self.widget.geometry())
+        return False
+    
+    def _update_area(self, geometry: QRect):
+        """Repaint area glow untuk geometry widget tertentu (lama/baru)"""
+        parent = self.widget.parentWidget()
+        if parent is not None and self.color.alpha() > 0:
+            b = self.blur
+            parent.update(geometry.adjusted(-b, -b, b, b).translated(self.offset))
+
+
+class TextGlowSource(GlowSource):
+    """Glow mengikuti siluet teks QLabel (GlowLabel)"""
+    
+    def shape_key(self) -> str:
+        widget = self.widget
+        return f"text|{widget.text()}|{widget.font().key()}|{int(widget.alignment().value)}"
+    
+    def render_shape(self, painter: QPainter):
+        widget = self.widget
+        painter.setPen(Qt.GlobalColor.black)
+        painter.setFont(widget.font())
+        painter.drawText(QRectF(widget.contentsRect()), widget.alignment(), widget.text())
+
+
+class _GlowHost(QObject):
+    """Event filter di parent: paint parent dulu, lalu glow semua child terdaftar"""
+    
+    def __init__(self, parent_widget: QWidget):
+        super().__init__(parent_widget)
+        self.parent_widget = parent_widget
+        self.sources: List[GlowSource] = []
+        parent_widget.installEventFilter(self)
+    
+    @staticmethod
+    def for_parent(parent_widget: Optional[QWidget]) -> Optional["_GlowHost"]:
+        if parent_widget is None:
+            return None
+        host = parent_widget.findChild(_GlowHost, options=Qt.FindChildOption.FindDirectChildrenOnly)
+        return host or _GlowHost(parent_widget)
+    
+    def add(self, source: GlowSource):
+        if source not in self.sources:
+            self.sources.append(source)
+            source.destroyed.connect(lambda _=None, s=source: self.remove(s))
+    
+    def remove(self, source: GlowSource):
+        if source in self.sources:
+            self.sources.remove(source)
+    
+    def eventFilter(self, obj, event):
+        if obj is self.parent_widget and event.type() == QEvent.Type.Paint and self.sources:
+            obj.event(event)
+            painter = QPainter(obj)
+            for source in self.sources:
+                source.paint(painter)
+            painter.end()
+            return True
+        return False
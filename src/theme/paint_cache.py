@@ -0,0 +1,105 @@
+"""
+Paint Cache - Pixmap cache untuk komponen custom-painted
+Glyph (box checkbox, track switch, ring progress, dst) dirender sekali per
+(component, state, size, theme, dpr) ke QPixmapCache, repaint cukup blit.
+Pen/brush juga di-prebuild supaya paintEvent tidak alokasi QColor/QPen tiap frame.
+"""
+from typing import Callable, Dict, Optional, Tuple
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPainter, QPixmap, QPixmapCache, QPen, QBrush, QColor
+
+from .colors import Colors
+
+
+class PaintCache:
+    """Shared pixmap / pen / brush cache (keyed per theme)"""
+    
+    # Batas QPixmapCache (KB) - glyph kecil, 10 MB lebih dari cukup
+    CACHE_LIMIT_KB = 10 * 1024
+    
+    _theme_key: Optional[str] = None
+    _pens: Dict[Tuple, QPen] = {}
+    _brushes: Dict[str, QBrush] = {}
+    _colors: Dict[str, QColor] = {}
+    
+    @classmethod
+    def theme_key(cls) -> str:
+        """Fingerprint palette Colors (berubah -> semua key cache ikut berubah)"""
+        if cls._theme_key is None:
+            palette = tuple(
+                value for name, value in sorted(vars(Colors).items())
+                if name.isupper() and isinstance(value, str)
+            )
+            cls._theme_key = format(hash(palette) & 0xFFFFFFFF, "08x")
+            if QPixmapCache.cacheLimit() < cls.CACHE_LIMIT_KB:
+                QPixmapCache.setCacheLimit(cls.CACHE_LIMIT_KB)
+        return cls._theme_key
+    
+    @classmethod
+    def invalidate(cls):
+        """Buang semua pixmap/pen/brush (dipanggil saat theme berubah)"""
+        cls._theme_key = None
+        cls._pens.clear()
+        cls._brushes.clear()
+        cls._colors.clear()
+        QPixmapCache.clear()
+    
+    # ===================
+    # PEN / BRUSH
+    # ===================
+    
+    @classmethod
+    def color(cls, value: str) -> QColor:
+        color = cls._colors.get(value)
+        if color is None:
+            color = cls._colors[value] = QColor(value)
+        return color
+    
+    @classmethod
+    def pen(cls, value: str, width: float = 1.0, round_cap: bool = False) -> QPen:
+        """Pen siap pakai (jangan dimodifikasi, objeknya di-share)"""
+        key = (value, width, round_cap)
+        pen = cls._pens.get(key)
+        if pen is None:
+            pen = QPen(cls.color(value), width)
+            if round_cap:
+                pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+                pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+            cls._pens[key] = pen
+        return pen
+    
+    @classmethod
+    def brush(cls, value: str) -> QBrush:
+        brush = cls._brushes.get(value)
+        if brush is None:
+            brush = cls._brushes[value] = QBrush(cls.color(value))
+        return brush
+    
+    # ===================
+    # PIXMAP
+    # ===================
+    
+    @classmethod
+    def pixmap(cls, component: str, state: str, width: int, height: int,
+               dpr: float, render: Callable[[QPainter], None]) -> QPixmap:
+        """
+        Ambil pixmap dari cache, render via render(painter) kalau belum ada.
+        Koordinat render dalam logical pixel (0..width, 0..height).
+        """
+        key = f"{component}|{state}|{width}x{height}@{dpr:g}|{cls.theme_key()}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+        
+        pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        render(painter)
+        painter.end()
+        
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
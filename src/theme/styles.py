@@ -851,3 +851,588 @@ class Styles:
                 font-weight: 600;
             }}
         """
+
+    # ========================
+    # THEMED RULES (dikompilasi sekali oleh ThemeEngine)
+    # Selector memakai nama class, objectName dan dynamic property
+    # ========================
+    
+    @staticmethod
+    def component_rules() -> str:
+        """Rules untuk src/components"""
+        return f"""
+            GamingButton[btnSize="small"] {{
+                padding: 8px 16px;
+                font-size: 10px;
+                min-height: 16px;
+            }}
+            GamingButton[btnSize="large"] {{
+                padding: 16px 32px;
+                font-size: 14px;
+                min-height: 24px;
+            }}
+            
+            ToggleButton[on="false"] {{
+                background: {Colors.SECONDARY_DARK};
+                color: {Colors.TEXT_SECONDARY};
+                border: 2px solid {Colors.BORDER_DEFAULT};
+                border-radius: 8px;
+                padding: 10px 22px;
+                font-weight: 600;
+                font-size: 12px;
+            }}
+            ToggleButton[on="false"]:hover {{
+                background: {Colors.SECONDARY};
+                border-color: {Colors.SECONDARY_LIGHT};
+                color: {Colors.TEXT_PRIMARY};
+            }}
+            ToggleButton[on="true"] {{
+                background: {Colors.GRADIENT_ACCENT};
+                color: {Colors.SECONDARY_DARKEST};
+                border: none;
+                border-radius: 8px;
+                padding: 12px 24px;
+                font-weight: 700;
+                font-size: 12px;
+            }}
+            ToggleButton[on="true"]:hover {{
+                background: {Colors.ACCENT_LIGHT};
+            }}
+            
+            TitleLabel {{
+                color: {Colors.TEXT_PRIMARY};
+                background: transparent;
+                border: none;
+            }}
+            TitleLabel[level="1"] {{ font-size: 28px; font-weight: 800; }}
+            TitleLabel[level="2"] {{ font-size: 24px; font-weight: 700; }}
+            TitleLabel[level="3"] {{ font-size: 20px; font-weight: 700; }}
+            TitleLabel[level="4"] {{ font-size: 16px; font-weight: 600; }}
+            TitleLabel[level="5"] {{ font-size: 14px; font-weight: 600; }}
+            TitleLabel[level="6"] {{ font-size: 12px; font-weight: 500; }}
+            
+            BadgeLabel {{ border-radius: 14px; border: none; background: {Colors.PRIMARY}; }}
+            BadgeLabel[variant="accent"] {{ background: {Colors.ACCENT}; }}
+            BadgeLabel[variant="success"] {{ background: {Colors.SUCCESS}; }}
+            BadgeLabel[variant="warning"] {{ background: {Colors.WARNING}; }}
+            BadgeLabel[variant="error"] {{ background: {Colors.ERROR}; }}
+            BadgeLabel[variant="info"] {{ background: {Colors.INFO}; }}
+            BadgeLabel QLabel {{
+                color: {Colors.TEXT_PRIMARY};
+                font-size: 11px;
+                font-weight: 700;
+                background: transparent;
+                border: none;
+            }}
+            BadgeLabel[variant="accent"] QLabel, BadgeLabel[variant="warning"] QLabel {{
+                color: {Colors.SECONDARY_DARKEST};
+            }}
+            
+            StatusIndicator {{ background: {Colors.SECONDARY_LIGHT}; border: 2px solid {Colors.SECONDARY_DARK}; }}
+            StatusIndicator[status="online"] {{ background: {Colors.SUCCESS}; }}
+            StatusIndicator[status="away"] {{ background: {Colors.WARNING}; }}
+            StatusIndicator[status="busy"] {{ background: {Colors.ERROR}; }}
+            
+            GamingPanel {{
+                background: {Colors.SECONDARY_DARKER};
+                border: 1px solid {Colors.BORDER_DEFAULT};
+                border-radius: 16px;
+            }}
+            QWidget#panelTitleContainer {{ background: transparent; }}
+            QLabel#panelTitle {{
+                color: {Colors.TEXT_PRIMARY};
+                font-size: 16px;
+                font-weight: 700;
+                background: transparent;
+                border: none;
+            }}
+            QFrame#panelSeparator {{ background: {Colors.BORDER_DEFAULT}; }}
+            
+            GlassPanel {{
+                background: {Colors.GLASS_BACKGROUND};
+                border: 1px solid {Colors.rgba(Colors.PRIMARY_LIGHT, 0.3)};
+                border-radius: 20px;
+            }}
+            
+            SidebarPanel {{
+                background: {Colors.SECONDARY_DARKEST};
+                border-right: 1px solid {Colors.BORDER_DEFAULT};
+            }}
+            QFrame#sidebarHeader {{
+                background: transparent;
+                border: none;
+                border-bottom: 1px solid {Colors.BORDER_DEFAULT};
+            }}
+            QFrame#sidebarFooter {{
+                background: transparent;
+                border: none;
+                border-top: 1px solid {Colors.BORDER_DEFAULT};
+            }}
+            QScrollArea#sidebarScroll {{ background: transparent; border: none; }}
+            QScrollArea#sidebarScroll > QWidget > QWidget {{ background: transparent; }}
+            
+            NavItem {{ background: transparent; border-radius: 12px; border: none; }}
+            NavItem:hover {{ background: {Colors.rgba(Colors.PRIMARY, 0.15)}; }}
+            NavItem[active="true"] {{
+                background: {Colors.PRIMARY_DARK};
+                border-left: 3px solid {Colors.ACCENT_LIGHT};
+            }}
+            NavItem QLabel#navIcon {{
+                color: {Colors.TEXT_MUTED};
+                font-size: 16px;
+                background: transparent;
+                border: none;
+            }}
+            NavItem QLabel#navText {{
+                color: {Colors.TEXT_SECONDARY};
+                font-size: 14px;
+                font-weight: 500;
+                background: transparent;
+                border: none;
+            }}
+            NavItem[active="true"] QLabel#navIcon {{ color: {Colors.ACCENT_LIGHT}; }}
+            NavItem[active="true"] QLabel#navText {{ color: {Colors.TEXT_PRIMARY}; font-weight: 600; }}
+            
+            GamingProgressBar QProgressBar {{
+                background: {Colors.SECONDARY_DARK};
+                border: none;
+                border-radius: 6px;
+            }}
+            GamingProgressBar QProgressBar::chunk {{
+                background: {Colors.GRADIENT_PRIMARY};
+                border-radius: 6px;
+            }}
+            GamingProgressBar[variant="accent"] QProgressBar::chunk {{
+                background: {Colors.GRADIENT_ACCENT};
+            }}
+            QLabel#progressPercent {{
+                color: {Colors.TEXT_PRIMARY};
+                font-size: 13px;
+                font-weight: 600;
+                background: transparent;
+                border: none;
+            }}
+            QLabel#progressLabel {{
+                color: {Colors.TEXT_SECONDARY};
+                font-size: 12px;
+                font-weight: 500;
+                background: transparent;
+                border: none;
+            }}
+            
+            GamingCard {{
+                background: {Colors.SECONDARY_DARK};
+                border: 1px solid {Colors.BORDER_DEFAULT};
+                border-radius: 12px;
+            }}
+            GamingCard[highlighted="true"] {{
+                background: {Colors.PRIMARY_DARKEST};
+                border: 2px solid {Colors.PRIMARY};
+            }}
+            StatCard {{
+                background: {Colors.SECONDARY_DARK};
+                border: 1px solid {Colors.BORDER_DEFAULT};
+                border-radius: 16px;
+            }}
+            QLabel#statTitle {{
+                color: {Colors.TEXT_SECONDARY};
+                font-size: 12px;
+                font-weight: 500;
+                background: transparent;
+                border: none;
+            }}
+            QLabel#statValue {{
+                color: {Colors.TEXT_PRIMARY};
+                font-size: 32px;
+                font-weight: 700;
+                background: transparent;
+                border: none;
+            }}
+            FeatureCard {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                    stop:0 {Colors.SECONDARY_DARK}, stop:1 {Colors.SECONDARY_DARKER});
+                border: 1px solid {Colors.BORDER_DEFAULT};
+                border-radius: 16px;
+            }}
+            FeatureCard:hover {{
+                border-color: {Colors.PRIMARY};
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                    stop:0 {Colors.PRIMARY_DARKEST}, stop:1 {Colors.SECONDARY_DARK});
+            }}
+            QLabel#featureIcon {{
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
+                    stop:0 {Colors.PRIMARY}, stop:1 {Colors.ACCENT});
+                color: {Colors.TEXT_PRIMARY};
+                font-size: 24px;
+                border-radius: 14px;
+                border: none;
+            }}
+            QLabel#featureTitle {{
+                color: {Colors.TEXT_PRIMARY};
+                font-size: 15px;
+                font-weight: 700;
+                background: transparent;
+                border: none;
+            }}
+            QLabel#featureDescription {{
+                color: {Colors.TEXT_MUTED};
+                font-size: 12px;
+                background: transparent;
+                border: none;
+            }}
+            
+            GamingInput, GamingTextArea, GamingSpinBox, GamingComboBox {{
+                background: transparent;
+                border: none;
+            }}
+            QLabel[role="fieldLabel"] {{
+                color: {Colors.TEXT_SECONDARY};
+                font-size: 12px;
+                font-weight: 600;
+                background: transparent;
+                border: none;
+            }}
+            
+            QLabel#sliderValue {{
+                color: {Colors.ACCENT_LIGHT};
+                font-size: 13px;
+                font-weight: 700;
+                background: transparent;
+                border: none;
+            }}
+            GamingSlider QSlider::groove:horizontal {{
+                background: {Colors.SECONDARY_DARK};
+                height: 6px;
+                border-radius: 3px;
+            }}
+            GamingSlider QSlider::handle:horizontal {{
+                background: {Colors.ACCENT_LIGHT};
+                width: 18px;
+                height: 18px;
+                margin: -6px 0;
+                border-radius: 9px;
+            }}
+            GamingSlider QSlider::handle:horizontal:hover {{
+                background: {Colors.ACCENT_LIGHTER};
+            }}
+            GamingSlider QSlider::sub-page:horizontal {{
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+                    stop:0 {Colors.PRIMARY}, stop:1 {Colors.ACCENT});
+                border-radius: 3px;
+            }}
+            
+            QLabel#switchLabel {{ color: {Colors.TEXT_PRIMARY}; background: transparent; }}
+        """
+    
+    @staticmethod
+    def hotkey_widget_rules() -> str:
+        """Rules untuk src/widgets (dialog & item hotkey)"""
+        return f"""
+            InputCaptureDialog, AddActionDialog, AddEditHotkeyDialog, RecordMacroDialog {{
+                background: {Colors.SECONDARY_DARKEST};
+            }}
+            
+            QLabel[role="dialogTitle"] {{
+                color: {Colors.TEXT_PRIMARY};
+                font-size: 22px;
+                font-weight: 700;
+                background: transparent;
+            }}
+            AddActionDialog QLabel[role="dialogTitle"] {{ font-size: 20px; }}
+            QLabel[role="formLabel"] {{
+                color: {Colors.TEXT_SECONDARY};
+                font-weight: 600;
+                background: transparent;
+            }}
+            QLabel[role="hint"] {{ color: {Colors.TEXT_MUTED}; background: transparent; }}
+            
+            QPushButton[role="dialogCancel"] {{
+                background: transparent;
+                color: {Colors.TEXT_SECONDARY};
+                border: 1px solid {Colors.BORDER_DEFAULT};
+                border-radius: 8px;
+                padding: 12px 24px;
+            }}
+            QPushButton[role="dialogConfirm"] {{
+                background: {Colors.PRIMARY};
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 12px 24px;
+                font-weight: 600;
+            }}
+            QPushButton[role="dialogConfirm"]:hover {{ background: {Colors.PRIMARY_LIGHT}; }}
+            QPushButton[role="listAdd"] {{
+                background: {Colors.PRIMARY_DARK};
+                color: white;
+                border: none;
+                border-radius: 6px;
+                padding: 6px 12px;
+            }}
+            QPushButton[role="listAdd"]:hover {{ background: {Colors.PRIMARY}; }}
+            QPushButton[role="listRemove"] {{
+                background: {Colors.SECONDARY_DARK};
+                color: {Colors.ERROR_LIGHT};
+                border: 1px solid {Colors.BORDER_DEFAULT};
+                border-radius: 6px;
+                padding: 6px 12px;
+            }}
+            QPushButton[role="listRemove"]:hover {{
+                background: {Colors.ERROR};
+                color: white;
+                border-color: {Colors.ERROR};
+            }}
+            
+            QLabel#recordStatus {{ color: {Colors.ACCENT_LIGHT}; font-weight: 600; background: transparent; }}
+            
+            QLabel#captureIcon {{ font-size: 32px; background: transparent; }}
+            QLabel#captureTitle {{
+                color: {Colors.ACCENT_LIGHT};
+                font-size: 15px;
+                font-weight: 600;
+                background: transparent;
+            }}
+            QLabel#captureHint {{ color: {Colors.TEXT_MUTED}; font-size: 11px; background: transparent; }}
+            QPushButton#captureCancel {{
+                background: {Colors.SECONDARY_DARK};
+                color: {Colors.TEXT_SECONDARY};
+                border: 1px solid {Colors.BORDER_DEFAULT};
+                border-radius: 6px;
+                padding: 10px 24px;
+            }}
+            QPushButton#captureCancel:hover {{ border-color: {Colors.TEXT_SECONDARY}; }}
+            
+            QComboBox#actionTypeCombo {{
+                background: {Colors.SECONDARY_DARK};
+                color: {Colors.TEXT_PRIMARY};
+                border: 2px solid {Colors.BORDER_DEFAULT};
+                border-radius: 8px;
+                padding: 12px;
+                font-size: 13px;
+            }}
+            QComboBox#actionTypeCombo::drop-down {{ border: none; width: 30px; }}
+            QComboBox#actionTypeCombo::down-arrow {{ image: none; border: none; }}
+            QComboBox#actionTypeCombo QAbstractItemView {{
+                background: {Colors.SECONDARY_DARK};
+                color: {Colors.TEXT_PRIMARY};
+                selection-background-color: {Colors.PRIMARY_DARK};
+            }}
+            QComboBox#delayUnitCombo {{
+                background: {Colors.SECONDARY_DARK};
+                color: {Colors.TEXT_PRIMARY};
+                border: 1px solid {Colors.BORDER_DEFAULT};
+                border-radius: 6px;
+                padding: 8px;
+            }}
+            QLabel#delayValue {{ color: {Colors.ACCENT_LIGHT}; font-weight: 700; background: transparent; }}
+            QSlider#delaySlider::groove:horizontal {{
+                background: {Colors.SECONDARY_DARK};
+                height: 8px;
+                border-radius: 4px;
+            }}
+            QSlider#delaySlider::handle:horizontal {{
+                background: {Colors.ACCENT_LIGHT};
+                width: 20px;
+                height: 20px;
+                margin: -6px 0;
+                border-radius: 10px;
+            }}
+            QSlider#delaySlider::sub-page:horizontal {{
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {Colors.PRIMARY}, stop:1 {Colors.ACCENT});
+                border-radius: 4px;
+            }}
+            
+            QPushButton#actionKeyButton {{
+                background: {Colors.SECONDARY_DARK};
+                color: {Colors.TEXT_SECONDARY};
+                border: 2px dashed {Colors.BORDER_DEFAULT};
+                border-radius: 8px;
+                padding: 14px;
+                font-size: 13px;
+            }}
+            QPushButton#actionKeyButton:hover {{ border-color: {Colors.PRIMARY}; color: {Colors.TEXT_PRIMARY}; }}
+            QPushButton#actionKeyButton[captured="true"] {{
+                background: {Colors.PRIMARY_DARK};
+                color: {Colors.ACCENT_LIGHT};
+                border: 2px solid {Colors.PRIMARY};
+                font-size: 14px;
+                font-weight: 700;
+            }}
+            
+            KeyCaptureButton {{
+                background: {Colors.SECONDARY_DARK};
+                color: {Colors.TEXT_SECONDARY};
+                border: 2px dashed {Colors.BORDER_DEFAULT};
+                border-radius: 10px;
+                padding: 16px 24px;
+                font-size: 13px;
+                min-width: 250px;
+                min-height: 50px;
+            }}
+            KeyCaptureButton:hover {{ border-color: {Colors.PRIMARY}; color: {Colors.TEXT_PRIMARY}; }}
+            KeyCaptureButton[captured="true"] {{
+                background: {Colors.PRIMARY_DARK};
+                color: {Colors.TEXT_PRIMARY};
+                border: 2px solid {Colors.PRIMARY};
+                font-size: 14px;
+                font-weight: 700;
+            }}
+            KeyCaptureButton[captured="true"]:hover {{ background: {Colors.PRIMARY}; }}
+            
+            HotkeyItemWidget {{
+                background: {Colors.SECONDARY_DARK};
+                border: 1px solid {Colors.BORDER_DEFAULT};
+                border-radius: 12px;
+            }}
+            HotkeyItemWidget:hover {{ border-color: {Colors.PRIMARY_DARK}; }}
+            QLabel#hotkeyName {{
+                color: {Colors.TEXT_PRIMARY};
+                font-size: 14px;
+                font-weight: 600;
+                background: transparent;
+                border: none;
+            }}
+            QLabel#hotkeyDetails {{ color: {Colors.TEXT_MUTED}; font-size: 12px; background: transparent; border: none; }}
+            QLabel#hotkeyBadge {{
+                background: {Colors.PRIMARY_DARK};
+                color: {Colors.ACCENT_LIGHT};
+                border: none;
+                border-radius: 8px;
+                padding: 10px 14px;
+                font-size: 11px;
+                font-weight: 700;
+            }}
+            QPushButton#hotkeyEdit, QPushButton#hotkeyExport, QPushButton#hotkeyDelete {{
+                background: transparent;
+                color: {Colors.TEXT_MUTED};
+                border: 1px solid {Colors.BORDER_DEFAULT};
+                border-radius: 6px;
+            }}
+            QPushButton#hotkeyEdit {{ color: {Colors.TEXT_SECONDARY}; padding: 8px 16px; }}
+            QPushButton#hotkeyExport {{ padding: 8px; }}
+            QPushButton#hotkeyEdit:hover {{ background: {Colors.PRIMARY_DARK}; color: {Colors.TEXT_PRIMARY}; }}
+            QPushButton#hotkeyExport:hover {{ background: {Colors.SECONDARY_DARKER}; color: {Colors.TEXT_PRIMARY}; }}
+            QPushButton#hotkeyDelete:hover {{ background: {Colors.ERROR}; color: white; }}
+            
+            EditableItemWidget QLabel {{
+                background: transparent;
+                border: none;
+                font-weight: 500;
+                color: {Colors.TEXT_PRIMARY};
+            }}
+            EditableItemWidget QPushButton {{
+                background: transparent;
+                color: {Colors.TEXT_MUTED};
+                border: none;
+                font-size: 20px;
+                padding-bottom: 4px;
+            }}
+            EditableItemWidget QPushButton:hover {{ background: transparent; color: {Colors.ACCENT_LIGHT}; }}
+            
+            QLineEdit#hotkeyNameInput {{
+                background: {Colors.SECONDARY_DARK};
+                color: {Colors.TEXT_PRIMARY};
+                border: 2px solid {Colors.BORDER_DEFAULT};
+                border-radius: 8px;
+                padding: 12px;
+            }}
+            QLineEdit#hotkeyNameInput:focus {{ border-color: {Colors.PRIMARY}; }}
+            QSpinBox#repeatDelaySpin {{
+                background: {Colors.SECONDARY_DARK};
+                color: {Colors.TEXT_PRIMARY};
+                border: 2px solid {Colors.BORDER_DEFAULT};
+                border-radius: 6px;
+                padding: 6px;
+            }}
+            QListWidget[role="editableList"] {{
+                background: {Colors.SECONDARY_DARK};
+                border: 2px solid {Colors.BORDER_DEFAULT};
+                border-radius: 8px;
+                outline: 0px;
+            }}
+            QListWidget[role="editableList"]::item {{
+                background: {Colors.SECONDARY_DARKER};
+                color: {Colors.TEXT_PRIMARY};
+                border-radius: 4px;
+                padding: 0px;
+                margin: 2px;
+                min-height: 34px;
+            }}
+            QListWidget[role="editableList"]::item:selected {{ background: {Colors.PRIMARY_DARK}; }}
+            QListWidget[role="editableList"]::item:focus {{ outline: none; }}
+            QListWidget#triggersList {{ min-height: 70px; max-height: 100px; }}
+            QListWidget#triggersList::item {{ min-height: 30px; }}
+            
+            HotkeyListView {{ background: transparent; border: none; }}
+        """
+    
+    @staticmethod
+    def window_rules() -> str:
+        """Rules untuk MainWindow dan pages"""
+        return f"""
+            QWidget#contentArea, HotkeyPage, SettingsPage {{
+                background: {Colors.SECONDARY_DARKEST};
+            }}
+            
+            QWidget#sidebarBrand, QWidget#sidebarStatusBar {{ background: transparent; }}
+            QLabel#brandLogo {{
+                color: {Colors.ACCENT_LIGHT};
+                font-size: 20px;
+                font-weight: 800;
+                letter-spacing: 3px;
+                background: transparent;
+                border: none;
+            }}
+            QLabel#brandSubtitle, QLabel#sidebarStatus {{
+                color: {Colors.TEXT_MUTED};
+                font-size: 11px;
+                background: transparent;
+                border: none;
+            }}
+            QLabel#sidebarStatus[active="true"] {{ color: {Colors.SUCCESS}; }}
+            
+            QLabel#hotkeyStatus {{
+                color: {Colors.TEXT_MUTED};
+                font-size: 13px;
+                font-weight: 500;
+                background: transparent;
+            }}
+            QLabel#hotkeyStatus[active="true"] {{ color: {Colors.SUCCESS}; }}
+            QLabel#emptyState {{
+                color: {Colors.TEXT_MUTED};
+                font-size: 14px;
+                padding: 60px;
+                background: transparent;
+            }}
+            
+            QLabel#settingsDescription {{
+                color: {Colors.TEXT_MUTED};
+                font-size: 13px;
+                margin-bottom: 10px;
+            }}
+            QListWidget#masterKeysList {{
+                background: transparent;
+                border: none;
+                outline: none;
+            }}
+            QListWidget#masterKeysList::item {{
+                background: {Colors.SECONDARY_DARK};
+                color: {Colors.ACCENT};
+                border: 1px solid {Colors.ACCENT_DARK};
+                border-radius: 6px;
+                width: 100px;
+                height: 40px;
+                margin: 4px;
+                font-weight: bold;
+                font-size: 14px;
+            }}
+            QListWidget#masterKeysList::item:selected {{
+                background: {Colors.PRIMARY_DARK};
+                border: 1px solid {Colors.PRIMARY_LIGHT};
+                color: white;
+            }}
+            QListWidget#masterKeysList::item:hover {{
+                border: 1px solid {Colors.ACCENT};
+                background: {Colors.SECONDARY_DARKER};
+            }}
+        """
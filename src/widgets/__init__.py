@@ -3,12 +3,18 @@ from .hotkey_widgets import (
     KeyCaptureButton, 
     HotkeyItemWidget, 
     AddEditHotkeyDialog,
-    InputCaptureDialog
+    InputCaptureDialog,
+    RecordMacroDialog
 )
+from .hotkey_list import HotkeyListModel, HotkeyItemDelegate, HotkeyListView
 
 __all__ = [
     'KeyCaptureButton',
     'HotkeyItemWidget', 
     'AddEditHotkeyDialog',
-    'InputCaptureDialog'
+    'InputCaptureDialog',
+    'RecordMacroDialog',
+    'HotkeyListModel',
+    'HotkeyItemDelegate',
+    'HotkeyListView'
 ]
@@ -0,0 +1,379 @@
+"""
+Hotkey List - Model/View untuk daftar hotkey
+Hanya baris yang terlihat yang di-paint (tanpa widget per item),
+sehingga list tetap ringan walaupun ada ribuan binding.
+"""
+from typing import Dict, List, Optional
+
+from PyQt6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QToolTip, QAbstractItemView
+from PyQt6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QRect, QRectF, QSize, QPoint, QEvent, pyqtSignal
+)
+from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QFontMetrics
+
+from src.theme import Colors
+from src.core.models import HotkeyBinding
+from src.core.hotstrings import trigger_display
+
+
+BindingRole = Qt.ItemDataRole.UserRole + 1
+
+
+class HotkeyListModel(QAbstractListModel):
+    """List model berisi HotkeyBinding (satu baris per binding)"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._bindings: List[HotkeyBinding] = []
+        self._rows: Dict[str, int] = {}
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._bindings)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._bindings)):
+            return None
+        binding = self._bindings[index.row()]
+        if role == BindingRole:
+            return binding
+        if role == Qt.ItemDataRole.DisplayRole:
+            return binding.name
+        return None
+    
+    def set_bindings(self, bindings: List[HotkeyBinding]):
+        """Ganti seluruh isi model"""
+        self.beginResetModel()
+        self._bindings = list(bindings)
+        self._rows = {b.id: i for i, b in enumerate(self._bindings)}
+        self.endResetModel()
+    
+    def binding_at(self, row: int) -> Optional[HotkeyBinding]:
+        if 0 <= row < len(self._bindings):
+            return self._bindings[row]
+        return None
+    
+    def row_of(self, binding_id: str) -> int:
+        """Row untuk binding id (-1 jika tidak ada)"""
+        return self._rows.get(binding_id, -1)
+    
+    def refresh_row(self, binding_id: str):
+        """Repaint satu baris saja"""
+        row = self.row_of(binding_id)
+        if row >= 0:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+    
+    # ===================
+    # INCREMENTAL UPDATES
+    # ===================
+    
+    def append_binding(self, binding: HotkeyBinding):
+        """Tambah satu binding di akhir list"""
+        if binding.id in self._rows:
+            self.update_binding(binding)
+            return
+        row = len(self._bindings)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._bindings.append(binding)
+        self._rows[binding.id] = row
+        self.endInsertRows()
+    
+    def update_binding(self, binding: HotkeyBinding):
+        """Ganti data satu binding (row tetap)"""
+        row = self.row_of(binding.id)
+        if row < 0:
+            self.append_binding(binding)
+            return
+        self._bindings[row] = binding
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+    
+    def remove_binding(self, binding_id: str):
+        """Hapus satu binding"""
+        row = self.row_of(binding_id)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._bindings[row]
+        del self._rows[binding_id]
+        for i in range(row, len(self._bindings)):
+            self._rows[self._bindings[i].id] = i
+        self.endRemoveRows()
+
+
+class HotkeyItemDelegate(QStyledItemDelegate):
+    """
+    Delegate yang menggambar satu hotkey item (tampilan sama dengan HotkeyItemWidget).
+    Switch dan tombol Edit/Exp/Delete di-handle lewat hit-testing.
+    """
+    
+    editClicked = pyqtSignal(str)
+    deleteClicked = pyqtSignal(str)
+    toggleClicked = pyqtSignal(str, bool)
+    exportClicked = pyqtSignal(str)
+    
+    ROW_HEIGHT = 80
+    ROW_SPACING = 12
+    PADDING_X = 20
+    SPACING = 16
+    
+    # Hit-test targets
+    HIT_SWITCH = "switch"
+    HIT_EDIT = "edit"
+    HIT_EXPORT = "export"
+    HIT_DELETE = "delete"
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._hover_row = -1
+        self._hover_pos = QPoint()
+        
+        # Prebuilt paint objects (dibuat sekali, dipakai semua baris)
+        self._name_font = QFont()
+        self._name_font.setPixelSize(14)
+        self._name_font.setWeight(QFont.Weight.DemiBold)
+        self._details_font = QFont()
+        self._details_font.setPixelSize(12)
+        self._badge_font = QFont()
+        self._badge_font.setPixelSize(11)
+        self._badge_font.setWeight(QFont.Weight.Bold)
+        self._button_font = QFont()
+        self._button_font.setPixelSize(11)
+        
+        self._name_metrics = QFontMetrics(self._name_font)
+        self._details_metrics = QFontMetrics(self._details_font)
+        self._badge_metrics = QFontMetrics(self._badge_font)
+        
+        self._card_brush = QBrush(QColor(Colors.SECONDARY_DARK))
+        self._card_pen = QPen(QColor(Colors.BORDER_DEFAULT), 1)
+        self._card_hover_pen = QPen(QColor(Colors.PRIMARY_DARK), 1)
+        self._button_pen = QPen(QColor(Colors.BORDER_DEFAULT), 1)
+        self._track_on = QBrush(QColor(Colors.ACCENT))
+        self._track_off = QBrush(QColor(Colors.SECONDARY_LIGHT))
+        self._handle_brush = QBrush(QColor(Colors.TEXT_PRIMARY))
+        self._badge_brush = QBrush(QColor(Colors.PRIMARY_DARK))
+        self._text_primary = QColor(Colors.TEXT_PRIMARY)
+        self._text_secondary = QColor(Colors.TEXT_SECONDARY)
+        self._text_muted = QColor(Colors.TEXT_MUTED)
+        self._accent_light = QColor(Colors.ACCENT_LIGHT)
+        self._button_hover = {
+            self.HIT_EDIT: QBrush(QColor(Colors.PRIMARY_DARK)),
+            self.HIT_EXPORT: QBrush(QColor(Colors.SECONDARY_DARKER)),
+            self.HIT_DELETE: QBrush(QColor(Colors.ERROR)),
+        }
+    
+    # ===================
+    # LAYOUT & HIT-TEST
+    # ===================
+    
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), self.ROW_HEIGHT + self.ROW_SPACING)
+    
+    def _card_rect(self, rect: QRect) -> QRect:
+        return QRect(rect.x(), rect.y(), rect.width(), self.ROW_HEIGHT)
+    
+    def _badge_text(self, binding: HotkeyBinding) -> str:
+        # Show first trigger (or count if multiple)
+        text = trigger_display(binding.trigger_keys[0]) if binding.trigger_keys else "NO TRIGGER"
+        if len(binding.trigger_keys) > 1:
+            text += f" +{len(binding.trigger_keys) - 1}"
+        return text
+    
+    def _layout(self, rect: QRect, binding: HotkeyBinding) -> Dict[str, QRect]:
+        """Hitung posisi semua elemen di dalam satu baris"""
+        card = self._card_rect(rect)
+        cy = card.y() + card.height() // 2
+        right = card.right() - self.PADDING_X
+        
+        delete = QRect(right - 36, cy - 18, 36, 36)
+        export = QRect(delete.left() - self.SPACING - 48, cy - 17, 48, 34)
+        edit = QRect(export.left() - self.SPACING - 64, cy - 17, 64, 34)
+        badge_w = max(100, self._badge_metrics.horizontalAdvance(self._badge_text(binding)) + 28)
+        badge = QRect(edit.left() - self.SPACING - badge_w, cy - 18, badge_w, 36)
+        switch = QRect(card.x() + self.PADDING_X, cy - 14, 52, 28)
+        text_left = switch.right() + self.SPACING
+        text = QRect(text_left, card.y() + 16, max(0, badge.left() - self.SPACING - text_left), card.height() - 32)
+        
+        return {
+            "card": card,
+            self.HIT_SWITCH: switch,
+            "text": text,
+            "badge": badge,
+            self.HIT_EDIT: edit,
+            self.HIT_EXPORT: export,
+            self.HIT_DELETE: delete,
+        }
+    
+    def hit_test(self, rect: QRect, binding: HotkeyBinding, pos: QPoint) -> Optional[str]:
+        """Return target yang ada di posisi pos (atau None)"""
+        layout = self._layout(rect, binding)
+        for target in (self.HIT_SWITCH, self.HIT_EDIT, self.HIT_EXPORT, self.HIT_DELETE):
+            if layout[target].contains(pos):
+                return target
+        return None
+    
+    def set_hover(self, row: int, pos: QPoint):
+        self._hover_row = row
+        self._hover_pos = pos
+    
+    # ===================
+    # PAINT
+    # ===================
+    
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        binding = index.data(BindingRole)
+        if binding is None:
+            return
+        
+        layout = self._layout(option.rect, binding)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        hover_target = None
+        if index.row() == self._hover_row:
+            hover_target = self.hit_test(option.rect, binding, self._hover_pos)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Card
+        painter.setPen(self._card_hover_pen if hovered else self._card_pen)
+        painter.setBrush(self._card_brush)
+        painter.drawRoundedRect(QRectF(layout["card"]).adjusted(0.5, 0.5, -0.5, -0.5), 12, 12)
+        
+        # Switch
+        switch = layout[self.HIT_SWITCH]
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._track_on if binding.enabled else self._track_off)
+        painter.drawRoundedRect(QRectF(switch), 14, 14)
+        handle_x = switch.x() + (28 if binding.enabled else 4)
+        painter.setBrush(self._handle_brush)
+        painter.drawEllipse(QRectF(handle_x, switch.y() + 4, 20, 20))
+        
+        # Name & details
+        text = layout["text"]
+        half = text.height() // 2
+        painter.setFont(self._name_font)
+        painter.setPen(self._text_primary)
+        name = self._name_metrics.elidedText(binding.name, Qt.TextElideMode.ElideRight, text.width())
+        painter.drawText(QRect(text.x(), text.y(), text.width(), half),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom, name)
+        
+        details = f"{len(binding.actions)} action(s)"
+        if binding.repeat:
+            details += " • Repeat"
+        # Show trigger count
+        trigger_count = len(binding.trigger_keys)
+        if trigger_count > 1:
+            details += f" • {trigger_count} triggers"
+        painter.setFont(self._details_font)
+        painter.setPen(self._text_muted)
+        details = self._details_metrics.elidedText(details, Qt.TextElideMode.ElideRight, text.width())
+        painter.drawText(QRect(text.x(), text.y() + half + 4, text.width(), half - 4),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, details)
+        
+        # Badge
+        badge = layout["badge"]
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._badge_brush)
+        painter.drawRoundedRect(QRectF(badge), 8, 8)
+        painter.setFont(self._badge_font)
+        painter.setPen(self._accent_light)
+        painter.drawText(badge, Qt.AlignmentFlag.AlignCenter, self._badge_text(binding))
+        
+        # Buttons
+        painter.setFont(self._button_font)
+        for target, label, color in (
+            (self.HIT_EDIT, "Edit", self._text_secondary),
+            (self.HIT_EXPORT, "Exp", self._text_muted),
+            (self.HIT_DELETE, "✕", self._text_muted),
+        ):
+            rect = layout[target]
+            is_hover = hover_target == target
+            painter.setPen(self._button_pen)
+            painter.setBrush(self._button_hover[target] if is_hover else Qt.BrushStyle.NoBrush)
+            painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 6, 6)
+            painter.setPen(self._text_primary if is_hover else color)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
+        
+        painter.restore()
+    
+    # ===================
+    # EVENTS
+    # ===================
+    
+    def editorEvent(self, event, model, option, index) -> bool:
+        if event.type() != QEvent.Type.MouseButtonRelease or event.button() != Qt.MouseButton.LeftButton:
+            return super().editorEvent(event, model, option, index)
+        
+        binding = index.data(BindingRole)
+        if binding is None:
+            return False
+        
+        target = self.hit_test(option.rect, binding, event.position().toPoint())
+        if target == self.HIT_SWITCH:
+            self.toggleClicked.emit(binding.id, not binding.enabled)
+        elif target == self.HIT_EDIT:
+            self.editClicked.emit(binding.id)
+        elif target == self.HIT_EXPORT:
+            self.exportClicked.emit(binding.id)
+        elif target == self.HIT_DELETE:
+            self.deleteClicked.emit(binding.id)
+        else:
+            return False
+        return True
+    
+    def helpEvent(self, event, view, option, index) -> bool:
+        binding = index.data(BindingRole)
+        if binding is not None and self.hit_test(option.rect, binding, event.pos()) == self.HIT_EXPORT:
+            QToolTip.showText(event.globalPos(), "Export this hotkey", view)
+            return True
+        return super().helpEvent(event, view, option, index)
+
+
+class HotkeyListView(QListView):
+    """List view untuk HotkeyListModel dengan HotkeyItemDelegate"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        
+        self.item_delegate = HotkeyItemDelegate(self)
+        self.setItemDelegate(self.item_delegate)
+        self._hover_row = -1
+    
+    def mouseMoveEvent(self, event):
+        pos = event.position().toPoint()
+        index = self.indexAt(pos)
+        row = index.row() if index.isValid() else -1
+        
+        # Repaint hanya baris lama & baru (untuk hover tombol)
+        if self._hover_row != row and self._hover_row >= 0:
+            self.viewport().update(self.visualRect(self.model().index(self._hover_row, 0)))
+        self._hover_row = row
+        self.item_delegate.set_hover(row, pos)
+        
+        target = None
+        if index.isValid():
+            self.viewport().update(self.visualRect(index))
+            target = self.item_delegate.hit_test(self.visualRect(index), index.data(BindingRole), pos)
+        
+        if target:
+            self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        else:
+            self.viewport().unsetCursor()
+        
+        super().mouseMoveEvent(event)
+    
+    def leaveEvent(self, event):
+        if self._hover_row >= 0 and self.model():
+            self.viewport().update(self.visualRect(self.model().index(self._hover_row, 0)))
+        self._hover_row = -1
+        self.item_delegate.set_hover(-1, QPoint())
+        self.viewport().unsetCursor()
+        super().leaveEvent(event)
@@ -1,18 +1,22 @@
 """
 Hotkey Widgets - UI Components dengan Qt Native Input Capture
 """
+from dataclasses import replace
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QDialog, QLineEdit, QSpinBox, QListWidget, QListWidgetItem, QAbstractItemView,
-    QCheckBox, QMessageBox, QApplication, QComboBox, QSlider
+    QCheckBox, QMessageBox, QApplication, QComboBox, QSlider, QInputDialog
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QEvent, QSize
-from PyQt6.QtGui import QKeyEvent, QMouseEvent
+from PyQt6.QtCore import Qt, pyqtSignal, QEvent, QSize, QTimer
+from PyQt6.QtGui import QKeyEvent, QMouseEvent, QWheelEvent
 
-from src.theme import Colors
+from src.theme import ThemeEngine
 from src.components.controls import GamingCheckbox
 from src.components.switches import GamingSwitch
-from src.core.hotkey_manager import HotkeyBinding, KeyAction, ActionType
+from src.core.models import TRIGGER_MODES, HotkeyBinding, KeyAction, ActionType
+from src.core.hotstrings import HOTSTRING_PREFIX, is_hotstring, trigger_display
+from src.core.trigger_automaton import is_stateful_trigger
 
 
 # Complete Qt key mapping
@@ -97,7 +101,6 @@ class InputCaptureDialog(QDialog):
         self.setWindowTitle("Capture Input")
         self.setFixedSize(420, 200)
         self.setModal(True)
-        self.setStyleSheet(f"QDialog {{ background: {Colors.SECONDARY_DARKEST}; }}")
         
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -105,19 +108,17 @@ class InputCaptureDialog(QDialog):
         layout.setContentsMargins(30, 30, 30, 30)
         
         icon = QLabel("🎮")
-        icon.setStyleSheet("font-size: 32px; background: transparent;")
+        icon.setObjectName("captureIcon")
         icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(icon)
         
         self.label = QLabel(title)
-        self.label.setStyleSheet(f"""
-            QLabel {{ color: {Colors.ACCENT_LIGHT}; font-size: 15px; font-weight: 600; background: transparent; }}
-        """)
+        self.label.setObjectName("captureTitle")
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.label)
         
-        hint = QLabel("Keyboard • Mouse • Combinations (Ctrl+Shift+Key)")
-        hint.setStyleSheet(f"QLabel {{ color: {Colors.TEXT_MUTED}; font-size: 11px; background: transparent; }}")
+        hint = QLabel("Keyboard • Mouse • Wheel • Combinations (Ctrl+Shift+Key)")
+        hint.setObjectName("captureHint")
         hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(hint)
         
@@ -125,11 +126,7 @@ class InputCaptureDialog(QDialog):
         
         cancel_btn = QPushButton("Cancel")
         cancel_btn.clicked.connect(self.reject)
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{ background: {Colors.SECONDARY_DARK}; color: {Colors.TEXT_SECONDARY}; 
-                border: 1px solid {Colors.BORDER_DEFAULT}; border-radius: 6px; padding: 10px 24px; }}
-            QPushButton:hover {{ border-color: {Colors.TEXT_SECONDARY}; }}
-        """)
+        cancel_btn.setObjectName("captureCancel")
         layout.addWidget(cancel_btn, alignment=Qt.AlignmentFlag.AlignCenter)
     
     def keyPressEvent(self, event: QKeyEvent):
@@ -179,28 +176,41 @@ class InputCaptureDialog(QDialog):
             Qt.MouseButton.LeftButton: ('mouse_left', 'Left Click'),
             Qt.MouseButton.RightButton: ('mouse_right', 'Right Click'),
             Qt.MouseButton.MiddleButton: ('mouse_middle', 'Middle Click'),
-            Qt.MouseButton.BackButton: ('mouse_back', 'Back'),
-            Qt.MouseButton.ForwardButton: ('mouse_forward', 'Forward'),
+            # Nama sama dengan yang dilaporkan hook (pynput Button.x1 / x2)
+            Qt.MouseButton.BackButton: ('mouse_x1', 'Back (X1)'),
+            Qt.MouseButton.ForwardButton: ('mouse_x2', 'Forward (X2)'),
         }
         
         if button in button_map:
-            key_name, display = button_map[button]
+            self._accept_mouse(*button_map[button], modifiers)
             
-            parts = []
-            if modifiers & Qt.KeyboardModifier.ControlModifier:
-                parts.append('ctrl')
-            if modifiers & Qt.KeyboardModifier.ShiftModifier:
-                parts.append('shift')
-            if modifiers & Qt.KeyboardModifier.AltModifier:
-                parts.append('alt')
+    def wheelEvent(self, event: QWheelEvent):
+        delta = event.angleDelta()
+        if delta.y():
+            key_name, display = ('mouse_wheel_up', 'Wheel Up') if delta.y() > 0 else ('mouse_wheel_down', 'Wheel Down')
+        elif delta.x():
+            # Qt: x positif = scroll ke kiri
+            key_name, display = ('mouse_wheel_left', 'Wheel Left') if delta.x() > 0 else ('mouse_wheel_right', 'Wheel Right')
+        else:
+            return
+        self._accept_mouse(key_name, display, event.modifiers())
             
-            if parts:
-                self.captured_key = '+'.join(parts) + '+' + key_name
-                self.captured_display = '🖱️ ' + ' + '.join(p.upper() for p in parts) + ' + ' + display
-            else:
-                self.captured_key = key_name
-                self.captured_display = '🖱️ ' + display
-            self.accept()
+    def _accept_mouse(self, key_name: str, display: str, modifiers):
+        parts = []
+        if modifiers & Qt.KeyboardModifier.ControlModifier:
+            parts.append('ctrl')
+        if modifiers & Qt.KeyboardModifier.ShiftModifier:
+            parts.append('shift')
+        if modifiers & Qt.KeyboardModifier.AltModifier:
+            parts.append('alt')
+        
+        if parts:
+            self.captured_key = '+'.join(parts) + '+' + key_name
+            self.captured_display = '🖱️ ' + ' + '.join(p.upper() for p in parts) + ' + ' + display
+        else:
+            self.captured_key = key_name
+            self.captured_display = '🖱️ ' + display
+        self.accept()
 
 
 class AddActionDialog(QDialog):
@@ -216,7 +226,6 @@ class AddActionDialog(QDialog):
         title_text = "Edit Action" if self.edit_action else "Add Action"
         self.setWindowTitle(title_text)
         self.setFixedSize(450, 380)
-        self.setStyleSheet(f"QDialog {{ background: {Colors.SECONDARY_DARKEST}; }}")
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -224,12 +233,12 @@ class AddActionDialog(QDialog):
         
         # Title
         title = QLabel(title_text)
-        title.setStyleSheet(f"color: {Colors.TEXT_PRIMARY}; font-size: 20px; font-weight: 700; background: transparent;")
+        title.setProperty("role", "dialogTitle")
         layout.addWidget(title)
         
         # Action type selector
         type_label = QLabel("Action Type")
-        type_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; font-weight: 600; background: transparent;")
+        type_label.setProperty("role", "formLabel")
         layout.addWidget(type_label)
         
         self.type_combo = QComboBox()
@@ -237,26 +246,12 @@ class AddActionDialog(QDialog):
             "🎹 Key Press (press & release)",
             "⬇️ Key Down (press only)",
             "⬆️ Key Up (release only)",
-            "⏸️ Delay (wait)"
+            "⏸️ Delay (wait)",
+            "🖱️ Mouse Move",
+            "🔤 Type Text"
         ])
         self.type_combo.currentIndexChanged.connect(self._on_type_changed)
-        self.type_combo.setStyleSheet(f"""
-            QComboBox {{
-                background: {Colors.SECONDARY_DARK};
-                color: {Colors.TEXT_PRIMARY};
-                border: 2px solid {Colors.BORDER_DEFAULT};
-                border-radius: 8px;
-                padding: 12px;
-                font-size: 13px;
-            }}
-            QComboBox::drop-down {{ border: none; width: 30px; }}
-            QComboBox::down-arrow {{ image: none; border: none; }}
-            QComboBox QAbstractItemView {{
-                background: {Colors.SECONDARY_DARK};
-                color: {Colors.TEXT_PRIMARY};
-                selection-background-color: {Colors.PRIMARY_DARK};
-            }}
-        """)
+        self.type_combo.setObjectName("actionTypeCombo")
         layout.addWidget(self.type_combo)
         
         # Key capture section
@@ -265,23 +260,13 @@ class AddActionDialog(QDialog):
         key_layout.setContentsMargins(0, 0, 0, 0)
         
         key_label = QLabel("Key to Execute")
-        key_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; font-weight: 600; background: transparent;")
+        key_label.setProperty("role", "formLabel")
         key_layout.addWidget(key_label)
         
         self.key_btn = QPushButton("Click to capture key...")
         self.key_btn.clicked.connect(self._capture_key)
         self.key_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.key_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {Colors.SECONDARY_DARK};
-                color: {Colors.TEXT_SECONDARY};
-                border: 2px dashed {Colors.BORDER_DEFAULT};
-                border-radius: 8px;
-                padding: 14px;
-                font-size: 13px;
-            }}
-            QPushButton:hover {{ border-color: {Colors.PRIMARY}; color: {Colors.TEXT_PRIMARY}; }}
-        """)
+        self.key_btn.setObjectName("actionKeyButton")
         key_layout.addWidget(self.key_btn)
         layout.addWidget(self.key_section)
         
@@ -295,11 +280,11 @@ class AddActionDialog(QDialog):
         
         delay_header = QHBoxLayout()
         delay_label = QLabel("Delay Duration")
-        delay_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; font-weight: 600; background: transparent;")
+        delay_label.setProperty("role", "formLabel")
         delay_header.addWidget(delay_label)
         
         self.delay_value_label = QLabel("100 ms")
-        self.delay_value_label.setStyleSheet(f"color: {Colors.ACCENT_LIGHT}; font-weight: 700; background: transparent;")
+        self.delay_value_label.setObjectName("delayValue")
         delay_header.addWidget(self.delay_value_label)
         delay_header.addStretch()
         delay_layout.addLayout(delay_header)
@@ -309,36 +294,19 @@ class AddActionDialog(QDialog):
         self.delay_slider.setRange(1, 1000)  # 1-1000 dalam unit yang dipilih
         self.delay_slider.setValue(100)
         self.delay_slider.valueChanged.connect(self._on_delay_changed)
-        self.delay_slider.setStyleSheet(f"""
-            QSlider::groove:horizontal {{ background: {Colors.SECONDARY_DARK}; height: 8px; border-radius: 4px; }}
-            QSlider::handle:horizontal {{ 
-                background: {Colors.ACCENT_LIGHT}; width: 20px; height: 20px; margin: -6px 0; border-radius: 10px; 
-            }}
-            QSlider::sub-page:horizontal {{ 
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {Colors.PRIMARY}, stop:1 {Colors.ACCENT}); 
-                border-radius: 4px; 
-            }}
-        """)
+        self.delay_slider.setObjectName("delaySlider")
         delay_layout.addWidget(self.delay_slider)
         
         # Unit selector
         unit_layout = QHBoxLayout()
         unit_label = QLabel("Unit:")
-        unit_label.setStyleSheet(f"color: {Colors.TEXT_MUTED}; background: transparent;")
+        unit_label.setProperty("role", "hint")
         unit_layout.addWidget(unit_label)
         
         self.unit_combo = QComboBox()
         self.unit_combo.addItems(["Milliseconds (ms)", "Seconds (s)", "Minutes (m)"])
         self.unit_combo.currentIndexChanged.connect(self._on_unit_changed)
-        self.unit_combo.setStyleSheet(f"""
-            QComboBox {{
-                background: {Colors.SECONDARY_DARK};
-                color: {Colors.TEXT_PRIMARY};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: 6px;
-                padding: 8px;
-            }}
-        """)
+        self.unit_combo.setObjectName("delayUnitCombo")
         unit_layout.addWidget(self.unit_combo)
         unit_layout.addStretch()
         delay_layout.addLayout(unit_layout)
@@ -346,6 +314,84 @@ class AddActionDialog(QDialog):
         layout.addWidget(self.delay_section)
         self.delay_section.hide()
         
+        # Mouse move section
+        self.move_section = QWidget()
+        move_layout = QVBoxLayout(self.move_section)
+        move_layout.setContentsMargins(0, 0, 0, 0)
+        move_layout.setSpacing(10)
+        
+        move_label = QLabel("Move Cursor")
+        move_label.setProperty("role", "formLabel")
+        move_layout.addWidget(move_label)
+        
+        coords = QHBoxLayout()
+        self.move_mode_combo = QComboBox()
+        self.move_mode_combo.addItems(["Relative (dx, dy)", "Absolute (screen x, y)"])
+        self.move_mode_combo.setObjectName("delayUnitCombo")
+        coords.addWidget(self.move_mode_combo)
+        self.move_x_spin = QSpinBox()
+        self.move_x_spin.setRange(-32768, 32767)
+        self.move_x_spin.setPrefix("X ")
+        coords.addWidget(self.move_x_spin)
+        self.move_y_spin = QSpinBox()
+        self.move_y_spin.setRange(-32768, 32767)
+        self.move_y_spin.setPrefix("Y ")
+        coords.addWidget(self.move_y_spin)
+        move_layout.addLayout(coords)
+        
+        smooth = QHBoxLayout()
+        self.move_duration_spin = QSpinBox()
+        self.move_duration_spin.setRange(0, 10000)
+        self.move_duration_spin.setSuffix(" ms")
+        self.move_duration_spin.setPrefix("Over ")
+        smooth.addWidget(self.move_duration_spin)
+        self.move_curve_combo = QComboBox()
+        self.move_curve_combo.addItems(["Linear", "Bezier (curved)"])
+        self.move_curve_combo.setObjectName("delayUnitCombo")
+        smooth.addWidget(self.move_curve_combo)
+        smooth.addStretch()
+        move_layout.addLayout(smooth)
+        
+        move_hint = QLabel("0 ms = instant jump")
+        move_hint.setProperty("role", "hint")
+        move_layout.addWidget(move_hint)
+        
+        layout.addWidget(self.move_section)
+        self.move_section.hide()
+        
+        # Type text section
+        self.text_section = QWidget()
+        text_layout = QVBoxLayout(self.text_section)
+        text_layout.setContentsMargins(0, 0, 0, 0)
+        text_layout.setSpacing(10)
+        
+        text_label = QLabel("Text to Type")
+        text_label.setProperty("role", "formLabel")
+        text_layout.addWidget(text_label)
+        
+        self.text_edit = QLineEdit()
+        self.text_edit.setPlaceholderText("gg wp! 👍")
+        text_layout.addWidget(self.text_edit)
+        
+        text_options = QHBoxLayout()
+        self.text_mode_combo = QComboBox()
+        self.text_mode_combo.addItems(["Unicode (any app)", "Physical keys (games)"])
+        self.text_mode_combo.setObjectName("delayUnitCombo")
+        text_options.addWidget(self.text_mode_combo)
+        self.text_delay_spin = QSpinBox()
+        self.text_delay_spin.setRange(0, 1000)
+        self.text_delay_spin.setSuffix(" ms / char")
+        text_options.addWidget(self.text_delay_spin)
+        text_options.addStretch()
+        text_layout.addLayout(text_options)
+        
+        text_hint = QLabel("0 ms = type instantly; \\n = Enter")
+        text_hint.setProperty("role", "hint")
+        text_layout.addWidget(text_hint)
+        
+        layout.addWidget(self.text_section)
+        self.text_section.hide()
+        
         layout.addStretch()
         
         # Buttons
@@ -354,20 +400,13 @@ class AddActionDialog(QDialog):
         
         cancel = QPushButton("Cancel")
         cancel.clicked.connect(self.reject)
-        cancel.setStyleSheet(f"""
-            QPushButton {{ background: transparent; color: {Colors.TEXT_SECONDARY}; 
-                border: 1px solid {Colors.BORDER_DEFAULT}; border-radius: 8px; padding: 12px 24px; }}
-        """)
+        cancel.setProperty("role", "dialogCancel")
         btns.addWidget(cancel)
         
         add_text = "Save Changes" if self.edit_action else "Add Action"
         add = QPushButton(add_text)
         add.clicked.connect(self._add)
-        add.setStyleSheet(f"""
-            QPushButton {{ background: {Colors.PRIMARY}; color: white; border: none; 
-                border-radius: 8px; padding: 12px 24px; font-weight: 600; }}
-            QPushButton:hover {{ background: {Colors.PRIMARY_LIGHT}; }}
-        """)
+        add.setProperty("role", "dialogConfirm")
         btns.addWidget(add)
         layout.addLayout(btns)
         
@@ -381,12 +420,24 @@ class AddActionDialog(QDialog):
             ActionType.KEY_PRESS: 0,
             ActionType.KEY_DOWN: 1,
             ActionType.KEY_UP: 2,
-            ActionType.DELAY: 3
+            ActionType.DELAY: 3,
+            ActionType.MOUSE_MOVE: 4,
+            ActionType.TYPE_TEXT: 5
         }
         idx = action_map.get(a.action_type, 0)
         self.type_combo.setCurrentIndex(idx)
         
-        if idx == 3: # Delay
+        if idx == 5: # Type text
+            self.text_edit.setText(a.text.replace("\n", "\\n"))
+            self.text_mode_combo.setCurrentIndex(1 if a.text_mode == "keys" else 0)
+            self.text_delay_spin.setValue(a.duration)
+        elif idx == 4: # Mouse move
+            self.move_mode_combo.setCurrentIndex(1 if a.absolute else 0)
+            self.move_x_spin.setValue(a.x)
+            self.move_y_spin.setValue(a.y)
+            self.move_duration_spin.setValue(a.duration)
+            self.move_curve_combo.setCurrentIndex(1 if a.curve == "bezier" else 0)
+        elif idx == 3: # Delay
              ms = a.duration
              if ms >= 60000 and ms % 60000 == 0:
                  self.unit_combo.setCurrentIndex(2) # Minutes
@@ -401,42 +452,20 @@ class AddActionDialog(QDialog):
              if a.keys:
                  self._captured_key = a.keys[0]
                  self.key_btn.setText(a.keys[0].upper())
-                 self.key_btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background: {Colors.PRIMARY_DARK};
-                        color: {Colors.ACCENT_LIGHT};
-                        border: 2px solid {Colors.PRIMARY};
-                        border-radius: 8px;
-                        padding: 14px;
-                        font-size: 14px;
-                        font-weight: 700;
-                    }}
-                """)
+                 ThemeEngine.set_state(self.key_btn, "captured", True)
     
     def _on_type_changed(self, index):
-        if index == 3:  # Delay
-            self.key_section.hide()
-            self.delay_section.show()
-        else:
-            self.key_section.show()
-            self.delay_section.hide()
+        self.key_section.setVisible(index < 3)
+        self.delay_section.setVisible(index == 3)
+        self.move_section.setVisible(index == 4)
+        self.text_section.setVisible(index == 5)
     
     def _capture_key(self):
         dialog = InputCaptureDialog("Press key to add...", allow_escape=True, parent=self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self._captured_key = dialog.captured_key
             self.key_btn.setText(dialog.captured_display)
-            self.key_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: {Colors.PRIMARY_DARK};
-                    color: {Colors.ACCENT_LIGHT};
-                    border: 2px solid {Colors.PRIMARY};
-                    border-radius: 8px;
-                    padding: 14px;
-                    font-size: 14px;
-                    font-weight: 700;
-                }}
-            """)
+            ThemeEngine.set_state(self.key_btn, "captured", True)
     
     def _on_delay_changed(self, value):
         unit_idx = self.unit_combo.currentIndex()
@@ -475,6 +504,26 @@ class AddActionDialog(QDialog):
         
         if type_idx == 3:  # Delay
             self.result_action = KeyAction(ActionType.DELAY, [], self._get_delay_ms())
+        elif type_idx == 4:  # Mouse move
+            self.result_action = KeyAction(
+                ActionType.MOUSE_MOVE,
+                duration=self.move_duration_spin.value(),
+                x=self.move_x_spin.value(),
+                y=self.move_y_spin.value(),
+                absolute=self.move_mode_combo.currentIndex() == 1,
+                curve="bezier" if self.move_curve_combo.currentIndex() == 1 else "linear"
+            )
+        elif type_idx == 5:  # Type text
+            text = self.text_edit.text().replace("\\n", "\n")
+            if not text:
+                QMessageBox.warning(self, "Error", "Please enter the text to type.")
+                return
+            self.result_action = KeyAction(
+                ActionType.TYPE_TEXT,
+                duration=self.text_delay_spin.value(),
+                text=text,
+                text_mode="keys" if self.text_mode_combo.currentIndex() == 1 else "unicode"
+            )
         else:
             if not self._captured_key:
                 QMessageBox.warning(self, "Error", "Please capture a key first.")
@@ -486,6 +535,122 @@ class AddActionDialog(QDialog):
         self.accept()
 
 
+class RecordMacroDialog(QDialog):
+    """Dialog rekam macro: keyboard + mouse direkam, lalu dikompres jadi actions"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.result_actions: list[KeyAction] = []
+        self._recorder = None
+        
+        # Update jumlah event (polling, listener jalan di thread pynput)
+        self._status_timer = QTimer(self)
+        self._status_timer.setInterval(100)
+        self._status_timer.timeout.connect(self._update_status)
+        
+        self._setup_ui()
+    
+    def _setup_ui(self):
+        self.setWindowTitle("Record Macro")
+        self.setFixedSize(440, 300)
+        self.setModal(True)
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(24, 24, 24, 24)
+        layout.setSpacing(14)
+        
+        title = QLabel("Record Macro")
+        title.setProperty("role", "dialogTitle")
+        layout.addWidget(title)
+        
+        self.status_label = QLabel("Press Start, perform the input, then press Stop.")
+        self.status_label.setObjectName("recordStatus")
+        self.status_label.setWordWrap(True)
+        layout.addWidget(self.status_label)
+        
+        # Opsi kompresi
+        opts = QHBoxLayout()
+        opts.addWidget(QLabel("Max idle gap:"))
+        self.idle_spin = QSpinBox()
+        self.idle_spin.setRange(50, 60000)
+        self.idle_spin.setValue(1000)
+        self.idle_spin.setSuffix(" ms")
+        opts.addWidget(self.idle_spin)
+        opts.addWidget(QLabel("Round to:"))
+        self.quantum_spin = QSpinBox()
+        self.quantum_spin.setRange(1, 500)
+        self.quantum_spin.setValue(10)
+        self.quantum_spin.setSuffix(" ms")
+        opts.addWidget(self.quantum_spin)
+        opts.addStretch()
+        layout.addLayout(opts)
+        
+        hint = QLabel("Key repeats are ignored; the click on Stop is not recorded.")
+        hint.setProperty("role", "hint")
+        layout.addWidget(hint)
+        layout.addStretch()
+        
+        btns = QHBoxLayout()
+        self.record_btn = QPushButton("● Start")
+        self.record_btn.setProperty("role", "listAdd")
+        self.record_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.record_btn.clicked.connect(self._toggle_recording)
+        btns.addWidget(self.record_btn)
+        btns.addStretch()
+        
+        cancel = QPushButton("Cancel")
+        cancel.setProperty("role", "dialogCancel")
+        cancel.clicked.connect(self.reject)
+        btns.addWidget(cancel)
+        
+        self.use_btn = QPushButton("Use Actions")
+        self.use_btn.setProperty("role", "dialogConfirm")
+        self.use_btn.setEnabled(False)
+        self.use_btn.clicked.connect(self._use)
+        btns.addWidget(self.use_btn)
+        layout.addLayout(btns)
+    
+    def _toggle_recording(self):
+        if self._recorder is not None and self._recorder.is_recording:
+            self._stop()
+            return
+        
+        # pynput baru di-import saat pertama kali merekam
+        from src.core.macro_recorder import MacroRecorder
+        if self._recorder is None:
+            self._recorder = MacroRecorder()
+        self._recorder.start()
+        self.result_actions = []
+        self.use_btn.setEnabled(False)
+        self.record_btn.setText("■ Stop")
+        self._status_timer.start()
+        self._update_status()
+    
+    def _stop(self):
+        self._status_timer.stop()
+        self._recorder.stop(discard_last_click=True)
+        self.record_btn.setText("● Record Again")
+        self.result_actions = self._recorder.to_actions(
+            quantum_ms=self.quantum_spin.value(), idle_cap_ms=self.idle_spin.value())
+        self.status_label.setText(
+            f"{len(self.result_actions)} actions from {self._recorder.event_count} events "
+            f"({self._recorder.raw_event_count} raw).")
+        self.use_btn.setEnabled(bool(self.result_actions))
+    
+    def _update_status(self):
+        self.status_label.setText(f"Recording... {self._recorder.event_count} events")
+    
+    def _use(self):
+        self.accept()
+    
+    def done(self, result):
+        # Pastikan listener dilepas walau dialog ditutup saat merekam
+        if self._recorder is not None and self._recorder.is_recording:
+            self._status_timer.stop()
+            self._recorder.stop()
+        super().done(result)
+
+
 class KeyCaptureButton(QPushButton):
     """Button untuk capture trigger key"""
     
@@ -501,35 +666,10 @@ class KeyCaptureButton(QPushButton):
         self.setCursor(Qt.CursorShape.PointingHandCursor)
     
     def _apply_default_style(self):
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background: {Colors.SECONDARY_DARK};
-                color: {Colors.TEXT_SECONDARY};
-                border: 2px dashed {Colors.BORDER_DEFAULT};
-                border-radius: 10px;
-                padding: 16px 24px;
-                font-size: 13px;
-                min-width: 250px;
-                min-height: 50px;
-            }}
-            QPushButton:hover {{ border-color: {Colors.PRIMARY}; color: {Colors.TEXT_PRIMARY}; }}
-        """)
+        ThemeEngine.set_state(self, "captured", False)
     
     def _apply_captured_style(self):
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background: {Colors.PRIMARY_DARK};
-                color: {Colors.TEXT_PRIMARY};
-                border: 2px solid {Colors.PRIMARY};
-                border-radius: 10px;
-                padding: 16px 24px;
-                font-size: 14px;
-                font-weight: 700;
-                min-width: 250px;
-                min-height: 50px;
-            }}
-            QPushButton:hover {{ background: {Colors.PRIMARY}; }}
-        """)
+        ThemeEngine.set_state(self, "captured", True)
     
     def _open_dialog(self):
         dialog = InputCaptureDialog("Press trigger key or click mouse...", parent=self.window())
@@ -568,10 +708,6 @@ class HotkeyItemWidget(QFrame):
         self._setup_ui()
     
     def _setup_ui(self):
-        self.setStyleSheet(f"""
-            HotkeyItemWidget {{ background: {Colors.SECONDARY_DARK}; border: 1px solid {Colors.BORDER_DEFAULT}; border-radius: 12px; }}
-            HotkeyItemWidget:hover {{ border-color: {Colors.PRIMARY_DARK}; }}
-        """)
         self.setFixedHeight(80)
         
         layout = QHBoxLayout(self)
@@ -587,7 +723,7 @@ class HotkeyItemWidget(QFrame):
         info.setSpacing(4)
         
         name = QLabel(self.binding.name)
-        name.setStyleSheet(f"color: {Colors.TEXT_PRIMARY}; font-size: 14px; font-weight: 600; background: transparent;")
+        name.setObjectName("hotkeyName")
         info.addWidget(name)
         
         details = f"{len(self.binding.actions)} action(s)"
@@ -598,54 +734,39 @@ class HotkeyItemWidget(QFrame):
         if trigger_count > 1:
             details += f" • {trigger_count} triggers"
         det = QLabel(details)
-        det.setStyleSheet(f"color: {Colors.TEXT_MUTED}; font-size: 12px; background: transparent;")
+        det.setObjectName("hotkeyDetails")
         info.addWidget(det)
         layout.addLayout(info, 1)
         
         # Show first trigger (or count if multiple)
-        trigger_text = self.binding.trigger_keys[0].upper() if self.binding.trigger_keys else "NO TRIGGER"
+        trigger_text = trigger_display(self.binding.trigger_keys[0]) if self.binding.trigger_keys else "NO TRIGGER"
         if len(self.binding.trigger_keys) > 1:
             trigger_text += f" +{len(self.binding.trigger_keys) - 1}"
         
         badge = QLabel(trigger_text)
         badge.setMinimumWidth(100)
         badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        badge.setStyleSheet(f"""
-            QLabel {{ background: {Colors.PRIMARY_DARK}; color: {Colors.ACCENT_LIGHT}; 
-                border-radius: 8px; padding: 10px 14px; font-size: 11px; font-weight: 700; }}
-        """)
+        badge.setObjectName("hotkeyBadge")
         layout.addWidget(badge)
         
         
         edit = QPushButton("Edit")
         edit.setCursor(Qt.CursorShape.PointingHandCursor)
-        edit.setStyleSheet(f"""
-            QPushButton {{ background: transparent; color: {Colors.TEXT_SECONDARY}; 
-                border: 1px solid {Colors.BORDER_DEFAULT}; border-radius: 6px; padding: 8px 16px; }}
-            QPushButton:hover {{ background: {Colors.PRIMARY_DARK}; color: {Colors.TEXT_PRIMARY}; }}
-        """)
+        edit.setObjectName("hotkeyEdit")
         edit.clicked.connect(lambda: self.editClicked.emit(self.binding.id))
         layout.addWidget(edit)
         
         export_btn = QPushButton("Exp")
         export_btn.setToolTip("Export this hotkey")
         export_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        export_btn.setStyleSheet(f"""
-            QPushButton {{ background: transparent; color: {Colors.TEXT_MUTED}; 
-                border: 1px solid {Colors.BORDER_DEFAULT}; border-radius: 6px; padding: 8px; }}
-            QPushButton:hover {{ background: {Colors.SECONDARY_DARKER}; color: {Colors.TEXT_PRIMARY}; }}
-        """)
+        export_btn.setObjectName("hotkeyExport")
         export_btn.clicked.connect(lambda: self.exportClicked.emit(self.binding.id))
         layout.addWidget(export_btn)
         
         delete = QPushButton("✕")
         delete.setFixedSize(36, 36)
         delete.setCursor(Qt.CursorShape.PointingHandCursor)
-        delete.setStyleSheet(f"""
-            QPushButton {{ background: transparent; color: {Colors.TEXT_MUTED}; 
-                border: 1px solid {Colors.BORDER_DEFAULT}; border-radius: 6px; }}
-            QPushButton:hover {{ background: {Colors.ERROR}; color: white; }}
-        """)
+        delete.setObjectName("hotkeyDelete")
         delete.clicked.connect(lambda: self.deleteClicked.emit(self.binding.id))
         layout.addWidget(delete)
 
@@ -663,7 +784,6 @@ class EditableItemWidget(QWidget):
         
         # Label
         self.label = QLabel(f"{icon_text}  {text}")
-        self.label.setStyleSheet(f"background: transparent; border: none; font-weight: 500; color: {Colors.TEXT_PRIMARY};")
         layout.addWidget(self.label)
         
         layout.addStretch()
@@ -673,13 +793,6 @@ class EditableItemWidget(QWidget):
         self.edit_btn.setFixedSize(28, 28)
         self.edit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.edit_btn.setToolTip("Edit Trigger")
-        self.edit_btn.setStyleSheet(f"""
-            QPushButton {{ 
-                background: transparent; color: {Colors.TEXT_MUTED}; 
-                border: none; font-size: 20px; padding-bottom: 4px;
-            }}
-            QPushButton:hover {{ background: transparent; color: {Colors.ACCENT_LIGHT}; }}
-        """)
         self.edit_btn.clicked.connect(self.editClicked.emit)
         self.edit_btn.hide() # Hide by default
         layout.addWidget(self.edit_btn)
@@ -696,16 +809,17 @@ class EditableItemWidget(QWidget):
 class AddEditHotkeyDialog(QDialog):
     """Dialog untuk add/edit hotkey dengan multiple triggers"""
     
-    def __init__(self, binding: HotkeyBinding = None, parent=None):
+    def __init__(self, binding: HotkeyBinding = None, layers: list = None, parent=None):
         super().__init__(parent)
         self.binding = binding
         self.is_edit = binding is not None
+        self.layer_names = layers or []  # Pilihan layer (binding boleh pakai nama baru)
         self.actions: list[KeyAction] = []
         self.trigger_keys: list[str] = []  # Multiple triggers
         self.result_data = None
         
         if self.is_edit:
-            self.actions = [KeyAction(a.action_type, a.keys.copy(), a.duration) for a in binding.actions]
+            self.actions = [replace(a, keys=a.keys.copy()) for a in binding.actions]
             self.trigger_keys = binding.trigger_keys.copy()
         
         self._setup_ui()
@@ -713,14 +827,13 @@ class AddEditHotkeyDialog(QDialog):
     def _setup_ui(self):
         self.setWindowTitle("Edit Hotkey" if self.is_edit else "Add New Hotkey")
         self.setMinimumSize(560, 700)
-        self.setStyleSheet(f"QDialog {{ background: {Colors.SECONDARY_DARKEST}; }}")
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(28, 28, 28, 28)
         layout.setSpacing(14)
         
         title = QLabel("Edit Hotkey" if self.is_edit else "Add New Hotkey")
-        title.setStyleSheet(f"color: {Colors.TEXT_PRIMARY}; font-size: 22px; font-weight: 700; background: transparent;")
+        title.setProperty("role", "dialogTitle")
         layout.addWidget(title)
         
         # Name
@@ -729,11 +842,7 @@ class AddEditHotkeyDialog(QDialog):
         self.name_input.setPlaceholderText("e.g., Quick Attack Combo")
         if self.is_edit:
             self.name_input.setText(self.binding.name)
-        self.name_input.setStyleSheet(f"""
-            QLineEdit {{ background: {Colors.SECONDARY_DARK}; color: {Colors.TEXT_PRIMARY}; 
-                border: 2px solid {Colors.BORDER_DEFAULT}; border-radius: 8px; padding: 12px; }}
-            QLineEdit:focus {{ border-color: {Colors.PRIMARY}; }}
-        """)
+        self.name_input.setObjectName("hotkeyNameInput")
         layout.addWidget(self.name_input)
         
         # Triggers (multiple)
@@ -742,14 +851,8 @@ class AddEditHotkeyDialog(QDialog):
         self.triggers_list = QListWidget()
         self.triggers_list.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
         self.triggers_list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        self.triggers_list.setStyleSheet(f"""
-            QListWidget {{ background: {Colors.SECONDARY_DARK}; border: 2px solid {Colors.BORDER_DEFAULT}; 
-                border-radius: 8px; min-height: 70px; max-height: 100px; outline: 0px; }}
-            QListWidget::item {{ background: {Colors.SECONDARY_DARKER}; color: {Colors.TEXT_PRIMARY}; 
-                border-radius: 4px; padding: 0px; margin: 2px; min-height: 30px; }}
-            QListWidget::item:selected {{ background: {Colors.PRIMARY_DARK}; }}
-            QListWidget::item:focus {{ outline: none; }}
-        """)
+        self.triggers_list.setObjectName("triggersList")
+        self.triggers_list.setProperty("role", "editableList")
         self.triggers_list.itemDoubleClicked.connect(self._edit_trigger_from_item)
         self.triggers_list.model().rowsMoved.connect(self._on_triggers_reordered)
         self._refresh_triggers()
@@ -759,21 +862,27 @@ class AddEditHotkeyDialog(QDialog):
         add_trigger = QPushButton("+ Add Trigger")
         add_trigger.clicked.connect(self._add_trigger)
         add_trigger.setCursor(Qt.CursorShape.PointingHandCursor)
-        add_trigger.setStyleSheet(f"""
-            QPushButton {{ background: {Colors.PRIMARY_DARK}; color: white; border: none; 
-                border-radius: 6px; padding: 6px 12px; }}
-            QPushButton:hover {{ background: {Colors.PRIMARY}; }}
-        """)
+        add_trigger.setProperty("role", "listAdd")
         trigger_btns.addWidget(add_trigger)
         
+        add_text_trigger = QPushButton("+ Add Text Trigger")
+        add_text_trigger.setToolTip("Fire when an abbreviation is typed, e.g. ;gg")
+        add_text_trigger.clicked.connect(self._add_text_trigger)
+        add_text_trigger.setCursor(Qt.CursorShape.PointingHandCursor)
+        add_text_trigger.setProperty("role", "listAdd")
+        trigger_btns.addWidget(add_text_trigger)
+        
+        add_sequence = QPushButton("+ Sequence")
+        add_sequence.setToolTip("Key sequence (g g) or chord pressed together (a+s)")
+        add_sequence.clicked.connect(self._add_sequence_trigger)
+        add_sequence.setCursor(Qt.CursorShape.PointingHandCursor)
+        add_sequence.setProperty("role", "listAdd")
+        trigger_btns.addWidget(add_sequence)
+        
         remove_trigger = QPushButton("Remove Selected")
         remove_trigger.clicked.connect(self._remove_trigger)
         remove_trigger.setCursor(Qt.CursorShape.PointingHandCursor)
-        remove_trigger.setStyleSheet(f"""
-            QPushButton {{ background: {Colors.SECONDARY_DARK}; color: {Colors.ERROR_LIGHT}; 
-                border: 1px solid {Colors.BORDER_DEFAULT}; border-radius: 6px; padding: 6px 12px; }}
-            QPushButton:hover {{ background: {Colors.ERROR}; color: white; border-color: {Colors.ERROR}; }}
-        """)
+        remove_trigger.setProperty("role", "listRemove")
         trigger_btns.addWidget(remove_trigger)
         trigger_btns.addStretch()
         layout.addLayout(trigger_btns)
@@ -791,28 +900,54 @@ class AddEditHotkeyDialog(QDialog):
         self.delay_spin.setRange(10, 5000)
         self.delay_spin.setValue(self.binding.repeat_delay if self.is_edit else 100)
         self.delay_spin.setSuffix(" ms")
-        self.delay_spin.setStyleSheet(f"""
-            QSpinBox {{ background: {Colors.SECONDARY_DARK}; color: {Colors.TEXT_PRIMARY}; 
-                border: 2px solid {Colors.BORDER_DEFAULT}; border-radius: 6px; padding: 6px; }}
-        """)
+        self.delay_spin.setObjectName("repeatDelaySpin")
         opts.addWidget(self.delay_spin)
         
         opts.addStretch()
         layout.addLayout(opts)
         
+        # Trigger mode (tap / hold / double-tap / release)
+        mode_opts = QHBoxLayout()
+        mode_opts.addWidget(QLabel("Trigger on:"))
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(["Press", "Release", "Tap", "Hold", "Double Tap"])
+        self.mode_combo.setObjectName("delayUnitCombo")
+        mode = self.binding.trigger_mode if self.is_edit else "press"
+        self.mode_combo.setCurrentIndex(TRIGGER_MODES.index(mode) if mode in TRIGGER_MODES else 0)
+        mode_opts.addWidget(self.mode_combo)
+        
+        mode_opts.addWidget(QLabel("Hold:"))
+        self.hold_spin = QSpinBox()
+        self.hold_spin.setRange(50, 5000)
+        self.hold_spin.setValue(self.binding.hold_ms if self.is_edit else 250)
+        self.hold_spin.setSuffix(" ms")
+        self.hold_spin.setObjectName("repeatDelaySpin")
+        mode_opts.addWidget(self.hold_spin)
+        
+        mode_opts.addWidget(QLabel("Layer:"))
+        self.layer_combo = QComboBox()
+        self.layer_combo.setEditable(True)
+        self.layer_combo.addItem("")
+        self.layer_combo.addItems(self.layer_names)
+        self.layer_combo.lineEdit().setPlaceholderText("Base")
+        self.layer_combo.setObjectName("delayUnitCombo")
+        self.layer_combo.setCurrentText(self.binding.layer if self.is_edit else "")
+        mode_opts.addWidget(self.layer_combo)
+        mode_opts.addStretch()
+        layout.addLayout(mode_opts)
+        
+        mode_hint = QLabel("Tap waits for the double-tap window when the same key also has a Double Tap binding")
+        mode_hint.setProperty("role", "hint")
+        layout.addWidget(mode_hint)
+        
         # Actions
         layout.addSpacing(10)
         self._label(layout, "Actions to Execute")
         self.actions_list = QListWidget()
         self.actions_list.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
         self.actions_list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        self.actions_list.setStyleSheet(f"""
-            QListWidget {{ background: {Colors.SECONDARY_DARK}; border: 2px solid {Colors.BORDER_DEFAULT}; border-radius: 8px; outline: 0px; }}
-            QListWidget::item {{ background: {Colors.SECONDARY_DARKER}; color: {Colors.TEXT_PRIMARY}; 
-                border-radius: 4px; padding: 0px; margin: 2px; min-height: 34px; }}
-            QListWidget::item:selected {{ background: {Colors.PRIMARY_DARK}; }}
-            QListWidget::item:focus {{ outline: none; }}
-        """)
+        self.actions_list.setObjectName("actionsList")
+        self.actions_list.setProperty("role", "editableList")
         self.actions_list.itemDoubleClicked.connect(self._edit_action_from_item)
         self.actions_list.model().rowsMoved.connect(self._on_actions_reordered)
         self.actions_list.setMinimumHeight(140)
@@ -828,21 +963,19 @@ class AddEditHotkeyDialog(QDialog):
         add_action = QPushButton("+ Add Action")
         add_action.clicked.connect(self._add_action)
         add_action.setCursor(Qt.CursorShape.PointingHandCursor)
-        add_action.setStyleSheet(f"""
-            QPushButton {{ background: {Colors.PRIMARY_DARK}; color: white; border: none; 
-                border-radius: 6px; padding: 6px 12px; }}
-            QPushButton:hover {{ background: {Colors.PRIMARY}; }}
-        """)
+        add_action.setProperty("role", "listAdd")
         btns_layout.addWidget(add_action)
         
+        record = QPushButton("● Record")
+        record.clicked.connect(self._record_actions)
+        record.setCursor(Qt.CursorShape.PointingHandCursor)
+        record.setProperty("role", "listAdd")
+        btns_layout.addWidget(record)
+        
         remove = QPushButton("Remove Selected")
         remove.clicked.connect(self._remove)
         remove.setCursor(Qt.CursorShape.PointingHandCursor)
-        remove.setStyleSheet(f"""
-            QPushButton {{ background: {Colors.SECONDARY_DARK}; color: {Colors.ERROR_LIGHT}; 
-                border: 1px solid {Colors.BORDER_DEFAULT}; border-radius: 6px; padding: 6px 12px; }}
-            QPushButton:hover {{ background: {Colors.ERROR}; color: white; border-color: {Colors.ERROR}; }}
-        """)
+        remove.setProperty("role", "listRemove")
         btns_layout.addWidget(remove)
         btns_layout.addStretch()
         
@@ -853,7 +986,16 @@ class AddEditHotkeyDialog(QDialog):
         checked = self.binding.block_input if self.is_edit else False
         self.block_cb = GamingCheckbox("Block Original Input", checked=checked)
         self.block_cb.setMinimumWidth(200)
-        layout.addWidget(self.block_cb)
+        
+        erase_checked = self.binding.hotstring_erase if self.is_edit else False
+        self.erase_cb = GamingCheckbox("Erase typed text trigger", checked=erase_checked)
+        self.erase_cb.setMinimumWidth(200)
+        
+        bottom_opts = QHBoxLayout()
+        bottom_opts.addWidget(self.block_cb)
+        bottom_opts.addWidget(self.erase_cb)
+        bottom_opts.addStretch()
+        layout.addLayout(bottom_opts)
         
         layout.addStretch()
         
@@ -865,25 +1007,18 @@ class AddEditHotkeyDialog(QDialog):
         
         cancel = QPushButton("Cancel")
         cancel.clicked.connect(self.reject)
-        cancel.setStyleSheet(f"""
-            QPushButton {{ background: transparent; color: {Colors.TEXT_SECONDARY}; 
-                border: 1px solid {Colors.BORDER_DEFAULT}; border-radius: 8px; padding: 12px 24px; }}
-        """)
+        cancel.setProperty("role", "dialogCancel")
         dlg_btns.addWidget(cancel)
         
         save = QPushButton("Save Hotkey")
         save.clicked.connect(self._save)
-        save.setStyleSheet(f"""
-            QPushButton {{ background: {Colors.PRIMARY}; color: white; border: none; 
-                border-radius: 8px; padding: 12px 24px; font-weight: 600; }}
-            QPushButton:hover {{ background: {Colors.PRIMARY_LIGHT}; }}
-        """)
+        save.setProperty("role", "dialogConfirm")
         dlg_btns.addWidget(save)
         layout.addLayout(dlg_btns)
     
     def _label(self, layout, text):
         lbl = QLabel(text)
-        lbl.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; font-weight: 600; background: transparent;")
+        lbl.setProperty("role", "formLabel")
         layout.addWidget(lbl)
     
     def _refresh_triggers(self):
@@ -895,7 +1030,8 @@ class AddEditHotkeyDialog(QDialog):
             item.setSizeHint(QSize(0, 44))
             
             # Custom Widget
-            widget = EditableItemWidget(key.upper(), "🎯", parent=self.triggers_list)
+            icon = "🔤" if is_hotstring(key) else "⛓️" if is_stateful_trigger(key) else "🎯"
+            widget = EditableItemWidget(trigger_display(key), icon, parent=self.triggers_list)
             # Safe binding in loop
             widget.editClicked.connect(lambda idx=i: self._edit_trigger(idx))
             
@@ -911,6 +1047,18 @@ class AddEditHotkeyDialog(QDialog):
         """Edit specific trigger"""
         if 0 <= index < len(self.trigger_keys):
             current_key = self.trigger_keys[index]
+            if is_hotstring(current_key):
+                text = self._ask_text_trigger(current_key[len(HOTSTRING_PREFIX):])
+                if text:
+                    self.trigger_keys[index] = HOTSTRING_PREFIX + text
+                    self._refresh_triggers()
+                return
+            if is_stateful_trigger(current_key):
+                sequence = self._ask_sequence_trigger(current_key)
+                if sequence:
+                    self.trigger_keys[index] = sequence
+                    self._refresh_triggers()
+                return
             dialog = InputCaptureDialog(f"Editing trigger '{current_key}'. Press new key...", parent=self)
             if dialog.exec() == QDialog.DialogCode.Accepted and dialog.captured_key:
                 # Update key at index
@@ -936,6 +1084,33 @@ class AddEditHotkeyDialog(QDialog):
                 self.trigger_keys.append(dialog.captured_key)
                 self._refresh_triggers()
     
+    def _ask_text_trigger(self, current: str = "") -> str:
+        text, ok = QInputDialog.getText(
+            self, "Text Trigger", "Abbreviation to type (e.g. ;gg):", text=current)
+        return text.strip() if ok else ""
+    
+    def _add_text_trigger(self):
+        """Add a hotstring trigger (typed abbreviation)"""
+        text = self._ask_text_trigger()
+        if text and HOTSTRING_PREFIX + text not in self.trigger_keys:
+            self.trigger_keys.append(HOTSTRING_PREFIX + text)
+            self._refresh_triggers()
+    
+    def _ask_sequence_trigger(self, current: str = "") -> str:
+        text, ok = QInputDialog.getText(
+            self, "Sequence / Chord Trigger",
+            "Steps separated by spaces, keys pressed together joined with +\n"
+            "e.g.  g g   •   up up down down   •   a+s   (optional @ms timeout: g g@200)",
+            text=current)
+        return " ".join(text.lower().split()) if ok else ""
+    
+    def _add_sequence_trigger(self):
+        """Add a multi-step sequence or chord trigger"""
+        sequence = self._ask_sequence_trigger()
+        if sequence and sequence not in self.trigger_keys:
+            self.trigger_keys.append(sequence)
+            self._refresh_triggers()
+    
     def _remove_trigger(self):
         """Remove selected trigger"""
         row = self.triggers_list.currentRow()
@@ -957,6 +1132,24 @@ class AddEditHotkeyDialog(QDialog):
             elif a.action_type == ActionType.KEY_UP:
                 icon = "⬆️"
                 text = f"Key Up: {', '.join(a.keys).upper()}"
+            elif a.action_type == ActionType.KEY_HOLD:
+                icon = "✊"
+                text = f"Key Hold: {', '.join(a.keys).upper()} ({a.duration} ms)"
+            elif a.action_type == ActionType.KEY_SEQUENCE:
+                icon = "🔢"
+                text = f"Sequence: {' '.join(a.keys).upper()}"
+            elif a.action_type == ActionType.MOUSE_MOVE:
+                icon = "🖱️"
+                target = f"to ({a.x}, {a.y})" if a.absolute else f"by ({a.x:+d}, {a.y:+d})"
+                smooth = f" over {a.duration} ms, {a.curve}" if a.duration > 0 else ""
+                text = f"Mouse Move {target}{smooth}"
+            elif a.action_type == ActionType.TYPE_TEXT:
+                icon = "🔤"
+                preview = a.text.replace("\n", "⏎")
+                if len(preview) > 32:
+                    preview = preview[:31] + "…"
+                rate = f" ({a.duration} ms/char)" if a.duration > 0 else ""
+                text = f"Type Text: \"{preview}\"{rate}"
             elif a.action_type == ActionType.DELAY:
                 icon = "⏸️"
                 if a.duration >= 60000:
@@ -1006,6 +1199,13 @@ class AddEditHotkeyDialog(QDialog):
             self.actions.append(dialog.result_action)
             self._refresh_actions()
     
+    def _record_actions(self):
+        """Rekam macro dan tambahkan actions hasilnya ke list"""
+        dialog = RecordMacroDialog(parent=self)
+        if dialog.exec() == QDialog.DialogCode.Accepted and dialog.result_actions:
+            self.actions.extend(dialog.result_actions)
+            self._refresh_actions()
+    
     def _remove(self):
         row = self.actions_list.currentRow()
         if row >= 0:
@@ -1032,7 +1232,11 @@ class AddEditHotkeyDialog(QDialog):
             "actions": self.actions,
             "repeat": self.repeat_cb.isChecked(),
             "repeat_delay": self.delay_spin.value(),
-            "block_input": self.block_cb.isChecked()
+            "block_input": self.block_cb.isChecked(),
+            "hotstring_erase": self.erase_cb.isChecked(),
+            "trigger_mode": TRIGGER_MODES[self.mode_combo.currentIndex()],
+            "hold_ms": self.hold_spin.value(),
+            "layer": self.layer_combo.currentText().strip()
         }
         self.accept()
 
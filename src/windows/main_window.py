@@ -1,12 +1,15 @@
 """
 Main Window - Gaming Tool
 """
+import time
+from typing import Callable, Dict, Optional
+
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QStackedWidget
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 
-from src.theme import Colors
+from src.theme import ThemeEngine
 from src.components.panels import SidebarPanel, NavItem
 from src.components.labels import StatusIndicator
 from src.pages.hotkey_page import HotkeyPage
@@ -17,18 +20,54 @@ from src.controllers.hotkey_controller import HotkeyController
 class MainWindow(QMainWindow):
     """Main application window"""
     
-    def __init__(self):
+    def __init__(self, deferred_init: bool = False, data_file: Optional[str] = None,
+                 engine_process: bool = False, preset_store: str = "json"):
+        """
+        deferred_init=True: window tampil dulu, load data + install hook
+        jalan di background setelah frame pertama (HotkeyController.ready).
+        data_file: profile JSON selain default (--profile).
+        engine_process: jalankan engine di child process (--engine-process).
+        preset_store: backend preset "json" / "sqlite" (--preset-store).
+        """
         super().__init__()
         self.setWindowTitle("Tobelsoft Macro - Gaming Tool")
         self.setMinimumSize(1200, 800)
         self.resize(1400, 900)
         
         # Initialize Controller (Singleton-like for window scope)
-        self.hotkey_controller = HotkeyController(self)
+        self.hotkey_controller = HotkeyController(self, deferred=deferred_init, data_file=data_file,
+                                                  engine_process=engine_process,
+                                                  preset_store=preset_store)
         self.hotkey_controller.statusChanged.connect(self.set_status)
-        
+        self.hotkey_controller.ready.connect(self._on_controller_ready)
+        
+        # Page cache: dibuat saat pertama dikunjungi, lalu disimpan di stack
+        self._page_factories: Dict[str, Callable[[], QWidget]] = {
+            "hotkey": lambda: HotkeyPage(self.hotkey_controller),
+            "settings": lambda: SettingsPage(self.hotkey_controller),
+        }
+        self._pages: Dict[str, QWidget] = {}
         self.current_page = None
+        self.current_page_name = None
         self._setup_ui()
+        
+        if not self.hotkey_controller.is_ready:
+            self.status_text.setText("Loading...")
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.hotkey_controller.is_ready:
+            # Event loop memproses paint frame pertama dulu, baru init engine
+            QTimer.singleShot(0, self.hotkey_controller.initialize_async)
+    
+    def closeEvent(self, event):
+        # Lepas hook / hentikan engine process sebelum aplikasi keluar
+        self.hotkey_controller.shutdown()
+        super().closeEvent(event)
+    
+    def _on_controller_ready(self):
+        """Data & hook siap (deferred init selesai)"""
+        self.set_status(self.hotkey_controller.is_active)
     
     def _setup_ui(self):
         """Setup main UI"""
@@ -45,17 +84,20 @@ class MainWindow(QMainWindow):
         
         # Content area
         self.content_area = QWidget()
-        self.content_area.setStyleSheet(f"background: {Colors.SECONDARY_DARKEST};")
+        self.content_area.setObjectName("contentArea")
         self.content_layout = QVBoxLayout(self.content_area)
         self.content_layout.setContentsMargins(0, 0, 0, 0)
         self.content_layout.setSpacing(0)
         
+        self.page_stack = QStackedWidget()
+        self.content_layout.addWidget(self.page_stack)
+        
         # Connect Navigation
         self.nav_hotkey.clicked.connect(lambda: self._switch_to_page("hotkey"))
         self.nav_settings.clicked.connect(lambda: self._switch_to_page("settings"))
         
         # Load default page (Hotkey)
-        self._load_page(HotkeyPage(self.hotkey_controller))
+        self._switch_to_page("hotkey")
         
         main_layout.addWidget(self.content_area, 1)
     
@@ -65,32 +107,16 @@ class MainWindow(QMainWindow):
         
         # Header - Logo
         header_widget = QWidget()
-        header_widget.setStyleSheet("background: transparent;")
+        header_widget.setObjectName("sidebarBrand")
         header_layout = QVBoxLayout(header_widget)
         header_layout.setContentsMargins(0, 0, 0, 0)
         header_layout.setSpacing(4)
         
         logo_label = QLabel("⚡ TOBELSOFT")
-        logo_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.ACCENT_LIGHT};
-                font-size: 20px;
-                font-weight: 800;
-                letter-spacing: 3px;
-                background: transparent;
-                border: none;
-            }}
-        """)
+        logo_label.setObjectName("brandLogo")
         
         subtitle = QLabel("Gaming Macro Tool")
-        subtitle.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_MUTED};
-                font-size: 11px;
-                background: transparent;
-                border: none;
-            }}
-        """)
+        subtitle.setObjectName("brandSubtitle")
         
         header_layout.addWidget(logo_label)
         header_layout.addWidget(subtitle)
@@ -105,20 +131,13 @@ class MainWindow(QMainWindow):
         
         # Footer - Status
         footer_widget = QWidget()
-        footer_widget.setStyleSheet("background: transparent;")
+        footer_widget.setObjectName("sidebarStatusBar")
         footer_layout = QHBoxLayout(footer_widget)
         footer_layout.setContentsMargins(0, 0, 0, 0)
         
         self.status_indicator = StatusIndicator("offline", 10)
         self.status_text = QLabel("Ready")
-        self.status_text.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_MUTED};
-                font-size: 11px;
-                background: transparent;
-                border: none;
-            }}
-        """)
+        self.status_text.setObjectName("sidebarStatus")
         
         footer_layout.addWidget(self.status_indicator)
         footer_layout.addWidget(self.status_text)
@@ -127,49 +146,45 @@ class MainWindow(QMainWindow):
         
         return sidebar
     
-    def _load_page(self, page: QWidget):
-        """Load a page into content area"""
-        # Clear current
-        if self.current_page:
-            self.content_layout.removeWidget(self.current_page)
-            self.current_page.deleteLater()
-        
-        self.current_page = page
-        self.content_layout.addWidget(page)
+    def _get_page(self, page_name: str) -> QWidget:
+        """Ambil page dari cache, buat jika belum pernah dikunjungi"""
+        page = self._pages.get(page_name)
+        if page is None:
+            # Page di-parent ke stack: koneksi signal ke controller ikut
+            # terputus otomatis saat page/window dihancurkan
+            page = self._page_factories[page_name]()
+            self.page_stack.addWidget(page)
+            self._pages[page_name] = page
+        return page
     
     def set_status(self, active: bool):
-        """Update sidebar status indicator"""
-        if active:
-            self.status_indicator.set_status("online")
-            self.status_text.setText("Active")
-            self.status_text.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.SUCCESS};
-                    font-size: 11px;
-                    background: transparent;
-                    border: none;
-                }}
-            """)
-        else:
-            self.status_indicator.set_status("offline")
-            self.status_text.setText("Ready")
-            self.status_text.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_MUTED};
-                    font-size: 11px;
-                    background: transparent;
-                    border: none;
-                }}
-            """)
+        """Update sidebar status indicator (flip property, tanpa parse ulang QSS)"""
+        self.status_indicator.set_status("online" if active else "offline")
+        self.status_text.setText("Active" if active else "Ready")
+        ThemeEngine.set_state(self.status_text, "active", active)
 
 
     def _switch_to_page(self, page_name: str):
         """Switch active page"""
-        if page_name == "hotkey":
-            self.nav_hotkey.set_active(True)
-            self.nav_settings.set_active(False)
-            self._load_page(HotkeyPage(self.hotkey_controller))
-        elif page_name == "settings":
-            self.nav_hotkey.set_active(False)
-            self.nav_settings.set_active(True)
-            self._load_page(SettingsPage(self.hotkey_controller))
+        if page_name == self.current_page_name or page_name not in self._page_factories:
+            return
+
+        start = time.perf_counter()
+        cached = page_name in self._pages
+        
+        self.nav_hotkey.set_active(page_name == "hotkey")
+        self.nav_settings.set_active(page_name == "settings")
+        
+        page = self._get_page(page_name)
+        self.page_stack.setCurrentWidget(page)
+        self.current_page = page
+        self.current_page_name = page_name
+        
+        # Ukur sampai event loop kembali (layout + paint sudah diproses)
+        QTimer.singleShot(0, lambda: self._report_navigation(page_name, cached, start))
+    
+    def _report_navigation(self, page_name: str, cached: bool, start: float):
+        """Log latency navigasi"""
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        source = "cached" if cached else "built"
+        print(f"[PERF] Switch to '{page_name}' ({source}): {elapsed_ms:.2f} ms")
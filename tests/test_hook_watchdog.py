@@ -0,0 +1,169 @@
+"""
+Test - HookWatchdog dengan clock, input idle & listener palsu (tanpa Qt / pynput)
+    
+    python -m pytest tests/test_hook_watchdog.py
+    python -m unittest tests.test_hook_watchdog
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.core.hook_watchdog import HookWatchdog
+
+
+class FakeClock:
+    """Clock manual (detik); callback palsu memajukan waktu sesuai durasinya"""
+    
+    def __init__(self):
+        self.now = 100.0
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class FakeListener:
+    def __init__(self, alive: bool = True):
+        self.alive = alive
+    
+    def is_alive(self) -> bool:
+        return self.alive
+
+
+class HookWatchdogTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        self.idle_ms = None  # None = OS tidak mendukung cek input
+        self.listeners = [FakeListener()]
+        self.rearms = []
+        self.watchdog = HookWatchdog(
+            get_listeners=lambda: self.listeners,
+            rearm=self._rearm,
+            budget_ms=4.0,
+            input_idle_ms=lambda: self.idle_ms,
+            clock=self.clock,
+        )
+    
+    def _rearm(self):
+        self.rearms.append(self.clock())
+        self.listeners = [FakeListener()]
+    
+    def _callback(self, duration_ms: float):
+        """Callback hook yang memakan duration_ms di clock palsu"""
+        def callback(*args):
+            self.clock.advance(duration_ms / 1000.0)
+            return True
+        return callback
+    
+    # ===================
+    # SHEDDING
+    # ===================
+    
+    def test_fast_callbacks_do_not_shed(self):
+        press = self.watchdog.timed("press", self._callback(0.5))
+        for _ in range(50):
+            self.assertTrue(press("a"))
+        self.assertFalse(self.watchdog.shedding)
+        stats = self.watchdog.stats["press"]
+        self.assertEqual(stats.count, 50)
+        self.assertEqual(stats.over_budget, 0)
+        self.assertEqual(sum(stats.histogram), 50)
+    
+    def test_slow_callbacks_turn_shedding_on_then_off(self):
+        fast = self._callback(0.1)
+        slow = self._callback(6.0)
+        calls = iter([slow] * 20 + [fast] * 60)
+        press = self.watchdog.timed("press", lambda *args: next(calls)(*args))
+        
+        for _ in range(20):
+            press("a")
+        self.assertTrue(self.watchdog.shedding)
+        stats = self.watchdog.stats["press"]
+        self.assertEqual(stats.over_budget, 20)
+        # Metrik opsional di-skip selama shedding, count tetap jalan
+        detailed = sum(stats.histogram)
+        self.assertLess(detailed, 20)
+        
+        for _ in range(60):
+            press("a")
+        self.assertFalse(self.watchdog.shedding)
+        self.assertEqual(stats.count, 80)
+        self.assertGreater(sum(stats.histogram), detailed)
+    
+    def test_shedding_stays_on_while_any_callback_is_slow(self):
+        slow = self.watchdog.timed("filter", self._callback(6.0))
+        fast = self.watchdog.timed("press", self._callback(0.1))
+        for _ in range(20):
+            slow()
+        for _ in range(50):
+            fast("a")
+        self.assertTrue(self.watchdog.shedding)
+        self.assertTrue(self.watchdog.snapshot()["shedding"])
+    
+    # ===================
+    # RE-ARM
+    # ===================
+    
+    def test_healthy_listeners_are_not_rearmed(self):
+        self.assertIsNone(self.watchdog.diagnose())
+        self.assertFalse(self.watchdog.check())
+        self.assertEqual(self.rearms, [])
+    
+    def test_no_listeners_is_not_a_failure(self):
+        self.listeners = []
+        self.assertFalse(self.watchdog.check())
+    
+    def test_dead_listener_thread_is_rearmed(self):
+        self.listeners = [FakeListener(), FakeListener(alive=False)]
+        self.assertIn("listener thread exited", self.watchdog.diagnose())
+        self.assertTrue(self.watchdog.check())
+        self.assertEqual(len(self.rearms), 1)
+        self.assertEqual(self.watchdog.rearm_count, 1)
+        self.assertIn("FakeListener", self.watchdog.last_rearm_reason)
+        # Listener baru dari rearm() sehat
+        self.assertFalse(self.watchdog.check())
+    
+    def test_rearm_respects_cooldown(self):
+        self.listeners = [FakeListener(alive=False)]
+        self.assertTrue(self.watchdog.check())
+        self.listeners = [FakeListener(alive=False)]
+        self.clock.advance(HookWatchdog.REARM_COOLDOWN / 2)
+        self.assertFalse(self.watchdog.check())
+        self.clock.advance(HookWatchdog.REARM_COOLDOWN)
+        self.assertTrue(self.watchdog.check())
+        self.assertEqual(self.watchdog.rearm_count, 2)
+    
+    def test_silent_hook_with_os_input_is_rearmed(self):
+        press = self.watchdog.timed("press", self._callback(0.1))
+        press("a")
+        # OS melihat input 0.5 dtk lalu, hook diam sejak lebih lama dari STALL_TIMEOUT
+        self.clock.advance(HookWatchdog.STALL_TIMEOUT + 2.0)
+        self.idle_ms = 500.0
+        self.assertIn("no hook events", self.watchdog.diagnose())
+        self.assertTrue(self.watchdog.check())
+        self.assertEqual(len(self.rearms), 1)
+    
+    def test_idle_user_is_not_a_stall(self):
+        self.watchdog.beat()
+        self.clock.advance(HookWatchdog.STALL_TIMEOUT * 10)
+        # Input terakhir OS sama tuanya dengan event hook terakhir
+        self.idle_ms = HookWatchdog.STALL_TIMEOUT * 10 * 1000.0
+        self.assertIsNone(self.watchdog.diagnose())
+        self.idle_ms = None
+        self.assertIsNone(self.watchdog.diagnose())
+    
+    def test_heartbeat_keeps_hook_alive(self):
+        for _ in range(10):
+            self.clock.advance(1.0)
+            self.watchdog.beat()
+        self.idle_ms = 0.0
+        self.assertIsNone(self.watchdog.diagnose())
+
+
+if __name__ == "__main__":
+    unittest.main()